@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -183,6 +184,7 @@ def generate_new_question():
     st.session_state.convert_place_values_correct_answer = correct_answer
     st.session_state.convert_place_values_current_question = "Fill in the missing number:"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.convert_place_values_question_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -139,6 +140,7 @@ def generate_new_question():
     st.session_state.even_odd_arithmetic_correct_answer = correct_answer
     st.session_state.even_odd_arithmetic_current_question = f"Is **{expression}** even or odd?"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.even_odd_arithmetic_question_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.widgets import new_question, order_numbers
 
 def run():
     """
@@ -18,7 +19,6 @@ def run():
         st.session_state.put_numbers_order_show_feedback = False
         st.session_state.put_numbers_order_answer_submitted = False
         st.session_state.put_numbers_order_question_data = {}
-        st.session_state.put_numbers_order_selected_order = []
     
     # Page header with breadcrumb
     st.markdown("**📚 Year 5 > A. Place values and number sense**")
@@ -53,6 +53,7 @@ def run():
     
     # Generate new question if needed
     if st.session_state.put_numbers_order_current_question is None:
+        new_question("put_numbers_order_clicks")
         generate_new_question()
     
     # Display current question based on type
@@ -101,7 +102,6 @@ def generate_new_question():
     question_type = random.choice(["position_finder", "click_to_order"])
     
     st.session_state.put_numbers_order_question_type = question_type
-    st.session_state.put_numbers_order_selected_order = []  # Reset selection
     
     if question_type == "position_finder":
         generate_position_finder_question(digits)
@@ -204,54 +204,12 @@ def display_click_to_order_question():
     st.markdown("### 📝 Question:")
     st.markdown(f"**{st.session_state.put_numbers_order_current_question}**")
     
-    # Display numbers as clickable elements
-    st.markdown("**Click the numbers in the correct order:**")
-    
-    # Create buttons in columns
-    cols = st.columns(4)
-    
-    # Track which numbers have been selected
-    if "put_numbers_order_button_states" not in st.session_state:
-        st.session_state.put_numbers_order_button_states = {num: False for num in data['numbers']}
-    
-    for i, number in enumerate(data['numbers']):
-        with cols[i]:
-            # Check if this number is already selected
-            is_selected = number in st.session_state.put_numbers_order_selected_order
-            button_style = "secondary" if is_selected else "primary"
-            disabled = is_selected
-            
-            if st.button(
-                f"{number:,}",
-                key=f"put_numbers_order_btn_{number}",
-                type=button_style,
-                disabled=disabled,
-                use_container_width=True
-            ):
-                if number not in st.session_state.put_numbers_order_selected_order:
-                    st.session_state.put_numbers_order_selected_order.append(number)
-                    st.rerun()
-    
-    # Show current selection
-    if st.session_state.put_numbers_order_selected_order:
-        st.markdown("**Your order so far:**")
-        order_display = " → ".join([f"{num:,}" for num in st.session_state.put_numbers_order_selected_order])
-        st.markdown(f"**{order_display}**")
-    
-    # Reset button
-    if st.session_state.put_numbers_order_selected_order:
-        if st.button("🔄 Reset Selection", type="secondary"):
-            st.session_state.put_numbers_order_selected_order = []
-            st.session_state.put_numbers_order_button_states = {num: False for num in data['numbers']}
-            st.rerun()
-    
-    # Submit button (only show when all numbers are selected)
-    if len(st.session_state.put_numbers_order_selected_order) == len(data['numbers']):
-        if st.button("✅ Submit Order", type="primary", use_container_width=True):
-            st.session_state.put_numbers_order_user_answer = st.session_state.put_numbers_order_selected_order.copy()
-            st.session_state.put_numbers_order_show_feedback = True
-            st.session_state.put_numbers_order_answer_submitted = True
-            st.rerun()
+    # Clicking, resetting and submitting happen in the page; only the final order comes back
+    order = order_numbers(data['numbers'], problem=data, key="put_numbers_order_clicks")
+    if order is not None and not st.session_state.put_numbers_order_answer_submitted:
+        st.session_state.put_numbers_order_user_answer = order
+        st.session_state.put_numbers_order_show_feedback = True
+        st.session_state.put_numbers_order_answer_submitted = True
     
     # Show feedback and next button
     handle_feedback_and_next()
@@ -367,8 +325,5 @@ def reset_question_state():
     st.session_state.put_numbers_order_show_feedback = False
     st.session_state.put_numbers_order_answer_submitted = False
     st.session_state.put_numbers_order_question_data = {}
-    st.session_state.put_numbers_order_selected_order = []
     if "put_numbers_order_user_answer" in st.session_state:
-        del st.session_state.put_numbers_order_user_answer
-    if "put_numbers_order_button_states" in st.session_state:
-        del st.session_state.put_numbers_order_button_states
\ No newline at end of file
+        del st.session_state.put_numbers_order_user_answer
\ No newline at end of file
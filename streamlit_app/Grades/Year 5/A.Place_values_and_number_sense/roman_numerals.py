@@ -1,5 +1,7 @@
 import streamlit as st
 import random
+from utils.answers import answers_match
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -147,6 +149,7 @@ def generate_new_question():
     
     st.session_state.roman_current_question = question_text
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     question_type = st.session_state.roman_question_type
@@ -228,9 +231,9 @@ def show_feedback():
     # Validate answer based on question type
     is_correct = False
     if question_type == "decimal_to_roman":
-        is_correct = user_answer.upper() == correct_answer
+        is_correct = answers_match(user_answer, correct_answer, "roman")
     else:
-        is_correct = user_answer == correct_answer
+        is_correct = answers_match(user_answer, correct_answer, "integer")
     
     if is_correct:
         st.success("🎉 **Excellent! That's correct!**")
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -142,6 +143,7 @@ def generate_new_question():
     st.session_state.rounding_numbers_correct_answer = str(correct_answer)
     st.session_state.rounding_numbers_current_question = f"What is **{number:,}** rounded to the **{place_label}**?"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.rounding_numbers_question_data
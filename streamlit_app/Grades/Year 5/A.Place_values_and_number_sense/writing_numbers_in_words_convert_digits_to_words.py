@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -194,6 +195,7 @@ def generate_new_question():
     st.session_state.digits_to_words_correct_answer = correct_word_form
     st.session_state.digits_to_words_current_question = f"How do you write this number in words?"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.digits_to_words_question_data
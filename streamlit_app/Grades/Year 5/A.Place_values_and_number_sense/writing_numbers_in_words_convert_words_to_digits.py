@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -192,6 +193,7 @@ def generate_new_question():
     st.session_state.words_to_digits_correct_answer = correct_number
     st.session_state.words_to_digits_current_question = f"How do you write this number using digits?"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.words_to_digits_question_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -157,6 +158,7 @@ def generate_new_question():
     st.session_state.add_subtract_whole_numbers_correct_answer = str(answer)
     st.session_state.add_subtract_whole_numbers_current_question = label
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.add_subtract_whole_numbers_question_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -179,6 +180,7 @@ def generate_new_question():
     st.session_state.correct_answer = str(answer)
     st.session_state.current_question = "Solve this word problem:"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     # Display question with nice formatting
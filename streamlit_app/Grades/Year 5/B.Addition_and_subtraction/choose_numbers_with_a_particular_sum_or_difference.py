@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -147,6 +148,7 @@ def generate_new_question():
     operation_name = "addition" if mode == "+" else "subtraction"
     st.session_state.current_question = f"Choose two numbers to complete the {operation_name} sentence:"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.problem_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -129,6 +130,7 @@ def generate_new_question():
     st.session_state.correct_answer = str(top if missing == "top" else bottom)
     st.session_state.current_question = "Fill in the missing number to complete the equation:"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.problem_data
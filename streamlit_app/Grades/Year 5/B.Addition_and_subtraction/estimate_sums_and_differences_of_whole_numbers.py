@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -193,6 +194,7 @@ def generate_new_question():
     st.session_state.correct_answer = str(int(answer))
     st.session_state.current_question = f"Estimate the {operation_name} by rounding each number to the nearest {round_to:,} and then calculating."
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.problem_data
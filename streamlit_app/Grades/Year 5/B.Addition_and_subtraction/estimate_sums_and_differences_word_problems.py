@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -275,6 +276,7 @@ def generate_new_question():
     st.session_state.correct_answer = correct_estimate
     st.session_state.current_question = "Choose the better estimate:"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.problem_data
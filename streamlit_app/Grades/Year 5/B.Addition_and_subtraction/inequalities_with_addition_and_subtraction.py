@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -184,6 +185,7 @@ def generate_new_question():
     
     st.session_state.current_question = "Which value or symbol makes this statement true?"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.problem_data
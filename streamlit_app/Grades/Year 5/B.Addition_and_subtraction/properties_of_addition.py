@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -171,6 +172,7 @@ def generate_new_question():
         }
         st.session_state.current_question = f"Which equation shows the **{target_property}** property of addition?"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.problem_data
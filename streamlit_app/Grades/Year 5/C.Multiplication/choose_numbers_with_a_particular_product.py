@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import itertools
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -203,6 +204,7 @@ def generate_new_question():
     st.session_state.current_question = question_text
     st.session_state.selected_numbers = []
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -237,7 +239,7 @@ def display_question():
                         # Replace first selected number
                         st.session_state.selected_numbers[0] = st.session_state.selected_numbers[1]
                         st.session_state.selected_numbers[1] = number
-                st.rerun()
+                rerun_question()
     
     # Display the sentence with selected numbers
     st.markdown("---")
@@ -276,7 +278,7 @@ def display_question():
             if st.button("✅ Submit", type="primary", use_container_width=True):
                 st.session_state.show_feedback = True
                 st.session_state.answer_submitted = True
-                st.rerun()
+                rerun_question()
         else:
             st.info("👆 Select exactly 2 numbers from the box above")
     
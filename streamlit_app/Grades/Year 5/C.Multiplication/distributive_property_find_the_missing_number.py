@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -209,6 +210,7 @@ def generate_new_question():
     st.session_state.correct_answer_dist = missing_number
     st.session_state.current_question_dist = "Use the distributive property of multiplication to find the missing number."
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data_dist
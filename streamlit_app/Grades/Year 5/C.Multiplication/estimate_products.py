@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -223,6 +224,7 @@ def round_to_nearest_thousand(num):
     """Round number to nearest thousand"""
     return round(num / 1000) * 1000
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -283,6 +284,7 @@ def generate_answer_choices(estimated_product, actual_product):
     
     return best_options
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -195,6 +196,7 @@ def generate_new_question():
     st.session_state.current_question = "Which sign makes the statement true?"
     st.session_state.selected_sign = None
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -231,21 +233,21 @@ def display_question():
         button_style = "primary" if st.session_state.selected_sign == ">" else "secondary"
         if st.button("**>**", key="greater", type=button_style, use_container_width=True):
             st.session_state.selected_sign = ">"
-            st.rerun()
+            rerun_question()
     
     with col3:
         # Less than button  
         button_style = "primary" if st.session_state.selected_sign == "<" else "secondary"
         if st.button("**<**", key="less", type=button_style, use_container_width=True):
             st.session_state.selected_sign = "<"
-            st.rerun()
+            rerun_question()
     
     with col4:
         # Equal button
         button_style = "primary" if st.session_state.selected_sign == "=" else "secondary"
         if st.button("**=**", key="equal", type=button_style, use_container_width=True):
             st.session_state.selected_sign = "="
-            st.rerun()
+            rerun_question()
     
     # Show selected statement
     if st.session_state.selected_sign:
@@ -274,7 +276,7 @@ def display_question():
             if st.button("✅ Submit", type="primary", use_container_width=True):
                 st.session_state.show_feedback = True
                 st.session_state.answer_submitted = True
-                st.rerun()
+                rerun_question()
         else:
             st.info("👆 Choose a sign (>, <, or =) above")
     
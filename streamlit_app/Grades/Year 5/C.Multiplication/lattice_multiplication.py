@@ -1,5 +1,7 @@
 import streamlit as st
 import random
+from utils.figure_cache import show_figure
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -224,6 +226,7 @@ def calculate_diagonal_sums(lattice_cells):
     
     return diagonal_sums
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -257,7 +260,7 @@ def display_question():
             st.session_state.user_diagonal_sums = diagonal_inputs
             st.session_state.show_feedback = True
             st.session_state.answer_submitted = True
-            st.rerun()
+            rerun_question()
     
     # Show feedback and next button
     handle_feedback_and_next()
@@ -288,59 +291,7 @@ def create_lattice_grid_simple(data):
                                          help="Diagonal 2 sum")
     
     with col2:
-        # Create matplotlib lattice grid (without the sum boxes)
-        import matplotlib.pyplot as plt
-        import matplotlib.patches as patches
-        
-        fig, ax = plt.subplots(1, 1, figsize=(3, 3), dpi=100)
-        ax.set_xlim(-0.5, 3.5)
-        ax.set_ylim(-0.5, 3.5)
-        ax.set_aspect('equal')
-        ax.axis('off')
-        
-        # Draw main grid
-        outer_rect = patches.Rectangle((0.5, 0.5), 2.0, 2.0, linewidth=2, edgecolor='black', facecolor='none')
-        ax.add_patch(outer_rect)
-        
-        # Internal grid lines
-        ax.plot([1.5, 1.5], [0.5, 2.5], 'k-', linewidth=1.5)  # Vertical divider
-        ax.plot([0.5, 2.5], [1.5, 1.5], 'k-', linewidth=1.5)  # Horizontal divider
-        
-        # Diagonal lines in each cell
-        ax.plot([0.5, 1.5], [1.5, 2.5], 'k-', linewidth=1)  # Top-left
-        ax.plot([1.5, 2.5], [1.5, 2.5], 'k-', linewidth=1)  # Top-right
-        ax.plot([0.5, 1.5], [0.5, 1.5], 'k-', linewidth=1)  # Bottom-left
-        ax.plot([1.5, 2.5], [0.5, 1.5], 'k-', linewidth=1)  # Bottom-right
-        
-        # Add numbers
-        # Top headers
-        ax.text(1.0, 2.7, str(data['num1_digits'][0]), ha='center', va='center', fontsize=14, fontweight='bold')
-        ax.text(2.0, 2.7, str(data['num1_digits'][1]), ha='center', va='center', fontsize=14, fontweight='bold')
-        
-        # Right headers
-        ax.text(2.7, 2.0, str(data['num2_digits'][0]), ha='center', va='center', fontsize=14, fontweight='bold')
-        ax.text(2.7, 1.0, str(data['num2_digits'][1]), ha='center', va='center', fontsize=14, fontweight='bold')
-        
-        # Cell values
-        # Top-left cell
-        ax.text(0.8, 2.2, str(tens1), ha='center', va='center', fontsize=12, fontweight='bold')
-        ax.text(1.2, 1.8, str(ones1), ha='center', va='center', fontsize=12, fontweight='bold')
-        
-        # Top-right cell
-        ax.text(1.8, 2.2, str(tens2), ha='center', va='center', fontsize=12, fontweight='bold')
-        ax.text(2.2, 1.8, str(ones2), ha='center', va='center', fontsize=12, fontweight='bold')
-        
-        # Bottom-left cell
-        ax.text(0.8, 1.2, str(tens3), ha='center', va='center', fontsize=12, fontweight='bold')
-        ax.text(1.2, 0.8, str(ones3), ha='center', va='center', fontsize=12, fontweight='bold')
-        
-        # Bottom-right cell
-        ax.text(1.8, 1.2, str(tens4), ha='center', va='center', fontsize=12, fontweight='bold')
-        ax.text(2.2, 0.8, str(ones4), ha='center', va='center', fontsize=12, fontweight='bold')
-        
-        plt.tight_layout()
-        st.pyplot(fig, use_container_width=False)
-        plt.close()
+        show_figure(draw_lattice_grid, data, width="content")
         
         # Bottom input boxes
         col_a, col_b, col_c = st.columns([1, 1, 1])
@@ -372,6 +323,66 @@ def create_lattice_grid_simple(data):
     with col4:
         st.markdown(f"**D4 (leftmost):** {tens1}")
 
+def draw_lattice_grid(data):
+    """Create the matplotlib lattice grid (without the sum boxes)"""
+    # Extract cell values for easier reference
+    tens1, ones1 = data['lattice_cells'][0][0]  # top-left
+    tens2, ones2 = data['lattice_cells'][0][1]  # top-right
+    tens3, ones3 = data['lattice_cells'][1][0]  # bottom-left
+    tens4, ones4 = data['lattice_cells'][1][1]  # bottom-right
+    
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as patches
+    
+    fig, ax = plt.subplots(1, 1, figsize=(3, 3), dpi=100)
+    ax.set_xlim(-0.5, 3.5)
+    ax.set_ylim(-0.5, 3.5)
+    ax.set_aspect('equal')
+    ax.axis('off')
+    
+    # Draw main grid
+    outer_rect = patches.Rectangle((0.5, 0.5), 2.0, 2.0, linewidth=2, edgecolor='black', facecolor='none')
+    ax.add_patch(outer_rect)
+    
+    # Internal grid lines
+    ax.plot([1.5, 1.5], [0.5, 2.5], 'k-', linewidth=1.5)  # Vertical divider
+    ax.plot([0.5, 2.5], [1.5, 1.5], 'k-', linewidth=1.5)  # Horizontal divider
+    
+    # Diagonal lines in each cell
+    ax.plot([0.5, 1.5], [1.5, 2.5], 'k-', linewidth=1)  # Top-left
+    ax.plot([1.5, 2.5], [1.5, 2.5], 'k-', linewidth=1)  # Top-right
+    ax.plot([0.5, 1.5], [0.5, 1.5], 'k-', linewidth=1)  # Bottom-left
+    ax.plot([1.5, 2.5], [0.5, 1.5], 'k-', linewidth=1)  # Bottom-right
+    
+    # Add numbers
+    # Top headers
+    ax.text(1.0, 2.7, str(data['num1_digits'][0]), ha='center', va='center', fontsize=14, fontweight='bold')
+    ax.text(2.0, 2.7, str(data['num1_digits'][1]), ha='center', va='center', fontsize=14, fontweight='bold')
+    
+    # Right headers
+    ax.text(2.7, 2.0, str(data['num2_digits'][0]), ha='center', va='center', fontsize=14, fontweight='bold')
+    ax.text(2.7, 1.0, str(data['num2_digits'][1]), ha='center', va='center', fontsize=14, fontweight='bold')
+    
+    # Cell values
+    # Top-left cell
+    ax.text(0.8, 2.2, str(tens1), ha='center', va='center', fontsize=12, fontweight='bold')
+    ax.text(1.2, 1.8, str(ones1), ha='center', va='center', fontsize=12, fontweight='bold')
+    
+    # Top-right cell
+    ax.text(1.8, 2.2, str(tens2), ha='center', va='center', fontsize=12, fontweight='bold')
+    ax.text(2.2, 1.8, str(ones2), ha='center', va='center', fontsize=12, fontweight='bold')
+    
+    # Bottom-left cell
+    ax.text(0.8, 1.2, str(tens3), ha='center', va='center', fontsize=12, fontweight='bold')
+    ax.text(1.2, 0.8, str(ones3), ha='center', va='center', fontsize=12, fontweight='bold')
+    
+    # Bottom-right cell
+    ax.text(1.8, 1.2, str(tens4), ha='center', va='center', fontsize=12, fontweight='bold')
+    ax.text(2.2, 0.8, str(ones4), ha='center', va='center', fontsize=12, fontweight='bold')
+    
+    plt.tight_layout()
+    return fig
+
 def handle_feedback_and_next():
     """Handle feedback display and next question button"""
     # Show feedback if answer was submitted
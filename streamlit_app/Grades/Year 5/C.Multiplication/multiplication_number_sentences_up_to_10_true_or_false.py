@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -223,6 +224,7 @@ def get_factor_pairs(number, max_factor):
                 pairs.append((i, j))
     return pairs
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -230,6 +231,7 @@ def generate_new_question():
         elif eq['missing'] == 'factor1':
             st.session_state.correct_answers[f'answer_{i}'] = eq['factor1']
 
+@question_fragment
 def display_question():
     """Display the current pattern question"""
     data = st.session_state.question_data
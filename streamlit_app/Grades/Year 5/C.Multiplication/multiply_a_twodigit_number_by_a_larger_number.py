@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -159,6 +160,7 @@ def generate_new_question():
     st.session_state.correct_answer = correct_answer
     st.session_state.current_question = f"Multiply: {num1} × {num2}"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -191,7 +193,7 @@ def display_question():
             
             st.session_state.show_feedback = True
             st.session_state.answer_submitted = True
-            st.rerun()
+            rerun_question()
     
     # Show feedback and next button
     handle_feedback_and_next()
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -254,6 +255,7 @@ def generate_missing_positions(multiplication_data, difficulty):
     
     return missing_positions
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -283,7 +285,7 @@ def display_question():
             
             st.session_state.show_feedback = True
             st.session_state.answer_submitted = True
-            st.rerun()
+            rerun_question()
     
     # Show feedback and next button
     handle_feedback_and_next()
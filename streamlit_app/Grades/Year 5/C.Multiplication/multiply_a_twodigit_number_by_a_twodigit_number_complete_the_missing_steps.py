@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -205,6 +206,7 @@ def generate_new_question():
     
     st.session_state.current_question = f"Fill in the missing numbers to complete the multiplication!"
 
+@question_fragment
 def display_question():
     """Display the multiplication problem with missing steps"""
     data = st.session_state.question_data
@@ -515,7 +517,7 @@ def show_step_by_step_solution():
     
     if st.button("❌ Close Step-by-Step Help"):
         st.session_state.show_step_solution = False
-        st.rerun()
+        rerun_question()
 
 def handle_feedback_and_next():
     """Handle feedback display and next question button"""
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -217,6 +218,7 @@ def generate_new_question():
     # Final answer is always required
     st.session_state.correct_answers["final"] = final_answer
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
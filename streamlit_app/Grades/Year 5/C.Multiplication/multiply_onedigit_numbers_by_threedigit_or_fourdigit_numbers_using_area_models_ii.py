@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -205,6 +206,7 @@ def break_down_number(number):
     
     return breakdown
 
+@question_fragment
 def display_question():
     """Display the interactive area model question"""
     data = st.session_state.question_data
@@ -263,7 +265,7 @@ def display_step1_partial_products(data):
             if all_correct:
                 st.success("🎉 **Great! All areas are correct!**")
                 st.session_state.step = 2
-                st.rerun()
+                rerun_question()
             else:
                 st.error("❌ **Some areas are incorrect. Check your calculations.**")
                 show_partial_feedback(data, partial_inputs)
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -260,6 +261,7 @@ def break_down_to_expanded_form(number):
     
     return parts
 
+@question_fragment
 def display_question():
     """Display the expanded form multiplication question - handles both types"""
     data = st.session_state.question_data
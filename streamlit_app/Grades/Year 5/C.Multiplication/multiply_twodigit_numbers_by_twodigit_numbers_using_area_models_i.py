@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -292,6 +293,7 @@ def create_area_model_visual(model_data, show_products=False):
     if show_products:
         st.markdown(f"**Calculation:** {tl} + {tr} + {bl} + {br} = **{tl + tr + bl + br}**")
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -212,6 +213,7 @@ def generate_new_question():
     
     st.session_state.current_question = f"Fill in the missing numbers to complete the partial products multiplication!"
 
+@question_fragment
 def display_question():
     """Display the current question interface with enhanced visuals"""
     data = st.session_state.question_data
@@ -589,7 +591,7 @@ def show_interactive_step_solution():
     # Close step-by-step when done
     if st.button("❌ Close Step-by-Step Help"):
         st.session_state.show_step_solution = False
-        st.rerun()
+        rerun_question()
 
 def handle_feedback_and_next():
     """Handle feedback display and next question button - FIXED VERSION"""
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -170,6 +171,7 @@ def generate_new_question():
     
     st.session_state.current_question_mult = f"Multiply using the distributive property:"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data_mult
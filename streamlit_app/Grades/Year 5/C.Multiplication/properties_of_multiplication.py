@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -233,6 +234,7 @@ def generate_new_question():
         st.session_state.correct_answer = correct_equation
         st.session_state.current_question = f"Which equation shows the {target_property} property of multiplication?"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -154,6 +155,7 @@ def generate_quotient_problem():
     st.session_state.quotient_answer = problem["answer"]
     st.session_state.current_quotient_problem = f"Choose two numbers that have a quotient of {problem['quotient']}"
 
+@question_fragment
 def display_quotient_problem():
     """Display the current quotient problem interface"""
     data = st.session_state.quotient_data
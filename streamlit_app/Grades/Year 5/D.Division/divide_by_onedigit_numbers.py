@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -133,6 +134,7 @@ def generate_new_division():
     st.session_state.correct_remainder = remainder
     st.session_state.current_division = f"{dividend} ÷ {divisor}"
 
+@question_fragment
 def display_division_question():
     """Display the current division question interface"""
     data = st.session_state.division_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -313,6 +314,7 @@ def generate_new_remainder_problem():
     st.session_state.correct_remainder_answer = remainder
     st.session_state.current_remainder_problem = problem_text
 
+@question_fragment
 def display_remainder_problem():
     """Display the current remainder problem interface"""
     data = st.session_state.remainder_problem_data
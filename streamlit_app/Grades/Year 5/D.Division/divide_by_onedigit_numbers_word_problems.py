@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -285,6 +286,7 @@ def generate_new_word_problem():
     st.session_state.correct_answer = correct_answer
     st.session_state.current_problem = problem_text
 
+@question_fragment
 def display_word_problem():
     """Display the current word problem interface"""
     data = st.session_state.problem_data
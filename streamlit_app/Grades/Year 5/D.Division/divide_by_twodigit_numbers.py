@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -189,6 +190,7 @@ def generate_two_digit_problem():
     st.session_state.two_digit_remainder = remainder
     st.session_state.current_two_digit_problem = f"Divide {problem['dividend']} by {problem['divisor']}"
 
+@question_fragment
 def display_two_digit_problem():
     """Display the current two-digit division problem interface"""
     data = st.session_state.two_digit_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -158,6 +159,7 @@ def generate_divide_question():
     st.session_state.divide_correct_answer = correct_answer
     st.session_state.current_divide_question = f"What is {dividend:,} ÷ {divisor:,}?"
 
+@question_fragment
 def display_divide_question():
     """Display the current division question interface"""
     data = st.session_state.divide_question_data
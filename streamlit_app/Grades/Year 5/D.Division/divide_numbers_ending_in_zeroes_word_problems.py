@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -225,6 +226,7 @@ def generate_word_problem():
     st.session_state.word_problem_answer = problem["answer"]
     st.session_state.current_word_problem = problem["scenario"]
 
+@question_fragment
 def display_word_problem():
     """Display the current word problem interface"""
     data = st.session_state.word_problem_data
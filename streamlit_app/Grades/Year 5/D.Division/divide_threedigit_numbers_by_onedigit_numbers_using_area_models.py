@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -187,6 +188,7 @@ def generate_new_question():
     
     st.session_state.current_question = f"Use the model to find {dividend} ÷ {divisor}."
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -114,6 +115,7 @@ def generate_new_problem():
     }
     st.session_state.current_problem = f"Solve {dividend} ÷ {divisor} using long division."
 
+@question_fragment
 def display_problem():
     """Display the current problem interface"""
     data = st.session_state.problem_data
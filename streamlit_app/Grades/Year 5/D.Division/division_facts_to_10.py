@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -162,6 +163,7 @@ def generate_new_question():
     st.session_state.correct_answer = quotient
     st.session_state.current_question = "Solve the division problem:"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -277,8 +278,8 @@ def generate_sentence_by_type(sentence_type, should_be_true, divisors, max_divid
             minuend = quotient + random.randint(1, 5)
             subtrahend = minuend - quotient
         else:
-            # Make subtraction different
-            minuend = random.randint(quotient + 1, quotient + 6)
+            # Make subtraction different; quotient + 1 would leave only 1 as a subtrahend
+            minuend = random.randint(quotient + 2, quotient + 6)
             subtrahend = random.randint(1, minuend - 1)
             while minuend - subtrahend == quotient:
                 subtrahend = random.randint(1, minuend - 1)
@@ -299,6 +300,7 @@ def generate_new_question():
     st.session_state.current_question = "Is the number sentence true or false?"
     st.session_state.selected_answer = None
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -330,12 +332,12 @@ def display_question():
     with col1:
         if st.button("true", key="true_btn", type="primary" if st.session_state.selected_answer == True else "secondary", use_container_width=True):
             st.session_state.selected_answer = True
-            st.rerun()
+            rerun_question()
     
     with col2:
         if st.button("false", key="false_btn", type="primary" if st.session_state.selected_answer == False else "secondary", use_container_width=True):
             st.session_state.selected_answer = False
-            st.rerun()
+            rerun_question()
     
     # Submit button
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -344,7 +346,7 @@ def display_question():
             if st.button("✅ Submit", type="primary", use_container_width=True):
                 st.session_state.show_feedback = True
                 st.session_state.answer_submitted = True
-                st.rerun()
+                rerun_question()
         else:
             st.info("👆 Choose true or false above")
     
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -218,6 +219,7 @@ def generate_new_pattern_problem():
     st.session_state.correct_pattern_answers = correct_answers
     st.session_state.current_pattern_problem = "Complete the pattern:"
 
+@question_fragment
 def display_pattern_problem():
     """Display the current pattern problem interface"""
     data = st.session_state.pattern_problem_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -268,6 +269,7 @@ def generate_new_estimate_problem():
     st.session_state.correct_estimate_answer = correct_answer
     st.session_state.current_estimate_problem = problem_text
 
+@question_fragment
 def display_estimate_problem():
     """Display the current estimation problem interface"""
     data = st.session_state.estimate_problem_data
@@ -331,14 +333,14 @@ def display_estimate_problem():
                 st.session_state.user_estimate_answer = ">"
                 st.session_state.show_estimate_feedback = True
                 st.session_state.estimate_answer_submitted = True
-                st.rerun()
+                rerun_question()
         
         with col2:
             if st.button(f"👇 {data['number1']:,} is LESS", use_container_width=True, type="secondary", key="less_than_btn"):
                 st.session_state.user_estimate_answer = "<"
                 st.session_state.show_estimate_feedback = True
                 st.session_state.estimate_answer_submitted = True
-                st.rerun()
+                rerun_question()
     
     elif question_type == "multiple_choice":
         # Multiple choice problem
@@ -386,7 +388,7 @@ def display_estimate_problem():
                     st.session_state.user_estimate_answer = option
                     st.session_state.show_estimate_feedback = True
                     st.session_state.estimate_answer_submitted = True
-                    st.rerun()
+                    rerun_question()
     
     else:
         # Direct estimation problem
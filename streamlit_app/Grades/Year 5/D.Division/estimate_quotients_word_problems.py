@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -326,6 +327,7 @@ def generate_new_estimate_word_problem():
     st.session_state.correct_estimate_word_answer = best_estimate
     st.session_state.current_estimate_word_problem = problem_text
 
+@question_fragment
 def display_estimate_word_problem():
     """Display the current estimation word problem interface"""
     data = st.session_state.estimate_word_problem_data
@@ -385,7 +387,7 @@ def display_estimate_word_problem():
                 st.session_state.user_estimate_word_answer = option
                 st.session_state.show_estimate_word_feedback = True
                 st.session_state.estimate_word_answer_submitted = True
-                st.rerun()
+                rerun_question()
     
     # Show feedback and next button
     handle_estimate_word_feedback_and_next()
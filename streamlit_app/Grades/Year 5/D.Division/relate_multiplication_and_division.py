@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -156,6 +157,7 @@ def generate_new_question():
     st.session_state.correct_answer = correct_answer
     st.session_state.current_question = "Find the missing number:"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
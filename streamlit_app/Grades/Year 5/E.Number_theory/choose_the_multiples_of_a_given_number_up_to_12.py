@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -222,6 +223,7 @@ def generate_multiples_problem():
     st.session_state.multiples_answers = set(final_correct)
     st.session_state.current_multiples_problem = f"Which of the following numbers are multiples of {base_number}?"
 
+@question_fragment
 def display_multiples_problem():
     """Display the current multiples problem with clickable tiles"""
     data = st.session_state.multiples_data
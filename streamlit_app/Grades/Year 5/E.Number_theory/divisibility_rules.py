@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -211,6 +212,7 @@ def generate_div_problem():
     st.session_state.div_answer = "yes" if problem["correct"] else "no"
     st.session_state.current_div_problem = f"Is {problem['number']:,} divisible by {problem['divisor']}?"
 
+@question_fragment
 def display_div_problem():
     """Display the current divisibility problem with yes/no clickable tiles"""
     data = st.session_state.div_data
@@ -263,7 +265,7 @@ def display_div_problem():
                 help="Click to select: yes"
             ):
                 st.session_state.div_selected_option = "yes"
-                st.rerun()
+                rerun_question()
         
         with no_col:
             # Determine if "no" is selected
@@ -279,7 +281,7 @@ def display_div_problem():
                 help="Click to select: no"
             ):
                 st.session_state.div_selected_option = "no"
-                st.rerun()
+                rerun_question()
     
     with col3:
         pass  # Empty column for spacing
@@ -307,7 +309,7 @@ def display_div_problem():
         st.session_state.div_user_answer = st.session_state.div_selected_option
         st.session_state.div_feedback = True
         st.session_state.div_submitted = True
-        st.rerun()
+        rerun_question()
     
     # Show feedback and next button
     handle_div_feedback()
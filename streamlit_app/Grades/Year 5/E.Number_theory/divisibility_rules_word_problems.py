@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -316,6 +317,7 @@ def generate_div_word_problem():
     st.session_state.div_word_answer = problem["correct"]
     st.session_state.current_div_word_problem = problem["story"]
 
+@question_fragment
 def display_div_word_problem():
     """Display the current divisibility word problem with clickable tiles"""
     data = st.session_state.div_word_data
@@ -366,7 +368,7 @@ def display_div_word_problem():
                 help=f"Click to select: {option}"
             ):
                 st.session_state.div_word_selected_option = option
-                st.rerun()
+                rerun_question()
     
     # Show current selection status
     st.markdown("")
@@ -391,7 +393,7 @@ def display_div_word_problem():
         st.session_state.div_word_user_answer = st.session_state.div_word_selected_option
         st.session_state.div_word_feedback = True
         st.session_state.div_word_submitted = True
-        st.rerun()
+        rerun_question()
     
     # Show feedback and next button
     handle_div_word_feedback()
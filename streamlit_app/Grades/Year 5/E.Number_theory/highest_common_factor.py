@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import math
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -246,6 +247,7 @@ def generate_hcf_problem():
         numbers_text = ", ".join(map(str, problem["numbers"][:-1])) + f" and {problem['numbers'][-1]}"
         st.session_state.current_hcf_problem = f"What is the highest common factor of {numbers_text}?"
 
+@question_fragment
 def display_hcf_problem():
     """Display the current HCF problem with text input"""
     data = st.session_state.hcf_data
@@ -302,7 +304,7 @@ def display_hcf_problem():
                     st.session_state.hcf_user_answer = user_answer
                     st.session_state.hcf_feedback = True
                     st.session_state.hcf_submitted = True
-                    st.rerun()
+                    rerun_question()
                 except ValueError:
                     st.error("Please enter a valid number!")
             else:
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -175,6 +176,7 @@ def generate_factors_problem():
     st.session_state.factors_answer = problem["correct"]
     st.session_state.current_factors_problem = f"Which number is a factor of {problem['target']}?"
 
+@question_fragment
 def display_factors_problem():
     """Display the current factors problem interface"""
     data = st.session_state.factors_data
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import math
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -274,6 +275,7 @@ def generate_lcm_problem():
         numbers_text = ", ".join(map(str, numbers[:-1])) + f" and {numbers[-1]}"
         st.session_state.current_lcm_problem = f"What is the lowest common multiple of {numbers_text}?"
 
+@question_fragment
 def display_lcm_problem():
     """Display the current LCM problem with text input"""
     data = st.session_state.lcm_data
@@ -330,7 +332,7 @@ def display_lcm_problem():
                     st.session_state.lcm_user_answer = user_answer
                     st.session_state.lcm_feedback = True
                     st.session_state.lcm_submitted = True
-                    st.rerun()
+                    rerun_question()
                 except ValueError:
                     st.error("Please enter a valid number!")
             else:
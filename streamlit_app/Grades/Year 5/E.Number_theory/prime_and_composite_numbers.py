@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -183,6 +184,7 @@ def generate_prime_problem():
     st.session_state.prime_answer = problem["type"]
     st.session_state.current_prime_problem = f"Is {problem['number']} a prime number or a composite number?"
 
+@question_fragment
 def display_prime_problem():
     """Display the current prime/composite problem interface"""
     data = st.session_state.prime_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -295,6 +296,7 @@ def generate_prime_fact_problem():
     st.session_state.prime_fact_answer = problem["correct"]
     st.session_state.current_prime_fact_problem = f"What is the prime factorisation of {problem['number']}?"
 
+@question_fragment
 def display_prime_fact_problem():
     """Display the current prime factorisation problem interface with clickable tiles"""
     data = st.session_state.prime_fact_data
@@ -334,7 +336,7 @@ def display_prime_fact_problem():
                 help=f"Click to select: {option}"
             ):
                 st.session_state.prime_fact_selected_option = option
-                st.rerun()
+                rerun_question()
     
     # Show current selection status
     st.markdown("")
@@ -359,7 +361,7 @@ def display_prime_fact_problem():
         st.session_state.prime_fact_user_answer = st.session_state.prime_fact_selected_option
         st.session_state.prime_fact_feedback = True
         st.session_state.prime_fact_submitted = True
-        st.rerun()
+        rerun_question()
     
     # Show feedback and next button
     handle_prime_fact_feedback()
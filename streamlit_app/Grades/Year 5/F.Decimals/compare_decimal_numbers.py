@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -193,6 +194,7 @@ def generate_new_question():
     st.session_state.correct_answer = correct_answer
     st.session_state.current_question = "Which sign makes the statement true?"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -241,7 +243,7 @@ def display_question():
             st.session_state.selected_comparison = ">"
             st.session_state.show_feedback = True
             st.session_state.answer_submitted = True
-            st.rerun()
+            rerun_question()
     
     with col3:
         if st.button("Less\n(<)", key="less_btn", use_container_width=True,
@@ -249,7 +251,7 @@ def display_question():
             st.session_state.selected_comparison = "<"
             st.session_state.show_feedback = True
             st.session_state.answer_submitted = True
-            st.rerun()
+            rerun_question()
     
     with col4:
         if st.button("Equal\n(=)", key="equal_btn", use_container_width=True,
@@ -257,7 +259,7 @@ def display_question():
             st.session_state.selected_comparison = "="
             st.session_state.show_feedback = True
             st.session_state.answer_submitted = True
-            st.rerun()
+            rerun_question()
     
     # Show selected answer
     if st.session_state.selected_comparison:
@@ -2,6 +2,7 @@ import streamlit as st
 import random
 from fractions import Fraction
 from decimal import Decimal
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -182,6 +183,7 @@ def generate_new_question():
     st.session_state.current_question = "Which sign makes the statement true?"
     st.session_state.selected_answer = None
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -292,19 +294,19 @@ def display_question():
             if st.button("&gt;", key="greater", use_container_width=True, 
                         help="Greater than"):
                 st.session_state.selected_answer = ">"
-                st.rerun()
+                rerun_question()
         
         with col2:
             if st.button("&lt;", key="less", use_container_width=True,
                         help="Less than"):
                 st.session_state.selected_answer = "<"
-                st.rerun()
+                rerun_question()
         
         with col3:
             if st.button("=", key="equal", use_container_width=True,
                         help="Equal to"):
                 st.session_state.selected_answer = "="
-                st.rerun()
+                rerun_question()
     
     # Show selected answer feedback
     if st.session_state.selected_answer:
@@ -321,7 +323,7 @@ def display_question():
                 st.session_state.user_answer = st.session_state.selected_answer
                 st.session_state.show_feedback = True
                 st.session_state.answer_submitted = True
-                st.rerun()
+                rerun_question()
     
     # Show feedback if answer was submitted
     if st.session_state.show_feedback:
@@ -2,9 +2,8 @@ import streamlit as st
 import random
 import math
 from fractions import Fraction
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-import numpy as np
+from utils.number_line import number_line_svg
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -193,6 +192,7 @@ def generate_new_question():
     st.session_state.correct_answer = correct_answer
     st.session_state.current_question = f"Graph the numbers on the number line and answer: {question_text}"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -265,7 +265,7 @@ def display_interactive_number_line():
             if st.button("🔄 Clear All Plots", use_container_width=True):
                 st.session_state.user_plots = {}
                 st.session_state.plots_complete = False
-                st.rerun()
+                rerun_question()
 
 def create_interactive_number_line_with_clicks(points, current_num):
     """Create an interactive number line with clickable areas"""
@@ -294,102 +294,33 @@ def create_interactive_number_line_with_clicks(points, current_num):
                 if len(st.session_state.user_plots) == len(data["numbers"]):
                     st.session_state.plots_complete = True
                 
-                st.rerun()
+                rerun_question()
 
 def create_number_line_svg():
-    """Create beautiful matplotlib visualization of the number line with plots"""
+    """Draw the number line with the student's plotted numbers"""
     data = st.session_state.question_data
     range_min, range_max = data["range"]
-    step = data["step"]
-    
-    # Calculate points on the number line
-    points = []
-    current = range_min
-    while current <= range_max + 0.001:
-        points.append(round(current, 2))
-        current += step
-    
-    # Create figure with better styling
-    plt.style.use('default')
-    fig, ax = plt.subplots(1, 1, figsize=(14, 4))
-    fig.patch.set_facecolor('#f8f9fa')
-    
-    # Draw the main number line with gradient effect
-    line_y = 0
-    ax.plot([range_min, range_max], [line_y, line_y], 
-            color='#2c3e50', linewidth=4, solid_capstyle='round', zorder=2)
-    
-    # Add subtle shadow under the line
-    ax.plot([range_min, range_max], [line_y - 0.02, line_y - 0.02], 
-            color='#bdc3c7', linewidth=6, solid_capstyle='round', alpha=0.3, zorder=1)
-    
-    # Add tick marks with better styling
-    for point in points:
-        # Main tick marks
-        ax.plot([point, point], [line_y - 0.08, line_y + 0.08], 
-                color='#34495e', linewidth=3, solid_capstyle='round', zorder=3)
-        
-        # Tick labels with better typography
-        ax.text(point, line_y - 0.18, str(point), 
-                ha='center', va='top', fontsize=13, fontweight='600',
-                color='#2c3e50', family='sans-serif')
-    
-    # Add plotted points with beautiful styling
+
+    # Plotted numbers as coloured dots with a tag above
     colors = ['#e74c3c', '#3498db', '#f39c12', '#27ae60']  # Modern flat colors
-    color_names = ['Red', 'Blue', 'Orange', 'Green']
-    
-    for i, (number_text, plotted_value) in enumerate(st.session_state.user_plots.items()):
-        color = colors[i % len(colors)]
-        
-        # Draw point with glow effect
-        ax.plot(plotted_value, line_y, 'o', color=color, markersize=16, 
-                markeredgecolor='white', markeredgewidth=3, zorder=5)
-        ax.plot(plotted_value, line_y, 'o', color=color, markersize=20, 
-                alpha=0.3, zorder=4)  # Glow effect
-        
-        # Add elegant label above the point
-        label_y = line_y + 0.25
-        ax.text(plotted_value, label_y, number_text, 
-                ha='center', va='bottom', fontsize=14, fontweight='bold', 
-                color='white', family='sans-serif',
-                bbox=dict(boxstyle="round,pad=0.4", facecolor=color, 
-                         edgecolor='white', linewidth=2, alpha=0.9),
-                zorder=6)
-        
-        # Add connecting line from point to label
-        ax.plot([plotted_value, plotted_value], [line_y + 0.08, label_y - 0.05], 
-                color=color, linewidth=2, alpha=0.7, zorder=4)
-    
-    # Add arrow ends to the number line
-    arrow_size = 0.06
-    # Left arrow
-    ax.annotate('', xy=(range_min - 0.05, line_y), 
-                xytext=(range_min + 0.05, line_y),
-                arrowprops=dict(arrowstyle='->', color='#2c3e50', lw=3))
-    # Right arrow  
-    ax.annotate('', xy=(range_max + 0.05, line_y), 
-                xytext=(range_max - 0.05, line_y),
-                arrowprops=dict(arrowstyle='->', color='#2c3e50', lw=3))
-    
-    # Set up the plot with better margins and styling
-    margin = (range_max - range_min) * 0.15
-    ax.set_xlim(range_min - margin, range_max + margin)
-    ax.set_ylim(-0.4, 0.5)
-    ax.set_aspect('equal')
-    ax.axis('off')
-    
-    # Add title with better styling
-    ax.text((range_min + range_max) / 2, 0.4, 'Number Line', 
-            ha='center', va='bottom', fontsize=18, fontweight='bold',
-            color='#2c3e50', family='sans-serif')
-    
-    # Adjust layout for better appearance
-    plt.tight_layout()
-    
-    # Display the plot
-    st.pyplot(fig, use_container_width=True)
-    plt.close()
-    
+    plotted = [
+        {"value": plotted_value, "label": number_text, "color": colors[i % len(colors)],
+         "stroke": "white", "tag": True, "label_gap": 30}
+        for i, (number_text, plotted_value) in enumerate(st.session_state.user_plots.items())
+    ]
+
+    svg = number_line_svg(
+        range_min, range_max, data["step"], points=plotted,
+        width=1000, height=170, margin=60, line_y=100, responsive=True,
+        line_color="#2c3e50", line_width=4, overhang=30, arrows="both",
+        minor_tick=8, minor_tick_width=3, minor_tick_color="#34495e",
+        major_tick=8, major_tick_width=3, major_tick_color="#34495e",
+        labels="all", label_offset=35, label_color="#2c3e50",
+        major_label_size=18, minor_label_size=18, major_label_weight="600",
+    )
+    st.markdown(f'<div style="background: #f8f9fa; border-radius: 10px; padding: 10px 0;">{svg}</div>',
+                unsafe_allow_html=True)
+
     # Show plotted numbers summary with better styling
     if st.session_state.user_plots:
         st.markdown("### 📍 **Plotted Numbers**")
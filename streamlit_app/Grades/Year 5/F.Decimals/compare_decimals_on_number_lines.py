@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import streamlit.components.v1 as components
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -366,6 +367,7 @@ def create_interactive_number_line(start, end, step):
     
     return html_content
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -396,7 +398,7 @@ def display_question():
         # Continue button (appears after plotting)
         if st.button("✅ Continue to Question", type="primary"):
             st.session_state.plotting_complete = True
-            st.rerun()
+            rerun_question()
     
     else:
         # Show the comparison question and answer options
@@ -411,7 +413,7 @@ def display_question():
                 st.session_state.selected_option = data['decimal1']
                 st.session_state.show_feedback = True
                 st.session_state.answer_submitted = True
-                st.rerun()
+                rerun_question()
         
         with col2:
             if st.button(f"{data['decimal2']}", key="option_2", use_container_width=True,
@@ -419,7 +421,7 @@ def display_question():
                 st.session_state.selected_option = data['decimal2']
                 st.session_state.show_feedback = True
                 st.session_state.answer_submitted = True
-                st.rerun()
+                rerun_question()
         
         # Show selected answer
         if st.session_state.selected_option:
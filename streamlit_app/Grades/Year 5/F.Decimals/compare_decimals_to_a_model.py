@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import streamlit.components.v1 as components
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -356,6 +357,7 @@ def create_decimal_model_svg(decimal_value, model_type):
     
     return svg
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -410,7 +412,7 @@ def display_answer_options():
             st.session_state.selected_option = options[0]
             st.session_state.show_feedback = True
             st.session_state.answer_submitted = True
-            st.rerun()
+            rerun_question()
         
         # Third option
         if len(options) > 2:
@@ -419,7 +421,7 @@ def display_answer_options():
                 st.session_state.selected_option = options[2]
                 st.session_state.show_feedback = True
                 st.session_state.answer_submitted = True
-                st.rerun()
+                rerun_question()
     
     with col2:
         # Second option
@@ -429,7 +431,7 @@ def display_answer_options():
                 st.session_state.selected_option = options[1]
                 st.session_state.show_feedback = True
                 st.session_state.answer_submitted = True
-                st.rerun()
+                rerun_question()
         
         # Fourth option
         if len(options) > 3:
@@ -438,7 +440,7 @@ def display_answer_options():
                 st.session_state.selected_option = options[3]
                 st.session_state.show_feedback = True
                 st.session_state.answer_submitted = True
-                st.rerun()
+                rerun_question()
     
     # Show selected answer
     if st.session_state.selected_option:
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import streamlit.components.v1 as components
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -242,6 +243,7 @@ def create_decimal_model_svg(decimal_value, model_type, side="left"):
     
     return svg
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -1,6 +1,9 @@
 import streamlit as st
 import random
-import pandas as pd
+from utils.lazy_imports import lazy_import
+from utils.fragments import question_fragment, rerun_question
+
+pd = lazy_import("pandas")
 
 def run():
     """
@@ -720,6 +723,7 @@ def generate_order_weights_question():
         "question_type": "order_weights"
     }
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -818,7 +822,7 @@ def display_question():
                 st.session_state.answer_submitted = True
                 if 'selected_answer' in st.session_state:
                     del st.session_state.selected_answer
-                st.rerun()
+                rerun_question()
     
     # Show feedback and next button
     handle_feedback_and_next()
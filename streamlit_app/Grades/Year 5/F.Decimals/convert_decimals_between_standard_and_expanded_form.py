@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from fractions import Fraction
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -321,6 +322,7 @@ def generate_conversion_distractors(terms, correct_answer):
     
     return distractors[:3]
 
+@question_fragment
 def display_convert_question():
     """Display the current conversion question with clickable tiles"""
     data = st.session_state.convert_question_data
@@ -384,7 +386,7 @@ def display_conversion_tiles(data):
                     use_container_width=True
                 ):
                     st.session_state.selected_convert_tile = option
-                    st.rerun()
+                    rerun_question()
     
     # Submit button
     st.markdown("<br>", unsafe_allow_html=True)
@@ -395,7 +397,7 @@ def display_conversion_tiles(data):
                 st.session_state.convert_user_answer = st.session_state.selected_convert_tile
                 st.session_state.convert_show_feedback = True
                 st.session_state.convert_answer_submitted = True
-                st.rerun()
+                rerun_question()
             else:
                 st.warning("⚠️ Please select an answer first!")
 
@@ -2,6 +2,7 @@ import streamlit as st
 import random
 from fractions import Fraction
 import re
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -240,6 +241,7 @@ def parse_user_fraction(user_input):
     
     raise ValueError("Invalid fraction format")
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -292,7 +294,7 @@ def display_question():
                         st.session_state.user_answer = user_fraction
                         st.session_state.show_feedback = True
                         st.session_state.answer_submitted = True
-                        st.rerun()
+                        rerun_question()
                     except ValueError as e:
                         st.error(f"❌ Please enter a valid fraction (e.g., 1/2 or 2 1/4)")
                 else:
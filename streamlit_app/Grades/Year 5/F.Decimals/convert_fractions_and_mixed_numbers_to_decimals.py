@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from fractions import Fraction
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -218,6 +219,7 @@ def generate_mixed_number_question():
         "question_type": "mixed_number"
     }
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -270,7 +272,7 @@ def display_question():
                         st.session_state.user_answer = user_answer
                         st.session_state.show_feedback = True
                         st.session_state.answer_submitted = True
-                        st.rerun()
+                        rerun_question()
                     except ValueError:
                         st.error("❌ Please enter a valid decimal number (e.g., 0.25)")
                 else:
@@ -1,5 +1,7 @@
 import streamlit as st
 import random
+from utils.number_line import number_line_svg
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -174,66 +176,14 @@ def generate_new_question():
 
 def create_number_line_svg(data):
     """Create an SVG number line with the marked point"""
-    start = data["start"]
-    end = data["end"]
-    step = data["step"]
-    point_value = data["point_value"]
-    point_letter = data["point_letter"]
-    
-    # SVG dimensions
-    width = 600
-    height = 120
-    margin = 50
-    line_width = width - 2 * margin
-    
-    # Calculate positions
-    total_range = end - start
-    
-    # Create tick marks
-    ticks = []
-    labels = []
-    
-    # Major ticks at start and end
-    ticks.append(f'<line x1="{margin}" y1="50" x2="{margin}" y2="70" stroke="#333" stroke-width="2"/>')
-    labels.append(f'<text x="{margin}" y="90" text-anchor="middle" font-size="14" fill="#333">{start}</text>')
-    
-    ticks.append(f'<line x1="{margin + line_width}" y1="50" x2="{margin + line_width}" y2="70" stroke="#333" stroke-width="2"/>')
-    labels.append(f'<text x="{margin + line_width}" y="90" text-anchor="middle" font-size="14" fill="#333">{end}</text>')
-    
-    # Add intermediate ticks
-    num_divisions = int(total_range / step)
-    for i in range(1, num_divisions):
-        x_pos = margin + (i * step / total_range) * line_width
-        ticks.append(f'<line x1="{x_pos}" y1="55" x2="{x_pos}" y2="65" stroke="#666" stroke-width="1"/>')
-    
-    # Mark the point
-    point_x = margin + ((point_value - start) / total_range) * line_width
-    point_mark = f'<line x1="{point_x}" y1="40" x2="{point_x}" y2="80" stroke="#007acc" stroke-width="3"/>'
-    point_label = f'<text x="{point_x}" y="35" text-anchor="middle" font-size="16" font-weight="bold" fill="#007acc">{point_letter}</text>'
-    
-    # Create the complete SVG
-    svg = f'''
-    <svg width="{width}" height="{height}" viewBox="0 0 {width} {height}">
-        <!-- Main line -->
-        <line x1="{margin}" y1="60" x2="{margin + line_width}" y2="60" stroke="#333" stroke-width="3"/>
-        
-        <!-- Arrow -->
-        <polygon points="{margin + line_width},{60} {margin + line_width - 8},{55} {margin + line_width - 8},{65}" fill="#333"/>
-        
-        <!-- Ticks -->
-        {chr(10).join(ticks)}
-        
-        <!-- Point marker -->
-        {point_mark}
-        {point_label}
-        
-        <!-- Labels -->
-        {chr(10).join(labels)}
-    </svg>
-    '''
-    
-    return svg
+    return number_line_svg(
+        data["start"], data["end"], data["step"],
+        points=[{"value": data["point_value"], "label": data["point_letter"], "marker": "bar",
+                 "label_size": 16}],
+        major_ticks="ends", line_width=3, minor_tick=5,
+    )
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -372,6 +373,7 @@ def generate_equivalent_distractors(given_number, correct_answer):
     
     return distractors[:3]
 
+@question_fragment
 def display_equivalent_question():
     """Display the current equivalent decimals question"""
     data = st.session_state.equivalent_question_data
@@ -420,7 +422,7 @@ def display_find_equivalent_tiles(data):
                     use_container_width=True
                 ):
                     st.session_state.selected_equivalent_tile = option
-                    st.rerun()
+                    rerun_question()
     
     # Submit button
     st.markdown("<br>", unsafe_allow_html=True)
@@ -431,7 +433,7 @@ def display_find_equivalent_tiles(data):
                 st.session_state.equivalent_user_answer = st.session_state.selected_equivalent_tile
                 st.session_state.equivalent_show_feedback = True
                 st.session_state.equivalent_answer_submitted = True
-                st.rerun()
+                rerun_question()
             else:
                 st.warning("⚠️ Please select an answer first!")
 
@@ -453,7 +455,7 @@ def display_yes_no_tiles(data):
             use_container_width=True
         ):
             st.session_state.selected_equivalent_tile = "yes"
-            st.rerun()
+            rerun_question()
     
     with col2:
         is_selected_no = st.session_state.get("selected_equivalent_tile") == "no"
@@ -466,7 +468,7 @@ def display_yes_no_tiles(data):
             use_container_width=True
         ):
             st.session_state.selected_equivalent_tile = "no"
-            st.rerun()
+            rerun_question()
     
     # Submit button
     st.markdown("<br>", unsafe_allow_html=True)
@@ -477,7 +479,7 @@ def display_yes_no_tiles(data):
                 st.session_state.equivalent_user_answer = st.session_state.selected_equivalent_tile
                 st.session_state.equivalent_show_feedback = True
                 st.session_state.equivalent_answer_submitted = True
-                st.rerun()
+                rerun_question()
             else:
                 st.warning("⚠️ Please select an answer first!")
 
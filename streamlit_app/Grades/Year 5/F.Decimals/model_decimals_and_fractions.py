@@ -2,6 +2,7 @@ import streamlit as st
 import streamlit.components.v1 as components
 import random
 import json
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -184,6 +185,7 @@ def generate_model_df_problem():
     st.session_state.model_df_feedback = False
     st.session_state.model_df_submitted = False
 
+@question_fragment
 def display_model_df_problem():
     """Display the modeling problem with interactive drag-and-shade grid"""
     data = st.session_state.model_df_data
@@ -252,11 +254,11 @@ def display_interactive_grid(data):
                 st.session_state.model_df_user_answer = shaded_count
                 st.session_state.model_df_feedback = True
                 st.session_state.model_df_submitted = True
-                st.rerun()
+                rerun_question()
         
         with col_b:
             if st.button("🔄 New Grid", use_container_width=True):
-                st.rerun()  # This will regenerate the grid with same problem
+                rerun_question()  # This will regenerate the grid with same problem
     
     # Show feedback if submitted
     if st.session_state.get("model_df_feedback", False):
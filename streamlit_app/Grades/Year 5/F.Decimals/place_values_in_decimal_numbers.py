@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -273,6 +274,7 @@ def generate_new_place_values_question():
         st.session_state.place_values_correct_answer = correct_digit
         st.session_state.current_place_values_question = f"In {number_str}, which digit is in the {target_place} place?"
 
+@question_fragment
 def display_place_values_question():
     """Display the current question interface"""
     data = st.session_state.place_values_question_data
@@ -346,7 +348,7 @@ def display_clickable_tiles(data):
                 ):
                     st.session_state.selected_tile = option
                     selected_option = option
-                    st.rerun()
+                    rerun_question()
     
     # Submit button
     st.markdown("<br>", unsafe_allow_html=True)
@@ -357,7 +359,7 @@ def display_clickable_tiles(data):
                 st.session_state.place_values_user_answer = st.session_state.selected_tile
                 st.session_state.place_values_show_feedback = True
                 st.session_state.place_values_answer_submitted = True
-                st.rerun()
+                rerun_question()
             else:
                 st.warning("⚠️ Please select a place value first!")
 
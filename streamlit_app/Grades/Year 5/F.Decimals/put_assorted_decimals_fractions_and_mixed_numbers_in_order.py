@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from fractions import Fraction
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -175,6 +176,7 @@ def get_position_label(position, total):
     else:
         return f"{position}th"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     # Display question
@@ -198,7 +200,7 @@ def display_question():
             if st.button("🔄 Reset Order", type="secondary", use_container_width=True):
                 st.session_state.user_selections = []
                 st.session_state.tile_positions = {}
-                st.rerun()
+                rerun_question()
     
     # Display tiles
     st.markdown("<br>", unsafe_allow_html=True)
@@ -238,7 +240,7 @@ def display_question():
                 # Add this selection
                 st.session_state.user_selections.append(i)
                 st.session_state.tile_positions[i] = len(st.session_state.user_selections)
-                st.rerun()
+                rerun_question()
     
     # Show message based on selection status
     if selections_made == num_items:
@@ -257,7 +259,7 @@ def display_question():
                     disabled=(selections_made < num_items or st.session_state.answer_submitted)):
             st.session_state.show_feedback = True
             st.session_state.answer_submitted = True
-            st.rerun()
+            rerun_question()
     
     # Show feedback if answer was submitted
     if st.session_state.show_feedback:
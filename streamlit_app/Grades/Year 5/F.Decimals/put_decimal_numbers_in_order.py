@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -179,6 +180,7 @@ def generate_new_question():
     st.session_state.available_numbers = numbers[:]
     st.session_state.selected_order = []
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -215,7 +217,7 @@ def display_question():
                     # Add to selected order and remove from available
                     st.session_state.selected_order.append(number)
                     st.session_state.available_numbers.remove(number)
-                    st.rerun()
+                    rerun_question()
             else:
                 # Show as selected/disabled
                 st.button(f"{number}", key=f"num_disabled_{i}", use_container_width=True, 
@@ -247,7 +249,7 @@ def display_question():
             if st.button("🔄 Reset", help="Start over"):
                 st.session_state.selected_order = []
                 st.session_state.available_numbers = data["numbers"][:]
-                st.rerun()
+                rerun_question()
     
     # Submit button (only show when all 4 numbers selected)
     if len(st.session_state.selected_order) == 4 and not st.session_state.answer_submitted:
@@ -256,7 +258,7 @@ def display_question():
             if st.button("✅ Submit", type="primary", use_container_width=True):
                 st.session_state.show_feedback = True
                 st.session_state.answer_submitted = True
-                st.rerun()
+                rerun_question()
     
     # Show feedback and next button
     handle_feedback_and_next()
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -209,6 +210,7 @@ def format_number(num):
         formatted = f"{num:.10f}".rstrip('0').rstrip('.')
         return formatted
 
+@question_fragment
 def display_relationship_question():
     """Display the current question interface"""
     data = st.session_state.relationship_question_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -160,6 +161,7 @@ def generate_new_question():
     st.session_state.correct_answer = correct_answer
     st.session_state.current_question = f"What is {number} rounded to the nearest {rounding_place}?"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -343,6 +344,7 @@ def generate_word_distractors(decimal_str, correct_words):
     
     return distractors[:3]  # Return exactly 3 distractors
 
+@question_fragment
 def display_decimals_question():
     """Display the current question interface"""
     data = st.session_state.decimals_question_data
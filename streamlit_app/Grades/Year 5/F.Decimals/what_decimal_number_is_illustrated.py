@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import math
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -227,6 +228,7 @@ def generate_decimal_illus_problem():
     st.session_state.decimal_illus_answer = decimal_value
     st.session_state.current_decimal_illus_problem = "What decimal number is illustrated?"
 
+@question_fragment
 def display_decimal_illus_problem():
     """Display the current decimal illustration problem with visual representation"""
     data = st.session_state.decimal_illus_data
@@ -314,7 +316,7 @@ def display_decimal_illus_problem():
                     st.session_state.decimal_illus_user_answer = user_answer
                     st.session_state.decimal_illus_feedback = True
                     st.session_state.decimal_illus_submitted = True
-                    st.rerun()
+                    rerun_question()
                 except ValueError:
                     st.error("Please enter a valid decimal number!")
             else:
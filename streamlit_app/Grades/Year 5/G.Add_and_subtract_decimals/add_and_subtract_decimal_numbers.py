@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from decimal import Decimal
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -160,6 +161,7 @@ def generate_new_question():
     st.session_state.current_question = f"{operation_word}."
     st.session_state.user_inputs = {}
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -317,7 +319,7 @@ def display_question():
             if user_answer is not None:
                 st.session_state.show_feedback = True
                 st.session_state.answer_submitted = True
-                st.rerun()
+                rerun_question()
             else:
                 st.warning("Please fill in all the answer boxes!")
     
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from decimal import Decimal
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -349,6 +350,7 @@ def generate_multi_step_problem(scenario_type, scenario, num1, num2, num3):
     
     return random.choice(templates)
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -387,7 +389,7 @@ def display_question():
                     st.session_state.user_answer = user_answer
                     st.session_state.show_feedback = True
                     st.session_state.answer_submitted = True
-                    st.rerun()
+                    rerun_question()
                 except ValueError:
                     st.error("Please enter a valid number!")
             else:
@@ -1,12 +1,12 @@
 import streamlit as st
 import random
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import Wedge, Rectangle, Polygon
-import numpy as np
 import math
+from utils.lazy_imports import lazy_import
+from utils.fragments import question_fragment, rerun_question
+
+plt = lazy_import("matplotlib.pyplot")
+patches = lazy_import("matplotlib.patches")
+np = lazy_import("numpy")
 
 def run():
     """
@@ -203,10 +203,10 @@ def create_visual_models(fraction1, fraction2, shape_type):
                 
                 # Determine if this section should be shaded
                 if i < numerator:
-                    wedge = Wedge((0, 0), 1, angle1, angle2, 
+                    wedge = patches.Wedge((0, 0), 1, angle1, angle2, 
                                  facecolor=color, edgecolor='black', linewidth=2)
                 else:
-                    wedge = Wedge((0, 0), 1, angle1, angle2, 
+                    wedge = patches.Wedge((0, 0), 1, angle1, angle2, 
                                  facecolor='white', edgecolor='black', linewidth=2)
                 ax.add_patch(wedge)
         
@@ -218,10 +218,10 @@ def create_visual_models(fraction1, fraction2, shape_type):
                 for i in range(denominator):
                     x = -1 + i * width
                     if i < numerator:
-                        rect = Rectangle((x, -0.5), width, 1, 
+                        rect = patches.Rectangle((x, -0.5), width, 1, 
                                        facecolor=color, edgecolor='black', linewidth=2)
                     else:
-                        rect = Rectangle((x, -0.5), width, 1, 
+                        rect = patches.Rectangle((x, -0.5), width, 1, 
                                        facecolor='white', edgecolor='black', linewidth=2)
                     ax.add_patch(rect)
             else:
@@ -238,10 +238,10 @@ def create_visual_models(fraction1, fraction2, shape_type):
                     y = 1 - (row + 1) * cell_height
                     
                     if i < numerator:
-                        rect = Rectangle((x, y), cell_width, cell_height,
+                        rect = patches.Rectangle((x, y), cell_width, cell_height,
                                        facecolor=color, edgecolor='black', linewidth=2)
                     else:
-                        rect = Rectangle((x, y), cell_width, cell_height,
+                        rect = patches.Rectangle((x, y), cell_width, cell_height,
                                        facecolor='white', edgecolor='black', linewidth=2)
                     ax.add_patch(rect)
         
@@ -255,7 +255,7 @@ def create_visual_models(fraction1, fraction2, shape_type):
                 main_points = [(-0.5, -h/2), (0.5, -h/2), (0, h/2)]
                 
                 # Draw the main triangle outline
-                main_triangle = Polygon(main_points, facecolor='none', 
+                main_triangle = patches.Polygon(main_points, facecolor='none', 
                                       edgecolor='black', linewidth=3)
                 ax.add_patch(main_triangle)
                 
@@ -273,10 +273,10 @@ def create_visual_models(fraction1, fraction2, shape_type):
                 
                 for i, section_points in enumerate(sections):
                     if i < numerator:
-                        triangle = Polygon(section_points, facecolor=color,
+                        triangle = patches.Polygon(section_points, facecolor=color,
                                          edgecolor='black', linewidth=2, alpha=0.8)
                     else:
-                        triangle = Polygon(section_points, facecolor='white',
+                        triangle = patches.Polygon(section_points, facecolor='white',
                                          edgecolor='black', linewidth=2)
                     ax.add_patch(triangle)
             else:
@@ -291,10 +291,10 @@ def create_visual_models(fraction1, fraction2, shape_type):
                     points = [(0, 0), (x1, y1), (x2, y2)]
                     
                     if i < numerator:
-                        triangle = Polygon(points, facecolor=color, 
+                        triangle = patches.Polygon(points, facecolor=color, 
                                          edgecolor='black', linewidth=2)
                     else:
-                        triangle = Polygon(points, facecolor='white', 
+                        triangle = patches.Polygon(points, facecolor='white', 
                                          edgecolor='black', linewidth=2)
                     ax.add_patch(triangle)
         
@@ -302,7 +302,7 @@ def create_visual_models(fraction1, fraction2, shape_type):
             # Draw diamond (square rotated 45 degrees) divided into parts
             # Main diamond outline
             diamond_points = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-            diamond = Polygon(diamond_points, facecolor='none', 
+            diamond = patches.Polygon(diamond_points, facecolor='none', 
                             edgecolor='black', linewidth=3)
             ax.add_patch(diamond)
             
@@ -322,10 +322,10 @@ def create_visual_models(fraction1, fraction2, shape_type):
                 
                 for i, section_points in enumerate(sections):
                     if i < numerator:
-                        triangle = Polygon(section_points, facecolor=color,
+                        triangle = patches.Polygon(section_points, facecolor=color,
                                          edgecolor='black', linewidth=2, alpha=0.8)
                     else:
-                        triangle = Polygon(section_points, facecolor='white',
+                        triangle = patches.Polygon(section_points, facecolor='white',
                                          edgecolor='black', linewidth=2)
                     ax.add_patch(triangle)
             elif denominator == 5:
@@ -354,10 +354,10 @@ def create_visual_models(fraction1, fraction2, shape_type):
                     section_points = [(0, 0), p1, p2]
                     
                     if i < numerator:
-                        triangle = Polygon(section_points, facecolor=color,
+                        triangle = patches.Polygon(section_points, facecolor=color,
                                          edgecolor='black', linewidth=2, alpha=0.8)
                     else:
-                        triangle = Polygon(section_points, facecolor='white',
+                        triangle = patches.Polygon(section_points, facecolor='white',
                                          edgecolor='black', linewidth=2)
                     ax.add_patch(triangle)
             else:
@@ -380,10 +380,10 @@ def create_visual_models(fraction1, fraction2, shape_type):
                     points = [(0, 0), (x1, y1), (x2, y2)]
                     
                     if i < numerator:
-                        triangle = Polygon(points, facecolor=color,
+                        triangle = patches.Polygon(points, facecolor=color,
                                          edgecolor='black', linewidth=2, alpha=0.8)
                     else:
-                        triangle = Polygon(points, facecolor='white',
+                        triangle = patches.Polygon(points, facecolor='white',
                                          edgecolor='black', linewidth=2)
                     ax.add_patch(triangle)
         
@@ -394,6 +394,7 @@ def create_visual_models(fraction1, fraction2, shape_type):
     plt.tight_layout()
     return fig
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -425,7 +426,7 @@ def display_question():
             help=f"Click to select {frac1_str}"
         ):
             st.session_state.selected_fraction = frac1_str
-            st.rerun()
+            rerun_question()
     
     with col3:
         # Second fraction tile
@@ -437,7 +438,7 @@ def display_question():
             help=f"Click to select {frac2_str}"
         ):
             st.session_state.selected_fraction = frac2_str
-            st.rerun()
+            rerun_question()
     
     # Show selection status
     if st.session_state.selected_fraction is None and not st.session_state.answer_submitted:
@@ -457,7 +458,7 @@ def display_question():
             st.session_state.user_answer = selected_tuple
             st.session_state.show_feedback = True
             st.session_state.answer_submitted = True
-            st.rerun()
+            rerun_question()
     
     # Show feedback if answer was submitted
     if st.session_state.show_feedback:
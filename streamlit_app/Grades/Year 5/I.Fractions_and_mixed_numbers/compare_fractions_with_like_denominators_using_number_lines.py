@@ -1,10 +1,11 @@
 import streamlit as st
 import random
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import numpy as np
 from fractions import Fraction
+from utils.lazy_imports import lazy_import
+from utils.fragments import question_fragment, rerun_question
+
+plt = lazy_import("matplotlib.pyplot")
+np = lazy_import("numpy")
 
 def run():
     """
@@ -240,6 +241,7 @@ def create_number_line_figure(fraction1, fraction2):
     
     return fig
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -271,7 +273,7 @@ def display_question():
             help=f"Click to select {frac1_str}"
         ):
             st.session_state.selected_fraction = frac1_str
-            st.rerun()
+            rerun_question()
     
     with col3:
         # Second fraction tile
@@ -283,7 +285,7 @@ def display_question():
             help=f"Click to select {frac2_str}"
         ):
             st.session_state.selected_fraction = frac2_str
-            st.rerun()
+            rerun_question()
     
     # Show selection status
     if st.session_state.selected_fraction is None and not st.session_state.answer_submitted:
@@ -303,7 +305,7 @@ def display_question():
             st.session_state.user_answer = selected_tuple
             st.session_state.show_feedback = True
             st.session_state.answer_submitted = True
-            st.rerun()
+            rerun_question()
     
     # Show feedback if answer was submitted
     if st.session_state.show_feedback:
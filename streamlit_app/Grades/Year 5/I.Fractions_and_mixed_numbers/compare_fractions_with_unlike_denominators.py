@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -268,6 +269,7 @@ def generate_new_problem():
     st.session_state.show_feedback = False
     st.session_state.answer_submitted = False
 
+@question_fragment
 def display_problem():
     """Display the current fraction comparison problem"""
     
@@ -293,7 +295,7 @@ def display_problem():
                         type="primary" if st.session_state.selected_answer == frac1 else "secondary",
                         use_container_width=True):
                 st.session_state.selected_answer = frac1
-                st.rerun()
+                rerun_question()
         
         with col2:
             frac2_text = f"{frac2[0]}/{frac2[1]}"
@@ -301,7 +303,7 @@ def display_problem():
                         type="primary" if st.session_state.selected_answer == frac2 else "secondary",
                         use_container_width=True):
                 st.session_state.selected_answer = frac2
-                st.rerun()
+                rerun_question()
         
         with col3:
             equal_text = "neither;\nthey are\nequal"
@@ -309,7 +311,7 @@ def display_problem():
                         type="primary" if st.session_state.selected_answer == "equal" else "secondary",
                         use_container_width=True):
                 st.session_state.selected_answer = "equal"
-                st.rerun()
+                rerun_question()
     else:
         # Two columns for two options
         col1, col2 = st.columns(2)
@@ -320,7 +322,7 @@ def display_problem():
                         type="primary" if st.session_state.selected_answer == frac1 else "secondary",
                         use_container_width=True):
                 st.session_state.selected_answer = frac1
-                st.rerun()
+                rerun_question()
         
         with col2:
             frac2_text = f"{frac2[0]}/{frac2[1]}"
@@ -328,7 +330,7 @@ def display_problem():
                         type="primary" if st.session_state.selected_answer == frac2 else "secondary",
                         use_container_width=True):
                 st.session_state.selected_answer = frac2
-                st.rerun()
+                rerun_question()
     
     st.markdown("<br>", unsafe_allow_html=True)
     
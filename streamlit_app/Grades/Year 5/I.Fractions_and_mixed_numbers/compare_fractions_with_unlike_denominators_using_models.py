@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import math
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -344,6 +345,7 @@ def create_svg_triangle(numerator, denominator, color):
     svg_parts.append('</svg>')
     return ''.join(svg_parts)
 
+@question_fragment
 def display_problem():
     """Display the current fraction comparison problem"""
     
@@ -411,14 +413,14 @@ def display_problem():
                     type="primary" if st.session_state.selected_answer == frac1 else "secondary",
                     use_container_width=True):
             st.session_state.selected_answer = frac1
-            st.rerun()
+            rerun_question()
     
     with col2:
         if st.button(f"{frac2[0]}/{frac2[1]}", key="frac2_btn",
                     type="primary" if st.session_state.selected_answer == frac2 else "secondary",
                     use_container_width=True):
             st.session_state.selected_answer = frac2
-            st.rerun()
+            rerun_question()
     
     # Submit button
     col1, col2, col3 = st.columns([1, 2, 1])
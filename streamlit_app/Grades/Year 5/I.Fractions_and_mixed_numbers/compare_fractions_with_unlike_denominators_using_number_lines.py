@@ -1,5 +1,8 @@
 import streamlit as st
 import random
+from fractions import Fraction
+from utils.number_line import number_line_svg
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -201,45 +204,16 @@ def generate_new_problem():
 
 def create_number_line_svg(numerator, denominator, color, position="top"):
     """Create SVG number line with fraction marked"""
-    
-    # SVG dimensions
-    width = 600
-    height = 80
-    margin = 50
-    line_y = 40 if position == "top" else 40
-    
-    svg_parts = [f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}">']
-    
-    # Draw main line with arrows
-    svg_parts.append(f'<line x1="{margin - 30}" y1="{line_y}" x2="{width - margin + 30}" y2="{line_y}" stroke="gray" stroke-width="2"/>')
-    svg_parts.append(f'<path d="M {margin - 35} {line_y} L {margin - 30} {line_y - 5} L {margin - 30} {line_y + 5} Z" fill="gray"/>')
-    svg_parts.append(f'<path d="M {width - margin + 35} {line_y} L {width - margin + 30} {line_y - 5} L {width - margin + 30} {line_y + 5} Z" fill="gray"/>')
-    
-    # Calculate line length
-    line_length = width - 2 * margin
-    
-    # Draw tick marks and labels for the denominator
-    for i in range(denominator + 1):
-        x = margin + (i / denominator) * line_length
-        
-        # Main tick marks at 0 and 1
-        if i == 0 or i == denominator:
-            svg_parts.append(f'<line x1="{x}" y1="{line_y - 10}" x2="{x}" y2="{line_y + 10}" stroke="black" stroke-width="2"/>')
-            label = "0" if i == 0 else "1"
-            svg_parts.append(f'<text x="{x}" y="{line_y + 25}" text-anchor="middle" font-size="14" font-weight="bold">{label}</text>')
-        else:
-            # Smaller tick marks for fractions
-            svg_parts.append(f'<line x1="{x}" y1="{line_y - 8}" x2="{x}" y2="{line_y + 8}" stroke="black" stroke-width="1"/>')
-            # Add fraction labels
-            svg_parts.append(f'<text x="{x}" y="{line_y + 25}" text-anchor="middle" font-size="12">{i}/{denominator}</text>')
-    
-    # Mark the fraction position with a colored dot
-    frac_x = margin + (numerator / denominator) * line_length
-    svg_parts.append(f'<circle cx="{frac_x}" cy="{line_y}" r="8" fill="{color}" stroke="black" stroke-width="2"/>')
-    
-    svg_parts.append('</svg>')
-    return ''.join(svg_parts)
+    return number_line_svg(
+        0, 1, Fraction(1, denominator),
+        points=[{"value": Fraction(numerator, denominator), "color": color}],
+        height=80, line_y=40, line_color="gray", overhang=30, arrows="both",
+        major_tick_color="black", minor_tick=8, minor_tick_color="black",
+        labels="all", label_format="fraction", label_offset=25, label_color="black",
+        major_label_weight="bold",
+    )
 
+@question_fragment
 def display_problem():
     """Display the current number line comparison problem"""
     
@@ -276,14 +250,14 @@ def display_problem():
                         type="primary" if st.session_state.selected_answer == frac1 else "secondary",
                         use_container_width=True):
                 st.session_state.selected_answer = frac1
-                st.rerun()
+                rerun_question()
         
         with col2:
             if st.button(f"{frac2[0]}/{frac2[1]}", key="frac2_btn",
                         type="primary" if st.session_state.selected_answer == frac2 else "secondary",
                         use_container_width=True):
                 st.session_state.selected_answer = frac2
-                st.rerun()
+                rerun_question()
         
         with col3:
             # Determine the button text based on the question
@@ -296,7 +270,7 @@ def display_problem():
                         type="primary" if st.session_state.selected_answer == "equal" else "secondary",
                         use_container_width=True):
                 st.session_state.selected_answer = "equal"
-                st.rerun()
+                rerun_question()
     else:
         # Two options: just the fractions
         col1, col2 = st.columns(2)
@@ -306,14 +280,14 @@ def display_problem():
                         type="primary" if st.session_state.selected_answer == frac1 else "secondary",
                         use_container_width=True):
                 st.session_state.selected_answer = frac1
-                st.rerun()
+                rerun_question()
         
         with col2:
             if st.button(f"{frac2[0]}/{frac2[1]}", key="frac2_btn",
                         type="primary" if st.session_state.selected_answer == frac2 else "secondary",
                         use_container_width=True):
                 st.session_state.selected_answer = frac2
-                st.rerun()
+                rerun_question()
     
     # Submit button
     col1, col2, col3 = st.columns([1, 2, 1])
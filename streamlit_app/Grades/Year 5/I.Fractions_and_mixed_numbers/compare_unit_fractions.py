@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -126,6 +127,7 @@ def generate_new_question():
     # Reset selection
     st.session_state.selected_fraction = None
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -188,7 +190,7 @@ def display_question():
             help=f"Click to select {frac1_str}"
         ):
             st.session_state.selected_fraction = frac1_str
-            st.rerun()
+            rerun_question()
     
     with col3:
         # Second fraction tile
@@ -200,7 +202,7 @@ def display_question():
             help=f"Click to select {frac2_str}"
         ):
             st.session_state.selected_fraction = frac2_str
-            st.rerun()
+            rerun_question()
     
     # Show selection reminder if no fraction is selected
     if st.session_state.selected_fraction is None and not st.session_state.answer_submitted:
@@ -222,7 +224,7 @@ def display_question():
             st.session_state.user_answer = selected_tuple
             st.session_state.show_feedback = True
             st.session_state.answer_submitted = True
-            st.rerun()
+            rerun_question()
     
     # Show feedback if answer was submitted
     if st.session_state.show_feedback:
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import math
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -450,6 +451,7 @@ def create_fraction_bar_svg(denominator, color, size=150):
     svg_parts.append('</svg>')
     return ''.join(svg_parts)
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.problem_data
@@ -1,9 +1,10 @@
 import streamlit as st
 import random
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-import numpy as np
+from utils.lazy_imports import lazy_import
+from utils.fragments import question_fragment
+
+plt = lazy_import("matplotlib.pyplot")
+np = lazy_import("numpy")
 
 def run():
     """
@@ -187,6 +188,7 @@ def create_number_line_figure(fraction1, fraction2):
     # Don't use tight_layout as we've manually adjusted spacing
     return fig
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import math
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -213,6 +214,7 @@ def generate_new_problem():
         
         st.session_state.current_problem = f"Write {whole} {simplified_num}/{simplified_den} as an improper fraction:"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.problem_data
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from fractions import Fraction
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -169,6 +170,7 @@ def get_gcd(a, b):
         a, b = b, a % b
     return a
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from fractions import Fraction
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -245,6 +246,7 @@ def generate_new_question():
     st.session_state.correct_answer = answer
     st.session_state.current_question = question_text
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -1,6 +1,8 @@
 import streamlit as st
 import random
 import math
+from utils.svg_cache import cached_svg
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -167,6 +169,7 @@ def generate_new_problem():
     st.session_state.correct_denominator = denominator
     st.session_state.current_problem = f"Write the mixed number:"
 
+@cached_svg
 def create_shape_svg(shape_type, denominator, filled_parts, color, size=80):
     """Create SVG for a shape with given divisions and filled parts"""
     if shape_type == 'circle':
@@ -274,6 +277,7 @@ def create_rectangle_svg(denominator, filled_parts, color, size):
     svg_parts.append('</svg>')
     return ''.join(svg_parts)
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.problem_data
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from fractions import Fraction
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -169,6 +170,7 @@ def generate_new_problem():
     st.session_state.show_feedback = False
     st.session_state.answer_submitted = False
 
+@question_fragment
 def display_problem():
     """Display the current fraction ordering problem"""
     
@@ -210,7 +212,7 @@ def display_problem():
         if st.button("🔄 Reset", type="secondary", use_container_width=True,
                     disabled=st.session_state.answer_submitted):
             st.session_state.selected_order = []
-            st.rerun()
+            rerun_question()
     
     with col2:
         # Submit button - only enabled when all fractions are selected
@@ -296,7 +298,7 @@ def display_fraction_tiles():
                                use_container_width=True,
                                type="primary"):
                         st.session_state.selected_order.append(frac)
-                        st.rerun()
+                        rerun_question()
                 else:
                     # Show as disabled
                     st.markdown(
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from fractions import Fraction
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -184,6 +185,7 @@ def generate_new_question():
     st.session_state.correct_answer = correct_answer
     st.session_state.current_question = f"What is {fraction_display} rounded to the nearest whole number?"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -1,5 +1,7 @@
 import streamlit as st
 import random
+from fractions import Fraction
+from utils.number_line import number_line_svg
 
 def run():
     """
@@ -136,49 +138,15 @@ def create_number_line_svg(denominator, numerator):
     # Colors for the dot
     colors = ['#4CAF50', '#FF9800', '#2196F3', '#9C27B0', '#F44336', '#009688']
     dot_color = random.choice(colors)
-    
-    svg_parts = []
-    svg_parts.append('<div style="text-align: center; margin: 30px 0;">')
-    svg_parts.append('<svg width="400" height="100" viewBox="0 0 400 100">')
-    
-    # Main line
-    line_start_x = 40
-    line_end_x = 360
-    line_y = 50
-    line_length = line_end_x - line_start_x
-    
-    # Draw main horizontal line
-    svg_parts.append(f'<line x1="{line_start_x}" y1="{line_y}" x2="{line_end_x}" y2="{line_y}" '
-                    f'stroke="black" stroke-width="2"/>')
-    
-    # Draw end markers (0 and 1)
-    svg_parts.append(f'<line x1="{line_start_x}" y1="{line_y-10}" x2="{line_start_x}" y2="{line_y+10}" '
-                    f'stroke="black" stroke-width="2"/>')
-    svg_parts.append(f'<line x1="{line_end_x}" y1="{line_y-10}" x2="{line_end_x}" y2="{line_y+10}" '
-                    f'stroke="black" stroke-width="2"/>')
-    
-    # Labels for 0 and 1
-    svg_parts.append(f'<text x="{line_start_x}" y="{line_y+30}" text-anchor="middle" '
-                    f'font-size="16" font-weight="bold">0</text>')
-    svg_parts.append(f'<text x="{line_end_x}" y="{line_y+30}" text-anchor="middle" '
-                    f'font-size="16" font-weight="bold">1</text>')
-    
-    # Draw division marks
-    for i in range(1, denominator):
-        x_pos = line_start_x + (i * line_length / denominator)
-        # Make division marks smaller than end marks
-        svg_parts.append(f'<line x1="{x_pos}" y1="{line_y-6}" x2="{x_pos}" y2="{line_y+6}" '
-                        f'stroke="gray" stroke-width="1.5"/>')
-    
-    # Draw the dot at the fraction position
-    dot_x = line_start_x + (numerator * line_length / denominator)
-    svg_parts.append(f'<circle cx="{dot_x}" cy="{line_y}" r="8" fill="{dot_color}" '
-                    f'stroke="black" stroke-width="2"/>')
-    
-    svg_parts.append('</svg>')
-    svg_parts.append('</div>')
-    
-    return ''.join(svg_parts)
+
+    svg = number_line_svg(
+        0, 1, Fraction(1, denominator),
+        points=[{"value": Fraction(numerator, denominator), "color": dot_color}],
+        width=400, height=100, margin=40, line_y=50, line_color="black", arrows="none",
+        major_tick_color="black", minor_tick_color="gray", minor_tick_width=1.5,
+        label_color="black", major_label_size=16, major_label_weight="bold",
+    )
+    return f'<div style="text-align: center; margin: 30px 0;">{svg}</div>'
 
 def show_feedback():
     """Display feedback for the submitted answer"""
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import math
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -223,6 +224,7 @@ def generate_new_fraction():
     st.session_state.correct_denominator = simplified_denominator
     st.session_state.current_fraction = f"{unsimplified_numerator}/{unsimplified_denominator}"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.fraction_data
@@ -1,5 +1,8 @@
 import streamlit as st
 import random
+from fractions import Fraction
+from utils.number_line import FRACTION_JUMPS, number_line_svg
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -136,132 +139,28 @@ def generate_new_question():
 
 def create_number_line_svg(data):
     """Create an SVG number line showing fraction addition or subtraction"""
-    width = 600
-    height = 200
-    line_y = 120
-    tick_height = 10
-    
-    # Calculate positions
-    unit_width = (width - 100) / data['denominator']
-    start_x = 50
-    end_x = width - 50
-    
-    # Build SVG
-    svg_parts = []
-    svg_parts.append(f'<svg width="{width}" height="{height}" style="margin: 20px 0;">')
-    
-    # Add arrow marker definitions
-    svg_parts.append('<defs>')
-    # Blue arrow for addition (pointing right)
-    svg_parts.append('<marker id="arrowhead-blue" markerWidth="10" markerHeight="7" ')
-    svg_parts.append('refX="9" refY="3.5" orient="auto">')
-    svg_parts.append('<polygon points="0 0, 10 3.5, 0 7" fill="#2196F3"/>')
-    svg_parts.append('</marker>')
-    # Pink arrow for subtraction (pointing left)
-    svg_parts.append('<marker id="arrowhead-pink" markerWidth="10" markerHeight="7" ')
-    svg_parts.append('refX="1" refY="3.5" orient="auto">')
-    svg_parts.append('<polygon points="10 0, 0 3.5, 10 7" fill="#E91E63"/>')
-    svg_parts.append('</marker>')
-    svg_parts.append('</defs>')
-    
-    # Main number line
-    svg_parts.append(f'<line x1="{start_x}" y1="{line_y}" x2="{end_x}" y2="{line_y}" ')
-    svg_parts.append('stroke="#333" stroke-width="2"/>')
-    
-    # Arrows at ends
-    svg_parts.append(f'<path d="M {start_x - 10} {line_y - 5} L {start_x} {line_y}')
-    svg_parts.append(f' L {start_x - 10} {line_y + 5}" stroke="#333" stroke-width="2" fill="none"/>')
-    svg_parts.append(f'<path d="M {end_x + 10} {line_y - 5} L {end_x} {line_y}')
-    svg_parts.append(f' L {end_x + 10} {line_y + 5}" stroke="#333" stroke-width="2" fill="none"/>')
-    
-    # Tick marks and labels
-    for i in range(data['denominator'] + 1):
-        x = start_x + i * unit_width
-        
-        # Tick mark
-        svg_parts.append(f'<line x1="{x}" y1="{line_y - tick_height}" ')
-        svg_parts.append(f'x2="{x}" y2="{line_y + tick_height}" stroke="#333" stroke-width="1"/>')
-        
-        # Label
-        if i == 0:
-            label = "0"
-        elif i == data['denominator']:
-            label = "1"
-        else:
-            label = f"{i}/{data['denominator']}"
-        
-        svg_parts.append(f'<text x="{x}" y="{line_y + 25}" ')
-        svg_parts.append(f'text-anchor="middle" font-size="12" fill="#666">{label}</text>')
-    
-    # Calculate positions for fractions
-    x1 = start_x + data['numerator1'] * unit_width
-    x2 = start_x + data['result'] * unit_width
-    
-    # First position with label
-    svg_parts.append(f'<rect x="{x1 - 20}" y="{line_y - 5}" ')
-    svg_parts.append('width="40" height="10" fill="#E3F2FD" stroke="#2196F3" stroke-width="2" rx="3"/>')
-    
-    fraction1_label = f"{data['numerator1']}/{data['denominator']}"
-    svg_parts.append(f'<text x="{x1}" y="{line_y - 15}" ')
-    svg_parts.append(f'text-anchor="middle" font-size="14" fill="#2196F3" font-weight="bold">{fraction1_label}</text>')
-    
-    # Result position
+    d = data['denominator']
+    first = Fraction(data['numerator1'], d)
+    result = Fraction(data['result'], d)
     if data['operation'] == 'add':
-        fill_color = "#E3F2FD"
-        stroke_color = "#2196F3"
+        fill_color, color, symbol = "#E3F2FD", "#2196F3", "+"
     else:
-        fill_color = "#FFEBEE"
-        stroke_color = "#E91E63"
-    
-    svg_parts.append(f'<rect x="{x2 - 20}" y="{line_y - 5}" ')
-    svg_parts.append(f'width="40" height="10" fill="{fill_color}" stroke="{stroke_color}" stroke-width="2" rx="3"/>')
-    
-    # Add question mark at result position
-    svg_parts.append(f'<text x="{x2}" y="{line_y - 15}" ')
-    svg_parts.append(f'text-anchor="middle" font-size="16" fill="{stroke_color}" font-weight="bold">?</text>')
-    
-    # Jump arc
-    arc_height = 50
-    
-    if data['operation'] == 'add':
-        # Forward arc for addition (left to right)
-        jump_start = x1
-        jump_end = x2
-        jump_mid = (jump_start + jump_end) / 2
-        arc_color = "#2196F3"
-        marker = "url(#arrowhead-blue)"
-        operation_symbol = "+"
-        
-        # Draw arc from left to right
-        svg_parts.append(f'<path d="M {jump_start} {line_y - 10}')
-        svg_parts.append(f' Q {jump_mid} {line_y - arc_height} ')
-        svg_parts.append(f'{jump_end} {line_y - 10}" ')
-        svg_parts.append(f'stroke="{arc_color}" stroke-width="3" fill="none" marker-end="{marker}"/>')
-    else:
-        # Backward arc for subtraction (right to left)
-        jump_start = x1  # Starting position
-        jump_end = x2    # Ending position (to the left)
-        jump_mid = (jump_start + jump_end) / 2
-        arc_color = "#E91E63"
-        marker = "url(#arrowhead-pink)"
-        operation_symbol = "−"
-        
-        # Draw arc from right to left (start at x1, end at x2)
-        svg_parts.append(f'<path d="M {jump_start} {line_y - 10}')
-        svg_parts.append(f' Q {jump_mid} {line_y - arc_height} ')
-        svg_parts.append(f'{jump_end} {line_y - 10}" ')
-        svg_parts.append(f'stroke="{arc_color}" stroke-width="3" fill="none" marker-end="{marker}"/>')
-    
-    # Label the jump
-    jump_label = f"{operation_symbol}{data['numerator2']}/{data['denominator']}"
-    svg_parts.append(f'<text x="{jump_mid}" y="{line_y - arc_height - 10}" ')
-    svg_parts.append(f'text-anchor="middle" font-size="18" fill="{arc_color}" font-weight="bold">')
-    svg_parts.append(f'{jump_label}</text>')
-    
-    svg_parts.append('</svg>')
-    
-    return ''.join(svg_parts)
+        fill_color, color, symbol = "#FFEBEE", "#E91E63", "−"
+
+    return number_line_svg(
+        0, 1, Fraction(1, d),
+        points=[
+            {"value": first, "label": f"{data['numerator1']}/{d}", "marker": "box",
+             "color": "#2196F3", "fill": "#E3F2FD"},
+            {"value": result, "label": "?", "marker": "box", "color": color, "fill": fill_color,
+             "label_size": 16},
+        ],
+        # Forward arc for addition, backward arc for subtraction
+        jumps=[{"start": first, "end": result, "label": f"{symbol}{data['numerator2']}/{d}", "color": color}],
+        **FRACTION_JUMPS,
+    )
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
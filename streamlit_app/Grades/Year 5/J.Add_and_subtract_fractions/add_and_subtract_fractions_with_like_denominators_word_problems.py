@@ -2,6 +2,7 @@ import streamlit as st
 import random
 from fractions import Fraction
 import re
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -277,6 +278,7 @@ def parse_fraction(fraction_str):
     
     return None
 
+@question_fragment
 def display_problem():
     """Display the current problem with visual aids"""
     data = st.session_state.problem_data
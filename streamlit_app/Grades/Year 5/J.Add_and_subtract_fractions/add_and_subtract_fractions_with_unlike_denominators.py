@@ -2,6 +2,7 @@ import streamlit as st
 import random
 from fractions import Fraction
 from math import gcd
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -183,6 +184,7 @@ def generate_adaptive_problem():
     st.session_state.show_feedback = False
     st.session_state.answer_submitted = False
 
+@question_fragment
 def display_problem():
     """Display the current problem"""
     problem = st.session_state.current_frac_problem
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from fractions import Fraction
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -318,6 +319,7 @@ def generate_fractions_for_level(level, operation):
         "frac2_obj": frac2
     }
 
+@question_fragment
 def display_word_problem():
     """Display the current word problem"""
     problem = st.session_state.current_word_problem
@@ -2,6 +2,7 @@ import streamlit as st
 import random
 from fractions import Fraction
 import re
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -243,6 +244,7 @@ def parse_mixed_answer(answer_str):
     
     return None
 
+@question_fragment
 def display_problem():
     """Display the current problem"""
     data = st.session_state.problem_data
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from fractions import Fraction
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -400,6 +401,7 @@ def format_mixed_for_display(mixed_tuple):
     whole, num, denom = mixed_tuple
     return f"{whole} {num}/{denom}"
 
+@question_fragment
 def display_mixed_word_problem():
     """Display the current word problem"""
     problem = st.session_state.current_mixed_word_problem
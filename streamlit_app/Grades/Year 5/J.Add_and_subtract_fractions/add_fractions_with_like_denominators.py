@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -135,6 +136,7 @@ def generate_new_question():
     st.session_state.correct_answer = sum_numerator
     st.session_state.current_question = "Add."
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -1,5 +1,7 @@
 import streamlit as st
 import random
+from utils.svg_cache import cached_svg
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -150,6 +152,7 @@ def generate_new_question():
     st.session_state.correct_answer = sum_numerator
     st.session_state.current_question = "Use the pictures to add."
 
+@cached_svg
 def create_rectangle_svg(numerator, denominator, color, width=120, height=80):
     """Create an SVG rectangle divided into parts with some shaded"""
     svg = f'<svg width="{width}" height="{height}" style="border: 2px solid #333;">'
@@ -184,6 +187,7 @@ def create_rectangle_svg(numerator, denominator, color, width=120, height=80):
     svg += '</svg>'
     return svg
 
+@cached_svg
 def create_square_svg(numerator, denominator, color, size=100):
     """Create an SVG square divided into parts with some shaded"""
     svg = f'<svg width="{size}" height="{size}" style="border: 2px solid #333;">'
@@ -223,6 +227,7 @@ def create_square_svg(numerator, denominator, color, size=100):
     svg += '</svg>'
     return svg
 
+@cached_svg
 def create_circle_svg(numerator, denominator, color, size=100):
     """Create an SVG circle divided into pie slices with some shaded"""
     radius = size / 2 - 2
@@ -272,6 +277,7 @@ def create_circle_svg(numerator, denominator, color, size=100):
     svg += '</svg>'
     return svg
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
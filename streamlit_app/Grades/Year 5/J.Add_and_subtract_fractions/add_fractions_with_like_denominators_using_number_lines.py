@@ -1,5 +1,8 @@
 import streamlit as st
 import random
+from fractions import Fraction
+from utils.number_line import FRACTION_JUMPS, number_line_svg
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -128,118 +131,32 @@ def generate_new_question():
 
 def create_number_line_svg(data):
     """Create an SVG number line showing fraction addition"""
-    width = 600
-    height = 200
-    line_y = 120
-    tick_height = 10
-    
-    # Calculate positions
-    unit_width = (width - 100) / data['denominator']
-    start_x = 50
-    end_x = width - 50
-    
-    # Build SVG
-    svg_parts = []
-    svg_parts.append(f'<svg width="{width}" height="{height}" style="margin: 20px 0;">')
-    
-    # Add arrow marker definition at the beginning
-    svg_parts.append('<defs>')
-    svg_parts.append('<marker id="arrowhead" markerWidth="10" markerHeight="7" ')
-    svg_parts.append('refX="9" refY="3.5" orient="auto">')
-    svg_parts.append('<polygon points="0 0, 10 3.5, 0 7" fill="#2196F3"/>')
-    svg_parts.append('</marker>')
-    svg_parts.append('</defs>')
-    
-    # Main number line
-    svg_parts.append(f'<line x1="{start_x}" y1="{line_y}" x2="{end_x}" y2="{line_y}" ')
-    svg_parts.append('stroke="#333" stroke-width="2"/>')
-    
-    # Arrows at ends
-    svg_parts.append(f'<path d="M {start_x - 10} {line_y - 5} L {start_x} {line_y}')
-    svg_parts.append(f' L {start_x - 10} {line_y + 5}" stroke="#333" stroke-width="2" fill="none"/>')
-    svg_parts.append(f'<path d="M {end_x + 10} {line_y - 5} L {end_x} {line_y}')
-    svg_parts.append(f' L {end_x + 10} {line_y + 5}" stroke="#333" stroke-width="2" fill="none"/>')
-    
-    # Tick marks and labels
-    for i in range(data['denominator'] + 1):
-        x = start_x + i * unit_width
-        
-        # Tick mark
-        svg_parts.append(f'<line x1="{x}" y1="{line_y - tick_height}" ')
-        svg_parts.append(f'x2="{x}" y2="{line_y + tick_height}" stroke="#333" stroke-width="1"/>')
-        
-        # Label
-        if i == 0:
-            label = "0"
-        elif i == data['denominator']:
-            label = "1"
-        else:
-            label = f"{i}/{data['denominator']}"
-        
-        svg_parts.append(f'<text x="{x}" y="{line_y + 25}" ')
-        svg_parts.append(f'text-anchor="middle" font-size="12" fill="#666">{label}</text>')
-    
-    # Calculate positions for fractions
-    x0 = start_x  # Starting at 0
-    x1 = start_x + data['numerator1'] * unit_width
-    x2 = start_x + data['sum_numerator'] * unit_width
-    
-    # Draw the starting point indicator at 0
-    svg_parts.append(f'<circle cx="{x0}" cy="{line_y}" r="5" fill="#4CAF50"/>')
-    svg_parts.append(f'<text x="{x0}" y="{line_y - 15}" ')
-    svg_parts.append('text-anchor="middle" font-size="12" fill="#4CAF50" font-weight="bold">Start</text>')
-    
-    # First fraction position with enhanced label
-    svg_parts.append(f'<rect x="{x1 - 20}" y="{line_y - 5}" ')
-    svg_parts.append('width="40" height="10" fill="#E3F2FD" stroke="#2196F3" stroke-width="2" rx="3"/>')
-    
-    # Add label above the first fraction position
-    fraction1_label = f"{data['numerator1']}/{data['denominator']}"
-    svg_parts.append(f'<text x="{x1}" y="{line_y - 15}" ')
-    svg_parts.append(f'text-anchor="middle" font-size="14" fill="#2196F3" font-weight="bold">{fraction1_label}</text>')
-    
-    # Final position - DON'T LABEL IT WITH THE ANSWER
-    svg_parts.append(f'<rect x="{x2 - 20}" y="{line_y - 5}" ')
-    svg_parts.append('width="40" height="10" fill="#FFE0B2" stroke="#FF6B35" stroke-width="2" rx="3"/>')
-    
-    # Add a question mark at the final position instead of the answer
-    svg_parts.append(f'<text x="{x2}" y="{line_y - 15}" ')
-    svg_parts.append(f'text-anchor="middle" font-size="16" fill="#FF6B35" font-weight="bold">?</text>')
-    
-    # Jump arc showing the addition
-    jump_start = x1
-    jump_end = x2
-    jump_mid = (jump_start + jump_end) / 2
-    arc_height = 50  # Increased height for better visibility
-    
-    # Create jump arc path
-    svg_parts.append(f'<path d="M {jump_start} {line_y - 10}')
-    svg_parts.append(f' Q {jump_mid} {line_y - arc_height} ')
-    svg_parts.append(f'{jump_end} {line_y - 10}" ')
-    svg_parts.append('stroke="#2196F3" stroke-width="3" fill="none" marker-end="url(#arrowhead)"/>')
-    
-    # Label the jump with the second fraction
-    jump_label = f"+{data['numerator2']}/{data['denominator']}"
-    svg_parts.append(f'<text x="{jump_mid}" y="{line_y - arc_height - 10}" ')
-    svg_parts.append('text-anchor="middle" font-size="18" fill="#2196F3" font-weight="bold">')
-    svg_parts.append(f'{jump_label}</text>')
-    
-    # Add the equation at the top - BUT WITHOUT THE ANSWER
-    # Background rectangle for the equation
-    equation_y = 50
-    svg_parts.append(f'<rect x="{width/2 - 120}" y="{equation_y - 20}" ')
-    svg_parts.append('width="240" height="40" fill="#F5F5F5" stroke="#DDD" stroke-width="1" rx="5"/>')
-    
-    # Display the equation at the top WITHOUT THE ANSWER
-    equation = f"{data['numerator1']}/{data['denominator']} + {data['numerator2']}/{data['denominator']} = ?"
-    svg_parts.append(f'<text x="{width/2}" y="{equation_y}" ')
-    svg_parts.append('text-anchor="middle" font-size="18" font-weight="bold" fill="#333">')
-    svg_parts.append(f'{equation}</text>')
-    
-    svg_parts.append('</svg>')
-    
-    return ''.join(svg_parts)
+    d = data['denominator']
+    first = Fraction(data['numerator1'], d)
+    total = Fraction(data['sum_numerator'], d)
+    equation = f"{data['numerator1']}/{d} + {data['numerator2']}/{d} = ?"
+    # The equation at the top, without the answer
+    equation_svg = (
+        '<rect x="180" y="30" width="240" height="40" fill="#F5F5F5" stroke="#DDD" stroke-width="1" rx="5"/>'
+        f'<text x="300" y="50" text-anchor="middle" font-size="18" font-weight="bold" fill="#333">{equation}</text>'
+    )
+
+    return number_line_svg(
+        0, 1, Fraction(1, d),
+        points=[
+            {"value": 0, "label": "Start", "color": "#4CAF50", "radius": 5, "stroke": None, "label_size": 12},
+            {"value": first, "label": f"{data['numerator1']}/{d}", "marker": "box",
+             "color": "#2196F3", "fill": "#E3F2FD"},
+            # The final position gets a question mark, not the answer
+            {"value": total, "label": "?", "marker": "box", "color": "#FF6B35", "fill": "#FFE0B2",
+             "label_size": 16},
+        ],
+        jumps=[{"start": first, "end": total, "label": f"+{data['numerator2']}/{d}", "color": "#2196F3"}],
+        extra=equation_svg,
+        **FRACTION_JUMPS,
+    )
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
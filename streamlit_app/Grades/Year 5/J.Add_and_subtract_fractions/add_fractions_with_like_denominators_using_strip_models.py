@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -184,6 +185,7 @@ def create_strip_model_svg(data):
     
     return ''.join(svg_parts)
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -3,6 +3,7 @@ import random
 from fractions import Fraction
 import re
 import math
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -220,6 +221,7 @@ def parse_fraction_answer(answer_str):
     
     return None
 
+@question_fragment
 def display_problem():
     """Display the current problem"""
     data = st.session_state.problem_data
@@ -372,6 +374,7 @@ def reset_problem_state():
     st.session_state.show_feedback = False
     st.session_state.answer_submitted = False
     st.session_state.problem_data = {}
-    st.session_state.user_answer_input = ""  # Clear the input
+    # Clear the input; its widget is already drawn, so drop the key rather than set it
+    st.session_state.pop("user_answer_input", None)
     if "user_answer" in st.session_state:
         del st.session_state.user_answer
\ No newline at end of file
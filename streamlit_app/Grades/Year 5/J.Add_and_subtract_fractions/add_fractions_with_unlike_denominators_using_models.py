@@ -3,6 +3,7 @@ import random
 from fractions import Fraction
 import re
 import math
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -272,6 +273,7 @@ def parse_fraction_answer(answer_str):
     
     return None
 
+@question_fragment
 def display_problem():
     """Display the current problem with visual model"""
     data = st.session_state.problem_data
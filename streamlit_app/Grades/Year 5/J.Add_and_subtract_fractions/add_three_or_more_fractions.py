@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from fractions import Fraction
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -100,6 +101,7 @@ def generate_new_problem():
     st.session_state.show_feedback = False
     st.session_state.answer_submitted = False
 
+@question_fragment
 def display_problem():
     """Display the current fraction addition problem"""
     fractions = st.session_state.current_problem
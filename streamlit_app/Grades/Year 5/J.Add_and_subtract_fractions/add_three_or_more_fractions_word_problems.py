@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from fractions import Fraction
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -220,6 +221,7 @@ def generate_new_word_problem():
     st.session_state.show_feedback = False
     st.session_state.answer_submitted = False
 
+@question_fragment
 def display_word_problem():
     """Display the current word problem"""
     problem = st.session_state.current_word_problem
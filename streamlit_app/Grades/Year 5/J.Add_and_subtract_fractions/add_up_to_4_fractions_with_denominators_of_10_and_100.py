@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from fractions import Fraction
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -252,6 +253,7 @@ def format_expression(expr):
         parts.append(f"{num}/{denom}")
     return "".join(parts)
 
+@question_fragment
 def display_question():
     """Display the current question"""
     question = st.session_state.current_question
@@ -329,7 +331,7 @@ def display_question():
                     st.session_state.answer_submitted = True
                     st.session_state.show_feedback = True
                     st.session_state.fractions_10_100_attempts += 1
-                    st.rerun()
+                    rerun_question()
                 else:
                     st.warning("Please select at least one answer.")
     
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -160,6 +161,7 @@ def generate_new_question():
     parts_text = {2: "two", 3: "three", 4: "four"}
     st.session_state.current_question = f"Write {numerator}/{denominator} as a sum of {parts_text.get(num_parts, str(num_parts))} fractions."
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -290,7 +292,7 @@ def display_question():
                 for i in range(len(st.session_state.selected_values)):
                     if st.session_state.selected_values[i] == "":
                         st.session_state.selected_values[i] = option
-                        st.rerun()
+                        rerun_question()
                         break
     
     # Control buttons
@@ -300,7 +302,7 @@ def display_question():
     with col1:
         if st.button("🔄 Clear All", type="secondary", use_container_width=True):
             st.session_state.selected_values = [""] * data["num_parts"]
-            st.rerun()
+            rerun_question()
     
     with col2:
         if st.button("⬅️ Remove Last", type="secondary", use_container_width=True):
@@ -308,7 +310,7 @@ def display_question():
             for i in range(len(st.session_state.selected_values) - 1, -1, -1):
                 if st.session_state.selected_values[i] != "":
                     st.session_state.selected_values[i] = ""
-                    st.rerun()
+                    rerun_question()
                     break
     
     with col3:
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -182,6 +183,7 @@ def generate_new_question():
     st.session_state.correct_answer = [f"1/{denominator}"] * numerator
     st.session_state.current_question = f"Fill in the missing numbers to write {numerator}/{denominator} as a sum of unit fractions."
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -314,7 +316,7 @@ def display_question():
                 for i in range(len(st.session_state.selected_values)):
                     if st.session_state.selected_values[i] == "":
                         st.session_state.selected_values[i] = option
-                        st.rerun()
+                        rerun_question()
                         break
     
     # Control buttons
@@ -324,7 +326,7 @@ def display_question():
     with col1:
         if st.button("🔄 Clear All", type="secondary", use_container_width=True):
             st.session_state.selected_values = [""] * data["numerator"]
-            st.rerun()
+            rerun_question()
     
     with col2:
         if st.button("⬅️ Remove Last", type="secondary", use_container_width=True):
@@ -332,7 +334,7 @@ def display_question():
             for i in range(len(st.session_state.selected_values) - 1, -1, -1):
                 if st.session_state.selected_values[i] != "":
                     st.session_state.selected_values[i] = ""
-                    st.rerun()
+                    rerun_question()
                     break
     
     with col3:
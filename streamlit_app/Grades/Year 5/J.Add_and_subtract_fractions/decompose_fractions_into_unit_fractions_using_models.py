@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -171,6 +172,7 @@ def generate_new_question():
     st.session_state.correct_answer = correct_index
     st.session_state.current_question = f"How do you write {numerator}/{denominator} as a sum of unit fractions?"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from itertools import combinations_with_replacement
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -220,6 +221,7 @@ def generate_new_question():
     
     st.session_state.current_question = f"Decompose {fraction_str} into a sum of fractions two different ways."
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -268,14 +270,14 @@ def display_question():
                             for i in range(len(st.session_state.selected_values_row1)):
                                 if st.session_state.selected_values_row1[i] == "":
                                     st.session_state.selected_values_row1[i] = option
-                                    st.rerun()
+                                    rerun_question()
                                     break
                         elif "" in st.session_state.selected_values_row2:
                             # Fill in row 2
                             for i in range(len(st.session_state.selected_values_row2)):
                                 if st.session_state.selected_values_row2[i] == "":
                                     st.session_state.selected_values_row2[i] = option
-                                    st.rerun()
+                                    rerun_question()
                                     break
                 button_index += 1
     
@@ -287,7 +289,7 @@ def display_question():
         if st.button("🔄 Clear All", type="secondary", use_container_width=True):
             st.session_state.selected_values_row1 = [""] * data['num_terms_way1']
             st.session_state.selected_values_row2 = [""] * data['num_terms_way2']
-            st.rerun()
+            rerun_question()
     
     with col2:
         if st.button("⬅️ Remove Last", type="secondary", use_container_width=True):
@@ -295,13 +297,13 @@ def display_question():
             for i in range(len(st.session_state.selected_values_row2) - 1, -1, -1):
                 if st.session_state.selected_values_row2[i] != "":
                     st.session_state.selected_values_row2[i] = ""
-                    st.rerun()
+                    rerun_question()
                     break
             else:
                 for i in range(len(st.session_state.selected_values_row1) - 1, -1, -1):
                     if st.session_state.selected_values_row1[i] != "":
                         st.session_state.selected_values_row1[i] = ""
-                        st.rerun()
+                        rerun_question()
                         break
     
     with col3:
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from fractions import Fraction
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -185,6 +186,7 @@ def generate_new_problem():
     st.session_state.show_feedback = False
     st.session_state.answer_submitted = False
 
+@question_fragment
 def display_problem():
     """Display the current benchmark problem"""
     problem = st.session_state.current_benchmark_problem
@@ -276,7 +278,7 @@ def display_benchmark_tiles(options):
             # Create clickable button for each benchmark
             if st.button(option, key=f"benchmark_{i}", use_container_width=True):
                 st.session_state.selected_benchmark = option
-                st.rerun()
+                rerun_question()
             
             # Show selected state
             if st.session_state.selected_benchmark == option:
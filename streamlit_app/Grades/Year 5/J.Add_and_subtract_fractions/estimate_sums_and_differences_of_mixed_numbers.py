@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from fractions import Fraction
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -200,6 +201,7 @@ def format_mixed_number(mixed):
         return str(mixed["whole"])
     return f"{mixed['whole']} {mixed['num']}/{mixed['denom']}"
 
+@question_fragment
 def display_problem():
     """Display the current estimation problem"""
     problem = st.session_state.current_problem
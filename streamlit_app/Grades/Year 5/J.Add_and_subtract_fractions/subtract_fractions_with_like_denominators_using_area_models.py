@@ -1,5 +1,7 @@
 import streamlit as st
 import random
+from utils.svg_cache import cached_svg
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -142,6 +144,7 @@ def generate_new_question():
     st.session_state.correct_answer = diff_numerator
     st.session_state.current_question = "Use the pictures to subtract."
 
+@cached_svg
 def create_shape_svg(shape_type, numerator, denominator, fill_color, empty_color):
     """Create an SVG shape with fractional shading"""
     if shape_type == "circle":
@@ -366,6 +369,7 @@ def create_pentagon_svg(numerator, denominator, fill_color, empty_color):
     svg += '</svg>'
     return svg
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
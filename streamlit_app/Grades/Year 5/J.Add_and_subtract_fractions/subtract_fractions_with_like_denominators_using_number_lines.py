@@ -1,5 +1,8 @@
 import streamlit as st
 import random
+from fractions import Fraction
+from utils.number_line import FRACTION_JUMPS, number_line_svg
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -125,111 +128,31 @@ def generate_new_question():
 
 def create_number_line_svg(data):
     """Create an SVG number line showing fraction subtraction"""
-    width = 600
-    height = 200
-    line_y = 120
-    tick_height = 10
-    
-    # Calculate positions
-    unit_width = (width - 100) / data['denominator']
-    start_x = 50
-    end_x = width - 50
-    
-    # Build SVG
-    svg_parts = []
-    svg_parts.append(f'<svg width="{width}" height="{height}" style="margin: 20px 0;">')
-    
-    # Add arrow marker definition at the beginning
-    svg_parts.append('<defs>')
-    svg_parts.append('<marker id="arrowhead" markerWidth="10" markerHeight="7" ')
-    svg_parts.append('refX="1" refY="3.5" orient="auto">')
-    svg_parts.append('<polygon points="10 0, 0 3.5, 10 7" fill="#E91E63"/>')
-    svg_parts.append('</marker>')
-    svg_parts.append('</defs>')
-    
-    # Main number line
-    svg_parts.append(f'<line x1="{start_x}" y1="{line_y}" x2="{end_x}" y2="{line_y}" ')
-    svg_parts.append('stroke="#333" stroke-width="2"/>')
-    
-    # Arrows at ends
-    svg_parts.append(f'<path d="M {start_x - 10} {line_y - 5} L {start_x} {line_y}')
-    svg_parts.append(f' L {start_x - 10} {line_y + 5}" stroke="#333" stroke-width="2" fill="none"/>')
-    svg_parts.append(f'<path d="M {end_x + 10} {line_y - 5} L {end_x} {line_y}')
-    svg_parts.append(f' L {end_x + 10} {line_y + 5}" stroke="#333" stroke-width="2" fill="none"/>')
-    
-    # Tick marks and labels
-    for i in range(data['denominator'] + 1):
-        x = start_x + i * unit_width
-        
-        # Tick mark
-        svg_parts.append(f'<line x1="{x}" y1="{line_y - tick_height}" ')
-        svg_parts.append(f'x2="{x}" y2="{line_y + tick_height}" stroke="#333" stroke-width="1"/>')
-        
-        # Label
-        if i == 0:
-            label = "0"
-        elif i == data['denominator']:
-            label = "1"
-        else:
-            label = f"{i}/{data['denominator']}"
-        
-        svg_parts.append(f'<text x="{x}" y="{line_y + 25}" ')
-        svg_parts.append(f'text-anchor="middle" font-size="12" fill="#666">{label}</text>')
-    
-    # Calculate positions for fractions
-    x1 = start_x + data['numerator1'] * unit_width  # Starting position
-    x2 = start_x + data['diff_numerator'] * unit_width  # Final position (after subtraction)
-    
-    # Starting position with enhanced label
-    svg_parts.append(f'<rect x="{x1 - 20}" y="{line_y - 5}" ')
-    svg_parts.append('width="40" height="10" fill="#E3F2FD" stroke="#2196F3" stroke-width="2" rx="3"/>')
-    
-    # Add label above the starting position
-    fraction1_label = f"{data['numerator1']}/{data['denominator']}"
-    svg_parts.append(f'<text x="{x1}" y="{line_y - 15}" ')
-    svg_parts.append(f'text-anchor="middle" font-size="14" fill="#2196F3" font-weight="bold">{fraction1_label}</text>')
-    
-    # Final position - DON'T LABEL IT WITH THE ANSWER
-    svg_parts.append(f'<rect x="{x2 - 20}" y="{line_y - 5}" ')
-    svg_parts.append('width="40" height="10" fill="#FFEBEE" stroke="#E91E63" stroke-width="2" rx="3"/>')
-    
-    # Add a question mark at the final position
-    svg_parts.append(f'<text x="{x2}" y="{line_y - 15}" ')
-    svg_parts.append(f'text-anchor="middle" font-size="16" fill="#E91E63" font-weight="bold">?</text>')
-    
-    # Jump arc showing the subtraction (going backwards/left)
-    jump_start = x1
-    jump_end = x2
-    jump_mid = (jump_start + jump_end) / 2
-    arc_height = 50
-    
-    # Create backward jump arc path
-    svg_parts.append(f'<path d="M {jump_start} {line_y - 10}')
-    svg_parts.append(f' Q {jump_mid} {line_y - arc_height} ')
-    svg_parts.append(f'{jump_end} {line_y - 10}" ')
-    svg_parts.append('stroke="#E91E63" stroke-width="3" fill="none" marker-end="url(#arrowhead)"/>')
-    
-    # Label the jump with the subtraction amount
-    jump_label = f"-{data['numerator2']}/{data['denominator']}"
-    svg_parts.append(f'<text x="{jump_mid}" y="{line_y - arc_height - 10}" ')
-    svg_parts.append('text-anchor="middle" font-size="18" fill="#E91E63" font-weight="bold">')
-    svg_parts.append(f'{jump_label}</text>')
-    
-    # Add the equation at the top WITHOUT THE ANSWER
-    equation_y = 50
-    svg_parts.append(f'<rect x="{width/2 - 120}" y="{equation_y - 20}" ')
-    svg_parts.append('width="240" height="40" fill="#F5F5F5" stroke="#DDD" stroke-width="1" rx="5"/>')
-    
-    # Display the equation at the top WITHOUT THE ANSWER
-    equation = f"{data['numerator1']}/{data['denominator']} - {data['numerator2']}/{data['denominator']} = ?"
-    svg_parts.append(f'<text x="{width/2}" y="{equation_y}" ')
-    svg_parts.append('text-anchor="middle" font-size="18" font-weight="bold" fill="#333">')
-    svg_parts.append(f'{equation}</text>')
-    
-    svg_parts.append('</svg>')
-    
-    return ''.join(svg_parts)
+    d = data['denominator']
+    first = Fraction(data['numerator1'], d)
+    difference = Fraction(data['diff_numerator'], d)
+    equation = f"{data['numerator1']}/{d} - {data['numerator2']}/{d} = ?"
+    # The equation at the top, without the answer
+    equation_svg = (
+        '<rect x="180" y="30" width="240" height="40" fill="#F5F5F5" stroke="#DDD" stroke-width="1" rx="5"/>'
+        f'<text x="300" y="50" text-anchor="middle" font-size="18" font-weight="bold" fill="#333">{equation}</text>'
+    )
+
+    return number_line_svg(
+        0, 1, Fraction(1, d),
+        points=[
+            {"value": first, "label": f"{data['numerator1']}/{d}", "marker": "box",
+             "color": "#2196F3", "fill": "#E3F2FD"},
+            {"value": difference, "label": "?", "marker": "box", "color": "#E91E63", "fill": "#FFEBEE",
+             "label_size": 16},
+        ],
+        # Backward jump (right to left)
+        jumps=[{"start": first, "end": difference, "label": f"-{data['numerator2']}/{d}", "color": "#E91E63"}],
+        extra=equation_svg,
+        **FRACTION_JUMPS,
+    )
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
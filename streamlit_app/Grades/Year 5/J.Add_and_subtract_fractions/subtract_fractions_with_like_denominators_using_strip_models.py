@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -189,6 +190,7 @@ def create_fraction_strips_svg(data):
     svg_parts.append('</svg>')
     return ''.join(svg_parts)
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
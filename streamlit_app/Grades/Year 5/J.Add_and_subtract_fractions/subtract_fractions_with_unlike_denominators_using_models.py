@@ -2,6 +2,7 @@ import streamlit as st
 import random
 from fractions import Fraction
 from math import gcd
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -159,6 +160,7 @@ def create_fraction_visual(numerator, denominator, color, is_blocks=True):
         
         return f'<div style="text-align: center;">{svg_content}</div>'
 
+@question_fragment
 def display_problem():
     """Display the current fraction subtraction problem"""
     problem = st.session_state.frac_subtract_problem
@@ -219,7 +221,7 @@ def display_problem():
                 st.session_state.frac_subtract_answer = user_answer
                 st.session_state.show_feedback = True
                 st.session_state.answer_submitted = True
-                st.rerun()
+                rerun_question()
     
     # Show feedback
     if st.session_state.show_feedback:
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -414,6 +415,7 @@ def generate_new_decimal_word_problem():
     st.session_state.correct_answer = answer
     st.session_state.current_problem = problem_text
 
+@question_fragment
 def display_decimal_word_problem():
     """Display the current decimal word problem"""
     # Display the problem in a nice card
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -211,6 +212,7 @@ def generate_new_decimal_problem():
     st.session_state.correct_answer = answer
     st.session_state.current_problem = operation
 
+@question_fragment
 def display_decimal_problem():
     """Display the current decimal problem"""
     data = st.session_state.problem_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -206,6 +207,7 @@ def generate_new_problem():
     st.session_state.correct_answer = answer
     st.session_state.current_problem = operation
 
+@question_fragment
 def display_problem():
     """Display the current problem interface"""
     data = st.session_state.problem_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.expressions import ExpressionError, evaluate_expression, parse_expression, reduction_steps
 
 def run():
     """
@@ -257,17 +258,14 @@ def generate_new_expression():
     
     # Calculate the correct answer
     try:
-        # Replace × and ÷ with * and / for eval
-        eval_expr = expression.replace('×', '*').replace('÷', '/')
-        correct_answer = eval(eval_expr)
+        correct_answer = evaluate_expression(expression)
         
         # Round if necessary (for division results)
-        if isinstance(correct_answer, float):
-            if correct_answer == int(correct_answer):
-                correct_answer = int(correct_answer)
-            else:
-                correct_answer = round(correct_answer, 2)
-    except:
+        if correct_answer.denominator == 1:
+            correct_answer = int(correct_answer)
+        else:
+            correct_answer = round(float(correct_answer), 2)
+    except ExpressionError:
         # Fallback to a simple expression if evaluation fails
         expression = "5 + 3 × 2"
         correct_answer = 11
@@ -392,107 +390,18 @@ def show_step_by_step_solution():
     with st.expander("📖 **Step-by-Step Solution**", expanded=True):
         st.markdown(f"### Let's evaluate: {expression}")
         
-        # Create a working copy of the expression
-        work_expr = expression
-        steps = []
-        
-        # Step 1: Handle parentheses
-        while '(' in work_expr:
-            # Find innermost parentheses
-            start = -1
-            for i, char in enumerate(work_expr):
-                if char == '(':
-                    start = i
-                elif char == ')' and start != -1:
-                    # Evaluate what's inside
-                    inner = work_expr[start+1:i]
-                    inner_eval = inner.replace('×', '*').replace('÷', '/')
-                    try:
-                        result = eval(inner_eval)
-                        if isinstance(result, float) and result == int(result):
-                            result = int(result)
-                        steps.append(f"Evaluate inside parentheses: ({inner}) = {result}")
-                        work_expr = work_expr[:start] + str(result) + work_expr[i+1:]
-                        break
-                    except:
-                        break
-        
-        # Step 2: Handle multiplication and division (left to right)
-        while '×' in work_expr or '÷' in work_expr:
-            # Find the leftmost × or ÷
-            mult_pos = work_expr.find('×')
-            div_pos = work_expr.find('÷')
-            
-            if mult_pos == -1:
-                pos = div_pos
-                op = '÷'
-            elif div_pos == -1:
-                pos = mult_pos
-                op = '×'
-            else:
-                if mult_pos < div_pos:
-                    pos = mult_pos
-                    op = '×'
-                else:
-                    pos = div_pos
-                    op = '÷'
-            
-            if pos != -1:
-                # Find the numbers around the operation
-                left_num, right_num, left_start, right_end = extract_numbers_around_op(work_expr, pos)
-                
-                if op == '×':
-                    result = left_num * right_num
-                    steps.append(f"Multiply: {left_num} × {right_num} = {result}")
-                else:
-                    result = left_num / right_num
-                    if result == int(result):
-                        result = int(result)
-                    else:
-                        result = round(result, 2)
-                    steps.append(f"Divide: {left_num} ÷ {right_num} = {result}")
-                
-                work_expr = work_expr[:left_start] + str(result) + work_expr[right_end:]
-        
-        # Step 3: Handle addition and subtraction (left to right)
-        while '+' in work_expr or ('-' in work_expr and not work_expr.startswith('-')):
-            # Find the leftmost + or -
-            add_pos = work_expr.find('+')
-            # Find subtraction (not negative numbers)
-            sub_pos = -1
-            for i in range(1, len(work_expr)):
-                if work_expr[i] == '-':
-                    sub_pos = i
-                    break
-            
-            if add_pos == -1 and sub_pos == -1:
-                break
-            elif add_pos == -1:
-                pos = sub_pos
-                op = '-'
-            elif sub_pos == -1:
-                pos = add_pos
-                op = '+'
-            else:
-                if add_pos < sub_pos:
-                    pos = add_pos
-                    op = '+'
-                else:
-                    pos = sub_pos
-                    op = '-'
-            
-            if pos != -1:
-                # Find the numbers around the operation
-                left_num, right_num, left_start, right_end = extract_numbers_around_op(work_expr, pos)
-                
-                if op == '+':
-                    result = left_num + right_num
-                    steps.append(f"Add: {left_num} + {right_num} = {result}")
-                else:
-                    result = left_num - right_num
-                    steps.append(f"Subtract: {left_num} - {right_num} = {result}")
-                
-                work_expr = work_expr[:left_start] + str(result) + work_expr[right_end:]
+        # Parentheses first, then × and ÷, then + and - (left to right)
+        step_labels = {
+            "parentheses": "Evaluate inside parentheses",
+            "multiply": "Multiply",
+            "divide": "Divide",
+            "add": "Add",
+            "subtract": "Subtract",
+        }
+        steps = [
+            f"{step_labels[step['kind']]}: {step['text']}"
+            for step in reduction_steps(parse_expression(expression))
+        ]
         
         # Display all steps
         st.markdown("### Order of Operations (PEMDAS):")
@@ -510,34 +419,6 @@ def show_step_by_step_solution():
         3️⃣ **A**ddition and **S**ubtraction (left to right)
         """)
 
-def extract_numbers_around_op(expr, op_pos):
-    """Extract numbers around an operation"""
-    # Find left number
-    left_start = op_pos - 1
-    while left_start > 0 and (expr[left_start-1].isdigit() or expr[left_start-1] == '.'):
-        left_start -= 1
-    if left_start > 0 and expr[left_start-1] == '-':
-        left_start -= 1
-    
-    # Find right number
-    right_end = op_pos + 1
-    if right_end < len(expr) and expr[right_end] == '-':
-        right_end += 1
-    while right_end < len(expr) and (expr[right_end].isdigit() or expr[right_end] == '.'):
-        right_end += 1
-    
-    left_num_str = expr[left_start:op_pos].strip()
-    right_num_str = expr[op_pos+1:right_end].strip()
-    
-    try:
-        left_num = float(left_num_str) if '.' in left_num_str else int(left_num_str)
-        right_num = float(right_num_str) if '.' in right_num_str else int(right_num_str)
-    except:
-        left_num = 0
-        right_num = 1
-    
-    return left_num, right_num, left_start, right_end
-
 def reset_expression_state():
     """Reset the expression state for next question"""
     st.session_state.current_expression = None
@@ -1,5 +1,7 @@
 import streamlit as st
 import random
+from utils.answers import canonical_answer
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -327,6 +329,7 @@ def generate_compound_expression():
     st.session_state.correct_answer = correct_expression
     st.session_state.current_problem = problem_text
 
+@question_fragment
 def display_expression_problem():
     """Display the current expression problem"""
     # Display the problem
@@ -388,28 +391,13 @@ def display_expression_problem():
 
 def normalize_expression(expr):
     """Normalize an expression for comparison"""
-    # Remove all spaces
-    expr = expr.replace(" ", "")
-    # Replace various multiplication symbols
-    expr = expr.replace("*", "×")
-    expr = expr.replace("x", "×")
-    expr = expr.replace("X", "×")
-    # Replace various division symbols
-    expr = expr.replace("/", "÷")
-    # Remove outer parentheses if they encompass the whole expression
-    if expr.startswith("(") and expr.endswith(")"):
-        # Check if these are the outermost parentheses
-        count = 0
-        for i, char in enumerate(expr):
-            if char == "(":
-                count += 1
-            elif char == ")":
-                count -= 1
-            if count == 0 and i < len(expr) - 1:
-                break
-        if i == len(expr) - 1:
-            expr = expr[1:-1]
-    return expr
+    # Spaces, × written as * or x, ÷ as /, and parentheses around the whole
+    # expression don't matter
+    normalized = canonical_answer(expr, "expression")
+    if normalized is None:
+        # Not an expression; compare it as typed
+        return expr.replace(" ", "")
+    return normalized
 
 def handle_feedback_and_next():
     """Handle feedback display and next question button"""
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -730,6 +731,7 @@ def generate_new_order_problem():
     }
     st.session_state.current_problem = problem_text
 
+@question_fragment
 def display_order_problem():
     """Display the current ordering problem"""
     problem_data = st.session_state.problem_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -528,6 +529,7 @@ def generate_new_guess_check_problem():
     }
     st.session_state.current_problem = problem_text
 
+@question_fragment
 def display_guess_check_problem():
     """Display the current guess-and-check problem"""
     problem_data = st.session_state.problem_data
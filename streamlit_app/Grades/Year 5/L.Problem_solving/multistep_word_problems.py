@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -563,6 +564,7 @@ def generate_new_multistep_problem():
     st.session_state.solution_steps = solution_steps
     st.session_state.current_problem = problem_text
 
+@question_fragment
 def display_multistep_problem():
     """Display the current multi-step problem"""
     # Display the problem
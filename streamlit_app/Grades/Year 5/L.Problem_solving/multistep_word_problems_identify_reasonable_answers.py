@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -699,6 +700,7 @@ def generate_new_reasonable_problem():
     }
     st.session_state.current_problem = problem_text
 
+@question_fragment
 def display_reasonable_problem():
     """Display the current reasonable answer problem"""
     problem_data = st.session_state.problem_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -483,6 +484,7 @@ def generate_new_remainder_problem():
     }
     st.session_state.current_problem = problem_text
 
+@question_fragment
 def display_remainder_problem():
     """Display the current remainder problem with fill-in-the-blank interface"""
     problem_data = st.session_state.problem_data
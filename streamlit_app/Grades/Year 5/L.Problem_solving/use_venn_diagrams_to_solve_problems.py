@@ -1,6 +1,8 @@
 import streamlit as st
 import random
 import html
+from utils.figure_cache import show_figure
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -360,6 +362,7 @@ def generate_new_venn_problem():
     }
     st.session_state.current_venn_problem = problem_text
 
+@question_fragment
 def display_venn_problem():
     """Display the current Venn diagram problem"""
     data = st.session_state.venn_data
@@ -419,7 +422,11 @@ def display_venn_problem():
                 st.rerun()
 
 def draw_venn_diagram(data):
-    """Draw Venn diagram using matplotlib"""
+    """Display the Venn diagram, drawn once per problem and feedback state"""
+    show_figure(create_venn_figure, data, st.session_state.show_feedback)
+
+def create_venn_figure(data, show_numbers):
+    """Create the Venn diagram figure using matplotlib"""
     import matplotlib.pyplot as plt
     import matplotlib.patches as patches
     
@@ -441,7 +448,7 @@ def draw_venn_diagram(data):
             fontsize=12, fontweight='bold')
     
     # Add numbers if feedback is shown
-    if st.session_state.show_feedback:
+    if show_numbers:
         ax.text(0.2, 0.5, str(data['only_group1']), ha='center', va='center', 
                 fontsize=20, fontweight='bold')
         ax.text(0.5, 0.5, str(data['both_count']), ha='center', va='center', 
@@ -459,9 +466,7 @@ def draw_venn_diagram(data):
     ax.set_aspect('equal')
     ax.axis('off')
     
-    # Display the figure
-    st.pyplot(fig)
-    plt.close()
+    return fig
 
 def handle_venn_answer(answer):
     """Handle user's answer submission"""
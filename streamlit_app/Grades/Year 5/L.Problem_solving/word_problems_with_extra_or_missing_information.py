@@ -1,5 +1,8 @@
 import streamlit as st
 import random
+import math
+from utils.expressions import evaluate_expression, to_number
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -187,7 +190,9 @@ def generate_problem_scenarios():
                     "per_tray": [24, 30, 36],
                     "per_box": [6, 8, 12]
                 },
-                "solution": "(trays × per_tray) ÷ per_box"
+                "solution": "(trays × per_tray) ÷ per_box",
+                # A part-filled box is still a box they need
+                "round_up": True
             }
         ],
         
@@ -221,7 +226,7 @@ def generate_problem_scenarios():
                 "variables": {
                     "floors": [4, 5, 6, 8],
                     "spaces": [75, 80, 100, 120],
-                    "taken": [234, 287, 345, 412]
+                    "taken": [134, 187, 245, 288]
                 },
                 "solution": "(floors × spaces) - taken"
             }
@@ -440,13 +445,12 @@ def generate_new_extra_missing_problem():
     if problem_type == "solvable":
         # Calculate the actual answer
         solution = problem_template["solution"]
-        # Replace variable names with values for calculation
-        calc_expr = solution
-        for var, val in variable_values.items():
-            calc_expr = calc_expr.replace(var, str(val))
         
         try:
-            correct_answer = eval(calc_expr)
+            value = evaluate_expression(solution, variable_values)
+            if problem_template.get("round_up"):
+                value = math.ceil(value)
+            correct_answer = to_number(value)
             # Generate plausible wrong answers
             wrong_answers = []
             
@@ -499,6 +503,7 @@ def generate_new_extra_missing_problem():
     }
     st.session_state.current_problem = problem_text
 
+@question_fragment
 def display_extra_missing_problem():
     """Display the current problem with extra or missing information"""
     problem_data = st.session_state.problem_data
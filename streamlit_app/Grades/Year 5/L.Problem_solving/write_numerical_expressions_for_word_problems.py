@@ -1,5 +1,7 @@
 import streamlit as st
 import random
+from utils.expressions import evaluate_expression, format_number
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -344,6 +346,7 @@ def generate_new_word_expression_problem():
     st.session_state.wrong_expression = wrong_expression
     st.session_state.current_problem = problem_text
 
+@question_fragment
 def display_word_expression_problem():
     """Display the current word expression problem"""
     # Display the story
@@ -389,7 +392,7 @@ def display_word_expression_problem():
             type="secondary" if st.session_state.selected_expression != "left" else "primary"
         ):
             st.session_state.selected_expression = "left"
-            st.rerun()
+            rerun_question()
     
     with col2:
         if st.button(
@@ -400,7 +403,7 @@ def display_word_expression_problem():
             type="secondary" if st.session_state.selected_expression != "right" else "primary"
         ):
             st.session_state.selected_expression = "right"
-            st.rerun()
+            rerun_question()
     
     # Submit button
     if st.session_state.selected_expression and not st.session_state.answer_submitted:
@@ -418,7 +421,7 @@ def display_word_expression_problem():
                 
                 st.session_state.show_feedback = True
                 st.session_state.answer_submitted = True
-                st.rerun()
+                rerun_question()
     
     # Show feedback and next button
     handle_feedback_and_next()
@@ -476,6 +479,8 @@ def show_problem_explanation():
     operation = st.session_state.problem_data["operation"]
     num1 = st.session_state.problem_data["num1"]
     num2 = st.session_state.problem_data["num2"]
+    # What the story's question works out to
+    value = format_number(evaluate_expression(st.session_state.correct_expression))
     
     with st.expander("📖 **Understanding the Problem**", expanded=True):
         st.markdown("### Let's break down the story:")
@@ -492,7 +497,7 @@ def show_problem_explanation():
             
             **Operation:** Addition (+)
             
-            **Expression:** {num1} + {num2}
+            **Expression:** {num1} + {num2} = {value}
             
             💡 **Why not multiplication?**
             We're combining two separate amounts, not finding groups of equal size.
@@ -509,7 +514,7 @@ def show_problem_explanation():
             
             **Operation:** Subtraction (-)
             
-            **Expression:** {num1} - {num2}
+            **Expression:** {num1} - {num2} = {value}
             
             💡 **Why not addition?**
             We're finding what remains after taking away, not combining.
@@ -526,7 +531,7 @@ def show_problem_explanation():
             
             **Operation:** Multiplication (×)
             
-            **Expression:** {num1} × {num2}
+            **Expression:** {num1} × {num2} = {value}
             
             💡 **Why not addition?**
             We have equal groups, not just two amounts to add.
@@ -544,7 +549,7 @@ def show_problem_explanation():
             
             **Operation:** Division (÷)
             
-            **Expression:** {num1} ÷ {num2}
+            **Expression:** {num1} ÷ {num2} = {value}
             
             💡 **Why not multiplication?**
             We're finding how many groups, not the total of groups.
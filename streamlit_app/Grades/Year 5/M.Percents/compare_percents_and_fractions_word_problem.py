@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from fractions import Fraction
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -326,6 +327,7 @@ def generate_new_word_problem():
     st.session_state.correct_answer = correct_answer
     st.session_state.current_question = "word_comparison"
 
+@question_fragment
 def display_word_problem():
     """Display the current word problem interface"""
     data = st.session_state.question_data
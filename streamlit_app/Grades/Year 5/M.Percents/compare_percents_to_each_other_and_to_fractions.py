@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from fractions import Fraction
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -331,6 +332,7 @@ def generate_percent_decimal_comparison(difficulty):
     st.session_state.correct_answer = correct_sign
     st.session_state.current_question = "comparison_question"  # Mark that we have a question
 
+@question_fragment
 def display_comparison_question():
     """Display the current comparison question interface"""
     data = st.session_state.question_data
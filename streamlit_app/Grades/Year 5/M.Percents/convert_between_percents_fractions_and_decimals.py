@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from fractions import Fraction
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -313,6 +314,7 @@ def generate_decimal_to_fraction(difficulty):
     st.session_state.correct_answer = st.session_state.question_data["answer_str"]
     st.session_state.current_question = f"How do you write {decimal} as a fraction?"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     # Display question
@@ -1,6 +1,8 @@
 import streamlit as st
 import random
 import json
+from utils.widgets import new_question, shade_grid
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -54,6 +56,7 @@ def run():
     
     # Generate new question if needed
     if st.session_state.current_question is None:
+        new_question("percent_grid")
         generate_new_question()
     
     # Display current question
@@ -128,6 +131,7 @@ def generate_new_question():
     st.session_state.current_question = f"Shade {numerator}/{denominator} of the grid."
     st.session_state.cells_shaded = 0
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -137,27 +141,14 @@ def display_question():
     st.markdown(f"**{st.session_state.current_question}**")
     st.markdown("*Click and drag to shade.*")
     
-    # Create placeholder for cell count
-    cell_count_placeholder = st.empty()
-    
-    # Display initial progress
-    update_progress(cell_count_placeholder)
-    
-    # Create interactive grid
-    create_draggable_grid(cell_count_placeholder)
-    
-    # Clear button
-    col1, col2, col3 = st.columns([3, 1, 3])
-    with col2:
-        if st.button("🔄 Clear Grid", type="secondary"):
-            st.session_state.cells_shaded = 0
-            st.rerun()
-    
-    # Answer input section
-    st.markdown("---")
-    st.markdown(f"**What percent is equivalent to {data['fraction_str']}?**")
-    
     with st.form("answer_form", clear_on_submit=False):
+        # Shading stays in the page until the form is submitted
+        cells_shaded = create_draggable_grid()
+        
+        # Answer input section
+        st.markdown("---")
+        st.markdown(f"**What percent is equivalent to {data['fraction_str']}?**")
+        
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
             user_answer = st.text_input(
@@ -174,11 +165,14 @@ def display_question():
             submit_button = st.form_submit_button("✅ Submit", type="primary", use_container_width=True)
         
         if submit_button and user_answer:
+            st.session_state.cells_shaded = cells_shaded or 0
             st.session_state.user_answer = user_answer
             st.session_state.show_feedback = True
             st.session_state.answer_submitted = True
     
     # Show feedback and next button
+    if st.session_state.answer_submitted:
+        update_progress(st.empty())
     handle_feedback_and_next()
 
 def update_progress(placeholder):
@@ -194,252 +188,13 @@ def update_progress(placeholder):
         else:
             st.warning(f"Too many! Cells shaded: {cells_shaded}/{cells_needed} (unshade {cells_shaded - cells_needed})")
 
-def create_draggable_grid(cell_count_placeholder):
-    """Create an interactive grid with drag functionality"""
-    
-    grid_html = f"""
-    <div id="grid-container-wrapper">
-        <style>
-            #grid-container-wrapper {{
-                text-align: center;
-                margin: 20px 0;
-            }}
-            #fraction-grid {{
-                display: inline-grid;
-                grid-template-columns: repeat(10, 35px);
-                grid-template-rows: repeat(10, 35px);
-                gap: 0;
-                border: 3px solid #333;
-                background: white;
-                cursor: crosshair;
-                user-select: none;
-                -webkit-user-select: none;
-                -moz-user-select: none;
-                -ms-user-select: none;
-            }}
-            .grid-cell {{
-                width: 35px;
-                height: 35px;
-                border: 1px solid #ccc;
-                background: white;
-                transition: background-color 0.1s ease;
-            }}
-            .grid-cell.shaded {{
-                background: #2196F3;
-            }}
-            .grid-cell.preview {{
-                background: #90CAF9 !important;
-            }}
-            #grid-info {{
-                text-align: center;
-                margin: 10px 0;
-                font-size: 14px;
-                color: #666;
-            }}
-        </style>
-        
-        <div id="fraction-grid"></div>
-        <div id="grid-info">Drag to shade • Click shaded cells to unshade</div>
-        
-        <script>
-            (function() {{
-                const GRID_SIZE = 10;
-                let isMouseDown = false;
-                let isShading = true;
-                let startCell = null;
-                let currentShadedCount = {st.session_state.cells_shaded};
-                const grid = document.getElementById('fraction-grid');
-                
-                // Create grid
-                for (let i = 0; i < GRID_SIZE * GRID_SIZE; i++) {{
-                    const cell = document.createElement('div');
-                    cell.className = 'grid-cell';
-                    cell.dataset.index = i;
-                    cell.dataset.row = Math.floor(i / GRID_SIZE);
-                    cell.dataset.col = i % GRID_SIZE;
-                    grid.appendChild(cell);
-                }}
-                
-                // Restore previous state if any
-                if (currentShadedCount > 0) {{
-                    const cells = grid.querySelectorAll('.grid-cell');
-                    for (let i = 0; i < currentShadedCount && i < cells.length; i++) {{
-                        cells[i].classList.add('shaded');
-                    }}
-                }}
-                
-                // Get all cells in rectangle between two cells
-                function getCellsInRectangle(cell1, cell2) {{
-                    if (!cell1 || !cell2) return [];
-                    
-                    const r1 = parseInt(cell1.dataset.row);
-                    const c1 = parseInt(cell1.dataset.col);
-                    const r2 = parseInt(cell2.dataset.row);
-                    const c2 = parseInt(cell2.dataset.col);
-                    
-                    const minR = Math.min(r1, r2);
-                    const maxR = Math.max(r1, r2);
-                    const minC = Math.min(c1, c2);
-                    const maxC = Math.max(c1, c2);
-                    
-                    const cells = [];
-                    for (let r = minR; r <= maxR; r++) {{
-                        for (let c = minC; c <= maxC; c++) {{
-                            const index = r * GRID_SIZE + c;
-                            const cell = grid.querySelector(`[data-index="${{index}}"]`);
-                            if (cell) cells.push(cell);
-                        }}
-                    }}
-                    return cells;
-                }}
-                
-                // Clear preview
-                function clearPreview() {{
-                    grid.querySelectorAll('.preview').forEach(cell => {{
-                        cell.classList.remove('preview');
-                    }});
-                }}
-                
-                // Update cells
-                function updateCells(cells, shade) {{
-                    cells.forEach(cell => {{
-                        if (shade && !cell.classList.contains('shaded')) {{
-                            cell.classList.add('shaded');
-                            currentShadedCount++;
-                        }} else if (!shade && cell.classList.contains('shaded')) {{
-                            cell.classList.remove('shaded');
-                            currentShadedCount--;
-                        }}
-                    }});
-                    
-                    // Update Streamlit
-                    updateStreamlit();
-                }}
-                
-                // Update Streamlit state
-                function updateStreamlit() {{
-                    // Create a custom event to communicate with Streamlit
-                    window.parent.postMessage({{
-                        type: 'UPDATE_CELLS',
-                        count: currentShadedCount
-                    }}, '*');
-                }}
-                
-                // Mouse events
-                grid.addEventListener('mousedown', (e) => {{
-                    if (e.target.classList.contains('grid-cell')) {{
-                        e.preventDefault();
-                        isMouseDown = true;
-                        startCell = e.target;
-                        isShading = !e.target.classList.contains('shaded');
-                        updateCells([e.target], isShading);
-                    }}
-                }});
-                
-                grid.addEventListener('mousemove', (e) => {{
-                    if (isMouseDown && e.target.classList.contains('grid-cell')) {{
-                        clearPreview();
-                        const cells = getCellsInRectangle(startCell, e.target);
-                        cells.forEach(cell => {{
-                            if (isShading && !cell.classList.contains('shaded')) {{
-                                cell.classList.add('preview');
-                            }} else if (!isShading && cell.classList.contains('shaded')) {{
-                                cell.classList.add('preview');
-                            }}
-                        }});
-                    }}
-                }});
-                
-                grid.addEventListener('mouseup', (e) => {{
-                    if (isMouseDown) {{
-                        clearPreview();
-                        const endCell = e.target.classList.contains('grid-cell') ? e.target : startCell;
-                        const cells = getCellsInRectangle(startCell, endCell);
-                        updateCells(cells, isShading);
-                        isMouseDown = false;
-                        startCell = null;
-                    }}
-                }});
-                
-                // Global mouseup
-                document.addEventListener('mouseup', () => {{
-                    if (isMouseDown) {{
-                        clearPreview();
-                        isMouseDown = false;
-                        startCell = null;
-                    }}
-                }});
-                
-                // Touch support
-                let touchStartCell = null;
-                
-                grid.addEventListener('touchstart', (e) => {{
-                    const touch = e.touches[0];
-                    const element = document.elementFromPoint(touch.clientX, touch.clientY);
-                    if (element && element.classList.contains('grid-cell')) {{
-                        e.preventDefault();
-                        touchStartCell = element;
-                        isShading = !element.classList.contains('shaded');
-                    }}
-                }});
-                
-                grid.addEventListener('touchmove', (e) => {{
-                    e.preventDefault();
-                    const touch = e.touches[0];
-                    const element = document.elementFromPoint(touch.clientX, touch.clientY);
-                    if (element && element.classList.contains('grid-cell') && touchStartCell) {{
-                        clearPreview();
-                        const cells = getCellsInRectangle(touchStartCell, element);
-                        cells.forEach(cell => {{
-                            if (isShading && !cell.classList.contains('shaded')) {{
-                                cell.classList.add('preview');
-                            }} else if (!isShading && cell.classList.contains('shaded')) {{
-                                cell.classList.add('preview');
-                            }}
-                        }});
-                    }}
-                }});
-                
-                grid.addEventListener('touchend', (e) => {{
-                    if (touchStartCell) {{
-                        clearPreview();
-                        const touch = e.changedTouches[0];
-                        const element = document.elementFromPoint(touch.clientX, touch.clientY);
-                        const endCell = element && element.classList.contains('grid-cell') ? element : touchStartCell;
-                        const cells = getCellsInRectangle(touchStartCell, endCell);
-                        updateCells(cells, isShading);
-                        touchStartCell = null;
-                    }}
-                }});
-                
-                // Listen for messages to update count
-                window.addEventListener('message', (e) => {{
-                    if (e.data && e.data.type === 'UPDATE_CELLS') {{
-                        currentShadedCount = e.data.count;
-                    }}
-                }});
-                
-                // Initial update
-                updateStreamlit();
-            }})();
-        </script>
-    </div>
-    """
-    
-    # Display the grid
-    st.components.v1.html(grid_html, height=450)
-    
-    # JavaScript to handle updates from the grid
-    st.markdown("""
-    <script>
-        window.addEventListener('message', (e) => {
-            if (e.data && e.data.type === 'UPDATE_CELLS') {
-                // Store the count for retrieval
-                window.cellCount = e.data.count;
-            }
-        });
-    </script>
-    """, unsafe_allow_html=True)
+def create_draggable_grid():
+    """Create an interactive grid with drag functionality and return the cells shaded"""
+    return shade_grid(
+        target=st.session_state.cells_needed,
+        problem=st.session_state.question_data,
+        key="percent_grid"
+    )
 
 def handle_feedback_and_next():
     """Handle feedback display and next question button"""
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -206,6 +207,7 @@ def generate_new_question():
     st.session_state.correct_answer = scenario["correct_percentage"]
     st.session_state.current_question = f"What percentage of the shape is {scenario['color_name']}?"
 
+@question_fragment
 def display_question():
     """Display the current question interface"""
     data = st.session_state.question_data
@@ -2,6 +2,7 @@ import streamlit as st
 import random
 from fractions import Fraction
 from math import floor
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -183,6 +184,7 @@ def generate_new_problem():
     }
     st.session_state.current_problem = f"{'Add' if operation == 'add' else 'Subtract'} these money amounts:"
 
+@question_fragment
 def display_problem():
     """Display the money problem with interactive digit boxes"""
     data = st.session_state.problem_data
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from decimal import Decimal, ROUND_HALF_UP
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -397,6 +398,7 @@ def generate_specific_problem(problem_type, difficulty):
     }
     st.session_state.current_problem = problem
 
+@question_fragment
 def display_problem():
     """Display the word problem with input field"""
     data = st.session_state.problem_data
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from decimal import Decimal, ROUND_HALF_UP
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -327,6 +328,7 @@ def generate_specific_problem(template, item_data, quantity, people, difficulty)
     }
     st.session_state.current_problem = problem
 
+@question_fragment
 def display_problem():
     """Display the word problem with input field"""
     data = st.session_state.problem_data
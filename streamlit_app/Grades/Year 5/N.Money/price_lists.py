@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from decimal import Decimal, ROUND_HALF_UP
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -349,6 +350,7 @@ def generate_specific_problem(scenario, problem_type, difficulty):
     st.session_state.current_problem = problem_text
     st.session_state.problem_type = problem_type["type"]
 
+@question_fragment
 def display_problem():
     """Display the problem with price list"""
     data = st.session_state.problem_data
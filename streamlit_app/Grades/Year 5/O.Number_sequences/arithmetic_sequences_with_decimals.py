@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -188,6 +189,7 @@ def generate_new_decimal_problem():
     }
     st.session_state.current_decimal_problem = True
 
+@question_fragment
 def display_decimal_problem():
     """Display the decimal arithmetic sequence problem"""
     data = st.session_state.decimal_problem_data
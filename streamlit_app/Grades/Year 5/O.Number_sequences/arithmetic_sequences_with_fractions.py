@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 from fractions import Fraction
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -233,6 +234,7 @@ def generate_new_fraction_problem():
     }
     st.session_state.current_fraction_problem = True
 
+@question_fragment
 def display_fraction_problem():
     """Display the fraction sequence problem"""
     data = st.session_state.fraction_problem_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -169,6 +170,7 @@ def generate_new_problem():
     }
     st.session_state.current_problem = True
 
+@question_fragment
 def display_problem():
     """Display the arithmetic sequence problem"""
     data = st.session_state.problem_data
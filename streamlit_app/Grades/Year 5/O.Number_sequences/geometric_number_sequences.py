@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -210,6 +211,7 @@ def generate_new_geometric_problem():
     }
     st.session_state.current_geometric_problem = True
 
+@question_fragment
 def display_geometric_problem():
     """Display the geometric sequence problem"""
     data = st.session_state.geometric_problem_data
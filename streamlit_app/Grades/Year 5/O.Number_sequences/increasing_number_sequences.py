@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -261,6 +262,7 @@ def generate_new_increasing_problem():
     }
     st.session_state.current_increasing_problem = True
 
+@question_fragment
 def display_increasing_problem():
     """Display the increasing sequence problem"""
     data = st.session_state.increasing_problem_data
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -373,6 +374,7 @@ def generate_new_word_problem():
     }
     st.session_state.current_word_problem = True
 
+@question_fragment
 def display_word_problem():
     """Display the word problem"""
     data = st.session_state.word_problem_data
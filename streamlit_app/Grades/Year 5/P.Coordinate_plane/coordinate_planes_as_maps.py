@@ -1,9 +1,13 @@
 import streamlit as st
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.offsetbox import AnnotationBbox, OffsetImage
-import numpy as np
 import random
+from utils.figure_cache import show_figure
+from utils.lazy_imports import lazy_import
+from utils.fragments import question_fragment, rerun_question
+
+plt = lazy_import("matplotlib.pyplot")
+patches = lazy_import("matplotlib.patches")
+offsetbox = lazy_import("matplotlib.offsetbox")
+np = lazy_import("numpy")
 
 def run():
     """
@@ -268,6 +272,7 @@ def generate_map_problem():
     st.session_state.show_result = False
     st.session_state.selected_answer = None
 
+@question_fragment
 def display_map_problem():
     """Display the map and question interface"""
     problem = st.session_state.current_map_problem
@@ -295,7 +300,7 @@ def display_map_problem():
                     type="primary" if st.session_state.selected_answer == option else "secondary"
                 ):
                     st.session_state.selected_answer = option
-                    st.rerun()
+                    rerun_question()
             
             # Submit button
             st.markdown("---")
@@ -327,6 +332,10 @@ def display_map_problem():
                 st.rerun()
 
 def create_map_visualization(problem):
+    """Display the map, drawn once per problem and result state"""
+    show_figure(draw_map, problem, st.session_state.show_result)
+
+def draw_map(problem, show_result):
     """Create the map visualization with locations"""
     settings = problem['settings']
     location_map = problem['location_map']
@@ -365,7 +374,7 @@ def create_map_visualization(problem):
                    bbox=dict(boxstyle="round,pad=0.2", facecolor='lightyellow', alpha=0.7))
     
     # Highlight target position if showing result
-    if st.session_state.show_result:
+    if show_result:
         if problem['question_type'] == 'what_is_at' and problem['target_position']:
             # Highlight the position asked about
             x, y = problem['target_position']
@@ -394,7 +403,7 @@ def create_map_visualization(problem):
                 fontsize=16, pad=20)
     
     plt.tight_layout()
-    st.pyplot(fig)
+    return fig
     
     # Show legend
     with st.expander("📍 Location Legend", expanded=False):
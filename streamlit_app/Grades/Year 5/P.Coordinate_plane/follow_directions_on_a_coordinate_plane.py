@@ -1,9 +1,12 @@
 import streamlit as st
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import FancyArrowPatch
-import numpy as np
 import random
+from utils.figure_cache import show_figure
+from utils.lazy_imports import lazy_import
+from utils.fragments import question_fragment
+
+plt = lazy_import("matplotlib.pyplot")
+patches = lazy_import("matplotlib.patches")
+np = lazy_import("numpy")
 
 def run():
     """
@@ -287,6 +290,7 @@ def generate_direction_problem():
     st.session_state.user_x = ""
     st.session_state.user_y = ""
 
+@question_fragment
 def display_direction_problem():
     """Display the direction problem interface"""
     problem = st.session_state.current_direction_problem
@@ -369,6 +373,17 @@ def display_direction_problem():
                 st.rerun()
 
 def create_direction_visualization(problem):
+    """Display the coordinate grid, drawn once per problem and answer"""
+    show_result = st.session_state.show_result
+    user_answer = None
+    if show_result:
+        try:
+            user_answer = (int(st.session_state.user_x), int(st.session_state.user_y))
+        except:
+            pass
+    show_figure(draw_direction_grid, problem, show_result, user_answer)
+
+def draw_direction_grid(problem, show_result, user_answer):
     """Create the coordinate grid with movement visualization"""
     settings = problem['settings']
     
@@ -400,7 +415,7 @@ def create_direction_visualization(problem):
     ax.text(start_x + 0.2, start_y + 0.2, 'START', fontsize=10, color='green', weight='bold')
     
     # If showing result, draw the path
-    if st.session_state.show_result:
+    if show_result:
         # Draw path
         path = problem['path']
         for i in range(len(path) - 1):
@@ -408,7 +423,7 @@ def create_direction_visualization(problem):
             x2, y2 = path[i + 1]
             
             # Draw arrow
-            arrow = FancyArrowPatch(
+            arrow = patches.FancyArrowPatch(
                 (x1, y1), (x2, y2),
                 arrowstyle='->', 
                 mutation_scale=20,
@@ -431,15 +446,11 @@ def create_direction_visualization(problem):
         ax.text(end_x + 0.2, end_y + 0.2, 'END', fontsize=10, color='red', weight='bold')
         
         # Draw user's answer if incorrect
-        try:
-            user_x = int(st.session_state.user_x)
-            user_y = int(st.session_state.user_y)
-            if (user_x, user_y) != (end_x, end_y):
-                ax.plot(user_x, user_y, 'ko', markersize=15, alpha=0.5)
-                ax.text(user_x + 0.2, user_y - 0.3, 'Your Answer', 
-                       fontsize=9, color='black', alpha=0.7)
-        except:
-            pass
+        if user_answer is not None and user_answer != (end_x, end_y):
+            user_x, user_y = user_answer
+            ax.plot(user_x, user_y, 'ko', markersize=15, alpha=0.5)
+            ax.text(user_x + 0.2, user_y - 0.3, 'Your Answer', 
+                   fontsize=9, color='black', alpha=0.7)
     else:
         # Just show starting point with a question mark for end
         ax.text(settings['grid_size'] / 2, settings['grid_size'] - 1, '?', 
@@ -449,11 +460,11 @@ def create_direction_visualization(problem):
     ax.set_title("Follow the Directions", fontsize=16, pad=20)
     
     # Add legend if showing result
-    if st.session_state.show_result:
+    if show_result:
         ax.legend(loc='upper right', bbox_to_anchor=(1.15, 1))
     
     plt.tight_layout()
-    st.pyplot(fig)
+    return fig
 
 def check_direction_answer():
     """Check if the submitted answer is correct"""
@@ -1,8 +1,11 @@
 import streamlit as st
-from streamlit_plotly_events import plotly_events
-import plotly.graph_objects as go
 import random
 import math
+from utils.lazy_imports import lazy_import
+from utils.fragments import question_fragment, rerun_question
+
+go = lazy_import("plotly.graph_objects")
+streamlit_plotly_events = lazy_import("streamlit_plotly_events")
 
 def run():
     """
@@ -278,6 +281,7 @@ def generate_graph_problem():
     st.session_state.show_result = False
     st.session_state.plot_key += 1
 
+@question_fragment
 def display_graph_problem():
     """Display the interactive coordinate plane"""
     problem = st.session_state.current_graph_problem
@@ -309,7 +313,7 @@ def display_graph_problem():
             # Important: Add config to enable click events
             config = {'displayModeBar': False}
             
-            clicked_points = plotly_events(
+            clicked_points = streamlit_plotly_events.plotly_events(
                 fig,
                 click_event=True,
                 hover_event=False,
@@ -341,7 +345,7 @@ def display_graph_problem():
                 if st.button("Clear All", type="secondary", use_container_width=True):
                     st.session_state.plotted_points = []
                     st.session_state.plot_key += 1
-                    st.rerun()
+                    rerun_question()
             
             # Submit button
             if points_plotted == points_needed:
@@ -378,7 +382,7 @@ def display_graph_problem():
                 if (x_input, y_input) not in st.session_state.plotted_points:
                     st.session_state.plotted_points.append((x_input, y_input))
                     st.session_state.plot_key += 1
-                    st.rerun()
+                    rerun_question()
                 else:
                     st.warning("Point already plotted!")
         
@@ -560,7 +564,7 @@ def handle_click(clicked_point, problem):
             if (x, y) not in st.session_state.plotted_points:
                 st.session_state.plotted_points.append((x, y))
                 st.session_state.plot_key += 1
-                st.rerun()
+                rerun_question()
 
 def check_graph_answer():
     """Check if the plotted points are correct"""
@@ -1,8 +1,12 @@
 import streamlit as st
 import random
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-import numpy as np
+from utils.figure_cache import show_figure
+from utils.lazy_imports import lazy_import
+from utils.fragments import question_fragment
+
+plt = lazy_import("matplotlib.pyplot")
+patches = lazy_import("matplotlib.patches")
+np = lazy_import("numpy")
 
 def run():
     """
@@ -325,6 +329,7 @@ def generate_distractors(correct_answer, other_coord, ask_for, settings):
     
     return distractors[:3]
 
+@question_fragment
 def display_coordinate_problem():
     """Display the coordinate plane with shape(s)"""
     problem = st.session_state.current_problem
@@ -352,9 +357,8 @@ def display_coordinate_problem():
     
     st.markdown(question)
     
-    # Create coordinate plane with matplotlib
-    fig = create_coordinate_plane_plot(problem)
-    st.pyplot(fig)
+    # Coordinate plane, drawn once per problem state
+    show_figure(create_coordinate_plane_plot, problem)
     
     # Handle input based on type
     if not problem.get("answered", False):
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -350,6 +351,7 @@ def get_expert_scenarios():
         }
     ]
 
+@question_fragment
 def display_problem():
     """Display the current problem"""
     data = st.session_state.problem_data
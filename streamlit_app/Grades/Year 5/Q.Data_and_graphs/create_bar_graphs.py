@@ -1,7 +1,7 @@
 import streamlit as st
-import streamlit.components.v1 as components
 import random
-import json
+from utils.widgets import draggable_bar_chart, new_question
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -18,6 +18,7 @@ def run():
         st.session_state.current_values = {}
     
     if "current_create_bar_problem" not in st.session_state:
+        new_question("create_bar_chart")
         generate_create_bar_problem()
     
     # Page header
@@ -284,7 +285,7 @@ def generate_create_bar_problem():
     st.session_state.graph_submitted = False
 
 def create_draggable_bar_chart(problem):
-    """Create HTML/JS for draggable bar chart"""
+    """Display the draggable bar chart and return the bar values once checked"""
     data = problem["data"]
     settings = problem["settings"]
     context = data["context"]
@@ -304,345 +305,19 @@ def create_draggable_bar_chart(problem):
             "index": i
         })
     
-    # Create the HTML/JS
-    html_code = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <script src="https://d3js.org/d3.v7.min.js"></script>
-        <style>
-            body {{
-                font-family: Arial, sans-serif;
-                margin: 0;
-                padding: 20px;
-                background: white;
-            }}
-            .bar {{
-                cursor: pointer;
-                transition: opacity 0.2s;
-            }}
-            .bar.draggable {{
-                cursor: ns-resize;
-                stroke: #333;
-                stroke-width: 2;
-            }}
-            .bar.draggable:hover {{
-                opacity: 0.7;
-            }}
-            .axis {{
-                font-size: 12px;
-            }}
-            .grid line {{
-                stroke: #e0e0e0;
-                stroke-dasharray: 3,3;
-            }}
-            .grid path {{
-                stroke-width: 0;
-            }}
-            .target-line {{
-                stroke: #52c41a;
-                stroke-width: 3;
-                stroke-dasharray: 5,5;
-                opacity: 0.8;
-            }}
-            .value-label {{
-                font-size: 14px;
-                font-weight: bold;
-                text-anchor: middle;
-            }}
-            .title {{
-                font-size: 18px;
-                font-weight: bold;
-                text-anchor: middle;
-            }}
-            .drag-hint {{
-                font-size: 12px;
-                fill: #ff4d4f;
-                text-anchor: middle;
-                font-weight: bold;
-            }}
-            #submit-btn {{
-                position: absolute;
-                bottom: 20px;
-                right: 20px;
-                padding: 10px 20px;
-                background: #1890ff;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                cursor: pointer;
-                font-size: 16px;
-            }}
-            #submit-btn:hover {{
-                background: #40a9ff;
-            }}
-            .feedback {{
-                position: absolute;
-                top: 20px;
-                right: 20px;
-                padding: 10px;
-                border-radius: 4px;
-                font-weight: bold;
-            }}
-            .feedback.correct {{
-                background: #f6ffed;
-                color: #52c41a;
-                border: 1px solid #b7eb8f;
-            }}
-            .feedback.incorrect {{
-                background: #fff2e8;
-                color: #fa8c16;
-                border: 1px solid #ffbb96;
-            }}
-            .arrow {{
-                fill: #ff4d4f;
-            }}
-        </style>
-    </head>
-    <body>
-        <div id="chart"></div>
-        <div id="feedback" class="feedback" style="display: none;"></div>
-        <button id="submit-btn" onclick="submitAnswer()">Check Answer</button>
-        
-        <script>
-            // Data
-            const data = {chart_data_json};
-            const maxValue = {max_value};
-            const stepSize = {step_size};
-            
-            // Dimensions
-            const margin = {{top: 60, right: 40, bottom: 60, left: 60}};
-            const width = 700 - margin.left - margin.right;
-            const height = 400 - margin.top - margin.bottom;
-            
-            // Create SVG
-            const svg = d3.select("#chart")
-                .append("svg")
-                .attr("width", width + margin.left + margin.right)
-                .attr("height", height + margin.top + margin.bottom)
-                .append("g")
-                .attr("transform", "translate(" + margin.left + "," + margin.top + ")");
-            
-            // Title
-            svg.append("text")
-                .attr("class", "title")
-                .attr("x", width / 2)
-                .attr("y", -30)
-                .text("{title}");
-            
-            // Scales
-            const x = d3.scaleBand()
-                .range([0, width])
-                .domain(data.map(d => d.category))
-                .padding(0.2);
-            
-            const y = d3.scaleLinear()
-                .range([height, 0])
-                .domain([0, maxValue]);
-            
-            // Grid
-            svg.append("g")
-                .attr("class", "grid")
-                .attr("transform", "translate(0," + height + ")")
-                .call(d3.axisBottom(x)
-                    .tickSize(-height)
-                    .tickFormat("")
-                );
-            
-            svg.append("g")
-                .attr("class", "grid")
-                .call(d3.axisLeft(y)
-                    .tickSize(-width)
-                    .tickFormat("")
-                    .ticks(maxValue / stepSize)
-                );
-            
-            // X axis
-            svg.append("g")
-                .attr("transform", "translate(0," + height + ")")
-                .call(d3.axisBottom(x))
-                .append("text")
-                .attr("x", width / 2)
-                .attr("y", 40)
-                .style("text-anchor", "middle")
-                .style("fill", "black")
-                .text("{x_label}");
-            
-            // Y axis
-            svg.append("g")
-                .call(d3.axisLeft(y).ticks(maxValue / stepSize))
-                .append("text")
-                .attr("transform", "rotate(-90)")
-                .attr("y", -40)
-                .attr("x", -height / 2)
-                .style("text-anchor", "middle")
-                .style("fill", "black")
-                .text("{y_label} ({unit})");
-            
-            // Target lines for draggable bars
-            const targetLines = svg.selectAll(".target-line")
-                .data(data.filter(d => d.isDraggable))
-                .enter().append("line")
-                .attr("class", "target-line")
-                .attr("x1", d => x(d.category))
-                .attr("x2", d => x(d.category) + x.bandwidth())
-                .attr("y1", d => y(d.targetValue))
-                .attr("y2", d => y(d.targetValue));
-            
-            // Add labels for target values
-            svg.selectAll(".target-label")
-                .data(data.filter(d => d.isDraggable))
-                .enter().append("text")
-                .attr("x", d => x(d.category) + x.bandwidth() + 5)
-                .attr("y", d => y(d.targetValue))
-                .attr("dy", "0.3em")
-                .style("font-size", "12px")
-                .style("fill", "#52c41a")
-                .text(d => "Target: " + d.targetValue);
-            
-            // Bars
-            const bars = svg.selectAll(".bar")
-                .data(data)
-                .enter().append("rect")
-                .attr("class", d => d.isDraggable ? "bar draggable" : "bar")
-                .attr("x", d => x(d.category))
-                .attr("width", x.bandwidth())
-                .attr("y", d => y(d.value))
-                .attr("height", d => height - y(d.value))
-                .attr("fill", d => {{
-                    if (!d.isDraggable) return "#1890ff";
-                    return d.value === d.targetValue ? "#52c41a" : "#ff4d4f";
-                }});
-            
-            // Add drag hints for draggable bars
-            const dragHints = svg.selectAll(".drag-hint")
-                .data(data.filter(d => d.isDraggable))
-                .enter().append("text")
-                .attr("class", "drag-hint")
-                .attr("x", d => x(d.category) + x.bandwidth() / 2)
-                .attr("y", d => y(d.value) - 25)
-                .text("↕ Drag me!");
-            
-            // Value labels
-            const labels = svg.selectAll(".value-label")
-                .data(data)
-                .enter().append("text")
-                .attr("class", "value-label")
-                .attr("x", d => x(d.category) + x.bandwidth() / 2)
-                .attr("y", d => y(d.value) - 5)
-                .text(d => d.value);
-            
-            // Drag behavior
-            const drag = d3.drag()
-                .on("start", function(event, d) {{
-                    if (!d.isDraggable) return;
-                    d3.select(this).style("opacity", 0.6);
-                    // Hide drag hint when dragging starts
-                    dragHints.filter(h => h.index === d.index)
-                        .style("display", "none");
-                }})
-                .on("drag", function(event, d) {{
-                    if (!d.isDraggable) return;
-                    
-                    // Calculate new value
-                    let newY = Math.max(0, Math.min(height, event.y));
-                    let newValue = Math.round(y.invert(newY) / stepSize) * stepSize;
-                    newValue = Math.max(0, Math.min(maxValue, newValue));
-                    
-                    // Update data
-                    d.value = newValue;
-                    
-                    // Update bar
-                    d3.select(this)
-                        .attr("y", y(newValue))
-                        .attr("height", height - y(newValue))
-                        .attr("fill", newValue === d.targetValue ? "#52c41a" : "#ff4d4f");
-                    
-                    // Update label
-                    labels.filter(l => l.index === d.index)
-                        .attr("y", y(newValue) - 5)
-                        .text(newValue);
-                    
-                    // Update drag hint position
-                    dragHints.filter(h => h.index === d.index)
-                        .attr("y", y(newValue) - 25);
-                }})
-                .on("end", function(event, d) {{
-                    if (!d.isDraggable) return;
-                    d3.select(this).style("opacity", 1);
-                    
-                    // Show drag hint again if not correct
-                    if (d.value !== d.targetValue) {{
-                        dragHints.filter(h => h.index === d.index)
-                            .style("display", "block");
-                    }}
-                    
-                    // Store the value
-                    window.currentValues = window.currentValues || {{}};
-                    window.currentValues[d.index] = d.value;
-                }});
-            
-            bars.call(drag);
-            
-            // Submit function
-            window.submitAnswer = function() {{
-                const results = {{}};
-                let allCorrect = true;
-                
-                data.forEach(d => {{
-                    if (d.isDraggable) {{
-                        results[d.index] = {{
-                            value: d.value,
-                            target: d.targetValue,
-                            correct: d.value === d.targetValue
-                        }};
-                        if (d.value !== d.targetValue) {{
-                            allCorrect = false;
-                        }}
-                    }}
-                }});
-                
-                // Show feedback
-                const feedback = document.getElementById('feedback');
-                if (allCorrect) {{
-                    feedback.className = 'feedback correct';
-                    feedback.textContent = '✅ Perfect! All bars are correct!';
-                }} else {{
-                    feedback.className = 'feedback incorrect';
-                    feedback.textContent = '❌ Some bars need adjustment. Check the green dotted lines!';
-                }}
-                feedback.style.display = 'block';
-                
-                // Send results to Streamlit
-                window.parent.postMessage({{
-                    type: 'submit',
-                    results: results,
-                    allCorrect: allCorrect
-                }}, '*');
-            }};
-            
-            // Initialize current values
-            window.currentValues = {{}};
-            data.forEach(d => {{
-                if (d.isDraggable) {{
-                    window.currentValues[d.index] = d.value;
-                }}
-            }});
-        </script>
-    </body>
-    </html>
-    """.format(
-        chart_data_json=json.dumps(chart_data),
+    return draggable_bar_chart(
+        chart_data,
         max_value=settings['max_value'],
         step_size=settings['step_size'],
         title=context['title'],
         x_label=context.get('x_label', 'Category'),
-        y_label=context.get('y_label', 'Value'),
-        unit=context['unit']
+        y_label=f"{context.get('y_label', 'Value')} ({context['unit']})",
+        locked=st.session_state.graph_submitted,
+        problem=data,
+        key="create_bar_chart"
     )
-    
-    return html_code
 
+@question_fragment
 def display_create_bar_problem():
     """Display the bar graph creation interface"""
     problem = st.session_state.current_create_bar_problem
@@ -653,54 +328,11 @@ def display_create_bar_problem():
     st.markdown(problem['instruction'])
     st.info(f"💡 {problem['hint']}")
     
-    # Create and display the draggable chart
-    html_code = create_draggable_bar_chart(problem)
-    
-    # Display the interactive component
-    components.html(html_code, height=500, scrolling=False)
-    
-    # Show current status
-    if not st.session_state.graph_submitted:
-        st.markdown("---")
-        st.markdown("### Current Progress:")
-        
-        cols = st.columns(len(data["missing_indices"]))
-        for i, idx in enumerate(sorted(data["missing_indices"])):
-            with cols[i]:
-                current = st.session_state.current_values.get(idx, 0)
-                target = data["values"][idx]
-                
-                if current == target:
-                    st.success(f"✅ {data['categories'][idx]}")
-                else:
-                    st.warning(f"🔄 {data['categories'][idx]}")
-                
-                st.caption(f"Target: {target} {data['context']['unit']}")
-    
-    # Manual submit button (since we can't easily get data back from iframe)
-    if not st.session_state.graph_submitted:
-        st.markdown("---")
-        st.markdown("### Check Your Answer:")
-        st.markdown("After adjusting all bars in the graph above, enter the values you set:")
-        
-        cols = st.columns(len(data["missing_indices"]))
-        for i, idx in enumerate(sorted(data["missing_indices"])):
-            with cols[i]:
-                value = st.number_input(
-                    f"{data['categories'][idx]}:",
-                    min_value=0,
-                    max_value=problem["settings"]["max_value"],
-                    value=st.session_state.current_values.get(idx, problem["settings"]["step_size"]),
-                    step=problem["settings"]["step_size"],
-                    key=f"input_{idx}"
-                )
-                st.session_state.current_values[idx] = value
-        
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            if st.button("Submit Answer", type="primary", use_container_width=True):
-                check_create_bar_answer()
-                st.rerun()
+    # Display the draggable chart; its Check Answer button sends the bars back
+    values = create_draggable_bar_chart(problem)
+    if values is not None and not st.session_state.graph_submitted:
+        st.session_state.current_values.update(values)
+        check_create_bar_answer()
     
     # Show feedback
     if st.session_state.graph_submitted:
@@ -709,6 +341,7 @@ def display_create_bar_problem():
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
             if st.button("Next Graph", type="primary", use_container_width=True):
+                new_question("create_bar_chart")
                 generate_create_bar_problem()
                 st.rerun()
 
@@ -1,5 +1,7 @@
 import streamlit as st
 import random
+from utils.svg_chart import dot_plot_svg
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -264,6 +266,7 @@ def generate_new_problem():
     )}
     st.session_state.current_problem = scenario["instruction"]
 
+@question_fragment
 def display_problem():
     """Display the current problem"""
     data = st.session_state.problem_data
@@ -372,7 +375,7 @@ def create_interactive_plot(scenario):
                             use_container_width=True
                         ):
                             st.session_state.user_plot[x_val] = current_count - 1
-                            st.rerun()
+                            rerun_question()
                     elif row == current_count + 1:
                         # Next available spot - show as clickable gray box
                         if st.button(
@@ -382,7 +385,7 @@ def create_interactive_plot(scenario):
                             use_container_width=True
                         ):
                             st.session_state.user_plot[x_val] = current_count + 1
-                            st.rerun()
+                            rerun_question()
                     else:
                         # Empty space - use markdown for consistent height
                         st.markdown("&nbsp;", unsafe_allow_html=True)
@@ -401,7 +404,7 @@ def create_interactive_plot(scenario):
                     use_container_width=True
                 ):
                     st.session_state.user_plot[x_val] = 0
-                    st.rerun()
+                    rerun_question()
         
         # X-axis label
         st.markdown(f"**{scenario['x_label']}**")
@@ -491,6 +494,9 @@ def show_correct_plot():
         # Show the correct distribution
         st.markdown("---")
         st.markdown("### Correct distribution:")
+        st.markdown(dot_plot_svg(correct_plot, data["min_value"], data["max_value"],
+                                 x_label=scenario["x_label"], color=scenario["color"]),
+                    unsafe_allow_html=True)
         
         # Create a summary table
         import pandas as pd
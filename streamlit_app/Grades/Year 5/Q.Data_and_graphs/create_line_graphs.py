@@ -1,8 +1,11 @@
 import streamlit as st
-import plotly.graph_objects as go
-import pandas as pd
-import numpy as np
 import random
+from utils.lazy_imports import lazy_import
+from utils.fragments import question_fragment, rerun_question
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+go = lazy_import("plotly.graph_objects")
 
 def run():
     """
@@ -270,6 +273,7 @@ def generate_create_graph_problem():
     st.session_state.show_result = False
     st.session_state.last_click = None
 
+@question_fragment
 def display_create_graph_problem():
     """Display the graph creation interface"""
     problem = st.session_state.current_create_graph_problem
@@ -332,7 +336,7 @@ def display_create_graph_problem():
                         if x in st.session_state.plotted_points:
                             del st.session_state.plotted_points[x]
                             break
-                    st.rerun()
+                    rerun_question()
         
         with col2:
             if st.button("Reset Graph", type="secondary", use_container_width=True):
@@ -503,7 +507,7 @@ def process_graph_click(point_data, problem):
         x_val = data['x_values'][x_index]
         st.session_state.plotted_points[x_val] = y_value
         st.session_state.last_click = f"Plotted ({x_val}, {y_value})"
-        st.rerun()
+        rerun_question()
 
 def display_data_table(data):
     """Display the data table"""
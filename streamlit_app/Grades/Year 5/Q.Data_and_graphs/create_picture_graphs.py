@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import math
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -430,13 +431,13 @@ def create_clickable_pictograph(problem):
                             if st.button(scenario["icon"], key=f"icon_{category}_{j}", 
                                        help="Click to remove"):
                                 st.session_state.current_icons[category] = current_count - 1
-                                st.rerun()
+                                rerun_question()
                         else:
                             # Inactive placeholder
                             if st.button("⚪", key=f"icon_{category}_{j}", 
                                        help="Click to add"):
                                 st.session_state.current_icons[category] = j + 1
-                                st.rerun()
+                                rerun_question()
                     else:
                         # This is a completed row (reference)
                         if j < current_count:
@@ -449,6 +450,7 @@ def create_clickable_pictograph(problem):
     st.markdown("---")
     st.info(f"**Each {scenario['icon']} = {settings['value_per_icon']} {scenario['unit']}**")
 
+@question_fragment
 def display_create_pictograph_problem():
     """Display the current create pictograph problem"""
     problem = st.session_state.current_create_pictograph_problem
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -361,6 +362,7 @@ def generate_question_types(difficulty, scenario, frequency_data):
     
     return question_types
 
+@question_fragment
 def display_problem():
     """Display the current problem"""
     data = st.session_state.problem_data
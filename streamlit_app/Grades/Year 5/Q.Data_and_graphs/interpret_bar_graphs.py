@@ -1,9 +1,10 @@
 import streamlit as st
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-import pandas as pd
-import numpy as np
 import random
+from utils.lazy_imports import lazy_import
+from utils.svg_chart import bar_chart_svg
+from utils.fragments import question_fragment
+
+pd = lazy_import("pandas")
 
 def run():
     """
@@ -621,6 +622,7 @@ def generate_bar_graph_problem():
     st.session_state.answer_submitted = False
     st.session_state.show_result = False
 
+@question_fragment
 def display_bar_graph_problem():
     """Display the bar graph problem interface"""
     problem = st.session_state.current_bar_graph_problem
@@ -738,43 +740,16 @@ def display_data_table(data):
     )
 
 def create_bar_graph(data, settings):
-    """Create and display the bar graph"""
+    """Display the bar graph as SVG"""
     context = data["context"]
-    
-    fig, ax = plt.subplots(figsize=(8, 6))
-    
-    # Create bars
-    x_pos = np.arange(len(data["categories"]))
-    colors = plt.cm.Set3(np.linspace(0, 1, len(data["categories"])))
-    
-    bars = ax.bar(x_pos, data["values"], color=colors, edgecolor='black', linewidth=1)
-    
-    # Customize the plot
-    ax.set_xlabel(context["x_label"], fontsize=12)
-    ax.set_ylabel(context["y_label"], fontsize=12)
-    ax.set_title(context["title"], fontsize=14, fontweight='bold')
-    
-    # Set x-axis labels
-    ax.set_xticks(x_pos)
-    ax.set_xticklabels(data["categories"], rotation=45 if len(data["categories"]) > 5 else 0, ha='right')
-    
-    # Set y-axis
-    ax.set_ylim(0, settings["y_max"])
-    ax.set_yticks(range(0, settings["y_max"] + 1, settings["y_step"]))
-    
-    # Add grid
-    ax.grid(True, axis='y', alpha=0.3, linestyle='--')
-    
-    # Add value labels on bars for easier levels
-    if st.session_state.bar_graph_difficulty <= 3:
-        for bar, value in zip(bars, data["values"]):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + settings["y_step"]/10,
-                   f'{int(value)}', ha='center', va='bottom', fontsize=10)
-    
-    plt.tight_layout()
-    st.pyplot(fig)
-    plt.close()
+    svg = bar_chart_svg(
+        data["categories"], data["values"],
+        title=context["title"], x_label=context["x_label"], y_label=context["y_label"],
+        y_max=settings["y_max"], y_step=settings["y_step"],
+        # Value labels on bars for easier levels
+        value_labels=st.session_state.bar_graph_difficulty <= 3,
+    )
+    st.markdown(svg, unsafe_allow_html=True)
 
 def check_bar_graph_answer():
     """Check if the answer is correct"""
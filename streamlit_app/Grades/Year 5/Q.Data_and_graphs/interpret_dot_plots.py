@@ -1,5 +1,7 @@
 import streamlit as st
 import random
+from utils.svg_chart import dot_plot_svg
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -508,6 +510,7 @@ def difference_question(data, unit, scenario):
     else:
         return simple_count_question(data, unit, get_context_word(scenario))
 
+@question_fragment
 def display_problem():
     """Display the current dot plot problem"""
     data = st.session_state.problem_data
@@ -557,63 +560,12 @@ def display_problem():
     handle_feedback_and_next()
 
 def create_html_dot_plot(data, scenario):
-    """Create a dot plot using SVG for better control"""
-    # Get the range of x values
-    x_values = sorted(data.keys())
-    x_min = min(x_values)
-    x_max = max(x_values)
-    
-    # Calculate max frequency for scaling
-    max_freq = max(data.values()) if data.values() else 1
-    
-    # SVG dimensions
-    svg_width = 600
-    svg_height = 350
-    padding = 60
-    plot_width = svg_width - 2 * padding
-    plot_height = svg_height - 2 * padding
-    
-    # Calculate spacing
-    num_values = x_max - x_min + 1
-    column_width = plot_width / num_values
-    
-    # Start building SVG
-    svg_parts = [f'<svg width="{svg_width}" height="{svg_height}" style="background-color: white;">']
-    
-    # Add background
-    svg_parts.append(f'<rect x="0" y="0" width="{svg_width}" height="{svg_height}" fill="#f8f9fa" rx="10"/>')
-    
-    # Draw x-axis line
-    svg_parts.append(f'<line x1="{padding}" y1="{svg_height - padding}" x2="{svg_width - padding}" y2="{svg_height - padding}" stroke="black" stroke-width="2"/>')
-    
-    # Add arrows to x-axis
-    svg_parts.append(f'<polygon points="{padding-5},{svg_height-padding} {padding},{svg_height-padding-3} {padding},{svg_height-padding+3}" fill="black"/>')
-    svg_parts.append(f'<polygon points="{svg_width-padding+5},{svg_height-padding} {svg_width-padding},{svg_height-padding-3} {svg_width-padding},{svg_height-padding+3}" fill="black"/>')
-    
-    # Draw data points and labels
-    for i, x_val in enumerate(range(x_min, x_max + 1)):
-        x_pos = padding + (i + 0.5) * column_width
-        
-        # Draw x-axis label
-        svg_parts.append(f'<text x="{x_pos}" y="{svg_height - padding + 25}" text-anchor="middle" font-weight="bold" font-size="16">{x_val}</text>')
-        
-        # Draw X marks for this value
-        if x_val in data:
-            frequency = data[x_val]
-            for j in range(frequency):
-                y_pos = svg_height - padding - 30 - (j * 30)  # 30 pixels between each X
-                svg_parts.append(f'<text x="{x_pos}" y="{y_pos}" text-anchor="middle" font-size="24" font-weight="bold" fill="{scenario["color"]}" font-family="Arial, sans-serif">X</text>')
-    
-    # Add x-axis label
-    svg_parts.append(f'<text x="{svg_width/2}" y="{svg_height - 15}" text-anchor="middle" font-weight="bold" font-size="18">{scenario["x_label"]}</text>')
-    
-    svg_parts.append('</svg>')
-    
-    # Display the SVG
+    """Display the dot plot as SVG"""
+    svg = dot_plot_svg(data, min(data), max(data), x_label=scenario["x_label"], color=scenario["color"])
     st.markdown(
         f"""
         <div style="text-align: center; margin: 20px 0;">
-            {''.join(svg_parts)}
+            {svg}
         </div>
         """,
         unsafe_allow_html=True
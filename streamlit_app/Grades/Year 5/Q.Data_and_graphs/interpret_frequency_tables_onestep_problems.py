@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -383,6 +384,7 @@ def generate_question(scenario, frequencies, question_type):
         else:
             return generate_question(scenario, frequencies, "total")  # Fallback
 
+@question_fragment
 def display_problem():
     """Display the current problem"""
     data = st.session_state.problem_data
@@ -1,8 +1,8 @@
 import streamlit as st
-import matplotlib.pyplot as plt
-import numpy as np
 import random
 from datetime import datetime
+from utils.svg_chart import line_chart_svg
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -522,6 +522,7 @@ def generate_graph_problem():
     st.session_state.selected_answer = None
     st.session_state.user_input = ""
 
+@question_fragment
 def display_graph_problem():
     """Display the graph and question interface"""
     problem = st.session_state.current_graph_problem
@@ -552,7 +553,7 @@ def display_graph_problem():
                         type="primary" if st.session_state.selected_answer == option else "secondary"
                     ):
                         st.session_state.selected_answer = option
-                        st.rerun()
+                        rerun_question()
             
             # Submit button
             if st.button("Submit", type="primary", disabled=st.session_state.selected_answer is None):
@@ -619,89 +620,42 @@ def display_graph_problem():
                 st.rerun()
 
 def create_line_graph(problem):
-    """Create and display the line graph"""
+    """Display the line graph as SVG"""
     data = problem['data']
     theme = data['theme']
-    
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    # Convert x_values for plotting
-    if theme["x_type"] in ["month", "month_subset", "school_months", "day"]:
-        x_positions = range(len(data['x_values']))
-        ax.plot(x_positions, data['y_values'], 
-                color=theme['color'], linewidth=2, marker='o', markersize=8)
-        ax.set_xticks(x_positions)
-        ax.set_xticklabels(data['x_values'], rotation=45, ha='right')
-    else:
-        ax.plot(data['x_values'], data['y_values'], 
-                color=theme['color'], linewidth=2, marker='o', markersize=8)
-    
-    # Set labels and title
-    ax.set_xlabel(theme['x_label'], fontsize=12)
-    ax.set_ylabel(theme['y_label'], fontsize=12)
-    ax.set_title(theme['title'], fontsize=14, fontweight='bold', pad=20)
-    
-    # Add grid
-    ax.grid(True, alpha=0.3, linestyle='-')
-    
-    # Set y-axis to start at 0 and add some padding
-    y_min, y_max = 0, max(data['y_values']) * 1.1
-    ax.set_ylim(y_min, y_max)
-    
-    # Add value labels on points if difficulty is low
-    if st.session_state.graph_difficulty <= 2:
-        if theme["x_type"] in ["month", "month_subset", "school_months", "day"]:
-            for i, (x, y) in enumerate(zip(x_positions, data['y_values'])):
-                ax.text(x, y + 0.5, str(y), ha='center', va='bottom', fontsize=10)
-        else:
-            for x, y in zip(data['x_values'], data['y_values']):
-                ax.text(x, y + 0.5, str(y), ha='center', va='bottom', fontsize=10)
+    categorical = theme["x_type"] in ["month", "month_subset", "school_months", "day"]
     
     # Highlight answer point if showing result
+    highlights = []
     if st.session_state.show_result:
         details = problem.get("question_details", {})
         
         # Highlight based on question type
         if "target_value" in details and "target_x" in details:
-            # Find the point for "find value" or "direct read" questions
+            # The point for "find value" or "direct read" questions
             target_x = details["target_x"]
             target_y = details["target_value"]
-            
-            if theme["x_type"] in ["month", "month_subset", "school_months", "day"]:
-                # Find x position
-                if target_x in data['x_values']:
-                    x_pos = data['x_values'].index(target_x)
-                    ax.plot(x_pos, target_y, 'go', markersize=15, alpha=0.5)
-                    ax.annotate(f'({target_x}, {target_y})', 
-                              xy=(x_pos, target_y), 
-                              xytext=(x_pos, target_y + 1),
-                              ha='center', fontsize=10,
-                              bbox=dict(boxstyle="round,pad=0.3", facecolor='lightgreen'))
-            else:
-                ax.plot(target_x, target_y, 'go', markersize=15, alpha=0.5)
-                ax.annotate(f'({target_x}, {target_y})', 
-                          xy=(target_x, target_y), 
-                          xytext=(target_x, target_y + 1),
-                          ha='center', fontsize=10,
-                          bbox=dict(boxstyle="round,pad=0.3", facecolor='lightgreen'))
+            if not categorical or target_x in data['x_values']:
+                highlights.append({"points": [(target_x, target_y)], "color": "green",
+                                   "label": f'({target_x}, {target_y})'})
         
         elif "compare_indices" in details:
             # Highlight comparison points
             idx1, idx2 = details["compare_indices"]
             val1, val2 = details["compare_values"]
-            
-            if theme["x_type"] in ["month", "month_subset", "school_months", "day"]:
-                ax.plot([idx1, idx2], [val1, val2], 'ro', markersize=12, alpha=0.5)
-                # Draw connecting line
-                ax.plot([idx1, idx2], [val1, val2], 'r--', alpha=0.3, linewidth=2)
-            else:
-                x1, x2 = data['x_values'][idx1], data['x_values'][idx2]
-                ax.plot([x1, x2], [val1, val2], 'ro', markersize=12, alpha=0.5)
-                # Draw connecting line
-                ax.plot([x1, x2], [val1, val2], 'r--', alpha=0.3, linewidth=2)
-    
-    plt.tight_layout()
-    st.pyplot(fig)
+            x1, x2 = data['x_values'][idx1], data['x_values'][idx2]
+            highlights.append({"points": [(x1, val1), (x2, val2)], "color": "red",
+                               "radius": 8.3, "connect": True})
+    
+    svg = line_chart_svg(
+        data['x_values'], data['y_values'],
+        title=theme['title'], x_label=theme['x_label'], y_label=theme['y_label'],
+        color=theme['color'], categorical=categorical,
+        # Value labels on points if difficulty is low
+        value_labels=st.session_state.graph_difficulty <= 2,
+        highlights=highlights,
+    )
+    st.markdown(svg, unsafe_allow_html=True)
 
 def check_graph_answer():
     """Check if the submitted answer is correct"""
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import math
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -331,6 +332,7 @@ def display_pictograph(problem):
     
     st.info(legend_text)
 
+@question_fragment
 def display_pictograph_problem():
     """Display the current pictograph problem"""
     problem = st.session_state.current_pictograph_problem
@@ -1,6 +1,9 @@
 import streamlit as st
 import random
-import pandas as pd
+from utils.lazy_imports import lazy_import
+from utils.fragments import question_fragment, rerun_question
+
+pd = lazy_import("pandas")
 
 def run():
     """
@@ -408,6 +411,7 @@ def generate_table_problem():
     st.session_state.selected_answer = None
     st.session_state.user_input = ""
 
+@question_fragment
 def display_table_problem():
     """Display the table and question interface"""
     problem = st.session_state.current_table_problem
@@ -438,7 +442,7 @@ def display_table_problem():
                         type="primary" if st.session_state.selected_answer == option else "secondary"
                     ):
                         st.session_state.selected_answer = option
-                        st.rerun()
+                        rerun_question()
             
             # Submit button
             if st.button("Submit", type="primary", disabled=st.session_state.selected_answer is None):
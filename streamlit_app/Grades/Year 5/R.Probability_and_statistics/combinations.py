@@ -1,9 +1,11 @@
 import streamlit as st
 import random
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import Rectangle, FancyBboxPatch
-import numpy as np
+from utils.lazy_imports import lazy_import
+from utils.fragments import question_fragment
+
+plt = lazy_import("matplotlib.pyplot")
+patches = lazy_import("matplotlib.patches")
+np = lazy_import("numpy")
 
 def run():
     """
@@ -1029,6 +1031,7 @@ def generate_specific_problem(problem_type):
     # Default fallback
     return generate_specific_problem("outfit_simple")
 
+@question_fragment
 def display_problem():
     """Display the current problem with visualization"""
     data = st.session_state.problem_data
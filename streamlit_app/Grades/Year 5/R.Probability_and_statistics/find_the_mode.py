@@ -1,9 +1,13 @@
 import streamlit as st
 import random
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 from collections import Counter
-import numpy as np
+from utils.figure_cache import show_figure
+from utils.lazy_imports import lazy_import
+from utils.fragments import question_fragment
+
+plt = lazy_import("matplotlib.pyplot")
+patches = lazy_import("matplotlib.patches")
+np = lazy_import("numpy")
 
 def run():
     """
@@ -567,6 +571,7 @@ def generate_real_world_mode_problem():
         }
     }
 
+@question_fragment
 def display_problem():
     """Display the current problem with appropriate visualization"""
     data = st.session_state.problem_data
@@ -848,32 +853,35 @@ def display_real_world_data(data):
     freq = visual_data["frequency"]
     
     if len(freq) <= 8:
-        fig, ax = plt.subplots(figsize=(10, 4))
-        items = list(freq.keys())
-        counts = list(freq.values())
-        
-        colors = plt.cm.Set3(np.linspace(0, 1, len(items)))
-        bars = ax.bar(items, counts, color=colors)
-        
-        ax.set_xlabel(visual_data["data_type"].title())
-        ax.set_ylabel("Frequency")
-        ax.set_title("Data Distribution")
-        
-        # Add value labels on bars
-        for bar, count in zip(bars, counts):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{int(count)}',
-                   ha='center', va='bottom')
-        
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        st.pyplot(fig)
-        plt.close()
+        show_figure(draw_frequency_chart, dict(freq), visual_data["data_type"])
     else:
         # For large datasets, show as text
         display_context_data(dataset)
 
+def draw_frequency_chart(freq, data_type):
+    """Create the bar chart of how often each value appears"""
+    fig, ax = plt.subplots(figsize=(10, 4))
+    items = list(freq.keys())
+    counts = list(freq.values())
+    
+    colors = plt.cm.Set3(np.linspace(0, 1, len(items)))
+    bars = ax.bar(items, counts, color=colors)
+    
+    ax.set_xlabel(data_type.title())
+    ax.set_ylabel("Frequency")
+    ax.set_title("Data Distribution")
+    
+    # Add value labels on bars
+    for bar, count in zip(bars, counts):
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height,
+               f'{int(count)}',
+               ha='center', va='bottom')
+    
+    plt.xticks(rotation=45, ha='right')
+    plt.tight_layout()
+    return fig
+
 def check_answer():
     """Check the user's answer"""
     user_answer = st.session_state.user_answer
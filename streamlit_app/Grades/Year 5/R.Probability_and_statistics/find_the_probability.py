@@ -1,7 +1,8 @@
 import streamlit as st
 import random
-import re
 from fractions import Fraction
+from utils.answers import canonical_answer
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -887,51 +888,10 @@ def generate_specific_problem(problem_type):
 
 def parse_fraction_input(user_input):
     """Parse user input to extract fraction"""
-    if not user_input:
-        return None
-    
-    # Clean the input
-    cleaned = user_input.strip()
-    
-    # Handle special cases
-    if cleaned == "0":
-        return Fraction(0)
-    if cleaned == "1":
-        return Fraction(1)
-    
-    # Try to parse as fraction (e.g., "1/2", "3/4")
-    fraction_pattern = r'^(\d+)\s*/\s*(\d+)$'
-    match = re.match(fraction_pattern, cleaned)
-    
-    if match:
-        try:
-            numerator = int(match.group(1))
-            denominator = int(match.group(2))
-            if denominator == 0:
-                return None
-            return Fraction(numerator, denominator)
-        except:
-            return None
-    
-    # Try to parse as decimal
-    try:
-        # Convert decimal to fraction
-        decimal_val = float(cleaned)
-        # Use Python's Fraction to convert
-        return Fraction(decimal_val).limit_denominator(1000)
-    except:
-        pass
-    
-    # Try to parse as percentage (e.g., "50%")
-    if cleaned.endswith('%'):
-        try:
-            percent = float(cleaned[:-1])
-            return Fraction(int(percent), 100)
-        except:
-            pass
-    
-    return None
+    # Fractions, mixed numbers, decimals and percentages, exactly: 0.25 and 25% are 1/4
+    return canonical_answer(user_input, "fraction")
 
+@question_fragment
 def display_problem():
     """Display the current problem with input field"""
     data = st.session_state.problem_data
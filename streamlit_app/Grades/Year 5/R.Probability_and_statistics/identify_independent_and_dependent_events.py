@@ -1,8 +1,11 @@
 import streamlit as st
 import random
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-import numpy as np
+from utils.lazy_imports import lazy_import
+from utils.fragments import question_fragment
+
+plt = lazy_import("matplotlib.pyplot")
+patches = lazy_import("matplotlib.patches")
+np = lazy_import("numpy")
 
 def run():
     """
@@ -850,6 +853,7 @@ def generate_specific_problem(problem_type):
     # Default fallback
     return generate_specific_problem("marble_with_replacement")
 
+@question_fragment
 def display_problem():
     """Display the current problem with visualization"""
     data = st.session_state.problem_data
@@ -1,9 +1,12 @@
 import streamlit as st
 import random
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 from fractions import Fraction
 import math
+from utils.lazy_imports import lazy_import
+from utils.fragments import question_fragment
+
+plt = lazy_import("matplotlib.pyplot")
+patches = lazy_import("matplotlib.patches")
 
 def run():
     """
@@ -975,6 +978,7 @@ def generate_specific_problem(problem_type):
     # Default fallback
     return generate_specific_problem("marble_simple")
 
+@question_fragment
 def display_problem():
     """Display the current problem with visualization"""
     data = st.session_state.problem_data
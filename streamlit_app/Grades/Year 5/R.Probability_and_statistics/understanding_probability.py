@@ -2,8 +2,11 @@ import streamlit as st
 import random
 import math
 from fractions import Fraction
-import matplotlib.pyplot as plt
-import numpy as np
+from utils.lazy_imports import lazy_import
+from utils.fragments import question_fragment
+
+plt = lazy_import("matplotlib.pyplot")
+np = lazy_import("numpy")
 
 def run():
     """
@@ -989,6 +992,7 @@ def display_double_bag(data):
         st.markdown("**Bag B**")
         display_bag(data["bag2"])
 
+@question_fragment
 def display_problem():
     """Display the current problem with appropriate visualization"""
     data = st.session_state.problem_data
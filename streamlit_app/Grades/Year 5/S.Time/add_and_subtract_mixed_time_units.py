@@ -1,7 +1,10 @@
 import streamlit as st
 import random
-import matplotlib.pyplot as plt
-import numpy as np
+from utils.lazy_imports import lazy_import
+from utils.fragments import question_fragment
+
+plt = lazy_import("matplotlib.pyplot")
+np = lazy_import("numpy")
 
 def run():
     """
@@ -786,6 +789,7 @@ def generate_complex_explanation(scenario, result):
         v1, v2 = scenario["values"]
         return f"Subtract with borrowing if needed\n{v1[0]} {scenario['units'][0]} {v1[1]} {scenario['units'][1]} - {v2[0]} {scenario['units'][0]} {v2[1]} {scenario['units'][1]}\nAnswer: {result[0]} {scenario['units'][0]} {result[1]} {scenario['units'][1]}"
 
+@question_fragment
 def display_problem():
     """Display the current problem"""
     data = st.session_state.problem_data
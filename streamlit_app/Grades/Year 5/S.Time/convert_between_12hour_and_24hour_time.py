@@ -1,8 +1,7 @@
 import streamlit as st
 import random
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-import numpy as np
+from utils.clock_face import clock_face_html
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -511,6 +510,7 @@ def generate_context_explanation(conversion_type, given, answer):
         else:
             return f"Afternoon/evening times use P.M. In 24-hour format, we use {answer}."
 
+@question_fragment
 def display_problem():
     """Display the current problem"""
     data = st.session_state.problem_data
@@ -595,7 +595,7 @@ def display_time_visual(data):
     """Display visual representation of time conversion"""
     with st.expander("🕐 Visual Aid", expanded=False):
         # Create two clocks side by side
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(8, 4))
+        col1, col2 = st.columns(2)
         
         # Parse the given time
         given_time = data["given_time"]
@@ -606,10 +606,12 @@ def display_time_visual(data):
             minute = int(given_time.split(":")[1])
             
             # Left clock shows 24-hour
-            draw_digital_clock(ax1, given_time, "24-Hour Time")
+            with col1:
+                draw_digital_clock(given_time, "24-Hour Time")
             
             # Right clock shows 12-hour (answer)
-            draw_analog_clock(ax2, hour_24, minute, "12-Hour Time")
+            with col2:
+                draw_analog_clock(hour_24, minute, "12-Hour Time")
             
         else:
             # Given is 12-hour
@@ -630,69 +632,34 @@ def display_time_visual(data):
                 hour_24 = hour_12 + 12
             
             # Left clock shows 12-hour
-            draw_analog_clock(ax1, hour_24, minute, "12-Hour Time")
+            with col1:
+                draw_analog_clock(hour_24, minute, "12-Hour Time")
             
             # Right clock shows 24-hour (answer)
-            draw_digital_clock(ax2, f"{hour_24:02d}:{minute:02d}", "24-Hour Time")
-        
-        st.pyplot(fig)
-        plt.close()
+            with col2:
+                draw_digital_clock(f"{hour_24:02d}:{minute:02d}", "24-Hour Time")
 
-def draw_analog_clock(ax, hour_24, minute, title):
-    """Draw an analog clock"""
-    # Draw clock circle
-    circle = plt.Circle((0, 0), 1, fill=False, linewidth=2)
-    ax.add_patch(circle)
-    
-    # Draw hour markers
-    for i in range(12):
-        angle = np.pi/2 - (i * np.pi/6)
-        x = 0.85 * np.cos(angle)
-        y = 0.85 * np.sin(angle)
-        ax.text(x, y, str(12 if i == 0 else i), ha='center', va='center', fontsize=10)
-    
-    # Draw hands
-    hour_12 = hour_24 % 12
-    hour_angle = np.pi/2 - ((hour_12 + minute/60) * np.pi/6)
-    minute_angle = np.pi/2 - (minute * np.pi/30)
-    
-    # Hour hand
-    ax.arrow(0, 0, 0.5 * np.cos(hour_angle), 0.5 * np.sin(hour_angle),
-            head_width=0.05, head_length=0.05, fc='black', ec='black', linewidth=2)
-    
-    # Minute hand
-    ax.arrow(0, 0, 0.75 * np.cos(minute_angle), 0.75 * np.sin(minute_angle),
-            head_width=0.03, head_length=0.03, fc='blue', ec='blue', linewidth=1.5)
-    
-    # Center dot
-    ax.plot(0, 0, 'ko', markersize=8)
-    
-    # Add AM/PM indicator
-    period = "AM" if hour_24 < 12 else "PM"
-    ax.text(0, -1.3, period, ha='center', fontsize=12, fontweight='bold')
-    
-    ax.set_xlim(-1.5, 1.5)
-    ax.set_ylim(-1.5, 1.5)
-    ax.set_aspect('equal')
-    ax.axis('off')
-    ax.set_title(title, fontsize=12, fontweight='bold')
+def draw_analog_clock(hour_24, minute, title):
+    """Draw an analog clock with an A.M./P.M. indicator"""
+    st.markdown(f"<div style='text-align: center; font-weight: bold;'>{title}</div>", unsafe_allow_html=True)
+    st.markdown(clock_face_html(hour_24, minute, "period"), unsafe_allow_html=True)
 
-def draw_digital_clock(ax, time_str, title):
+def draw_digital_clock(time_str, title):
     """Draw a digital clock display"""
-    # Create digital display background
-    rect = patches.Rectangle((-0.8, -0.3), 1.6, 0.6, linewidth=2, 
-                            edgecolor='black', facecolor='lightgreen', alpha=0.3)
-    ax.add_patch(rect)
-    
-    # Display time
-    ax.text(0, 0, time_str, ha='center', va='center', fontsize=24, 
-           fontfamily='monospace', fontweight='bold')
-    
-    ax.set_xlim(-1, 1)
-    ax.set_ylim(-0.5, 0.5)
-    ax.set_aspect('equal')
-    ax.axis('off')
-    ax.set_title(title, fontsize=12, fontweight='bold')
+    st.markdown(f"""
+    <div style='text-align: center; font-weight: bold;'>{title}</div>
+    <div style='
+        margin: 60px auto;
+        width: 200px;
+        padding: 15px 0;
+        border: 2px solid black;
+        background: rgba(144, 238, 144, 0.3);
+        font-family: monospace;
+        font-size: 40px;
+        font-weight: bold;
+        text-align: center;
+    '>{time_str}</div>
+    """, unsafe_allow_html=True)
 
 def normalize_answer(answer):
     """Normalize answer for comparison"""
@@ -1,7 +1,10 @@
 import streamlit as st
 import random
-import matplotlib.pyplot as plt
-import numpy as np
+from utils.lazy_imports import lazy_import
+from utils.fragments import question_fragment
+
+plt = lazy_import("matplotlib.pyplot")
+np = lazy_import("numpy")
 
 def run():
     """
@@ -756,6 +759,7 @@ def generate_real_world_conversion():
             "problem_type": "real_world"
         }
 
+@question_fragment
 def display_problem():
     """Display the current problem"""
     data = st.session_state.problem_data
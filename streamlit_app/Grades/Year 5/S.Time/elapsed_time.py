@@ -1,9 +1,9 @@
 import streamlit as st
 import random
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-import numpy as np
 from datetime import datetime, timedelta
+from utils.answers import answers_match, canonical_answer
+from utils.clock_face import clock_face_html
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -711,6 +711,7 @@ def generate_real_world_problem():
             "show_clock": False
         }
 
+@question_fragment
 def display_problem():
     """Display the current problem with visual aids"""
     data = st.session_state.problem_data
@@ -794,88 +795,20 @@ def display_analog_clock(data):
             hour = int(time_parts[0])
             minute = int(time_parts[1])
             
-            # Create clock visualization
-            fig, ax = plt.subplots(figsize=(4, 4))
-            
-            # Draw clock circle
-            circle = plt.Circle((0, 0), 1, fill=False, linewidth=2)
-            ax.add_patch(circle)
-            
-            # Draw hour markers
-            for i in range(12):
-                angle = np.pi/2 - (i * np.pi/6)
-                x = 0.85 * np.cos(angle)
-                y = 0.85 * np.sin(angle)
-                ax.text(x, y, str(12 if i == 0 else i), ha='center', va='center', fontsize=10)
-            
-            # Draw hour hand
-            hour_angle = np.pi/2 - ((hour % 12 + minute/60) * np.pi/6)
-            ax.arrow(0, 0, 0.5 * np.cos(hour_angle), 0.5 * np.sin(hour_angle),
-                    head_width=0.05, head_length=0.05, fc='black', ec='black', linewidth=2)
-            
-            # Draw minute hand
-            minute_angle = np.pi/2 - (minute * np.pi/30)
-            ax.arrow(0, 0, 0.75 * np.cos(minute_angle), 0.75 * np.sin(minute_angle),
-                    head_width=0.03, head_length=0.03, fc='blue', ec='blue', linewidth=1.5)
-            
-            # Center dot
-            ax.plot(0, 0, 'ko', markersize=8)
-            
-            ax.set_xlim(-1.2, 1.2)
-            ax.set_ylim(-1.2, 1.2)
-            ax.set_aspect('equal')
-            ax.axis('off')
-            
-            st.pyplot(fig)
-            plt.close()
+            # Clock faces are drawn once per hand position and reused
+            st.markdown(clock_face_html(hour, minute), unsafe_allow_html=True)
             
             st.caption(f"Start: {hour}:{minute:02d}")
 
-def normalize_answer(answer):
-    """Normalize answer format for comparison"""
-    # Remove extra spaces and convert to lowercase
-    answer = answer.strip().lower()
-    
-    # Handle various time formats
-    answer = answer.replace(" ", "")
-    answer = answer.replace("am", "")
-    answer = answer.replace("pm", "")
-    answer = answer.replace("hours", "h")
-    answer = answer.replace("hour", "h")
-    answer = answer.replace("minutes", "m")
-    answer = answer.replace("minute", "m")
-    answer = answer.replace("mins", "m")
-    answer = answer.replace("min", "m")
-    
-    return answer
+def answer_kind(correct_answer):
+    """Return the utils.answers kind of a correct answer: a duration or a clock time"""
+    return "duration" if canonical_answer(correct_answer, "duration") is not None else "time"
 
 def check_answer():
     """Check the user's answer with flexible formatting"""
-    user_answer = normalize_answer(st.session_state.user_answer)
-    correct_answer = normalize_answer(st.session_state.correct_answer)
-    
-    # Also check without leading zeros (e.g., 9:05 vs 9:5)
-    user_alt = user_answer.replace(":0", ":")
-    correct_alt = correct_answer.replace(":0", ":")
-    
-    is_correct = (user_answer == correct_answer) or (user_alt == correct_alt)
-    
-    # Additional format checks for time
-    if ":" in st.session_state.correct_answer and ":" in st.session_state.user_answer:
-        # Check if times are equivalent (e.g., 1:00 vs 1:0)
-        try:
-            user_parts = st.session_state.user_answer.split(":")
-            correct_parts = st.session_state.correct_answer.split(":")
-            
-            user_h = int(user_parts[0])
-            user_m = int(user_parts[1]) if len(user_parts) > 1 else 0
-            
-            correct_h = int(correct_parts[0])
-            correct_m = int(correct_parts[1]) if len(correct_parts) > 1 else 0
-            
-            is_correct = (user_h == correct_h) and (user_m == correct_m)
-        except:
-            pass
+    # "2 hours 30 minutes" matches 2h 30m, and 9:5 or 9:05 PM match 9:05
+    correct_answer = st.session_state.correct_answer
+    is_correct = answers_match(st.session_state.user_answer, correct_answer, answer_kind(correct_answer))
     
     st.session_state.answer_correct = is_correct
     st.session_state.show_feedback = True
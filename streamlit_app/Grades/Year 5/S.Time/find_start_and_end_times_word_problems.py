@@ -1,9 +1,8 @@
 import streamlit as st
 import random
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-import numpy as np
 from datetime import datetime, timedelta
+from utils.clock_face import clock_face_html
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -700,6 +699,7 @@ def generate_time_options(correct_h, correct_m, num_options):
     random.shuffle(options)
     return options[:num_options]
 
+@question_fragment
 def display_problem():
     """Display the current problem with options"""
     data = st.session_state.problem_data
@@ -765,45 +765,9 @@ def display_clock_options(data):
             hour = int(parts[0])
             minute = int(parts[1])
             
-            # Create clock visualization
-            fig, ax = plt.subplots(figsize=(2, 2))
-            
-            # Draw clock circle
-            circle = plt.Circle((0, 0), 1, fill=False, linewidth=2, color='black')
-            ax.add_patch(circle)
-            
             # Clock face color (alternating)
-            colors = ['lightblue', 'lightgreen', 'lightyellow', 'lightpink']
-            face = plt.Circle((0, 0), 0.98, fill=True, color=colors[i % 4], alpha=0.3)
-            ax.add_patch(face)
-            
-            # Draw hour markers
-            for j in range(12):
-                angle = np.pi/2 - (j * np.pi/6)
-                x = 0.85 * np.cos(angle)
-                y = 0.85 * np.sin(angle)
-                ax.text(x, y, str(12 if j == 0 else j), ha='center', va='center', fontsize=8, fontweight='bold')
-            
-            # Draw hour hand
-            hour_angle = np.pi/2 - ((hour % 12 + minute/60) * np.pi/6)
-            ax.arrow(0, 0, 0.5 * np.cos(hour_angle), 0.5 * np.sin(hour_angle),
-                    head_width=0.05, head_length=0.05, fc='black', ec='black', linewidth=2)
-            
-            # Draw minute hand
-            minute_angle = np.pi/2 - (minute * np.pi/30)
-            ax.arrow(0, 0, 0.75 * np.cos(minute_angle), 0.75 * np.sin(minute_angle),
-                    head_width=0.03, head_length=0.03, fc='blue', ec='blue', linewidth=1.5)
-            
-            # Center dot
-            ax.plot(0, 0, 'ko', markersize=5)
-            
-            ax.set_xlim(-1.2, 1.2)
-            ax.set_ylim(-1.2, 1.2)
-            ax.set_aspect('equal')
-            ax.axis('off')
-            
-            st.pyplot(fig)
-            plt.close()
+            tints = ['blue', 'green', 'yellow', 'pink']
+            st.markdown(clock_face_html(hour, minute, tints[i % 4]), unsafe_allow_html=True)
             
             # Button below clock
             if st.button(f"Select {time_str}", key=f"clock_{i}", 
@@ -1,6 +1,8 @@
 import streamlit as st
 import random
-import pandas as pd
+from utils.lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
 
 def run():
     """
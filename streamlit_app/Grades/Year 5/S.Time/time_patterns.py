@@ -2,6 +2,7 @@ import streamlit as st
 import random
 from datetime import datetime, timedelta
 import math
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -202,6 +203,7 @@ def generate_time_sequence(pattern_type, interval, length):
     
     return sequence
 
+@question_fragment
 def display_question():
     """Display the current question based on type"""
     
@@ -377,7 +379,7 @@ def display_text_sequence(data):
             if submitted and user_input:
                 st.session_state.selected_answer = user_input.strip()
                 st.session_state.answer_submitted = True
-                st.rerun()
+                rerun_question()
     
     # Show feedback and next button
     if st.session_state.answer_submitted:
@@ -421,7 +423,7 @@ def display_answer_tiles_with_form(data):
             if tile_selection:
                 st.session_state.selected_answer = tile_selection
                 st.session_state.answer_submitted = True
-                st.rerun()
+                rerun_question()
     
     else:
         # After submission, show tiles with results
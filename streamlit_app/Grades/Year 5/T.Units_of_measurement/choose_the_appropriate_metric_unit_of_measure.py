@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -253,6 +254,7 @@ def generate_new_question():
     st.session_state.correct_answer = question["correct"]
     st.session_state.current_question = f"Which is a better estimate for {question['item']}?"
 
+@question_fragment
 def display_question():
     """Display the current question"""
     
@@ -280,7 +282,7 @@ def display_question():
                     type=button_type
                 ):
                     st.session_state.selected_answer = option
-                    st.rerun()
+                    rerun_question()
         
         # Submit button
         st.markdown("")  # Add space
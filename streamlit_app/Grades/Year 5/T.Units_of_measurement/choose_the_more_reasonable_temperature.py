@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -232,6 +233,7 @@ def generate_new_question():
     st.session_state.correct_answer = scenario["correct"]
     st.session_state.current_question = f"What is the temperature of {scenario['situation']}? Choose the more reasonable answer."
 
+@question_fragment
 def display_question():
     """Display the current question"""
     
@@ -259,7 +261,7 @@ def display_question():
                     type=button_type
                 ):
                     st.session_state.selected_answer = option
-                    st.rerun()
+                    rerun_question()
         
         # Submit button
         st.markdown("")  # Add space
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -234,6 +235,7 @@ def generate_new_question():
     st.session_state.correct_answer = correct_answer
     st.session_state.current_question = f"Which is more, {comparison['val1']} or {comparison['val2']}?"
 
+@question_fragment
 def display_question():
     """Display the current question"""
     
@@ -258,7 +260,7 @@ def display_question():
                 type=button_type
             ):
                 st.session_state.selected_answer = option
-                st.rerun()
+                rerun_question()
         
         # Submit button
         st.markdown("")  # Add space
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -249,6 +250,7 @@ def generate_new_question():
     st.session_state.correct_answer = correct_answer
     st.session_state.current_question = f"Which is more, {comparison['val1']} or {comparison['val2']}?"
 
+@question_fragment
 def display_question():
     """Display the current question"""
     
@@ -273,7 +275,7 @@ def display_question():
                 type=button_type
             ):
                 st.session_state.selected_answer = option
-                st.rerun()
+                rerun_question()
         
         # Submit button
         st.markdown("")  # Add space
@@ -2,6 +2,7 @@ import streamlit as st
 import streamlit.components.v1
 import random
 import math
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -170,6 +171,7 @@ def generate_new_angle_question():
     st.session_state.current_angle_question = "Is this angle acute, right, obtuse, or straight?"
     st.session_state.selected_answer = None
 
+@question_fragment
 def display_angle_question():
     """Display the current angle question interface"""
     data = st.session_state.angle_data
@@ -343,7 +345,7 @@ def display_clickable_tiles():
                 help=f"Select {value} angle"
             ):
                 st.session_state.selected_answer = value
-                st.rerun()
+                rerun_question()
 
 def handle_answer_submission():
     """Handle answer submission and feedback"""
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import math
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -532,6 +533,7 @@ def generate_angle_svg(degrees, base_rotation, color, show_square=False):
     svg_parts.append('</svg>')
     return "".join(svg_parts)
 
+@question_fragment
 def display_question():
     """Display the current question with the angle"""
     
@@ -569,7 +571,7 @@ def display_question():
                 type="primary" if value == st.session_state.selected_answer else "secondary"
             ):
                 st.session_state.selected_answer = value
-                st.rerun()
+                rerun_question()
         
         # Submit button
         st.markdown("")
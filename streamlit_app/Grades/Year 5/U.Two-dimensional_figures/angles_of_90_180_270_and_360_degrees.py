@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import math
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -657,6 +658,7 @@ def generate_special_angle_svg(degrees, orientation, color, show_square=False):
     svg_parts.append('</svg>')
     return "".join(svg_parts)
 
+@question_fragment
 def display_question():
     """Display the current question with the angle"""
     
@@ -699,7 +701,7 @@ def display_question():
                         type="primary" if value == st.session_state.selected_answer else "secondary"
                     ):
                         st.session_state.selected_answer = value
-                        st.rerun()
+                        rerun_question()
         
         else:  # fraction format
             # Display fraction options
@@ -713,7 +715,7 @@ def display_question():
                         type="primary" if value == st.session_state.selected_answer else "secondary"
                     ):
                         st.session_state.selected_answer = value
-                        st.rerun()
+                        rerun_question()
         
         # Submit button
         st.markdown("")
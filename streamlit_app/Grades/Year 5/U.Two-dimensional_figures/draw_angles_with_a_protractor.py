@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import math
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -136,6 +137,7 @@ def generate_new_target_angle():
     }
     st.session_state.target_angle = target_angle
 
+@question_fragment
 def display_angle_drawing_problem():
     """Display the interactive angle drawing problem"""
     data = st.session_state.angle_data
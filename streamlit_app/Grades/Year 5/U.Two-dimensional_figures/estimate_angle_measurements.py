@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import math
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -151,10 +152,11 @@ def generate_new_angle():
         
         for _ in range(3):
             offset = random.choice([o for o in offsets if o not in used_offsets])
+            # Out-of-range offsets count as used too, or the fallback below may run out of angles
+            used_offsets.append(offset)
             wrong = actual_angle + offset
             if 10 <= wrong <= 170:
                 wrong_options.append(wrong)
-                used_offsets.append(offset)
         
         # Ensure we have 3 wrong options
         while len(wrong_options) < 3:
@@ -184,6 +186,7 @@ def generate_new_angle():
     }
     st.session_state.current_angle = actual_angle
 
+@question_fragment
 def display_angle_problem():
     """Display the angle estimation problem"""
     data = st.session_state.angle_data
@@ -236,7 +239,7 @@ def display_angle_problem():
         # Store selected value if clicked
         if selected is not None:
             st.session_state.selected_angle = selected
-            st.rerun()
+            rerun_question()
         
         # Highlight selected option
         if "selected_angle" in st.session_state:
@@ -1,6 +1,8 @@
 import streamlit as st
 import random
 import math
+from utils.svg_cache import cached_svg
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -352,6 +354,7 @@ def get_shapes_for_difficulty(difficulty):
     
     return shapes
 
+@cached_svg
 def generate_shape_svg(shape_type, color, rotation=0):
     """Generate SVG code for different shape types with rotation"""
     
@@ -814,6 +817,7 @@ def generate_shape_svg(shape_type, color, rotation=0):
     
     return svg
 
+@question_fragment
 def display_question():
     """Display the current question"""
     
@@ -848,7 +852,7 @@ def display_question():
                     type=button_type
                 ):
                     st.session_state.selected_answer = option
-                    st.rerun()
+                    rerun_question()
         
         # Submit button
         st.markdown("")  # Add space
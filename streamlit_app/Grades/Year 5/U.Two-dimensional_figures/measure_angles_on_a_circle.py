@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import math
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -190,6 +191,7 @@ def generate_answer_options(correct_angle, difficulty):
     
     return options
 
+@question_fragment
 def display_angle_problem():
     """Display the angle measurement problem"""
     data = st.session_state.angle_data
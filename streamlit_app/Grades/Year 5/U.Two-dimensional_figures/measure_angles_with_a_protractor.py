@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import math
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -137,6 +138,7 @@ def generate_new_protractor_angle():
     }
     st.session_state.current_protractor_angle = angle_measure
 
+@question_fragment
 def display_protractor_problem():
     """Display the protractor measurement problem"""
     data = st.session_state.protractor_data
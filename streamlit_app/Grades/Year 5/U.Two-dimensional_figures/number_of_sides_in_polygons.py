@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import math
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -605,6 +606,7 @@ def generate_polygon_svg(shape_name, num_sides, color, shape_type, rotation=0, s
     svg_parts.append('</svg>')
     return "".join(svg_parts)
 
+@question_fragment
 def display_question():
     """Display the current question"""
     
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import math
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -775,6 +776,7 @@ def generate_polygon_svg_with_indicators(shape_data):
     svg_parts.append('</svg>')
     return "".join(svg_parts)
 
+@question_fragment
 def display_question():
     """Display the current question with the polygon"""
     
@@ -811,7 +813,7 @@ def display_question():
                     type=button_type
                 ):
                     st.session_state.selected_answer = option
-                    st.rerun()
+                    rerun_question()
         
         # Submit button
         st.markdown("")
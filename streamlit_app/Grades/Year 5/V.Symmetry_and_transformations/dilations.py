@@ -2,6 +2,7 @@ import streamlit as st
 import random
 import math
 import streamlit.components.v1 as components
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -347,6 +348,7 @@ def generate_new_problem():
     }
     st.session_state.current_problem = f"{selected_shape['name']}_{dilation_type}_{scale_factor}"
 
+@question_fragment
 def display_dilation_problem():
     """Display the dilation problem"""
     data = st.session_state.problem_data
@@ -388,7 +390,7 @@ def display_dilation_problem():
         # Store selected value if clicked
         if selected is not None:
             st.session_state.selected_answer = selected
-            st.rerun()
+            rerun_question()
         
         # Show selection
         if "selected_answer" in st.session_state:
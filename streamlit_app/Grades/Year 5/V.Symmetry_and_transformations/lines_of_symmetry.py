@@ -1,6 +1,8 @@
 import streamlit as st
 import random
 import math
+from utils.svg_cache import cached_svg
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -298,6 +300,7 @@ def generate_new_shape():
     st.session_state.shape_data = scenario
     st.session_state.current_shape = scenario['name']
 
+@question_fragment
 def display_symmetry_problem():
     """Display the symmetry problem"""
     data = st.session_state.shape_data
@@ -337,7 +340,7 @@ def display_symmetry_problem():
         # Store selected value if clicked
         if selected is not None:
             st.session_state.selected_answer = selected
-            st.rerun()
+            rerun_question()
         
         # Show selection
         if "selected_answer" in st.session_state:
@@ -424,6 +427,7 @@ def create_shape_visualization(data):
     components.html(html_content, height=440, scrolling=False)
 
 # SVG creation functions
+@cached_svg
 def create_watermelon_svg(line_type):
     """Create watermelon slice with symmetry line"""
     line = '<line x1="200" y1="100" x2="200" y2="300" stroke="black" stroke-width="2" stroke-dasharray="5,5"/>' if line_type == "vertical" else ""
@@ -446,6 +450,7 @@ def create_watermelon_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_heart_svg(line_type):
     """Create heart shape with symmetry line"""
     line = '<line x1="200" y1="100" x2="200" y2="300" stroke="black" stroke-width="2" stroke-dasharray="5,5"/>' if line_type == "vertical" else ""
@@ -461,6 +466,7 @@ def create_heart_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_butterfly_svg(line_type):
     """Create butterfly with symmetry line"""
     line = '<line x1="200" y1="100" x2="200" y2="300" stroke="black" stroke-width="2" stroke-dasharray="5,5"/>' if line_type == "vertical" else ""
@@ -489,6 +495,7 @@ def create_butterfly_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_square_svg(line_type):
     """Create square with symmetry line"""
     if line_type == "diagonal":
@@ -524,6 +531,7 @@ def create_circle_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_letter_f_svg(line_type):
     """Create letter F"""
     return f'''
@@ -537,6 +545,7 @@ def create_letter_f_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_crescent_svg(line_type):
     """Create crescent moon"""
     return f'''
@@ -550,6 +559,7 @@ def create_crescent_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_arrow_svg(line_type):
     """Create arrow pointing right"""
     return f'''
@@ -563,6 +573,7 @@ def create_arrow_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_star_svg(line_type):
     """Create five-pointed star"""
     line = '<line x1="200" y1="100" x2="200" y2="300" stroke="black" stroke-width="2" stroke-dasharray="5,5"/>' if line_type == "vertical" else ""
@@ -578,6 +589,7 @@ def create_star_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_hexagon_svg(line_type):
     """Create regular hexagon"""
     line = '<line x1="100" y1="200" x2="300" y2="200" stroke="black" stroke-width="2" stroke-dasharray="5,5"/>' if line_type == "horizontal" else ""
@@ -593,6 +605,7 @@ def create_hexagon_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_house_svg(line_type):
     """Create simple house"""
     line = '<line x1="200" y1="100" x2="200" y2="300" stroke="black" stroke-width="2" stroke-dasharray="5,5"/>' if line_type == "vertical" else ""
@@ -613,6 +626,7 @@ def create_house_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_robot_svg(line_type):
     """Create robot figure"""
     line = '<line x1="100" y1="200" x2="300" y2="200" stroke="black" stroke-width="2" stroke-dasharray="5,5"/>' if line_type == "horizontal" else ""
@@ -634,6 +648,7 @@ def create_robot_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_parallelogram_svg(line_type):
     """Create parallelogram"""
     return f'''
@@ -647,6 +662,7 @@ def create_parallelogram_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_scalene_triangle_svg(line_type):
     """Create scalene triangle"""
     return f'''
@@ -660,6 +676,7 @@ def create_scalene_triangle_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_letter_n_svg(line_type):
     """Create letter N"""
     return f'''
@@ -673,6 +690,7 @@ def create_letter_n_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_rectangle_svg(line_type):
     """Create rectangle"""
     if line_type == "diagonal":
@@ -690,6 +708,7 @@ def create_rectangle_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_rhombus_svg(line_type):
     """Create rhombus"""
     if line_type == "diagonal":
@@ -708,6 +727,7 @@ def create_rhombus_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_pentagon_svg(line_type):
     """Create regular pentagon"""
     line = '<line x1="200" y1="100" x2="200" y2="300" stroke="black" stroke-width="2" stroke-dasharray="5,5"/>' if line_type == "vertical" else ""
@@ -723,6 +743,7 @@ def create_pentagon_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_letter_h_svg(line_type):
     """Create letter H"""
     line = '<line x1="100" y1="200" x2="300" y2="200" stroke="black" stroke-width="2" stroke-dasharray="5,5"/>' if line_type == "horizontal" else ""
@@ -738,6 +759,7 @@ def create_letter_h_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_spiral_svg(line_type):
     """Create spiral"""
     return f'''
@@ -751,6 +773,7 @@ def create_spiral_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_letter_s_svg(line_type):
     """Create letter S"""
     return f'''
@@ -764,6 +787,7 @@ def create_letter_s_svg(line_type):
     </svg>
     '''
 
+@cached_svg
 def create_default_svg(line_type):
     """Create default shape"""
     return f'''
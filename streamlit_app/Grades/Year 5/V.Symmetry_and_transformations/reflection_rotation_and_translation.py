@@ -2,6 +2,7 @@ import streamlit as st
 import random
 import math
 import streamlit.components.v1 as components
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -648,6 +649,7 @@ def rotate_shape(points, angle):
     
     return rotated
 
+@question_fragment
 def display_transformation_problem():
     """Display the transformation problem"""
     data = st.session_state.problem_data
@@ -711,7 +713,7 @@ def display_transformation_problem():
         
         if selected is not None:
             st.session_state.selected_answer = selected
-            st.rerun()
+            rerun_question()
         
         if "selected_answer" in st.session_state:
             answer_text = chr(65 + st.session_state.selected_answer)
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import math
+from utils.fragments import question_fragment, rerun_question
 
 def run():
     """
@@ -590,6 +591,7 @@ def generate_new_object():
     st.session_state.object_data = scenario
     st.session_state.current_object = scenario['name']
 
+@question_fragment
 def display_rotation_problem():
     """Display the rotation problem"""
     data = st.session_state.object_data
@@ -629,7 +631,7 @@ def display_rotation_problem():
         # Store selected value if clicked
         if selected is not None:
             st.session_state.selected_answer = selected
-            st.rerun()
+            rerun_question()
         
         # Show selection
         if "selected_answer" in st.session_state:
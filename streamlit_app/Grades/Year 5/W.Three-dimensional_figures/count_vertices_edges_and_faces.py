@@ -1,6 +1,7 @@
 import streamlit as st
 import streamlit.components.v1 as components
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -675,6 +676,7 @@ def generate_counting_question(difficulty):
     
     return question_data
 
+@question_fragment
 def display_counting_question():
     """Display the current counting question"""
     question_data = st.session_state.current_counting_question
@@ -2,6 +2,7 @@ import streamlit as st
 import streamlit.components.v1 as components
 import random
 import math
+from utils.fragments import question_fragment
 
 # =========================
 # 3D helpers (isometric SVG)
@@ -544,6 +545,7 @@ def generate_new_shape_question():
     st.session_state.correct_answer = correct_answer
     st.session_state.current_shape_question = f"Does this shape have a **{face_to_ask}** as a face?"
 
+@question_fragment
 def display_shape_question():
     shape_data = st.session_state.shape_data
     if not shape_data:
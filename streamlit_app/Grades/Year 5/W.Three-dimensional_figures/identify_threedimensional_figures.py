@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -312,6 +313,7 @@ def generate_3d_question(difficulty):
     
     return selected
 
+@question_fragment
 def display_3d_question():
     """Display the current 3D shape question"""
     question_data = st.session_state.current_3d_question
@@ -3,6 +3,8 @@ import random
 import textwrap
 import streamlit as st
 import streamlit.components.v1 as components
+from utils.svg_cache import cached_svg
+from utils.fragments import question_fragment
 
 # =============================
 # Responsive HTML/SVG renderer
@@ -302,6 +304,7 @@ def generate_new_nets_question():
 # =============================
 # Display & feedback (buttons BELOW the images)
 # =============================
+@question_fragment
 def display_nets_question():
     data = st.session_state.nets_data
     if not data:
@@ -407,6 +410,7 @@ def reset_question_state():
 # =============================
 # SVG: Nets (regular polygons where needed)
 # =============================
+@cached_svg
 def draw_cube_net_cross():
     return '''
     <svg width="300" height="300" viewBox="-150 -150 300 300">
@@ -419,6 +423,7 @@ def draw_cube_net_cross():
     </svg>
     '''
 
+@cached_svg
 def draw_cube_net_t():
     return '''
     <svg width="300" height="250" viewBox="-150 -125 300 250">
@@ -431,6 +436,7 @@ def draw_cube_net_t():
     </svg>
     '''
 
+@cached_svg
 def draw_cube_net_l():
     return '''
     <svg width="300" height="300" viewBox="-150 -150 300 300">
@@ -443,6 +449,7 @@ def draw_cube_net_l():
     </svg>
     '''
 
+@cached_svg
 def draw_triangular_pyramid_net():
     return '''
     <svg width="300" height="250" viewBox="-150 -125 300 250">
@@ -453,6 +460,7 @@ def draw_triangular_pyramid_net():
     </svg>
     '''
 
+@cached_svg
 def draw_square_pyramid_net():
     return '''
     <svg width="300" height="300" viewBox="-150 -150 300 300">
@@ -464,6 +472,7 @@ def draw_square_pyramid_net():
     </svg>
     '''
 
+@cached_svg
 def draw_rectangular_pyramid_net():
     # Base rectangle with four triangles around
     return '''
@@ -476,6 +485,7 @@ def draw_rectangular_pyramid_net():
     </svg>
     '''
 
+@cached_svg
 def draw_pentagonal_pyramid_net():
     # Pentagonal base + 5 outward triangles (computed)
     base_pts = _poly_points_list(0, 0, 40, 5)  # CCW, one vertex up
@@ -499,6 +509,7 @@ def draw_pentagonal_pyramid_net():
     </svg>
     '''
 
+@cached_svg
 def draw_triangular_prism_net():
     return '''
     <svg width="350" height="200" viewBox="-175 -100 350 200">
@@ -510,6 +521,7 @@ def draw_triangular_prism_net():
     </svg>
     '''
 
+@cached_svg
 def draw_rectangular_prism_net():
     return '''
     <svg width="350" height="250" viewBox="-175 -125 350 250">
@@ -522,6 +534,7 @@ def draw_rectangular_prism_net():
     </svg>
     '''
 
+@cached_svg
 def draw_pentagonal_prism_net():
     pent_top  = _n_gon(0, -60, 32, 5, "#FFE4B5")
     pent_bot  = _n_gon(0,  60, 32, 5, "#FFE4B5")
@@ -541,6 +554,7 @@ def draw_pentagonal_prism_net():
     </svg>
     '''
 
+@cached_svg
 def draw_hexagonal_prism_net():
     hex_top = _n_gon(0, -64, 34, 6, "#B0E0E6")
     hex_bot = _n_gon(0,  64, 34, 6, "#B0E0E6")
@@ -562,6 +576,7 @@ def draw_hexagonal_prism_net():
     </svg>
     '''
 
+@cached_svg
 def draw_octahedron_net():
     return '''
     <svg width="420" height="200" viewBox="-210 -100 420 200">
@@ -576,6 +591,7 @@ def draw_octahedron_net():
     </svg>
     '''
 
+@cached_svg
 def draw_dodecahedron_net_simplified():
     center = _n_gon(0, -10, 26, 5, "#F7DC6F")
     ring = []
@@ -594,6 +610,7 @@ def draw_dodecahedron_net_simplified():
     </svg>
     '''
 
+@cached_svg
 def draw_octagonal_prism_net():
     return '''
     <svg width="500" height="200" viewBox="-250 -100 500 200">
@@ -611,11 +628,13 @@ def draw_octagonal_prism_net():
     </svg>
     '''
 
+@cached_svg
 def draw_octagonal_prism_3d():
     # Reuse the generic prism helper with an 8-gon base
     return _prism_3d(8, "#85C1E2")
 
 # NEW: Curved-surface nets
+@cached_svg
 def draw_cylinder_net():
     return '''
     <svg width="360" height="220" viewBox="-180 -110 360 220">
@@ -625,6 +644,7 @@ def draw_cylinder_net():
     </svg>
     '''
 
+@cached_svg
 def draw_cone_net():
     # sector + circle (simple 120° sector)
     return '''
@@ -634,6 +654,7 @@ def draw_cone_net():
     </svg>
     '''
 
+@cached_svg
 def draw_sphere_net():
     # 8 gores (curved “petals”)
     return '''
@@ -676,10 +697,14 @@ def _prism_3d(sides: int, fill: str) -> str:
     </svg>'''
     return svg
 
+@cached_svg
 def draw_pentagonal_prism_3d():   return _prism_3d(5, "#FFE4B5")
+@cached_svg
 def draw_hexagonal_prism_3d():    return _prism_3d(6, "#B0E0E6")
+@cached_svg
 def draw_triangular_prism_3d():   return _prism_3d(3, "#98FB98")
 
+@cached_svg
 def draw_cube_3d():
     return '''
     <svg width="150" height="150" viewBox="-75 -75 150 150">
@@ -694,6 +719,7 @@ def draw_cube_3d():
     </svg>
     '''
 
+@cached_svg
 def draw_rectangular_prism_3d():
     return '''
     <svg width="150" height="150" viewBox="-75 -75 150 150">
@@ -708,6 +734,7 @@ def draw_rectangular_prism_3d():
     </svg>
     '''
 
+@cached_svg
 def draw_triangular_pyramid_3d():
     return '''
     <svg width="150" height="150" viewBox="-75 -75 150 150">
@@ -720,6 +747,7 @@ def draw_triangular_pyramid_3d():
     </svg>
     '''
 
+@cached_svg
 def draw_square_pyramid_3d():
     return '''
     <svg width="150" height="150" viewBox="-75 -75 150 150">
@@ -733,6 +761,7 @@ def draw_square_pyramid_3d():
     </svg>
     '''
 
+@cached_svg
 def draw_rectangular_pyramid_3d():
     return '''
     <svg width="150" height="150" viewBox="-75 -75 150 150">
@@ -745,6 +774,7 @@ def draw_rectangular_pyramid_3d():
     </svg>
     '''
 
+@cached_svg
 def draw_pentagonal_pyramid_3d():
     return '''
     <svg width="150" height="150" viewBox="-75 -75 150 150">
@@ -759,6 +789,7 @@ def draw_pentagonal_pyramid_3d():
     </svg>
     '''
 
+@cached_svg
 def draw_hexagonal_pyramid_3d():
     return '''
     <svg width="150" height="150" viewBox="-75 -75 150 150">
@@ -774,6 +805,7 @@ def draw_hexagonal_pyramid_3d():
     </svg>
     '''
 
+@cached_svg
 def draw_octahedron_3d():
     return '''
     <svg width="150" height="150" viewBox="-75 -75 150 150">
@@ -790,6 +822,7 @@ def draw_octahedron_3d():
     </svg>
     '''
 
+@cached_svg
 def draw_dodecahedron_3d():
     return '''
     <svg width="150" height="150" viewBox="-75 -75 150 150">
@@ -804,6 +837,7 @@ def draw_dodecahedron_3d():
     </svg>
     '''
 
+@cached_svg
 def draw_icosahedron_3d():
     return '''
     <svg width="150" height="150" viewBox="-75 -75 150 150">
@@ -823,6 +857,7 @@ def draw_icosahedron_3d():
     '''
 
 # NEW: Curved-surface 3D icons
+@cached_svg
 def draw_cylinder_3d():
     return '''
     <svg width="150" height="150" viewBox="-75 -75 150 150">
@@ -835,6 +870,7 @@ def draw_cylinder_3d():
     </svg>
     '''
 
+@cached_svg
 def draw_cone_3d():
     return '''
     <svg width="150" height="150" viewBox="-75 -75 150 150">
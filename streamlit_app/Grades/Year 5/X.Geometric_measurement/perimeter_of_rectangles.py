@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from utils.fragments import question_fragment
 
 def run():
     """
@@ -157,6 +158,7 @@ def generate_perimeter_problem():
         "unit": shape["unit"]
     }
 
+@question_fragment
 def display_perimeter_problem():
     """Display the current perimeter problem"""
     
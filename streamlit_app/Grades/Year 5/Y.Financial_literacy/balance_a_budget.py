@@ -1,8 +1,10 @@
 # balance_a_budget.py
 import random
 import math
-import pandas as pd
 import streamlit as st
+from utils.lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
 
 # ----------------------------- Helpers -----------------------------
 
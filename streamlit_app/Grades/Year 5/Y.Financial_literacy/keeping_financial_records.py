@@ -1,9 +1,11 @@
 # -------------------- Keeping Financial Records (works on older Streamlit) --------------------
 import random
 from datetime import date
-import numpy as np
-import pandas as pd
 import streamlit as st
+from utils.lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
 
 # ---------- helpers ----------
 def money(x: float) -> str:
@@ -3,6 +3,7 @@ import random
 import math
 import streamlit as st
 from dataclasses import dataclass
+from utils import answers
 
 # ---------- Names, months, helpers ----------
 
@@ -26,8 +27,8 @@ def fmt_money(x: float) -> str:
     return f"${x:,.2f}"
 
 def parse_money(text: str) -> float:
-    t = (text or "").strip().replace("$","").replace(",","")
-    return float(t) if t else math.nan
+    value = answers.canonical_answer(text or "", "money")
+    return math.nan if value is None else float(value)
 
 @dataclass
 class Row:
@@ -40,7 +41,7 @@ class Row:
 # ---------- Problem generator (robust to edge cases) ----------
 
 def generate_ledger(difficulty:int):
-    person = random.choice(list(MALE | FEMALE))
+    person = random.choice(sorted(MALE | FEMALE))
     month_i = random.randrange(12)
     month = MONTHS[month_i]
     start = round(random.uniform(70, 500), 2)
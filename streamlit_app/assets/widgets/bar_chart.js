@@ -0,0 +1,146 @@
+// Bar chart whose missing bars the student drags to the right height.
+//
+// args: bars [{category, value, targetValue, isDraggable, index}], maxValue,
+// stepSize, title, xLabel, yLabel, locked (draw the bars without dragging)
+// value: {values: {index: value}} for the draggable bars, sent by Check Answer
+(function () {
+    "use strict";
+
+    const SVG_NS = "http://www.w3.org/2000/svg";
+    const MARGIN = {top: 60, right: 40, bottom: 60, left: 60};
+    const WIDTH = 700 - MARGIN.left - MARGIN.right;
+    const HEIGHT = 400 - MARGIN.top - MARGIN.bottom;
+    const PADDING = 0.2;
+
+    function el(parent, name, attributes, text) {
+        const node = document.createElementNS(SVG_NS, name);
+        for (const key in attributes) {
+            node.setAttribute(key, attributes[key]);
+        }
+        if (text !== undefined) {
+            node.textContent = text;
+        }
+        parent.appendChild(node);
+        return node;
+    }
+
+    function render(root, args) {
+        const data = args.bars.map(function (bar) { return Object.assign({}, bar); });
+        const maxValue = args.maxValue;
+        const stepSize = args.stepSize;
+
+        // Band scale for categories, linear scale for values
+        const step = WIDTH / (data.length + PADDING);
+        const bandwidth = step * (1 - PADDING);
+        const x = function (i) { return step * PADDING + i * step; };
+        const y = function (value) { return HEIGHT - value / maxValue * HEIGHT; };
+        const invertY = function (pixel) { return (HEIGHT - pixel) / HEIGHT * maxValue; };
+        let locked = Boolean(args.locked);
+        const fill = function (d) {
+            if (!d.isDraggable) return "#1890ff";
+            return d.value === d.targetValue ? "#52c41a" : "#ff4d4f";
+        };
+
+        const svg = el(root, "svg", {
+            width: WIDTH + MARGIN.left + MARGIN.right,
+            height: HEIGHT + MARGIN.top + MARGIN.bottom,
+        });
+        const chart = el(svg, "g", {transform: "translate(" + MARGIN.left + "," + MARGIN.top + ")"});
+        el(chart, "text", {class: "title", x: WIDTH / 2, y: -30}, args.title);
+
+        // Grid and axes
+        const grid = el(chart, "g", {class: "grid"});
+        const axis = el(chart, "g", {class: "axis"});
+        el(axis, "line", {x1: 0, y1: HEIGHT, x2: WIDTH, y2: HEIGHT, stroke: "currentColor"});
+        el(axis, "line", {x1: 0, y1: 0, x2: 0, y2: HEIGHT, stroke: "currentColor"});
+        const tickEvery = Math.max(1, Math.ceil(maxValue / stepSize / 10));
+        for (let value = 0; value <= maxValue; value += stepSize * tickEvery) {
+            el(grid, "line", {x1: 0, y1: y(value), x2: WIDTH, y2: y(value)});
+            el(axis, "line", {x1: -6, y1: y(value), x2: 0, y2: y(value), stroke: "currentColor"});
+            el(axis, "text", {x: -9, y: y(value), dy: "0.32em", "text-anchor": "end"}, value);
+        }
+        data.forEach(function (d, i) {
+            const center = x(i) + bandwidth / 2;
+            el(grid, "line", {x1: center, y1: 0, x2: center, y2: HEIGHT});
+            el(axis, "line", {x1: center, y1: HEIGHT, x2: center, y2: HEIGHT + 6, stroke: "currentColor"});
+            el(axis, "text", {x: center, y: HEIGHT + 9, dy: "0.71em", "text-anchor": "middle"}, d.category);
+        });
+        el(axis, "text", {class: "axis-label", x: WIDTH / 2, y: HEIGHT + 40}, args.xLabel);
+        el(axis, "text", {class: "axis-label", transform: "rotate(-90)", x: -HEIGHT / 2, y: -40}, args.yLabel);
+
+        // Target lines and labels for draggable bars
+        data.forEach(function (d, i) {
+            if (!d.isDraggable) return;
+            el(chart, "line", {class: "target-line", x1: x(i), x2: x(i) + bandwidth,
+                               y1: y(d.targetValue), y2: y(d.targetValue)});
+            el(chart, "text", {class: "target-label", x: x(i) + bandwidth + 5, y: y(d.targetValue), dy: "0.3em"},
+               "Target: " + d.targetValue);
+        });
+
+        // Bars, drag hints and value labels
+        data.forEach(function (d, i) {
+            const bar = el(chart, "rect", {
+                class: d.isDraggable && !locked ? "bar draggable" : "bar",
+                x: x(i), width: bandwidth, y: y(d.value), height: HEIGHT - y(d.value), fill: fill(d),
+            });
+            const hint = d.isDraggable && !locked
+                ? el(chart, "text", {class: "drag-hint", x: x(i) + bandwidth / 2, y: y(d.value) - 25}, "↕ Drag me!")
+                : null;
+            const label = el(chart, "text", {class: "value-label", x: x(i) + bandwidth / 2, y: y(d.value) - 5},
+                             d.value);
+            if (!d.isDraggable || locked) return;
+
+            function moveTo(clientY) {
+                const top = chart.getScreenCTM();
+                const pixel = Math.max(0, Math.min(HEIGHT, (clientY - top.f) / top.d));
+                const value = Math.max(0, Math.min(maxValue, Math.round(invertY(pixel) / stepSize) * stepSize));
+                d.value = value;
+                bar.setAttribute("y", y(value));
+                bar.setAttribute("height", HEIGHT - y(value));
+                bar.setAttribute("fill", fill(d));
+                label.setAttribute("y", y(value) - 5);
+                label.textContent = value;
+                hint.setAttribute("y", y(value) - 25);
+            }
+
+            bar.addEventListener("pointerdown", function (event) {
+                if (locked) return;
+                bar.setPointerCapture(event.pointerId);
+                bar.style.opacity = 0.6;
+                hint.style.display = "none";
+                moveTo(event.clientY);
+            });
+            bar.addEventListener("pointermove", function (event) {
+                if (bar.hasPointerCapture(event.pointerId)) {
+                    moveTo(event.clientY);
+                }
+            });
+            bar.addEventListener("pointerup", function () {
+                if (locked) return;
+                bar.style.opacity = 1;
+                // Show the drag hint again if not correct
+                hint.style.display = d.value === d.targetValue ? "none" : "block";
+            });
+        });
+
+        // Check answer sends the bars to Python, which marks them
+        if (locked) return;
+        const button = document.createElement("button");
+        button.id = "submit-btn";
+        button.textContent = "Check Answer";
+        button.addEventListener("click", function () {
+            const values = {};
+            data.forEach(function (d) {
+                if (d.isDraggable) values[d.index] = d.value;
+            });
+            locked = true;
+            root.querySelectorAll(".bar.draggable").forEach(function (bar) { bar.classList.remove("draggable"); });
+            root.querySelectorAll(".drag-hint").forEach(function (hint) { hint.style.display = "none"; });
+            button.remove();
+            MathwizComponent.setValue({values: values});
+        });
+        root.appendChild(button);
+    }
+
+    MathwizComponent.register("bar_chart", render);
+})();
@@ -0,0 +1,71 @@
+// Numbers the student clicks in order; reset and submit stay in the page.
+//
+// args: numbers
+// value: {order: [numbers in the order clicked]}, sent once by Submit Order
+(function () {
+    "use strict";
+
+    function format(number) {
+        return number.toLocaleString("en-US");
+    }
+
+    function button(parent, text, className) {
+        const node = document.createElement("button");
+        node.textContent = text;
+        if (className) {
+            node.className = className;
+        }
+        parent.appendChild(node);
+        return node;
+    }
+
+    function render(root, args) {
+        const order = [];
+        let submitted = false;
+
+        const prompt = document.createElement("div");
+        prompt.className = "order-question";
+        prompt.textContent = "Click the numbers in the correct order:";
+        const choices = document.createElement("div");
+        choices.className = "order-choices";
+        const soFar = document.createElement("div");
+        soFar.className = "order-so-far";
+        const actions = document.createElement("div");
+        actions.className = "order-actions";
+        [prompt, choices, soFar, actions].forEach(function (node) { root.appendChild(node); });
+
+        const reset = button(actions, "🔄 Reset Selection");
+        const submit = button(actions, "✅ Submit Order", "primary");
+        const numberButtons = args.numbers.map(function (number) {
+            const node = button(choices, format(number));
+            node.addEventListener("click", function () {
+                if (submitted || order.indexOf(number) !== -1) return;
+                order.push(number);
+                update();
+            });
+            return node;
+        });
+
+        function update() {
+            numberButtons.forEach(function (node, i) {
+                node.disabled = submitted || order.indexOf(args.numbers[i]) !== -1;
+            });
+            soFar.textContent = order.length ? "Your order so far: " + order.map(format).join(" → ") : "";
+            reset.style.display = order.length && !submitted ? "" : "none";
+            submit.style.display = order.length === args.numbers.length && !submitted ? "" : "none";
+        }
+
+        reset.addEventListener("click", function () {
+            order.length = 0;
+            update();
+        });
+        submit.addEventListener("click", function () {
+            submitted = true;
+            update();
+            MathwizComponent.setValue({order: order.slice()});
+        });
+        update();
+    }
+
+    MathwizComponent.register("order_numbers", render);
+})();
@@ -0,0 +1,128 @@
+// 10 x 10 grid the student shades by dragging rectangles of cells.
+//
+// args: target (cells the question asks for)
+// value: {shaded: count}, sent after every drag; put the grid in an st.form
+// so Python only sees it when the form is submitted
+(function () {
+    "use strict";
+
+    const GRID_SIZE = 10;
+
+    function render(root, args) {
+        const wrapper = document.createElement("div");
+        wrapper.id = "grid-container-wrapper";
+        const grid = document.createElement("div");
+        grid.id = "fraction-grid";
+        const info = document.createElement("div");
+        info.id = "grid-info";
+        info.textContent = "Drag to shade • Click shaded cells to unshade";
+        const count = document.createElement("div");
+        count.id = "grid-count";
+        const clear = document.createElement("button");
+        clear.id = "grid-clear";
+        clear.textContent = "🔄 Clear Grid";
+        wrapper.appendChild(count);
+        wrapper.appendChild(grid);
+        wrapper.appendChild(info);
+        wrapper.appendChild(clear);
+        root.appendChild(wrapper);
+
+        const cells = [];
+        for (let i = 0; i < GRID_SIZE * GRID_SIZE; i++) {
+            const cell = document.createElement("div");
+            cell.className = "grid-cell";
+            cell.dataset.row = Math.floor(i / GRID_SIZE);
+            cell.dataset.col = i % GRID_SIZE;
+            grid.appendChild(cell);
+            cells.push(cell);
+        }
+
+        function update() {
+            const shaded = cells.filter(function (cell) { return cell.classList.contains("shaded"); }).length;
+            const target = args.target;
+            if (target === undefined || target === null) {
+                count.className = "";
+                count.textContent = "Cells shaded: " + shaded;
+            } else if (shaded === target) {
+                count.className = "correct";
+                count.textContent = "✅ Perfect! You've shaded " + shaded + "/" + target + " cells";
+            } else if (shaded < target) {
+                count.className = "";
+                count.textContent = "Cells shaded: " + shaded + "/" + target + " (shade " + (target - shaded) + " more)";
+            } else {
+                count.className = "over";
+                count.textContent = "Too many! Cells shaded: " + shaded + "/" + target + " (unshade " + (shaded - target) + ")";
+            }
+            return shaded;
+        }
+        update();
+
+        let startCell = null;
+        let isShading = true;
+
+        // All cells in the rectangle between two cells
+        function cellsBetween(cell1, cell2) {
+            const rows = [+cell1.dataset.row, +cell2.dataset.row].sort(function (a, b) { return a - b; });
+            const cols = [+cell1.dataset.col, +cell2.dataset.col].sort(function (a, b) { return a - b; });
+            const found = [];
+            for (let r = rows[0]; r <= rows[1]; r++) {
+                for (let c = cols[0]; c <= cols[1]; c++) {
+                    found.push(cells[r * GRID_SIZE + c]);
+                }
+            }
+            return found;
+        }
+
+        function clearPreview() {
+            cells.forEach(function (cell) { cell.classList.remove("preview"); });
+        }
+
+        function cellAt(event) {
+            const element = document.elementFromPoint(event.clientX, event.clientY);
+            return element && element.classList.contains("grid-cell") ? element : null;
+        }
+
+        grid.addEventListener("pointerdown", function (event) {
+            const cell = cellAt(event);
+            if (!cell) return;
+            event.preventDefault();
+            grid.setPointerCapture(event.pointerId);
+            startCell = cell;
+            isShading = !cell.classList.contains("shaded");
+            cell.classList.toggle("shaded", isShading);
+        });
+
+        grid.addEventListener("pointermove", function (event) {
+            const cell = startCell && cellAt(event);
+            if (!cell) return;
+            clearPreview();
+            cellsBetween(startCell, cell).forEach(function (other) {
+                if (other.classList.contains("shaded") !== isShading) {
+                    other.classList.add("preview");
+                }
+            });
+        });
+
+        grid.addEventListener("pointerup", function (event) {
+            if (!startCell) return;
+            clearPreview();
+            cellsBetween(startCell, cellAt(event) || startCell).forEach(function (cell) {
+                cell.classList.toggle("shaded", isShading);
+            });
+            startCell = null;
+            MathwizComponent.setValue({shaded: update()});
+        });
+
+        grid.addEventListener("pointercancel", function () {
+            clearPreview();
+            startCell = null;
+        });
+
+        clear.addEventListener("click", function () {
+            cells.forEach(function (cell) { cell.classList.remove("shaded"); });
+            MathwizComponent.setValue({shaded: update()});
+        });
+    }
+
+    MathwizComponent.register("shade_grid", render);
+})();
@@ -0,0 +1,77 @@
+// The Streamlit custom component protocol, without a build step.
+//
+// Streamlit creates the component's iframe once per element and posts a
+// "streamlit:render" message with the Python arguments on every rerun.  The
+// widget registered under args.widget draws into the page; a rerun with the
+// same arguments leaves the page alone, so nothing the student did in the
+// widget is lost.
+//
+// Widgets keep their own state while the student works and call setValue
+// once with the final answer; Python only reruns then.  The answer is tagged
+// with args.problem so Python can tell it from the previous question's.
+(function () {
+    "use strict";
+
+    const widgets = {};
+    let root = null;
+    let renderedArgs = null;
+    let problem = null;
+    let lastHeight = null;
+
+    function send(type, data) {
+        window.parent.postMessage(Object.assign({isStreamlitMessage: true, type: type}, data), "*");
+    }
+
+    function setFrameHeight(height) {
+        if (height === undefined) {
+            height = Math.ceil(document.documentElement.getBoundingClientRect().height);
+        }
+        if (height !== lastHeight) {
+            lastHeight = height;
+            send("streamlit:setFrameHeight", {height: height});
+        }
+    }
+
+    function onMessage(event) {
+        if (!event.data || event.data.type !== "streamlit:render") {
+            return;
+        }
+        const args = event.data.args;
+        const serialized = JSON.stringify(args);
+        if (serialized === renderedArgs) {
+            return;
+        }
+        renderedArgs = serialized;
+        problem = args.problem;
+
+        const render = widgets[args.widget];
+        root.replaceChildren();
+        if (render) {
+            render(root, args);
+        } else {
+            root.textContent = "Unknown widget: " + args.widget;
+        }
+        setFrameHeight();
+    }
+
+    function setValue(value) {
+        send("streamlit:setComponentValue", {
+            value: Object.assign({problem: problem}, value),
+            dataType: "json",
+        });
+    }
+
+    window.MathwizComponent = {
+        register: function (name, render) {
+            widgets[name] = render;
+        },
+        setFrameHeight: setFrameHeight,
+        setValue: setValue,
+        start: function (element) {
+            root = element;
+            window.addEventListener("message", onMessage);
+            new ResizeObserver(function () { setFrameHeight(); }).observe(document.body);
+            send("streamlit:componentReady", {apiVersion: 1});
+        },
+    };
+})();
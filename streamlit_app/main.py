@@ -1,383 +1,54 @@
 import streamlit as st
-import importlib
-import os
-import sys
-import importlib.util
 
-# Helper function to sanitize subtopic text for URL usage
-def sanitize(text):
-    """Convert activity names to valid URL parameters"""
-    return text.lower().replace(" ", "_").replace("-", "").replace(":", "").replace(",", "").replace(".", "").replace("(", "").replace(")", "").replace("?", "")
+from utils.activity_registry import load_activity
+from utils.activity_state import enter_activity, leave_activity
+from utils import catalog
+from utils.fragments import show_activity_error
+from utils.route_manifest import DEFAULT_GRADE, GRADE_FOLDERS
+from utils.slugs import get_slug_index
+from utils.state_usage import log_state_usage, show_state_page
+from utils.warmup import start_warmup
+
+# Label <-> slug <-> route index, built once per process
+slug_index = get_slug_index()
+
+# Import and run popular activities in the background before students arrive
+start_warmup()
 
-# Routing block: check for a subtopic query parameter
 params = st.query_params
+
+# Log how much this session keeps in st.session_state every few minutes
+log_state_usage()
+
+# Debug page: ?debug=state shows what this session keeps in st.session_state
+if params.get("debug") == "state":
+    show_state_page()
+    st.stop()
+
+# Routing block: check for a subtopic query parameter
 if "subtopic" in params:
     subtopic = params["subtopic"]
-    grade = params.get("grade", "class_v")
+    grade = params.get("grade", DEFAULT_GRADE)
+    if grade not in GRADE_FOLDERS:
+        grade = DEFAULT_GRADE
     
     try:
-        # Map grade to folder name (keeping your current structure)
-        grade_folder_map = {
-            "lower_kindergarten": "Lower Kindergarten",
-            "upper_kindergarten": "Upper Kindergarten", 
-            "class_i": "Year 1",
-            "class_ii": "Year 2",
-            "class_iii": "Year 3",
-            "class_iv": "Year 4",
-            "class_v": "Year 5",
-            "class_vi": "Year 6",
-            "class_vii": "Year 7",
-            "class_viii": "Year 8",
-            "class_ix": "Year 9",
-            "class_x": "Year 10",
-            "class_xi": "Year 11",
-            "class_xii": "Year 12"
-        }
-        
-        # Map subtopic to section folder (using your EXACT folder structure)
-        section_map = {
-    # A. Place values and number sense
-    "place_values": "A.Place_values_and_number_sense",
-    "convert_between_place_values": "A.Place_values_and_number_sense",
-    "compare_numbers_up_to_millions": "A.Place_values_and_number_sense",
-    "put_numbers_in_order": "A.Place_values_and_number_sense",
-    "writing_numbers_in_words_convert_words_to_digits": "A.Place_values_and_number_sense",
-    "writing_numbers_in_words_convert_digits_to_words": "A.Place_values_and_number_sense",
-    "roman_numerals": "A.Place_values_and_number_sense",
-    "rounding": "A.Place_values_and_number_sense",
-    "even_or_odd_arithmetic_rules": "A.Place_values_and_number_sense",
-    
-    # B. Addition and subtraction
-    "add_and_subtract_whole_numbers": "B.Addition_and_subtraction",
-    "add_and_subtract_whole_numbers_word_problems": "B.Addition_and_subtraction", 
-    "complete_addition_and_subtraction_number_sentences": "B.Addition_and_subtraction",
-    "fill_in_the_missing_digits": "B.Addition_and_subtraction",
-    "choose_numbers_with_a_particular_sum_or_difference": "B.Addition_and_subtraction",
-    "properties_of_addition": "B.Addition_and_subtraction",
-    "inequalities_with_addition_and_subtraction": "B.Addition_and_subtraction",
-    "estimate_sums_and_differences_of_whole_numbers": "B.Addition_and_subtraction",
-    "estimate_sums_and_differences_word_problems": "B.Addition_and_subtraction",
-    
-    # C. Multiplication - Complete Section Map
-    "multiplication_facts_to_10": "C.Multiplication",
-    "multiplication_facts_to_10_word_problems": "C.Multiplication", 
-    "multiplication_facts_up_to_10_find_the_missing_factor": "C.Multiplication",
-    "multiplication_number_sentences_up_to_10_true_or_false": "C.Multiplication",
-    "multiply_onedigit_numbers_by_threedigit_or_fourdigit_numbers_using_area_models_i": "C.Multiplication",
-    "multiply_onedigit_numbers_by_threedigit_or_fourdigit_numbers_using_area_models_ii": "C.Multiplication", 
-    "multiply_onedigit_numbers_by_threedigit_or_fourdigit_numbers_using_expanded_form": "C.Multiplication",
-    "multiply_onedigit_numbers_by_multidigit_numbers_using_partial_products": "C.Multiplication",
-    "multiply_by_onedigit_numbers": "C.Multiplication",
-    "multiply_by_onedigit_numbers_word_problems": "C.Multiplication",
-    "multiplication_patterns_over_increasing_place_values": "C.Multiplication",
-    "multiply_numbers_ending_in_zeroes": "C.Multiplication", 
-    "multiply_numbers_ending_in_zeroes_word_problems": "C.Multiplication",
-    "properties_of_multiplication": "C.Multiplication",
-    "estimate_products": "C.Multiplication",
-    "estimate_products_word_problems": "C.Multiplication",
-    "multiply_twodigit_numbers_by_twodigit_numbers_using_area_models_i": "C.Multiplication",
-    "multiply_twodigit_numbers_by_twodigit_numbers_using_area_models_ii": "C.Multiplication",
-    "distributive_property_find_the_missing_number": "C.Multiplication",
-    "multiply_using_the_distributive_property": "C.Multiplication",
-    "use_one_multiplication_fact_to_complete_another": "C.Multiplication",
-    "multiply_twodigit_numbers_by_twodigit_numbers_using_partial_products": "C.Multiplication",
-    "multiply_a_twodigit_number_by_a_twodigit_number_complete_the_missing_steps": "C.Multiplication",
-    "multiply_a_twodigit_number_by_a_twodigit_number": "C.Multiplication",
-    "box_multiplication": "C.Multiplication",
-    "lattice_multiplication": "C.Multiplication",
-    "multiply_a_twodigit_number_by_a_larger_number_complete_the_missing_steps": "C.Multiplication",
-    "multiply_a_twodigit_number_by_a_larger_number": "C.Multiplication",
-    "multiply_by_twodigit_numbers_word_problems": "C.Multiplication",
-    "multiply_three_or_more_numbers_up_to_two_digits_each": "C.Multiplication",
-    "multiply_three_or_more_numbers_word_problems": "C.Multiplication",
-    "choose_numbers_with_a_particular_product": "C.Multiplication",
-    "inequalities_with_multiplication": "C.Multiplication",
-    
-    # D. Division
-    "division_facts_to_10": "D.Division",
-    "division_facts_to_10_word_problems": "D.Division",
-    "division_facts_up_to_10_find_the_missing_number": "D.Division",
-    "division_number_sentences_up_to_10_true_or_false": "D.Division",
-    "relate_multiplication_and_division": "D.Division",
-    "divide_twodigit_numbers_by_onedigit_numbers_using_arrays": "D.Division",
-    "divide_using_the_distributive_property": "D.Division",
-    "divide_threedigit_numbers_by_onedigit_numbers_using_area_models": "D.Division",
-    "divide_using_partial_quotients": "D.Division",
-    "divide_by_onedigit_numbers": "D.Division",
-    "divide_by_onedigit_numbers_word_problems": "D.Division",
-    "divide_by_onedigit_numbers_interpret_remainders": "D.Division",
-    "estimate_quotients": "D.Division",
-    "estimate_quotients_word_problems": "D.Division",
-    "division_patterns_over_increasing_place_values": "D.Division",
-    "divide_numbers_ending_in_zeroes": "D.Division",
-    "divide_numbers_ending_in_zeroes_word_problems": "D.Division",
-    "choose_numbers_with_a_particular_quotient": "D.Division",
-    "divide_by_twodigit_numbers": "D.Division",
-    
-    # E. Number theory
-    "identify_factors": "E.Number_theory",
-    "prime_and_composite_numbers": "E.Number_theory",
-    "prime_factorisation": "E.Number_theory",
-    "divisibility_rules": "E.Number_theory",
-    "divisibility_rules_word_problems": "E.Number_theory",
-    "highest_common_factor": "E.Number_theory",
-    "choose_the_multiples_of_a_given_number_up_to_12": "E.Number_theory",
-    "lowest_common_multiple": "E.Number_theory",
-    
-    # F. Decimals
-    "what_decimal_number_is_illustrated": "F.Decimals",
-    "model_decimals_and_fractions": "F.Decimals",
-    "understanding_decimals_expressed_in_words": "F.Decimals",
-    "place_values_in_decimal_numbers": "F.Decimals",
-    "relationship_between_decimal_place_values": "F.Decimals",
-    "convert_decimals_between_standard_and_expanded_form": "F.Decimals",
-    "equivalent_decimals": "F.Decimals",
-    "round_decimals": "F.Decimals",
-    "decimal_number_lines": "F.Decimals",
-    "compare_decimals_using_models": "F.Decimals",
-    "compare_decimals_to_a_model": "F.Decimals",
-    "compare_decimals_on_number_lines": "F.Decimals",
-    "compare_decimal_numbers": "F.Decimals",
-    "put_decimal_numbers_in_order": "F.Decimals",
-    "compare_order_and_round_decimals_word_problems": "F.Decimals",
-    "convert_fractions_and_mixed_numbers_to_decimals": "F.Decimals",
-    "convert_decimals_to_fractions_and_mixed_numbers": "F.Decimals",
-    "convert_decimals_between_standard_and_expanded_form_using_fractions": "F.Decimals",
-    "compare_decimals_and_fractions_on_number_lines": "F.Decimals",
-    "compare_decimals_and_fractions": "F.Decimals",
-    "put_assorted_decimals_fractions_and_mixed_numbers_in_order": "F.Decimals",
-    
-    # G. Add and subtract decimals
-    "add_and_subtract_decimal_numbers": "G.Add_and_subtract_decimals",
-    "add_and_subtract_decimals_word_problems": "G.Add_and_subtract_decimals",
-    "choose_decimals_with_a_particular_sum_or_difference": "G.Add_and_subtract_decimals",
-    "complete_addition_and_subtraction_number_sentences_with_decimals": "G.Add_and_subtract_decimals",
-    "inequalities_with_decimal_addition_and_subtraction": "G.Add_and_subtract_decimals",
-    "estimate_sums_and_differences_of_decimals": "G.Add_and_subtract_decimals",
-    
-    # H. Multiply and divide decimals
-    "estimate_products_of_whole_numbers_and_decimals": "H.Multiply_and_divide_decimals",
-    "multiply_a_decimal_by_a_power_of_ten": "H.Multiply_and_divide_decimals",
-    "multiply_decimals_and_whole_numbers": "H.Multiply_and_divide_decimals",
-    "multiply_decimals_and_whole_numbers_word_problems": "H.Multiply_and_divide_decimals",
-    "inequalities_with_decimal_multiplication": "H.Multiply_and_divide_decimals",
-    "divide_by_powers_of_ten": "H.Multiply_and_divide_decimals",
-    "decimal_division_patterns_over_increasing_place_values": "H.Multiply_and_divide_decimals",
-    
-    # I. Fractions and mixed numbers
-    "fractions_review": "I.Fractions_and_mixed_numbers",
-    "fractions_of_a_whole_word_problems": "I.Fractions_and_mixed_numbers",
-    "fractions_of_a_group_word_problems": "I.Fractions_and_mixed_numbers",
-    "unit_fractions_on_number_lines": "I.Fractions_and_mixed_numbers",
-    "equivalent_fractions": "I.Fractions_and_mixed_numbers",
-    "patterns_of_equivalent_fractions": "I.Fractions_and_mixed_numbers",
-    "write_fractions_in_lowest_terms": "I.Fractions_and_mixed_numbers",
-    "mixed_numbers": "I.Fractions_and_mixed_numbers",
-    "convert_between_improper_fractions_and_mixed_numbers": "I.Fractions_and_mixed_numbers",
-    "compare_unit_fractions_using_models": "I.Fractions_and_mixed_numbers",
-    "compare_unit_fractions_using_number_lines": "I.Fractions_and_mixed_numbers",
-    "compare_unit_fractions": "I.Fractions_and_mixed_numbers",
-    "compare_fractions_with_like_denominators_using_models": "I.Fractions_and_mixed_numbers",
-    "compare_fractions_with_like_denominators_using_number_lines": "I.Fractions_and_mixed_numbers",
-    "compare_fractions_with_like_denominators": "I.Fractions_and_mixed_numbers",
-    "compare_fractions_with_unlike_denominators_using_models": "I.Fractions_and_mixed_numbers",
-    "compare_fractions_with_unlike_denominators_using_number_lines": "I.Fractions_and_mixed_numbers",
-    "compare_fractions_with_unlike_denominators": "I.Fractions_and_mixed_numbers",
-    "put_fractions_in_order": "I.Fractions_and_mixed_numbers",
-    "fractions_of_a_number": "I.Fractions_and_mixed_numbers",
-    "fractions_of_a_number_word_problems": "I.Fractions_and_mixed_numbers",
-    "round_mixed_numbers": "I.Fractions_and_mixed_numbers",
-    
-    # J. Add and subtract fractions
-    "decompose_fractions_into_unit_fractions_using_models": "J.Add_and_subtract_fractions",
-    "decompose_fractions_into_unit_fractions": "J.Add_and_subtract_fractions",
-    "decompose_fractions": "J.Add_and_subtract_fractions",
-    "decompose_fractions_multiple_ways": "J.Add_and_subtract_fractions",
-    "add_fractions_with_like_denominators_using_area_models": "J.Add_and_subtract_fractions",
-    "add_fractions_with_like_denominators_using_strip_models": "J.Add_and_subtract_fractions",
-    "add_fractions_with_like_denominators_using_number_lines": "J.Add_and_subtract_fractions",
-    "add_fractions_with_like_denominators": "J.Add_and_subtract_fractions",
-    "subtract_fractions_with_like_denominators": "J.Add_and_subtract_fractions",
-    "subtract_fractions_with_like_denominators_using_area_models": "J.Add_and_subtract_fractions",
-    "subtract_fractions_with_like_denominators_using_strip_models": "J.Add_and_subtract_fractions",
-    "subtract_fractions_with_like_denominators_using_number_lines": "J.Add_and_subtract_fractions",
-    "subtract_fractions_with_like_denominators": "J.Add_and_subtract_fractions",
-    "add_and_subtract_fractions_with_like_denominators_using_number_lines": "J.Add_and_subtract_fractions",
-    "add_and_subtract_fractions_with_like_denominators": "J.Add_and_subtract_fractions",
-    "add_and_subtract_fractions_with_like_denominators_word_problems": "J.Add_and_subtract_fractions",
-    "add_and_subtract_mixed_numbers_with_like_denominators": "J.Add_and_subtract_fractions",
-    "add_and_subtract_mixed_numbers_with_like_denominators_word_problems": "J.Add_and_subtract_fractions",
-    "add_fractions_with_unlike_denominators_using_models": "J.Add_and_subtract_fractions",
-    "add_fractions_with_unlike_denominators": "J.Add_and_subtract_fractions",
-    "subtract_fractions_with_unlike_denominators_using_models": "J.Add_and_subtract_fractions",
-    "subtract_fractions_with_unlike_denominators": "J.Add_and_subtract_fractions",
-    "estimate_sums_and_differences_of_fractions_using_benchmarks": "J.Add_and_subtract_fractions",
-    "add_and_subtract_fractions_with_unlike_denominators": "J.Add_and_subtract_fractions",
-    "add_and_subtract_fractions_with_unlike_denominators_word_problems": "J.Add_and_subtract_fractions",
-    "add_and_subtract_mixed_numbers_with_unlike_denominators": "J.Add_and_subtract_fractions",
-    "add_and_subtract_mixed_numbers_with_unlike_denominators_word_problems": "J.Add_and_subtract_fractions",
-    "add_three_or_more_fractions": "J.Add_and_subtract_fractions",
-    "add_three_or_more_fractions_word_problems": "J.Add_and_subtract_fractions",
-    "complete_addition_and_subtraction_number_sentences_with_fractions": "J.Add_and_subtract_fractions",
-    "inequalities_with_addition_and_subtraction_of_fractions": "J.Add_and_subtract_fractions",
-    "estimate_sums_and_differences_of_mixed_numbers": "J.Add_and_subtract_fractions",
-    "add_up_to_4_fractions_with_denominators_of_10_and_100": "J.Add_and_subtract_fractions",
-    
-    # K. Mixed operations
-    "add_subtract_multiply_and_divide_whole_numbers": "K.Mixed_operations",
-    "add_subtract_multiply_and_divide_whole_numbers_word_problems": "K.Mixed_operations",
-    "add_subtract_multiply_and_divide_decimals": "K.Mixed_operations",
-    "add_subtract_and_multiply_decimals_word_problems": "K.Mixed_operations",
-    "write_numerical_expressions": "K.Mixed_operations",
-    "evaluate_numerical_expressions": "K.Mixed_operations",
-    
-    # L. Problem solving
-    "write_numerical_expressions_for_word_problems": "L.Problem_solving",
-    "multistep_word_problems": "L.Problem_solving",
-    "multistep_word_problems_involving_remainders": "L.Problem_solving",
-    "multistep_word_problems_identify_reasonable_answers": "L.Problem_solving",
-    "word_problems_with_extra_or_missing_information": "L.Problem_solving",
-    "guessandcheck_problems": "L.Problem_solving",  
-    "find_the_order": "L.Problem_solving",
-    "use_venn_diagrams_to_solve_problems": "L.Problem_solving",
-    
-    # M. Percents
-    "what_percentage_is_illustrated": "M.Percents",
-    "convert_fractions_to_percents_using_grid_models": "M.Percents",
-    "convert_between_percents_fractions_and_decimals": "M.Percents",
-    "convert_between_percents_fractions_and_decimals_word_problems": "M.Percents",
-    "compare_percents_to_each_other_and_to_fractions": "M.Percents",
-    "compare_percents_and_fractions_word_problem": "M.Percents",
-    
-    # N. Money
-    "add_and_subtract_money_amounts": "N.Money",
-    "add_and_subtract_money_word_problems": "N.Money",
-    "multiply_money_amounts_word_problems": "N.Money",
-    "multiply_money_amounts_with_decimals_word_problems": "N.Money",
-    "divide_money_amounts_word_problems": "N.Money",
-    "divide_money_amounts_with_decimals_word_problems": "N.Money",
-    "price_lists": "N.Money",
-    
-    # O. Number sequences
-    "use_a_rule_to_complete_a_number_sequence": "O.Number_sequences",
-    "arithmetic_sequences_with_whole_numbers": "O.Number_sequences",
-    "arithmetic_sequences_with_decimals": "O.Number_sequences",
-    "arithmetic_sequences_with_fractions": "O.Number_sequences",
-    "increasing_number_sequences": "O.Number_sequences",
-    "geometric_number_sequences": "O.Number_sequences",
-    "number_sequences_mixed_review": "O.Number_sequences",
-    "number_sequences_word_problems": "O.Number_sequences",
-    
-    # P. Coordinate plane
-    "objects_on_a_coordinate_plane": "P.Coordinate_plane",
-    "graph_points_on_a_coordinate_plane": "P.Coordinate_plane",
-    "coordinate_planes_as_maps": "P.Coordinate_plane",
-    "follow_directions_on_a_coordinate_plane": "P.Coordinate_plane",
-    
-    # Q. Data and graphs
-    "read_a_table": "Q.Data_and_graphs",
-    "interpret_line_graphs": "Q.Data_and_graphs",
-    "create_line_graphs": "Q.Data_and_graphs",
-    "interpret_bar_graphs": "Q.Data_and_graphs",
-    "create_bar_graphs": "Q.Data_and_graphs",
-    "interpret_picture_graphs": "Q.Data_and_graphs",
-    "create_picture_graphs": "Q.Data_and_graphs",
-    "interpret_dot_plots": "Q.Data_and_graphs",
-    "create_dot_plots": "Q.Data_and_graphs",
-    "frequency_tables": "Q.Data_and_graphs",
-    "interpret_frequency_tables_onestep_problems": "Q.Data_and_graphs",
-    "choose_the_best_type_of_graph": "Q.Data_and_graphs",
-    
-    # R. Probability and statistics
-    "understanding_probability": "R.Probability_and_statistics",
-    "find_the_probability": "R.Probability_and_statistics",
-    "make_predictions": "R.Probability_and_statistics",
-    "identify_independent_and_dependent_events": "R.Probability_and_statistics",
-    "combinations": "R.Probability_and_statistics",
-    "find_the_mode": "R.Probability_and_statistics",
-    
-    # S. Time
-    "convert_time_units": "S.Time",
-    "add_and_subtract_mixed_time_units": "S.Time",
-    "elapsed_time": "S.Time",
-    "find_start_and_end_times_word_problems": "S.Time",
-    "convert_between_12hour_and_24hour_time": "S.Time",
-    "time_zones__12hour_time": "S.Time",
-    "schedules_24hour_time": "S.Time",
-    "schedules_and_timelines_12hour_time": "S.Time",
-    "schedules__24hour_time": "S.Time",
-    "time_patterns": "S.Time",
-    
-    # T. Units of measurement
-    "choose_the_appropriate_metric_unit_of_measure": "T.Units_of_measurement",
-    "compare_metric_units_of_length": "T.Units_of_measurement",
-    "compare_metric_units_of_mass": "T.Units_of_measurement",
-    "compare_metric_units_of_volume": "T.Units_of_measurement",
-    "choose_the_more_reasonable_temperature": "T.Units_of_measurement",
-    
-    # U. Two-dimensional figures
-    "is_it_a_polygon": "U.Two-dimensional_figures",
-    "number_of_sides_in_polygons": "U.Two-dimensional_figures",
-    "regular_and_irregular_polygons": "U.Two-dimensional_figures",
-    "angles_greater_than_less_than_or_equal_to_a_right_angle": "U.Two-dimensional_figures",
-    "angles_of_90_180_270_and_360_degrees": "U.Two-dimensional_figures",
-    "acute_right_obtuse_and_straight_angles": "U.Two-dimensional_figures",
-    "measure_angles_on_a_circle": "U.Two-dimensional_figures",
-    "measure_angles_with_a_protractor": "U.Two-dimensional_figures",
-    "draw_angles_with_a_protractor": "U.Two-dimensional_figures",
-    "estimate_angle_measurements": "U.Two-dimensional_figures",
-    
-    # V. Symmetry and transformations
-    "lines_of_symmetry": "V.Symmetry_and_transformations",
-    "rotational_symmetry": "V.Symmetry_and_transformations",
-    "reflection_rotation_and_translation": "V.Symmetry_and_transformations",
-    "dilations": "V.Symmetry_and_transformations",
-    
-    # W. Three-dimensional figures
-    "identify_threedimensional_figures": "W.Three-dimensional_figures",
-    "count_vertices_edges_and_faces": "W.Three-dimensional_figures",
-    "identify_faces_of_threedimensional_figures": "W.Three-dimensional_figures",
-    "nets_of_threedimensional_figures": "W.Three-dimensional_figures",
-    "threedimensional_figures_viewed_from_different_perspectives": "W.Three-dimensional_figures",
-    
-    # X. Geometric measurement
-    "perimeter_of_rectangles": "X.Geometric_measurement",
-    "perimeter_of_polygons": "X.Geometric_measurement",
-    "area_of_squares_and_rectangles": "X.Geometric_measurement",
-    "area_and_perimeter_of_figures_on_grids": "X.Geometric_measurement",
-    "area_and_perimeter_word_problems": "X.Geometric_measurement",
-    "use_area_and_perimeter_to_determine_cost": "X.Geometric_measurement",
-    "volume": "X.Geometric_measurement",
-    
-    # Y. Financial literacy
-    "budget_a_weekly_allowance_word_problems": "Y.Financial_literacy",
-    "reading_financial_records": "Y.Financial_literacy",
-    "keeping_financial_records": "Y.Financial_literacy",
-    "balance_a_budget": "Y.Financial_literacy",
-    "adjust_a_budget": "Y.Financial_literacy",
-}
+        # O(1) lookup in the route manifest generated from the Grades tree
+        route = slug_index.route_for(grade, subtopic)
         
-        grade_folder = grade_folder_map.get(grade, "Year 5")
-        section_folder = section_map.get(subtopic, "A.Place values and number sense")
-        
-        # Construct file path using your current structure
-        file_path = os.path.join("Grades", grade_folder, section_folder, f"{subtopic}.py")
-        
-        if os.path.exists(file_path):
-            # Add the directory to Python path temporarily
-            module_dir = os.path.join("Grades", grade_folder, section_folder)
-            if module_dir not in sys.path:
-                sys.path.insert(0, module_dir)
-            
-            # Import the module by filename
-            spec = importlib.util.spec_from_file_location(subtopic, file_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            
+        if route is not None:
+            # Reuse the module loaded by an earlier rerun unless the file changed
+            module = load_activity(grade, subtopic, route)
+
+            # Swap the previous activity's session keys out and this one's back in
+            enter_activity(route["module"])
+
             # Call the run function
             module.run()
         else:
-            st.error(f"❌ Activity not found: `{subtopic.replace('_', ' ').title()}`")
+            link = slug_index.link_for(grade, subtopic)
+            activity_name = link[1] if link else subtopic.replace('_', ' ').title()
+            st.error(f"❌ Activity not found: `{activity_name}`")
             st.info("💡 This activity is coming soon! Please try another one.")
             if st.button("← Back to Curriculum"):
                 if "subtopic" in st.query_params:
@@ -385,14 +56,12 @@ if "subtopic" in params:
                 st.rerun()
             
     except Exception as e:
-        st.error(f"❌ Error loading activity: {str(e)}")
-        st.info("💡 This activity is experiencing technical issues. Please try another one.")
-        if st.button("← Back to Curriculum"):
-            if "subtopic" in st.query_params:
-                del st.query_params["subtopic"]
-            st.rerun()
+        show_activity_error(e)
     st.stop()  # Stop further execution
 
+# Back on the curriculum: put the last activity's session keys away
+leave_activity()
+
 # Set page configuration
 st.set_page_config(
     page_title="MathWiz - K-12 Mathematics Learning Platform", 
@@ -513,4829 +182,6 @@ else:  # Topics view
     # Keep current grade selection
     selected_grade_display = reverse_grade_mapping.get(grade, "Class I")
 
-# **Grade-based Curriculum Structure**
-grade_curriculum = {
-    "class_v": {
-        "A. Place values and number sense": [
-            "Place values",
-            "Convert between place values",
-            "Compare numbers up to millions",
-            "Put numbers in order",
-            "Writing numbers in words: convert words to digits",
-            "Writing numbers in words: convert digits to words",
-            "Roman numerals",
-            "Rounding",
-            "Even or odd: arithmetic rules"
-        ],
-        "B. Addition and subtraction": [
-            "Add and subtract whole numbers",
-            "Add and subtract whole numbers: word problems",
-            "Complete addition and subtraction number sentences",
-            "Fill in the missing digits",
-            "Choose numbers with a particular sum or difference",
-            "Properties of addition",
-            "Inequalities with addition and subtraction",
-            "Estimate sums and differences of whole numbers",
-            "Estimate sums and differences: word problems"
-        ],
-        "C. Multiplication": [
-            "Multiplication facts to 10",
-            "Multiplication facts to 10: word problems",
-            "Multiplication facts up to 10: find the missing factor",
-            "Multiplication number sentences up to 10: true or false?",
-            "Multiply one-digit numbers by three-digit or four-digit numbers using area models I",
-            "Multiply one-digit numbers by three-digit or four-digit numbers using area models II",
-            "Multiply one-digit numbers by three-digit or four-digit numbers using expanded form",
-            "Multiply one-digit numbers by multi-digit numbers using partial products",
-            "Multiply by one-digit numbers",
-            "Multiply by one-digit numbers: word problems",
-            "Multiplication patterns over increasing place values",
-            "Multiply numbers ending in zeroes",
-            "Multiply numbers ending in zeroes: word problems",
-            "Properties of multiplication",
-            "Estimate products",
-            "Estimate products: word problems",
-            "Multiply two-digit numbers by two-digit numbers using area models I",
-            "Multiply two-digit numbers by two-digit numbers using area models II",
-            "Distributive property: find the missing number",
-            "Multiply using the distributive property",
-            "Use one multiplication fact to complete another",
-            "Multiply two-digit numbers by two-digit numbers using partial products",
-            "Multiply a two-digit number by a two-digit number: complete the missing steps",
-            "Multiply a two-digit number by a two-digit number",
-            "Box multiplication",
-            "Lattice multiplication",
-            "Multiply a two-digit number by a larger number: complete the missing steps",
-            "Multiply a two-digit number by a larger number",
-            "Multiply by two-digit numbers: word problems",
-            "Multiply three or more numbers up to two digits each",
-            "Multiply three or more numbers: word problems",
-            "Choose numbers with a particular product",
-            "Inequalities with multiplication"
-        ],
-        "D. Division": [
-            "Division facts to 10",
-            "Division facts to 10: word problems",
-            "Division facts up to 10: find the missing number",
-            "Division number sentences up to 10: true or false?",
-            "Relate multiplication and division",
-            "Divide two-digit numbers by one-digit numbers using arrays",
-            "Divide using the distributive property",
-            "Divide three-digit numbers by one-digit numbers using area models",
-            "Divide using partial quotients",
-            "Divide by one-digit numbers",
-            "Divide by one-digit numbers: word problems",
-            "Divide by one-digit numbers: interpret remainders",
-            "Estimate quotients",
-            "Estimate quotients: word problems",
-            "Division patterns over increasing place values",
-            "Divide numbers ending in zeroes",
-            "Divide numbers ending in zeroes: word problems",
-            "Choose numbers with a particular quotient",
-            "Divide by two-digit numbers"
-        ],
-        "E. Number theory": [
-            "Identify factors",
-            "Prime and composite numbers",
-            "Prime factorisation",
-            "Divisibility rules",
-            "Divisibility rules: word problems",
-            "Highest common factor",
-            "Choose the multiples of a given number up to 12",
-            "Lowest common multiple"
-        ],
-        "F. Decimals": [
-            "What decimal number is illustrated?",
-            "Model decimals and fractions",
-            "Understanding decimals expressed in words",
-            "Place values in decimal numbers",
-            "Relationship between decimal place values",
-            "Convert decimals between standard and expanded form",
-            "Equivalent decimals",
-            "Round decimals",
-            "Decimal number lines",
-            "Compare decimals using models",
-            "Compare decimals to a model",
-            "Compare decimals on number lines",
-            "Compare decimal numbers",
-            "Put decimal numbers in order",
-            "Compare, order and round decimals: word problems",
-            "Convert fractions and mixed numbers to decimals",
-            "Convert decimals to fractions and mixed numbers",
-            "Convert decimals between standard and expanded form using fractions",
-            "Compare decimals and fractions on number lines",
-            "Compare decimals and fractions",
-            "Put assorted decimals, fractions and mixed numbers in order"
-        ],
-        "G. Add and subtract decimals": [
-            "Add and subtract decimal numbers",
-            "Add and subtract decimals: word problems",
-            "Choose decimals with a particular sum or difference",
-            "Complete addition and subtraction number sentences with decimals",
-            "Inequalities with decimal addition and subtraction",
-            "Estimate sums and differences of decimals"
-        ],
-        "H. Multiply and divide decimals": [
-            "Estimate products of whole numbers and decimals",
-            "Multiply a decimal by a power of ten",
-            "Multiply decimals and whole numbers",
-            "Multiply decimals and whole numbers: word problems",
-            "Inequalities with decimal multiplication",
-            "Divide by powers of ten",
-            "Decimal division patterns over increasing place values"
-        ],
-        "I. Fractions and mixed numbers": [
-            "Fractions review",
-            "Fractions of a whole: word problems",
-            "Fractions of a group: word problems",
-            "Unit fractions on number lines",
-            "Equivalent fractions",
-            "Patterns of equivalent fractions",
-            "Write fractions in lowest terms",
-            "Mixed numbers",
-            "Convert between improper fractions and mixed numbers",
-            "Compare unit fractions using models",
-            "Compare unit fractions using number lines",
-            "Compare unit fractions",
-            "Compare fractions with like denominators using models",
-            "Compare fractions with like denominators using number lines",
-            "Compare fractions with like denominators",
-            "Compare fractions with unlike denominators using models",
-            "Compare fractions with unlike denominators using number lines",
-            "Compare fractions with unlike denominators",
-            "Put fractions in order",
-            "Fractions of a number",
-            "Fractions of a number: word problems",
-            "Round mixed numbers"
-        ],
-        "J. Add and subtract fractions": [
-            "Decompose fractions into unit fractions using models",
-            "Decompose fractions into unit fractions",
-            "Decompose fractions",
-            "Decompose fractions multiple ways",
-            "Add fractions with like denominators using area models",
-            "Add fractions with like denominators using strip models",
-            "Add fractions with like denominators using number lines",
-            "Add fractions with like denominators",
-            "Subtract fractions with like denominators using area models",
-            "Subtract fractions with like denominators using strip models",
-            "Subtract fractions with like denominators using number lines",
-            "Subtract fractions with like denominators",
-            "Add and subtract fractions with like denominators using number lines",
-            "Add and subtract fractions with like denominators",
-            "Add and subtract fractions with like denominators: word problems",
-            "Add and subtract mixed numbers with like denominators",
-            "Add and subtract mixed numbers with like denominators: word problems",
-            "Add fractions with unlike denominators using models",
-            "Add fractions with unlike denominators",
-            "Subtract fractions with unlike denominators using models",
-            "Subtract fractions with unlike denominators",
-            "Estimate sums and differences of fractions using benchmarks",
-            "Add and subtract fractions with unlike denominators",
-            "Add and subtract fractions with unlike denominators: word problems",
-            "Add and subtract mixed numbers with unlike denominators",
-            "Add and subtract mixed numbers with unlike denominators: word problems",
-            "Add three or more fractions",
-            "Add three or more fractions: word problems",
-            "Complete addition and subtraction number sentences with fractions",
-            "Inequalities with addition and subtraction of fractions",
-            "Estimate sums and differences of mixed numbers",
-            "Add up to 4 fractions with denominators of 10 and 100"
-        ],
-        "K. Mixed Operations": [
-            "Add, subtract, multiply and divide whole numbers",
-            "Add, subtract, multiply and divide whole numbers: word problems",
-            "Add, subtract, multiply and divide decimals",
-            "Add, subtract and multiply decimals: word problems",
-            "Write numerical expressions",
-            "Evaluate numerical expressions"
-        ],
-        "L. Problem Solving": [
-            "Write numerical expressions for word problems",
-            "Multi-step word problems",
-            "Multi-step word problems involving remainders",
-            "Multi-step word problems: identify reasonable answers",
-            "Word problems with extra or missing information",
-            "Guess-and-check problems",
-            "Find the order",
-            "Use Venn diagrams to solve problems"
-        ],
-        "M. Percent": [
-            "What percentage is illustrated?",
-            "Convert fractions to percents using grid models",
-            "Convert between percents, fractions and decimals",
-            "Convert between percents, fractions and decimals: word problems",
-            "Compare percents to each other and to fractions",
-            "Compare percents and fractions: word problem"
-        ],
-        "N. Money": [
-            "Add and subtract money amounts",
-            "Add and subtract money: word problems",
-            "Multiply money amounts: word problems",
-            "Multiply money amounts with decimals: word problems",
-            "Divide money amounts: word problems",
-            "Divide money amounts with decimals: word problems",
-            "Price lists"
-        ],
-        "O. Number Sequences": [
-            "Use a rule to complete a number sequence",
-            "Arithmetic sequences with whole numbers",
-            "Arithmetic sequences with decimals",
-            "Arithmetic sequences with fractions",
-            "Increasing number sequences",
-            "Geometric number sequences",
-            "Number sequences: mixed review",
-            "Number sequences: word problems"
-        ],
-        "P. Coordinate plane": [
-            "Objects on a coordinate plane",
-            "Graph points on a coordinate plane",
-            "Coordinate planes as maps",
-            "Follow directions on a coordinate plane"
-        ],
-        "Q. Data and graphs": [
-            "Read a table",
-            "Interpret line graphs",
-            "Create line graphs",
-            "Interpret bar graphs",
-            "Match table to bar graph",
-            "Create bar graphs",
-            "Interpret picture graphs",
-            "Create picture graphs",
-            "Interpret dot plots",
-            "Create dot plots",
-            "Frequency tables",
-            "Interpret frequency tables: one-step problems",
-            "Choose the best type of graph"
-        ],
-        "R. Probability and statistics": [
-            "Understanding probability",
-            "Find the probability",
-            "Make predictions",
-            "Identify independent and dependent events",
-            "Combinations",
-            "Find the mode"
-        ],
-        "S. Time": [
-            "Convert time units",
-            "Add and subtract mixed time units",
-            "Elapsed time",
-            "Find start and end times: word problems",
-            "Convert between 12-hour and 24-hour time",
-            "Time zones - 12-hour time",
-            "Time zones - 24-hour time",
-            "Schedules and timelines - 12-hour time",
-            "Schedules - 24-hour time",
-            "Time patterns"
-        ],
-        "T. Units of measurement": [
-            "Choose the appropriate metric unit of measure",
-            "Compare metric units of length",
-            "Compare metric units of mass",
-            "Compare metric units of volume",
-            "Choose the more reasonable temperature"
-        ],
-        "U. Two-dimensional figures": [
-            "Is it a polygon?",
-            "Number of sides in polygons",
-            "Regular and irregular polygons",
-            "Angles greater than, less than or equal to a right angle",
-            "Classify angles by type",
-            "Angles of 90, 180, 270 and 360 degrees",
-            "Fraction of a turn angles",
-            "Acute, right, obtuse and straight angles",
-            "Measure angles on a circle",
-            "Measure angles with a protractor",
-            "Draw angles with a protractor",
-            "Estimate angle measurements"
-        ],
-        "V. Symmetry and transformations": [
-            "Lines of symmetry",
-            "Rotational symmetry",
-            "Reflection, rotation and translation",
-            "Dilations"
-        ],
-        "W. Three-dimensional figures": [
-            "Identify three-dimensional figures",
-            "Count vertices, edges and faces",
-            "Identify faces of three-dimensional figures",
-            "Nets of three-dimensional figures",
-            "Three-dimensional figures viewed from different perspectives"
-        ],
-        "X. Geometric measurement": [
-            "Perimeter of rectangles",
-            "Perimeter of polygons",
-            "Area of squares and rectangles",
-            "Area and perimeter of figures on grids",
-            "Area and perimeter: word problems",
-            "Use area and perimeter to determine cost",
-            "Volume"
-        ],
-        "Y. Financial literacy": [
-            "Budget a weekly allowance: word problems",
-            "Reading financial records",
-            "Keeping financial records",
-            "Balance a budget",
-            "Adjust a budget"
-        ]
-    },
-    # Add other grades as needed
-    "class_i": {
-        "A. Counting and Number Recognition": [
-            "Count to 20",
-            "Number recognition",
-            "Before and after numbers"
-        ],
-        "B. Addition": [
-            "Add with pictures - sums up to 10",
-            "Addition sentences - sums up to 10",
-            "Addition facts - sums up to 10"
-        ]
-    }
-}
-
-# **Dictionary of Topics and Subtopics** (your complete topics dictionary)
-topics = {
-    "addition": {
-        "Upper Kindergarten Skills": [
-            "H.1 Add with pictures - sums up to 5",
-            "H.2 Addition sentences - sums up to 5",
-            "H.3 Make a number using addition - sums up to 5",
-            "H.4 Add two numbers - sums up to 5",
-            "H.5 Complete the addition sentence - sums up to 5",
-            "H.6 Addition word problems - sums up to 5",
-            "I.1 Add with pictures - sums up to 10",
-            "I.2 Addition sentences - sums up to 10",
-            "I.3 Make a number using addition - sums up to 10",
-            "I.4 Add two numbers - sums up to 10",
-            "I.5 Complete the addition sentence - sums up to 10",
-            "I.6 Complete the addition sentence - make 10",
-            "I.7 Write addition sentences",
-            "I.8 Addition word problems - sums up to 10",
-            "S.1 Sum and difference"
-        ],
-        "Class I Skills": [
-            "C.1 Add with pictures - sums up to 10",
-            "C.2 Addition sentences - sums up to 10",
-            "C.3 Addition sentences using number lines - sums up to 10",
-            "C.4 Adding zero",
-            "D.1 Adding 1", "D.2 Adding 2", "D.3 Adding 3", "D.4 Adding 4",
-            "D.5 Adding 5", "D.6 Adding 6", "D.7 Adding 7", "D.8 Adding 8",
-            "D.9 Adding 9", "D.10 Adding 0",
-            "E.1 Addition facts - sums up to 10",
-            "E.2 Ways to make a number - addition sentences",
-            "E.3 Make a number using addition - sums up to 10",
-            "E.4 Complete the addition sentence - sums up to 10",
-            "E.5 Addition word problems - sums up to 10",
-            "E.6 Addition sentences for word problems - sums up to 10",
-            "E.7 Addition facts - sums up to 18",
-            "E.8 Addition sentences using number lines - sums up to 18",
-            "E.9 Addition word problems - sums up to 18",
-            "E.10 Addition sentences for word problems - sums up to 18",
-			"E.11	Addition facts - sums up to 20",
-			"E.12	Make a number using addition - sums up to 20",
-			"E.13	Addition sentences for word problems - sums up to 20",
-			"E.14	Related addition facts",
-			"E.15	Addition sentences: true or false?",
-			"E.16	Add a one-digit number to a two-digit number - without regrouping",
-			"E.17	Add a one-digit number to a two-digit number - with regrouping",
-			"F.1	Add doubles",
-			"F.2	Add using doubles plus one",
-			"F.3	Add using doubles minus one",
-			"F.4	Add three numbers - use doubles",
-			"F.5	Complete the addition sentence - make ten",
-			"F.6	Add three numbers - make ten",
-			"F.7	Add two multiples of ten",
-			"F.8	Add a multiple of ten",
-			"F.9	Add three numbers",
-			"F.10	Add three numbers - word problems",
-			"J.1	Relate addition and subtraction sentences",
-			"W.1	Addition and subtraction - ways to make a number",
-			"W.2	Which sign makes the number sentence true?",
-			"W.3	Fact families",
-			"W.4	Addition and subtraction facts - numbers up to 10",
-			"W.5	Addition and subtraction facts - numbers up to 18",
-			"W.6	Addition and subtraction word problems",
-			"W.7	Addition and subtraction terms",
-        ],
-        "Class II Skills": [
-            "E.1 Review - add one-digit numbers - sums to 10",
-            "E.2 Review - ways to make a number - sums to 10",
-            "E.3 Review - writing addition sentences - sums to 10",
-            "E.4 Add doubles", "E.5 Add one-digit numbers",
-            "E.6 Addition with pictures - sums to 20",
-            "E.7 Write addition sentences to describe pictures - sums to 20",
-			"E.10	Addition word problems - one digit",
-			"E.11	Complete the addition sentence - one digit",
-			"E.12	Write the addition sentence - one digit",
-			"E.13	Balance addition equations - one digit",
-			"E.14	Add three or more one-digit numbers",
-			"E.15	Add three or more one-digit numbers - word problems",
-			"E.16	Identify repeated addition for arrays - sums to 10",
-			"E.17	Write addition sentences for arrays - sums to 10",
-			"E.18	Identify repeated addition for arrays - sums to 25",
-			"E.19	Write addition sentences for arrays - sums to 25",
-			"G.1	Add multiples of 10",
-			"G.2	Add a two-digit and a one-digit number - without regrouping",
-			"G.3	Add a two-digit and a one-digit number - with regrouping",
-			"G.4	Add two two-digit numbers - without regrouping",
-			"G.5	Add two two-digit numbers - with regrouping",
-			"G.6	Write addition sentences to describe pictures",
-			"G.7	Addition input/output tables - up to two digits",
-			"G.8	Ways to make a number using addition",
-			"G.9	Addition word problems - up to two digits",
-			"G.10	Complete the addition sentence - up to two digits",
-			"G.11	Write the addition sentence - up to two digits",
-			"G.12	Balance addition equations - up to two digits",
-			"G.13	Add three or more numbers up to two digits each",
-			"G.14	Add three or more numbers up to two digits - word problems",
-			"I.1	Related addition facts",
-			"I.3	Fact families",
-			"K.3	Estimate sums",
-			"L.8	Add and subtract money - word problems - up to 10 rupees",
-			"S.1	Add and subtract numbers up to 20",
-			"S.2	Addition and subtraction - ways to make a number - up to 20",
-			"S.3	Addition and subtraction word problems - up to 20",
-			"S.4	Addition and subtraction - balance equations - up to 20",
-			"S.5	Write the addition or subtraction rule for an input/output table - up to 20",
-			"S.6	Add and subtract numbers up to 100",
-			"S.7	Addition and subtraction - ways to make a number - up to 100",
-			"S.8	Addition and subtraction word problems - up to 100",
-			"S.9	Addition and subtraction - balance equations - up to 100",
-			"S.10	Write the addition or subtraction rule for an input/output table - up to 100",
-			"S.11	Which sign (+ or -) makes the number sentence true? - up to 100",
-			"S.12	Write addition and subtraction sentences",
-        ],
-        "Class III Skills": [
-            "C.1 Add two numbers up to three digits",
-            "C.2 Addition input/output tables - up to three digits",
-            "C.3 Add two numbers up to three digits - word problems",
-			"C.4	Complete the addition sentence - up to three digits",
-			"C.5	Balance addition equations - up to three digits",
-			"C.6	Add three or more numbers up to three digits each",
-			"C.7	Add three or more numbers up to three digits - word problems",
-			"C.8	Addition patterns over increasing place values",
-			"C.9	Addition: fill in the missing digits",
-			"N.7	Add and subtract money amounts",
-			"N.8	Add money amounts - word problems",
-			"R.3	Properties of addition",
-			"R.4	Solve using properties of addition",
-			"R.9	Relate addition and multiplication",
-			"T.4	Estimate sums",
-			"T.5	Estimate sums: word problems",
-        ],
-        "Class IV Skills": [
-            "B.1 Add numbers up to five digits",
-            "B.2 Add numbers up to five digits: word problems",
-            "B.3 Addition: fill in the missing digits",
-			"B.4	Properties of addition",
-			"B.5	Add three or more numbers up to five digits each",
-			"B.6	Addition patterns over increasing place values",
-			"B.7	Choose numbers with a particular sum",
-			"B.8	Estimate sums",
-			"B.9	Estimate sums: word problems",
-			"F.8	Mentally add and subtract numbers ending in zeroes",
-			"J.3	Add and subtract money amounts",
-			"J.6	Price lists",
-        ],
-        "Class V Skills": [
-            "B.1 Add and subtract whole numbers",
-            "B.2 Add and subtract whole numbers: word problems",
-            "B.3 Complete addition and subtraction sentences",
-			"B.4	Fill in the missing digits",
-			"B.5	Choose numbers with a particular sum or difference",
-			"B.6	Properties of addition",
-			"B.7	Estimate sums and differences of whole numbers",
-			"B.8	Estimate sums and differences: word problems",
-			"I.1	Add and subtract money amounts",
-			"I.2	Add and subtract money: word problems",
-        ],
-        "Class VI Skills": [
-            "A.4 Add and subtract whole numbers",
-            "A.5 Add and subtract whole numbers: word problems",
-            "F.1 Add and subtract decimal numbers",
-			"F.2	Add and subtract decimals: word problems",
-			"F.3	Estimate sums and differences of decimals",
-			"F.4	Maps with decimal distances",
-			"H.1	Add and subtract fractions with like denominators",
-			"H.2	Add and subtract fractions with like denominators: word problems",
-			"H.3	Add and subtract fractions with unlike denominators",
-			"H.4	Add and subtract fractions with unlike denominators: word problems",
-			"H.5	Inequalities with addition and subtraction of like and unlike fractions",
-			"H.6	Add and subtract mixed numbers",
-			"H.7	Add and subtract mixed numbers: word problems",
-			"H.8	Estimate sums and differences of mixed numbers",
-			"J.1	Add integers using counters",
-			"J.2	Add integers",
-			"J.5	Add and subtract integers: find the sign",
-			"J.6	Add and subtract integers: input/output tables",
-			"J.7	Add three or more integers",
-			"O.2	Add and subtract money amounts",
-			"O.3	Add and subtract money amounts: word problems",
-			"Q.3	Properties of addition and multiplication",
-			"Q.6	Properties of addition",
-        ],
-        "Class VII Skills": [
-            "C.1 Integer addition and subtraction rules",
-            "C.2 Add and subtract integers using counters",
-            "C.3 Add and subtract integers",
-			"C.4	Complete addition and subtraction sentences with integers",
-			"C.5	Add and subtract integers: word problems",
-			"E.1	Add and subtract decimals",
-			"E.2	Add and subtract decimals: word problems",
-			"E.10	Maps with decimal distances",
-			"G.1	Add and subtract fractions",
-			"G.2	Add and subtract fractions: word problems",
-			"G.3	Add and subtract mixed numbers",
-			"G.4	Add and subtract mixed numbers: word problems",
-			"G.5	Inequalities with addition and subtraction of fractions and mixed numbers",
-			"G.6	Estimate sums and differences of mixed numbers",
-			"H.5	Add and subtract rational numbers",
-			"H.6	Apply addition and subtraction rules",
-			"P.9	Properties of addition and multiplication",
-        ],
-        "Class VIII Skills": [
-            "C.1 Integer addition and subtraction rules",
-            "C.2 Add and subtract integers using counters",
-            "C.3 Add and subtract integers",
-			"C.4	Add and subtract three or more integers",
-			"C.5	Add and subtract integers: word problems",
-			"E.2	Add and subtract rational numbers",
-			"E.3	Add and subtract rational numbers: word problems",
-			"E.4	Apply addition and subtraction rules",
-			"E.8	Apply addition, subtraction, multiplication and division rules",
-			"V.11	Properties of addition and multiplication",
-			"W.11	Solve equations: word problems",
-        ],
-        "Class IX Skills": [
-            "B.4 Add and subtract rational numbers",
-            "DD.5 Add and subtract rational expressions"
-        ],
-        "Class X Skills": [
-            "B.4 Add and subtract rational numbers",
-            "K.5 Add and subtract rational expressions"
-        ],
-        "Class XI Skills": [
-            "O.6 Add and subtract rational expressions"
-        ]
-    },
-	"algebra": {
-        "Class VI Skills": [
-            "Q.1 Write variable expressions",
-            "Q.2 Evaluate variable expressions",
-            "Q.5 Write equivalent expressions using properties",
-            "Q.8 Solve for a variable using properties of multiplication",
-            "Q.9 Identify equivalent expressions",
-            "R.1 Write variable equations: word problems",
-            "R.2 Solve equations using properties",
-            "R.3 Solve equations"
-        ],
-        "Class VII Skills": [
-            "I.3 Solve equations with variable exponents",
-            "O.6 Evaluate variable expressions for number sequences",
-            "O.7 Write variable expressions for arithmetic sequences",
-            "P.1 Write variable expressions",
-            "P.2 Write variable expressions: word problems",
-            "P.3 Evaluate linear expressions",
-            "P.4 Evaluate multi-variable expressions",
-            "P.5 Evaluate absolute value expressions",
-            "P.6 Evaluate nonlinear expressions",
-            "P.7 Identify terms and coefficients",
-			"P.8	Sort factors of expressions",
-			"P.11	Solve equations using properties",
-			"P.12	Write equivalent expressions using properties",
-			"P.13	Add and subtract like terms",
-			"P.14	Add, subtract and multiply linear expressions",
-			"P.15	Factors of linear expressions",
-			"P.16	Identify equivalent linear expressions",
-			"Q.1	Which x satisfies an equation?",
-			"Q.2	Write an equation from words",
-			"Q.3	Model and solve equations using algebra tiles",
-			"Q.4	Write and solve equations that represent diagrams",
-			"Q.5	Solve one-step equations",
-			"Q.6	Solve two-step equations",
-			"Q.7	Solve equations: word problems",
-			"Q.8	Solve equations involving like terms",
-			"Q.9	Solve equations: complete the solution",
-        ],
-        "Class VIII Skills": [
-            "F.3 Solve equations with variable exponents",
-            "F.8 Multiplication with exponents",
-            "F.9 Division with exponents",
-            "F.10 Multiplication and division with exponents",
-            "F.11 Power rule",
-            "F.18 Solve equations involving squares and square roots",
-			"F.21	Solve equations involving cubes and cube roots",
-			"I.2	Write equations for proportional relationships from tables",
-			"I.5	Write equations for proportional relationships from graphs",
-			"I.8	Interpret graphs of proportional relationships",
-			"U.6	Evaluate variable expressions for number sequences",
-			"U.7	Write variable expressions for arithmetic sequences",
-			"V.1	Write variable expressions",
-			"V.2	Write variable expressions from diagrams",
-			"V.3	Write variable expressions: word problems",
-			"V.4	Evaluate one-variable expressions",
-			"V.5	Evaluate multi-variable expressions",
-			"V.6	Evaluate absolute value expressions",
-			"V.7	Evaluate radical expressions",
-			"V.8	Evaluate rational expressions",
-			"V.9	Identify terms and coefficients",
-			"V.10	Sort factors of expressions",
-			"V.13	Simplify variable expressions using properties",
-			"V.14	Add and subtract like terms",
-			"V.15	Add, subtract and multiply linear expressions",
-			"V.16	Factors of linear expressions",
-			"V.17	Identify equivalent linear expressions",
-			"W.1	Which x satisfies an equation?",
-			"W.2	Write an equation from words",
-			"W.3	Model and solve equations using algebra tiles",
-			"W.4	Write and solve equations that represent diagrams",
-			"W.6	Solve one-step equations",
-			"W.7	Solve two-step equations",
-			"W.8	Solve multi-step equations",
-			"W.9	Solve equations involving like terms",
-			"W.10	Solve equations: complete the solution",
-			"X.1	Identify monomials",
-			"X.2	Model polynomials with algebra tiles",
-			"X.3	Add and subtract polynomials using algebra tiles",
-			"X.4	Add and subtract polynomials",
-			"X.5	Add polynomials to find perimeter",
-			"X.6	Multiply monomials",
-			"X.7	Divide monomials",
-			"X.8	Multiply and divide monomials",
-			"X.9	Powers of monomials",
-			"X.10	Square and cube roots of monomials",
-			"X.11	Multiply polynomials using algebra tiles",
-			"X.12	Multiply polynomials",
-			"X.13	Multiply polynomials to find area",
-			"Y.1	HCF of monomials",
-			"Y.2	Factorise out a monomial",
-			"Y.3	Factorise quadratics with leading coefficient 1",
-			"Y.4	Factorise quadratics with other leading coefficients",
-			"Y.5	Factorise quadratics: special cases",
-			"Y.6	Factorise quadratics using algebra tiles",
-			"Y.7	Factorise by grouping",
-			"Y.8	Factorise polynomials",
-        ],
-        "Class IX Skills": [
-            "B.3 Evaluate variable expressions involving integers",
-            "B.7 Evaluate variable expressions involving rational numbers",
-            "N.1 Model and solve equations using algebra tiles",
-            "N.2 Write and solve equations that represent diagrams",
-            "N.3 Solve one-step linear equations",
-            "N.4 Solve two-step linear equations",
-			"N.5	Solve advanced linear equations",
-			"N.6	Solve equations with variables on both sides",
-			"N.7	Solve equations: complete the solution",
-			"N.8	Find the number of solutions",
-			"N.9	Create equations with no solutions or infinitely many solutions",
-			"N.10	Solve linear equations: word problems",
-			"N.11	Solve linear equations: mixed review",
-			"P.4	Rate of travel: word problems",
-			"P.5	Weighted averages: word problems",
-			"S.3	Graph a proportional relationship",
-			"S.4	Write direct variation equations",
-			"S.5	Write and solve direct variation equations",
-			"T.1	Identify linear equations",
-			"T.2	Find the slope of a graph",
-			"T.3	Find the slope from two points",
-			"T.5	Slope-intercept form: find the slope and y-intercept",
-			"T.6	Slope-intercept form: graph an equation",
-			"T.7	Slope-intercept form: write an equation from a graph",
-			"T.8	Slope-intercept form: write an equation",
-			"T.9	Slope-intercept form: write an equation from a table",
-			"T.10	Slope-intercept form: write an equation from a word problem",
-			"T.11	Linear equations: solve for y",
-			"T.12	Write linear equations to solve word problems",
-			"T.14	Write equations in standard form",
-			"T.15	Standard form: find x- and y-intercepts",
-			"T.16	Standard form: graph an equation",
-			"T.17	Equations of horizontal and vertical lines",
-			"T.18	Graph a horizontal or vertical line",
-			"T.19	Slopes of parallel and perpendicular lines",
-			"T.20	Write an equation for a parallel or perpendicular line",
-			"U.4	Multiplication with exponents",
-			"U.5	Division with exponents",
-			"U.6	Multiplication and division with exponents",
-			"U.7	Power rule",
-			"Y.1	Identify monomials",
-			"Y.2	Multiply monomials",
-			"Y.3	Divide monomials",
-			"Y.4	Multiply and divide monomials",
-			"Y.5	Powers of monomials",
-			"Z.1	Polynomial vocabulary",
-			"Z.2	Model polynomials with algebra tiles",
-			"Z.3	Add and subtract polynomials using algebra tiles",
-			"Z.4	Add and subtract polynomials",
-			"Z.5	Add polynomials to find perimeter",
-			"Z.6	Multiply a polynomial by a monomial",
-			"Z.7	Multiply two polynomials using algebra tiles",
-			"Z.8	Multiply two binomials",
-			"Z.9	Multiply two binomials: special cases",
-			"Z.10	Multiply polynomials",
-			"Z.11	Write a polynomial from its roots",
-			"Z.12	Find the roots of factorised polynomials",
-			"AA.1	HCF of monomials",
-			"AA.2	Factorise out a monomial",
-			"AA.3	Factorise quadratics with leading coefficient 1",
-			"AA.4	Factorise quadratics with other leading coefficients",
-			"AA.5	Factorise quadratics: special cases",
-			"AA.6	Factorise quadratics using algebra tiles",
-			"AA.7	Factorise by grouping",
-			"AA.8	Factorise polynomials",
-			"BB.1	Characteristics of quadratic equations",
-			"BB.2	Complete a table: quadratic equations",
-			"BB.3	Solve a quadratic equation using square roots",
-			"BB.4	Solve a quadratic equation using the zero product property",
-			"BB.5	Solve a quadratic equation by factorising",
-			"BB.6	Solve a quadratic equation using the quadratic formula",
-			"DD.2	Simplify rational expressions",
-			"DD.3	Multiply and divide rational expressions",
-			"DD.4	Divide polynomials",
-			"DD.5	Add and subtract rational expressions",
-			"DD.6	Solve rational equations",
-        ],
-        "Class X Skills": [
-            "B.3 Evaluate variable expressions involving integers",
-            "B.7 Evaluate variable expressions involving rational numbers",
-            "D.1 Identify linear equations",
-            "D.2 Find the slope of a graph",
-            "D.3 Find the slope from two points",
-            "D.5 Slope-intercept form: find the slope and y-intercept",
-			"D.6	Slope-intercept form: graph an equation",
-			"D.7	Slope-intercept form: write an equation from a graph",
-			"D.8	Slope-intercept form: write an equation",
-			"D.9	Slope-intercept form: write an equation from a table",
-			"D.10	Slope-intercept form: write an equation from a word problem",
-			"D.11	Write linear equations to solve word problems",
-			"D.13	Write equations in standard form",
-			"D.14	Standard form: find x- and y-intercepts",
-			"D.15	Standard form: graph an equation",
-			"D.16	Equations of horizontal and vertical lines",
-			"D.17	Graph a horizontal or vertical line",
-			"D.18	Slopes of parallel and perpendicular lines",
-			"D.19	Write an equation for a parallel or perpendicular line",
-			"E.1	Is (x, y) a solution to the pair of equations?",
-			"E.2	Solve a pair of equations by graphing",
-			"E.3	Solve a pair of equations by graphing: word problems",
-			"E.4	Find the number of solutions to a pair of equations by graphing",
-			"E.5	Find the number of solutions to a pair of equations",
-			"E.6	Solve a pair of equations using substitution",
-			"E.7	Solve a pair of equations using substitution: word problems",
-			"E.8	Solve a pair of equations using elimination",
-			"E.9	Solve a pair of equations using elimination: word problems",
-			"F.1	Matrix vocabulary",
-			"F.2	Matrix operation rules",
-			"F.3	Add and subtract matrices",
-			"F.4	Multiply a matrix by a scalar",
-			"F.5	Multiply two matrices",
-			"G.2	Evaluate variable expressions for arithmetic sequences",
-			"G.3	Write variable expressions for arithmetic sequences",
-			"H.1	Polynomial vocabulary",
-			"H.2	Model polynomials with algebra tiles",
-			"H.3	Add and subtract polynomials using algebra tiles",
-			"H.4	Add and subtract polynomials",
-			"H.5	Add polynomials to find perimeter",
-			"H.6	Multiply and divide monomials",
-			"H.7	Powers of monomials",
-			"H.8	Multiply a polynomial by a monomial",
-			"H.9	Multiply two polynomials using algebra tiles",
-			"H.10	Multiply two binomials",
-			"H.11	Multiply two binomials: special cases",
-			"H.12	Multiply polynomials",
-			"I.1	HCF of monomials",
-			"I.2	Factorise out a monomial",
-			"I.3	Factorise quadratics with leading coefficient 1",
-			"I.4	Factorise quadratics with other leading coefficients",
-			"I.5	Factorise quadratics: special cases",
-			"I.6	Factorise quadratics using algebra tiles",
-			"I.7	Factorise by grouping",
-			"I.8	Factorise polynomials",
-			"J.1	Characteristics of quadratic equations",
-			"J.2	Complete a table: quadratic equations",
-			"J.3	Solve a quadratic equation using square roots",
-			"J.4	Solve a quadratic equation using the zero product property",
-			"J.5	Solve a quadratic equation by factorising",
-			"J.6	Complete the square",
-			"J.7	Solve a quadratic equation by completing the square",
-			"J.8	Solve a quadratic equation using the quadratic formula",
-			"J.9	Using the discriminant",
-			"J.10	Graph a quadratic equation",
-			"K.2	Simplify rational expressions",
-			"K.3	Multiply and divide rational expressions",
-			"K.4	Divide polynomials",
-			"K.5	Add and subtract rational expressions",
-			"K.6	Solve rational equations",
-			"V.2	Rate of travel: word problems",
-			"V.3	Weighted averages: word problems",
-        ],
-        "Class XI Skills": [
-            "B.3 Identify solutions to inequalities",
-            "B.4 Solve one-step linear inequalities: addition and subtraction",
-            "B.5 Solve one-step linear inequalities: multiplication and division",
-            "B.6 Solve one-step linear inequalities",
-            "B.7 Graph solutions to one-step linear inequalities",
-			"B.8	Solve two-step linear inequalities",
-			"B.9	Graph solutions to two-step linear inequalities",
-			"B.10	Solve advanced linear inequalities",
-			"B.11	Graph solutions to advanced linear inequalities",
-			"B.14	Solve compound inequalities",
-			"B.15	Graph solutions to compound inequalities",
-			"B.16	Graph solutions to quadratic inequalities",
-			"B.17	Solve quadratic inequalities",
-			"C.7	Evaluate a function",
-			"C.8	Evaluate a function: plug in an expression",
-			"C.10	Complete a function table from an equation",
-			"C.11	Interpret the graph of a function: word problems",
-			"D.1	Find the slope of a graph",
-			"D.2	Find the slope from two points",
-			"D.4	Slope-intercept form: find the slope and y-intercept",
-			"D.5	Slope-intercept form: graph an equation",
-			"D.6	Slope-intercept form: write an equation from a graph",
-			"D.7	Slope-intercept form: write an equation",
-			"D.8	Slope-intercept form: write an equation from a table",
-			"D.9	Slope-intercept form: write an equation from a word problem",
-			"D.10	Write linear functions to solve word problems",
-			"D.11	Complete a table and graph a linear function",
-			"D.12	Write equations in standard form",
-			"D.13	Standard form: find x- and y-intercepts",
-			"D.14	Standard form: graph an equation",
-			"D.15	Equations of horizontal and vertical lines",
-			"D.16	Graph a horizontal or vertical line",
-			"D.17	Slopes of parallel and perpendicular lines",
-			"D.18	Write an equation for a parallel or perpendicular line",
-			"E.1	Does (x, y) satisfy the inequality?",
-			"E.2	Linear inequalities: solve for y",
-			"E.3	Graph a linear inequality in the coordinate plane",
-			"E.4	Linear inequalities: word problems",
-			"E.5	Is (x, y) a solution to the system of inequalities?",
-			"E.6	Solve systems of linear inequalities by graphing",
-			"E.7	Solve systems of linear and absolute value inequalities by graphing",
-			"F.1	Introduction to complex numbers",
-			"F.2	Add and subtract complex numbers",
-			"F.3	Complex conjugates",
-			"F.4	Multiply complex numbers",
-			"F.5	Divide complex numbers",
-			"F.6	Add, subtract, multiply and divide complex numbers",
-			"F.7	Absolute values of complex numbers",
-			"F.8	Powers of i",
-			"G.1	Introduction to the Argand plane",
-			"G.2	Graph complex numbers",
-			"G.3	Addition in the Argand plane",
-			"G.4	Subtraction in the Argand plane",
-			"G.5	Graph complex conjugates",
-			"G.6	Absolute value in the Argand plane",
-			"G.7	Midpoints in the Argand plane",
-			"G.8	Distance in the Argand plane",
-			"H.1	Factorise out a monomial",
-			"H.2	Factorise quadratic polynomials",
-			"H.3	Factorise quadratics using algebra tiles",
-			"H.4	Factorise using a quadratic pattern",
-			"H.5	Factorise by grouping",
-			"H.6	Factorise sums and differences of cubes",
-			"H.7	Factorise polynomials",
-			"I.1	Characteristics of quadratic functions",
-			"I.2	Complete a function table: quadratic functions",
-			"I.3	Find a quadratic function",
-			"I.4	Graph a quadratic function",
-			"I.6	Solve a quadratic equation using square roots",
-			"I.7	Solve a quadratic equation using the zero product property",
-			"I.8	Solve a quadratic equation by factorising",
-			"I.9	Complete the square",
-			"I.10	Solve a quadratic equation using the quadratic formula",
-			"I.11	Using the discriminant",
-			"J.1	Polynomial vocabulary",
-			"J.2	Add and subtract polynomials",
-			"J.3	Multiply polynomials",
-			"J.4	Divide polynomials using long division",
-			"J.5	Divide polynomials using synthetic division",
-			"J.6	Evaluate polynomials using synthetic division",
-			"J.7	Solve polynomial equations",
-			"J.8	Write a polynomial from its roots",
-			"J.9	Find the roots of factorised polynomials",
-			"J.10	Rational root theorem",
-			"J.11	Complex conjugate theorem",
-			"J.12	Conjugate root theorems",
-			"J.14	Fundamental Theorem of Algebra",
-			"J.15	Pascal's triangle",
-			"J.16	Pascal's triangle and the Binomial Theorem",
-			"J.17	Binomial Theorem I",
-			"J.18	Binomial Theorem II",
-			"O.1	Rational functions: asymptotes and excluded values",
-			"O.2	Evaluate rational expressions I",
-			"O.3	Evaluate rational expressions II",
-			"O.4	Simplify rational expressions",
-			"O.5	Multiply and divide rational expressions",
-			"O.6	Add and subtract rational expressions",
-			"O.7	Solve rational equations",
-			"P.1	Graph exponential functions",
-			"P.2	Match exponential functions and graphs",
-			"P.3	Graph logarithmic functions",
-			"V.4	Rate of travel: word problems",
-			"V.5	Weighted averages: word problems",
-			"X.5	Evaluate formulas for sequences",
-			"X.6	Write a formula for an arithmetic sequence",
-			"X.7	Write a formula for a geometric sequence",
-        ],
-        "Class XII Skills": [
-            "C.1 Divide polynomials using long division",
-            "C.2 Divide polynomials using synthetic division",
-            "C.3 Evaluate polynomials using synthetic division",
-            "C.4 Write a polynomial from its roots",
-            "C.5 Find the roots of factorised polynomials",
-            "C.6 Rational root theorem",
-			"C.7	Complex conjugate theorem",
-			"C.8	Conjugate root theorems",
-			"C.9	Descartes' Rule of Signs",
-			"C.10	Fundamental Theorem of Algebra",
-			"C.12	Factorise sums and differences of cubes",
-			"C.13	Solve equations with sums and differences of cubes",
-			"C.14	Factorise using a quadratic pattern",
-			"C.15	Solve equations using a quadratic pattern",
-			"C.16	Pascal's triangle",
-			"C.17	Pascal's triangle and the Binomial Theorem",
-			"C.18	Binomial Theorem I",
-			"C.19	Binomial Theorem II",
-			"D.1	Solve systems of linear inequalities by graphing",
-			"D.2	Solve systems of linear and absolute value inequalities by graphing",
-			"D.3	Find the vertices of a solution set",
-			"D.4	Linear programming",
-			"E.1	Graph solutions to quadratic inequalities",
-			"E.2	Solve quadratic inequalities",
-			"E.3	Graph solutions to higher-degree inequalities",
-			"E.4	Solve higher-degree inequalities",
-			"F.1	Matrix vocabulary",
-			"F.2	Matrix operation rules",
-			"F.3	Add and subtract matrices",
-			"F.4	Multiply a matrix by a scalar",
-			"F.5	Linear combinations of matrices",
-			"F.6	Multiply two matrices",
-			"F.7	Simplify matrix expressions",
-			"F.8	Solve matrix equations",
-			"F.9	Determinant of a matrix",
-			"F.10	Is a matrix invertible?",
-			"F.11	Inverse of a 2 x 2 matrix",
-			"F.12	Inverse of a 3 x 3 matrix",
-			"F.13	Identify inverse matrices",
-			"F.14	Solve matrix equations using inverses",
-			"K.1	Add and subtract complex numbers",
-			"K.2	Complex conjugates",
-			"K.3	Multiply and divide complex numbers",
-			"K.4	Add, subtract, multiply and divide complex numbers",
-			"K.5	Absolute values of complex numbers",
-			"K.6	Powers of i",
-			"L.1	Introduction to the Argand plane",
-			"L.2	Graph complex numbers",
-			"L.3	Addition in the Argand plane",
-			"L.4	Subtraction in the Argand plane",
-			"L.5	Graph complex conjugates",
-			"L.6	Absolute value in the Argand plane",
-			"L.7	Midpoints in the Argand plane",
-			"L.8	Distance in the Argand plane",
-			"M.1	Find the modulus and argument of a complex number",
-			"M.2	Convert complex numbers from rectangular to polar form",
-			"M.3	Convert complex numbers from polar to rectangular form",
-			"M.4	Convert complex numbers between rectangular and polar form",
-        ]
-    },
-	"calculus": {
-        "Class XI skills": [
-            "Y.1Find limits using graphs",
-			"Y.2	Find one-sided limits using graphs",
-			"Y.3	Determine if a limit exists",
-			"Z.1	Find limits using addition, subtraction and multiplication laws",
-			"Z.2	Find limits using the division law",
-			"Z.3	Find limits using power and root laws",
-			"Z.4	Find limits using limit laws",
-			"Z.5	Find limits of polynomials and rational functions",
-			"Z.6	Find limits involving factorisation and rationalisation",
-			"AA.1	Find limits at vertical asymptotes using graphs",
-			"AA.2	Determine end behaviour using graphs",
-			"AA.3	Determine end behaviour of polynomial and rational functions",
-			"BB.1	Find the limit at a vertical asymptote of a rational function I",
-			"BB.2	Find the limit at a vertical asymptote of a rational function II",
-			"CC.1	Identify graphs of continuous functions",
-			"CC.2	Determine continuity using graphs",
-			"CC.3	Determine one-sided continuity using graphs",
-			"CC.4	Find and analyse points of discontinuity using graphs",
-			"CC.5	Determine continuity on an interval using graphs",
-			"CC.6	Determine the continuity of a piecewise function at a point",
-			"CC.7	Make a piecewise function continuous",
-			"CC.8	Intermediate Value Theorem",
-			"DD.1	Average rate of change I",
-			"DD.2	Average rate of change II",
-			"DD.3	Find instantaneous rates of change",
-			"DD.4	Velocity as a rate of change",
-			"DD.5	Find values of derivatives using limits",
-			"DD.6	Find the slope of a tangent line using limits",
-			"DD.7	Find equations of tangent lines using limits",
-			"EE.1	Sum and difference rules",
-			"EE.2	Product rule",
-			"EE.3	Quotient rule",
-			"EE.4	Power rule I",
-			"EE.5	Power rule II",
-			"EE.6	Find derivatives of polynomials",
-			"EE.7	Find derivatives of rational functions",
-			"EE.8	Find derivatives of trigonometric functions I",
-			"EE.9	Find derivatives of trigonometric functions II",
-			"EE.10	Chain rule",
-			"EE.11	Find derivatives of radical functions",
-			"EE.12	Find derivatives using the product rule",
-			"EE.13	Find derivatives using the quotient rule I",
-			"EE.14	Find derivatives using the quotient rule II",
-			"EE.15	Find derivatives using the chain rule I",
-			"EE.16	Find derivatives using the chain rule",
-        ],
-        "Class XII skills": [
-            "Q.1	Identify graphs of continuous functions",
-			"Q.2	Determine continuity using graphs",
-			"Q.3	Determine one-sided continuity using graphs",
-			"Q.4	Find and analyse points of discontinuity using graphs",
-			"Q.5	Determine continuity on an interval using graphs",
-			"Q.6	Determine the continuity of a piecewise function at a point",
-			"Q.7	Make a piecewise function continuous",
-			"Q.8	Intermediate Value Theorem",
-			"R.1	Average rate of change I",
-			"R.2	Average rate of change II",
-			"R.3	Find instantaneous rates of change",
-			"R.4	Velocity as a rate of change",
-			"R.5	Find values of derivatives using limits",
-			"R.6	Find the slope of a tangent line using limits",
-			"R.7	Find equations of tangent lines using limits",
-			"S.1	Sum and difference rules",
-			"S.2	Product rule",
-			"S.3	Quotient rule",
-			"S.4	Power rule I",
-			"S.5	Power rule II",
-			"S.6	Chain rule",
-			"S.7	Inverse function rule",
-			"T.1	Find derivatives of polynomials",
-			"T.2	Find derivatives of rational functions",
-			"T.3	Find derivatives of trigonometric functions I",
-			"T.4	Find derivatives of trigonometric functions II",
-			"T.5	Find derivatives of exponential functions",
-			"T.6	Find derivatives of logarithmic functions",
-			"T.7	Find derivatives of inverse trigonometric functions",
-			"T.8	Find derivatives of radical functions",
-			"T.9	Find derivatives using the product rule I",
-			"T.10	Find derivatives using the product rule II",
-			"T.11	Find derivatives using the quotient rule I",
-			"T.12	Find derivatives using the quotient rule II",
-			"T.13	Find derivatives using the chain rule I",
-			"T.14	Find derivatives using the chain rule II",
-			"U.1	Find derivatives using implicit differentiation",
-			"U.2	Find tangent lines using implicit differentiation",
-			"U.3	Find derivatives using logarithmic differentiation",
-			"V.1	Find higher derivatives of polynomials",
-			"V.2	Find higher derivatives of rational and radical functions",
-			"V.3	Find second derivatives of trigonometric, exponential and logarithmic functions",
-			"V.4	Find higher derivatives using patterns",
-        ],
-    },
-	"comparing": {
-        "Lower kindergarten skills": [
-            "E.1	Are there enough?",
-			"E.2	More",
-			"E.3	Fewer",
-			"E.4	Fewer and more - compare by counting",
-			"E.5	Compare in a mixed group",
-			"G.1	Same",
-			"G.2	Different",
-			"G.3	Same and different",
-			"G.4	Classify shapes by colour",
-			"G.5	Classify and sort by colour",
-			"G.6	Classify and sort by shape",
-        ],
-		"Upper kindergarten skills": [
-            "E.1	Are there enough?",
-			"E.2	Fewer and more - compare by matching",
-			"E.3	Fewer and more - compare by counting",
-			"E.4	Fewer and more - compare in a mixed group",
-			"E.5	Fewer, more and same",
-			"E.6	Compare two numbers - up to 10",
-			"E.7	Compare three numbers - up to 10",
-			"L.1	Same",
-			"L.2	Different",
-			"L.3	Same and different",
-			"L.4	Classify shapes by colour",
-			"L.5	Classify and sort by colour",
-			"L.6	Classify and sort by shape",
-			"L.7	Classify and sort",
-			"L.9	Count shapes in a Venn diagram",
-			"L.10	Put numbers up to 10 in order",
-			"L.11	Put numbers up to 20 in order",
-        ],
-        "Class I Skills": [
-            "K.1	Comparing - review",
-			"K.2	Comparing numbers up to 10",
-			"K.3	Comparing numbers up to 100",
-			"K.4	Comparison word problems",
-			"U.2	Count shapes in a Venn diagram",
-			"U.3	Put numbers in order",
-        ],
-        "Class II Skills": [
-            "B.1	Comparing numbers up to 100",
-			"B.2	Put numbers up to 100 in order",
-			"B.3	Greatest and least - word problems - up to 100",
-        ],
-        "Class III Skills": [
-            "A.7	Comparing numbers",
-			"A.8	Which number is greatest/least?",
-			"A.9	Put numbers in order",
-			"M.5	Sort shapes into a Venn diagram",
-			"M.6	Count shapes in a Venn diagram",
-			"N.5	Inequalities with money",
-			"N.6	Put money amounts in order",
-        ],
-        "Class IV Skills": [
-            "A.7	Inequalities with number lines",
-            "A.8	Compare numbers up to five digits",
-        ],
-        "Class V Skills": [
-            "A.3	Compare numbers",
-			"E.8	Compare decimals on number lines",
-			"E.9	Compare decimal numbers",
-			"E.10	Put decimal numbers in order",
-			"F.10	Compare fractions",
-			"F.11	Put fractions in order",
-        ],
-        "Class VI Skills": [
-            "E.5	Put decimal numbers in order",
-			"E.6	Inequalities with decimals",
-			"G.7	Compare fractions with like and unlike denominators",
-			"G.8	Compare fractions: word problems",
-			"G.11	Put a mix of decimals, fractions and mixed numbers in order",
-			"H.5	Inequalities with addition and subtraction of like and unlike fractions",
-			"I.4	Compare and order integers",
-        ],
-        "Class VII Skills": [
-            "A.9	Compare numbers written in scientific notation",
-			"B.5	Compare and order integers",
-			"D.2	Compare and order decimals",
-			"E.9	Multi-step inequalities with decimals",
-			"F.6	Compare and order fractions",
-			"F.7	Compare fractions: word problems",
-			"F.9	Compare mixed numbers and improper fractions",
-			"G.5	Inequalities with addition and subtraction of fractions and mixed numbers",
-			"H.3	Compare rational numbers",
-			"H.4	Put rational numbers in order",
-			"J.6	Compare ratios: word problems",
-			"K.3	Compare percents to fractions and decimals",
-        ],
-        "Class VIII Skills": [
-            "B.3	Compare and order integers",
-			"D.6	Compare rational numbers",
-			"D.7	Put rational numbers in order",
-			"G.2	Compare numbers written in scientific notation",
-			"H.6	Compare ratios: word problems",
-			"J.2	Compare percents to fractions and decimals",
-			"J.8	Compare percents of numbers",
-        ],
-        "Class IX Skills": [
-            "A.2	Compare and order rational numbers",
-            "X.2	Compare numbers written in scientific notation"
-        ],
-        "Class X Skills": [
-            "A.4	Compare and order rational numbers",
-        ],
-        "Class XI Skills": [
-            "B.1	Graph inequalities",
-			"B.2	Write inequalities from graphs",
-			"B.3	Identify solutions to inequalities",
-			"B.4	Solve one-step linear inequalities: addition and subtraction",
-			"B.5	Solve one-step linear inequalities: multiplication and division",
-			"B.6	Solve one-step linear inequalities",
-			"B.7	Graph solutions to one-step linear inequalities",
-			"B.8	Solve two-step linear inequalities",
-			"B.9	Graph solutions to two-step linear inequalities",
-			"B.10	Solve advanced linear inequalities",
-			"B.11	Graph solutions to advanced linear inequalities",
-			"B.12	Graph compound inequalities",
-			"B.13	Write compound inequalities from graphs",
-			"B.14	Solve compound inequalities",
-			"B.15	Graph solutions to compound inequalities",
-			"E.1	Does (x, y) satisfy the inequality?",
-			"E.2	Linear inequalities: solve for y",
-			"E.3	Graph a linear inequality in the coordinate plane",
-			"E.4	Linear inequalities: word problems",
-			"E.5	Is (x, y) a solution to the system of inequalities?",
-        ]
-    },
-	"counting": {
-        "Lower kindergarten skills": [
-            "B.1	Learn to count - up to 3",
-			"B.2	Count objects - up to 3",
-			"B.3	Count dots - up to 3",
-			"B.4	Count shapes - up to 3",
-			"B.5	Count on ten frames - up to 3",
-			"B.6	Show numbers on ten frames - up to 3",
-			"B.7	Represent numbers - up to 3",
-			"C.1	Learn to count - up to 5",
-			"C.2	Count objects - up to 5",
-			"C.3	Count dots - up to 5",
-			"C.4	Count shapes - up to 5",
-			"C.5	Count on ten frames - up to 5",
-			"C.6	Show numbers on ten frames - up to 5",
-			"C.7	Represent numbers - up to 5",
-			"D.1	Learn to count - up to 10",
-			"D.2	Count objects - up to 10",
-			"D.3	Count dots - up to 10",
-			"D.4	Count shapes - up to 10",
-			"D.5	Count on ten frames - up to 10",
-			"D.6	Show numbers on ten frames - up to 10",
-			"D.7	Represent numbers - up to 10",
-        ],
-		"Upper kindergarten skills": [
-            "A.1	Learn to count to 3",
-			"A.2	Count to 3",
-			"A.3	Count using stickers - up to 3",
-			"A.4	Count on ten frames - up to 3",
-			"A.5	Show numbers on ten frames - up to 3",
-			"A.6	Represent numbers - up to 3",
-			"B.1	Learn to count to 5",
-			"B.2	Count to 5",
-			"B.3	Count using stickers - up to 5",
-			"B.4	Count on ten frames - up to 5",
-			"B.5	Show numbers on ten frames - up to 5",
-			"B.6	Represent numbers - up to 5",
-			"B.7	One more - up to 5",
-			"B.8	Count one more - up to 5",
-			"B.9	One less - up to 5",
-			"B.10	Count one less - up to 5",
-			"C.1	Learn to count to 10",
-			"C.2	Count to 10",
-			"C.3	Count using stickers - up to 10",
-			"C.4	Count on ten frames - up to 10",
-			"C.5	Show numbers on ten frames - up to 10",
-			"C.6	Represent numbers - up to 10",
-			"C.7	One more - up to 10",
-			"C.8	Count one more - up to 10",
-			"C.9	One less - up to 10",
-			"C.10	Count one less - up to 10",
-			"C.11	One more and one less - up to 10",
-			"C.12	Count one more and one less - up to 10",
-			"C.13	Count up and down to find the next number - up to 10",
-			"C.14	Count to fill a ten frame",
-			"C.15	Tally marks - up to 10",
-			"C.16	Number lines - up to 10",
-			"C.17	Before, after and between - up to 10",
-			"C.18	Count forward and backward - up to 10",
-			"C.19	Names of numbers - up to 10",
-			"C.20	Complete a sequence - up to 10",
-			"D.1	Count to 20",
-			"D.2	Count on ten frames - up to 20",
-			"D.3	Show numbers on ten frames - up to 20",
-			"D.4	Represent numbers - up to 20",
-			"D.5	Count up and down to find the next number - up to 20",
-			"D.6	Tally marks - up to 20",
-			"D.7	Number lines - up to 20",
-			"D.8	Before, after and between - up to 20",
-			"D.9	Count forward and backward - up to 20",
-			"D.10	Names of numbers - up to 20",
-			"D.11	Complete a sequence - up to 20",
-			"D.12	Count tens and ones - up to 20",
-			"D.13	Learn to skip-count by twos",
-			"D.14	Skip-count by twos",
-			"D.15	Skip-count by twos on ten frame",
-        ],
-        "Class I Skills": [
-            "A.1	Counting review - up to 10",
-			"A.2	Count to fill a ten frame",
-			"A.3	Counting review - up to 20",
-			"A.4	Counting tens and ones - up to 30",
-			"A.5	Count on ten frames - up to 40",
-			"A.6	Counting - up to 100",
-			"A.7	Counting tens and ones - up to 99",
-			"A.8	Counting by twos, fives and tens with pictures",
-			"A.9	Counting by twos, fives and tens",
-			"A.10	Counting forward and backward",
-			"A.11	Number lines - up to 100",
-			"A.12	Hundred chart",
-			"A.13	Even or odd",
-			"A.15	Even or odd numbers on number lines",
-			"A.17	Skip-counting patterns - with tables",
-			"A.18	Sequences - count up and down by 1, 2, 3, 5 and 10",
-			"A.19	Sequences - count up and down by 100",
-			"A.20	Ordinal numbers",
-			"A.21	Writing numbers in words",
-        ],
-        "Class II Skills": [
-            "A.1	Skip-counting",
-			"A.2	Skip-counting sequences",
-			"A.3	Counting patterns - up to 100",
-			"A.4	Number lines - up to 100",
-			"A.5	Hundred chart",
-			"A.6	Even or odd",
-			"A.9	Even or odd numbers on number lines",
-			"A.11	Skip-counting stories",
-			"A.12	Skip-counting puzzles",
-			"C.1	Ordinal numbers up to 10th",
-			"C.2	Ordinal numbers up to 100th",
-			"C.3	Writing numbers up to 100 in words",
-			"C.4	Distinguishing ordinal and cardinal numbers",
-        ],
-        "Class III Skills": [
-            "A.3	Skip-counting puzzles",
-			"A.5	Ordinal numbers to 100th",
-			"A.6	Write numbers in words",
-        ],
-        "Class IV Skills": [
-            "A.3	Word names for numbers",
-            "A.4	Ordinal numbers to 100th",
-        ],
-        "Class V Skills": [
-            "A.4	Word names for numbers",
-        ],
-        "Class VI Skills": [
-            "A.2	Word names for numbers",
-        ],
-    },
-	"decimals": {
-		"Class V skills": [
-            "E.1	What decimal number is illustrated?",
-			"E.2	Model decimals and fractions",
-			"E.3	Understanding decimals expressed in words",
-			"E.4	Place values in decimal numbers",
-			"E.5	Equivalent decimals",
-			"E.6	Round decimals",
-			"E.7	Decimal number lines",
-			"E.8	Compare decimals on number lines",
-			"E.9	Compare decimal numbers",
-			"E.10	Put decimal numbers in order",
-			"E.11	Convert fractions to decimals",
-			"E.12	Convert decimals to fractions",
-        ],
-        "Class VI skills": [
-            "E.1	What decimal number is illustrated?",
-			"E.2	Decimal place values",
-			"E.3	Word names for decimal numbers",
-			"E.4	Convert decimals to mixed numbers",
-			"E.5	Put decimal numbers in order",
-			"E.6	Inequalities with decimals",
-			"E.7	Round decimals",
-			"E.8	Round whole numbers and decimals: find the missing digit",
-			"E.9	Decimal number lines",
-			"F.1	Add and subtract decimal numbers",
-			"F.2	Add and subtract decimals: word problems",
-			"F.3	Estimate sums and differences of decimals",
-			"F.4	Maps with decimal distances",
-			"G.10	Convert between decimals and fractions or mixed numbers",
-			"G.11	Put a mix of decimals, fractions and mixed numbers in order",
-			"K.4	Add and subtract decimals or fractions",
-			"K.5	Add and subtract decimals or fractions: word problems",
-        ],
-        "Class VII skills": [
-            "D.1	Decimal numbers review",
-			"D.2	Compare and order decimals",
-			"D.3	Decimal number lines",
-			"D.4	Round decimals",
-			"E.1	Add and subtract decimals",
-			"E.2	Add and subtract decimals: word problems",
-			"E.3	Multiply decimals",
-			"E.4	Multiply decimals and whole numbers: word problems",
-			"E.5	Divide decimals",
-			"E.6	Divide decimals by whole numbers: word problems",
-			"E.7	Estimate sums, differences and products of decimals",
-			"E.8	Add, subtract, multiply and divide decimals: word problems",
-			"E.9	Multi-step inequalities with decimals",
-			"E.10	Maps with decimal distances",
-			"E.11	Evaluate numerical expressions involving decimals",
-			"H.2	Convert between decimals and fractions or mixed numbers",
-			"H.3	Compare rational numbers",
-			"H.4	Put rational numbers in order",
-			"H.5	Add and subtract rational numbers",
-			"H.7	Multiply and divide rational numbers",
-			"I.5	Powers with decimal and fractional bases",
-			"K.2	Convert between percents, fractions and decimals",
-			"K.3	Compare percents to fractions and decimals",
-        ],
-        "Class VIII skills": [
-            "D.4	Round decimals and mixed numbers",
-			"D.5	Convert between decimals and fractions or mixed numbers",
-			"D.6	Compare rational numbers",
-			"D.7	Put rational numbers in order",
-			"E.2	Add and subtract rational numbers",
-			"E.3	Add and subtract rational numbers: word problems",
-			"E.5	Multiply and divide rational numbers",
-			"E.6	Multiply and divide rational numbers: word problems",
-			"E.9	Evaluate numerical expressions involving rational numbers",
-			"F.5	Powers with decimal and fractional bases",
-			"J.1	Convert between percents, fractions and decimals",
-			"J.2	Compare percents to fractions and decimals",
-			"V.8	Evaluate rational expressions",
-        ],
-        "Class IX skills": [
-            "A.2	Compare and order rational numbers",
-			"A.4	Convert between decimals and fractions",
-			"B.4	Add and subtract rational numbers",
-			"B.5	Multiply and divide rational numbers",
-			"B.6	Evaluate numerical expressions involving rational numbers",
-			"B.7	Evaluate variable expressions involving rational numbers",
-			"D.1	Convert between percents, fractions and decimals",
-			"U.2	Powers with decimal and fractional bases",
-        ],
-        "Class X skills": [
-            "A.2	Convert between decimals and fractions",
-			"A.4	Compare and order rational numbers",
-			"B.4	Add and subtract rational numbers",
-			"B.5	Multiply and divide rational numbers",
-			"B.6	Evaluate numerical expressions involving rational numbers",
-			"B.7	Evaluate variable expressions involving rational numbers",
-        ],
-    },
-	"division": {
-        "Class III Skills": [
-            "I.1	Divide by counting equal groups",
-			"I.2	Write division sentences for groups",
-			"I.3	Relate multiplication and division for groups",
-			"I.4	Write division sentences for arrays",
-			"I.5	Relate multiplication and division for arrays",
-			"J.1	Divide by 1",
-			"J.2	Divide by 2",
-			"J.3	Divide by 3",
-			"J.4	Divide by 4",
-			"J.5	Divide by 5",
-			"J.6	Divide by 6",
-			"J.7	Divide by 7",
-			"J.8	Divide by 8",
-			"J.9	Divide by 9",
-			"J.10	Divide by 10",
-			"K.1	Division facts for 2, 3, 4, 5, 10",
-			"K.2	Division facts for 2, 3, 4, 5, 10: true or false?",
-			"K.3	Division facts for 2, 3, 4, 5, 10: sorting",
-			"K.4	Division facts for 6, 7, 8, 9",
-			"K.5	Division facts for 6, 7, 8, 9: true or false?",
-			"K.6	Division facts for 6, 7, 8, 9: sorting",
-			"K.7	Division facts up to 10",
-			"K.8	Division facts up to 10: true or false?",
-			"K.9	Division facts up to 10: sorting",
-			"K.10	Division facts up to 10: find the missing number",
-			"K.11	Division sentences up to 10: true or false?",
-			"L.1	Complete the division table",
-			"L.2	Division input/output tables",
-			"L.3	Division word problems",
-			"L.4	Divisibility rules for 2, 5 and 10",
-			"R.10	Relate multiplication and division",
-			"S.3	Multiplication and division facts up to 5: true or false?",
-			"S.4	Multiplication and division facts up to 10: true or false?",
-			"S.5	Multiplication and division facts up to 12: true or false?",
-			"S.6	Multiplication and division sentences up to 12: true or false?",
-        ],
-        "Class IV Skills": [
-            "E.1	Division facts to 10",
-			"E.2	Division facts to 10: word problems",
-			"E.3	Properties of division",
-			"E.4	Divide larger numbers",
-			"E.5	Divide larger numbers: word problems",
-			"E.6	Complete the division table",
-			"E.7	Interpret remainders",
-			"E.8	Choose numbers with a particular quotient",
-			"E.9	Divide numbers ending in zeroes",
-			"E.10	Estimate quotients: word problems",
-			"E.11	Divisibility rules",
-			"E.12	Divisibility rules: word problems",
-			"E.13	Division patterns over increasing place values",
-        ],
-        "Class V Skills": [
-            "D.1	Division facts to 12",
-			"D.2	Division facts to 12: word problems",
-			"D.3	Divisibility rules",
-			"D.4	Divisibility rules: word problems",
-			"D.5	Divide by one-digit numbers",
-			"D.6	Divide by one-digit numbers: word problems",
-			"D.7	Divide by one-digit numbers: interpret remainders",
-			"D.8	Estimate quotients: word problems",
-			"D.9	Division patterns over increasing place values",
-			"D.10	Divide numbers ending in zeroes",
-			"D.11	Divide numbers ending in zeroes: word problems",
-			"D.12	Divide by two-digit numbers",
-			"D.13	Divide by two-digit numbers: word problems",
-			"D.14	Choose numbers with a particular quotient",
-			"I.4	Divide money amounts: word problems",
-        ],
-        "Class VI Skills": [
-            "C.1	Divisibility rules",
-			"C.2	Division patterns with zeroes",
-			"C.3	Divide numbers ending in zeroes: word problems",
-			"C.4	Estimate quotients",
-			"C.5	Divide whole numbers - two-digit divisors",
-			"O.5	Divide money amounts",
-			"O.6	Divide money amounts: word problems",
-        ],
-        "Class VII Skills": [
-            "A.4	Divisibility rules",
-			"C.6	Integer multiplication and division rules",
-			"C.7	Multiply and divide integers",
-			"C.8	Complete multiplication and division sentences with integers",
-			"E.5	Divide decimals",
-			"E.6	Divide decimals by whole numbers: word problems",
-			"G.12	Divide whole numbers and unit fractions",
-			"G.13	Divide fractions",
-			"G.14	Divide mixed numbers",
-			"G.15	Divide fractions and mixed numbers: word problems",
-			"G.16	Estimate products and quotients of fractions and mixed numbers",
-			"H.7	Multiply and divide rational numbers",
-			"H.8	Apply multiplication and division rules",
-        ],
-        "Class VIII Skills": [
-            "A.2	Divisibility rules",
-			"C.6	Integer multiplication and division rules",
-			"C.7	Multiply and divide integers",
-			"E.5	Multiply and divide rational numbers",
-			"E.6	Multiply and divide rational numbers: word problems",
-			"E.7	Apply multiplication and division rules",
-			"E.8	Apply addition, subtraction, multiplication and division rules",
-			"G.4	Divide numbers written in scientific notation",
-        ],
-        "Class IX Skills": [
-            "B.5	Multiply and divide rational numbers",
-			"X.4	Divide numbers written in scientific notation",
-			"DD.3	Multiply and divide rational expressions",
-        ],
-        "Class X Skills": [
-            "B.5	Multiply and divide rational numbers",
-			"K.3	Multiply and divide rational expressions",
-        ],
-        "Class XI Skills": [
-            "O.5	Multiply and divide rational expressions",
-        ]
-    },
-	"estimation": {
-        "Class I Skills": [
-            "L.1	Estimate to the nearest ten",
-        ],
-        "Class II Skills": [
-            "K.1	Estimate to the nearest ten",
-			"K.2	Round to the nearest ten",
-			"K.3	Estimate sums",
-        ],
-		"Class III Skills": [
-            "P.2	Which metric unit of length is appropriate?",
-			"P.10	Reasonable temperature",
-			"T.1	Rounding",
-			"T.2	Round money amounts",
-			"T.3	Rounding puzzles",
-			"T.4	Estimate sums",
-			"T.5	Estimate sums: word problems",
-			"T.6	Estimate differences",
-			"T.7	Estimate differences: word problems",
-			"T.8	Estimate products",
-			"T.9	Estimate products: word problems",
-			"T.10	Estimate sums, differences and products: word problems",
-        ],
-		"Class IV Skills": [
-            "A.5	Rounding",
-			"B.8	Estimate sums",
-			"B.9	Estimate sums: word problems",
-			"C.6	Estimate differences",
-			"C.7	Estimate differences: word problems",
-			"D.9	Estimate products - multiply by 1-digit numbers",
-			"D.10	Estimate products - multiply by larger numbers",
-			"D.11	Estimate products: word problems",
-			"E.10	Estimate quotients: word problems",
-			"F.3	Estimate sums, differences, products and quotients: word problems",
-			"J.2	Round money amounts",
-			"K.1	Choose the appropriate metric unit of measure",
-        ],
-        "Class V Skills": [
-            "A.5	Rounding",
-			"B.7	Estimate sums and differences of whole numbers",
-			"B.8	Estimate sums and differences: word problems",
-			"C.8	Estimate products",
-			"C.9	Estimate products: word problems",
-			"D.8	Estimate quotients: word problems",
-			"E.6	Round decimals",
-			"N.1	Choose the appropriate metric unit of measure",
-			"N.5	Choose the more reasonable temperature",
-        ],
-        "Class VI Skills": [
-            "B.7	Estimate products",
-			"C.4	Estimate quotients",
-			"E.7	Round decimals",
-			"E.8	Round whole numbers and decimals: find the missing digit",
-			"F.3	Estimate sums and differences of decimals",
-			"H.8	Estimate sums and differences of mixed numbers",
-			"L.1	Estimate to solve word problems",
-			"N.1	Estimate metric measurements",
-        ],
-        "Class VII Skills": [
-            "D.4	Round decimals",
-			"E.7	Estimate sums, differences and products of decimals",
-			"F.10	Round mixed numbers",
-			"G.6	Estimate sums and differences of mixed numbers",
-			"G.16	Estimate products and quotients of fractions and mixed numbers",
-			"J.12	Estimate population size using proportions",
-			"K.4	Estimate percents of numbers",
-			"L.9	Estimate tips",
-			"M.1	Estimate to solve word problems",
-			"N.1	Estimate metric measurements",
-        ],
-        "Class VIII Skills": [
-            "D.4	Round decimals and mixed numbers",
-			"F.16	Estimate positive and negative square roots",
-			"F.20	Estimate cube roots",
-			"H.11	Estimate population size using proportions",
-			"J.5	Estimate percents of numbers",
-			"K.8	Estimate tips",
-        ]
-    },
-	"exponents, roots, and logarithms": {
-		"Class III Skills": [
-            "G.13	Squares up to 10 x 10",
-        ],
-        "Class VII Skills": [
-            "A.8	Scientific notation",
-			"A.9	Compare numbers written in scientific notation",
-			"I.1	Understanding exponents",
-			"I.2	Evaluate powers",
-			"I.3	Solve equations with variable exponents",
-			"I.4	Powers with negative bases",
-			"I.5	Powers with decimal and fractional bases",
-			"I.6	Evaluate numerical expressions involving exponents",
-        ],
-        "Class VIII Skills": [
-            "F.1	Understanding exponents",
-			"F.2	Evaluate powers",
-			"F.3	Solve equations with variable exponents",
-			"F.4	Powers with negative bases",
-			"F.5	Powers with decimal and fractional bases",
-			"F.6	Understanding negative exponents",
-			"F.7	Evaluate powers with negative exponents",
-			"F.8	Multiplication with exponents",
-			"F.9	Division with exponents",
-			"F.10	Multiplication and division with exponents",
-			"F.11	Power rule",
-			"F.12	Evaluate expressions using properties of exponents",
-			"F.13	Identify equivalent expressions involving exponents",
-			"F.14	Square roots of perfect squares",
-			"F.15	Positive and negative square roots",
-			"F.16	Estimate positive and negative square roots",
-			"F.17	Relationship between squares and square roots",
-			"F.19	Cube roots of perfect cubes",
-			"F.20	Estimate cube roots",
-			"F.21	Solve equations involving cubes and cube roots",
-			"G.1	Convert between standard and scientific notation",
-			"G.2	Compare numbers written in scientific notation",
-			"G.3	Multiply numbers written in scientific notation",
-			"G.4	Divide numbers written in scientific notation",
-			"K.10	Compound interest",
-			"V.7	Evaluate radical expressions",
-			"X.9	Powers of monomials",
-			"X.10	Square and cube roots of monomials",
-        ],
-		"Class IX Skills": [
-            "A.5	Square roots",
-			"A.6	Cube roots",
-			"U.1	Powers with integer bases",
-			"U.2	Powers with decimal and fractional bases",
-			"U.3	Negative exponents",
-			"U.4	Multiplication with exponents",
-			"U.5	Division with exponents",
-			"U.6	Multiplication and division with exponents",
-			"U.7	Power rule",
-			"U.8	Evaluate expressions using properties of exponents",
-			"U.9	Identify equivalent expressions involving exponents",
-			"V.1	Evaluate rational exponents",
-			"V.2	Multiplication with rational exponents",
-			"V.3	Division with rational exponents",
-			"V.4	Power rule with rational exponents",
-			"V.5	Simplify expressions involving rational exponents I",
-			"V.6	Simplify expressions involving rational exponents II",
-			"W.1	Convert between exponential and logarithmic form: rational bases",
-			"W.2	Evaluate logarithms",
-			"W.3	Change of base formula",
-			"W.4	Identify properties of logarithms",
-			"W.5	Product property of logarithms",
-			"W.6	Quotient property of logarithms",
-			"W.7	Power property of logarithms",
-			"W.8	Properties of logarithms: mixed review",
-			"W.9	Evaluate logarithms: mixed review",
-			"X.1	Convert between standard and scientific notation",
-			"X.2	Compare numbers written in scientific notation",
-			"X.3	Multiply numbers written in scientific notation",
-			"X.4	Divide numbers written in scientific notation",
-			"Y.5	Powers of monomials",
-			"CC.1	Roots of integers",
-			"CC.2	Roots of rational numbers",
-			"CC.3	Find roots using a calculator",
-			"CC.4	Nth roots",
-			"CC.5	Simplify radical expressions with variables I",
-			"CC.6	Simplify radical expressions with variables II",
-			"CC.7	Multiply radical expressions",
-			"CC.8	Divide radical expressions",
-			"CC.9	Add and subtract radical expressions",
-			"CC.10	Simplify radical expressions using the distributive property",
-			"CC.11	Simplify radical expressions using conjugate",
-        ],
-		"Class X Skills": [
-            "A.6	Square roots",
-			"A.7	Cube roots",
-			"C.2	Compound interest",
-			"H.7	Powers of monomials",
-			"V.4	Exponential growth and decay: word problems",
-        ],
-		"Class XI Skills": [
-            "A.2	Compound interest",
-			"A.3	Continuously compounded interest",
-        ],
-    },
-	"fractions": {
-		"Class IV Skills": [
-            "O.1	Halves and quarters",
-			"O.2	Equal parts",
-			"O.3	Simple fractions: what fraction does the shape show?",
-			"O.4	Simple fractions: which shape matches the fraction?",
-			"O.5	Simple fractions: parts of a group",
-        ],
-        "Class V Skills": [
-            "E.11	Convert fractions to decimals",
-			"E.12	Convert decimals to fractions",
-			"F.1	Fractions review",
-			"F.2	Unit fractions: modelling word problems",
-			"F.3	Unit fractions: word problems",
-			"F.4	Fractions of a whole: modelling word problems",
-			"F.5	Fractions of a whole: word problems",
-			"F.6	Fractions of a group: word problems",
-			"F.7	Equivalent fractions",
-			"F.8	Patterns of equivalent fractions",
-			"F.9	Write fractions in lowest terms",
-			"F.10	Compare fractions",
-			"F.11	Put fractions in order",
-			"F.12	Fractions of a number",
-			"F.13	Fractions of a number: word problems",
-			"F.14	Mixed numbers",
-        ],
-        "Class VI Skills": [
-            "E.4	Convert decimals to mixed numbers",
-			"G.1	Fractions and mixed numbers",
-			"G.2	Understanding fractions: word problems",
-			"G.3	Equivalent fractions",
-			"G.4	Write fractions in lowest terms",
-			"G.5	Fractions: word problems",
-			"G.6	Lowest common denominator",
-			"G.7	Compare fractions with like and unlike denominators",
-			"G.8	Compare fractions: word problems",
-			"G.9	Convert between improper fractions and mixed numbers",
-			"G.10	Convert between decimals and fractions or mixed numbers",
-			"G.11	Put a mix of decimals, fractions and mixed numbers in order",
-			"H.1	Add and subtract fractions with like denominators",
-			"H.2	Add and subtract fractions with like denominators: word problems",
-			"H.3	Add and subtract fractions with unlike denominators",
-			"H.4	Add and subtract fractions with unlike denominators: word problems",
-			"H.5	Inequalities with addition and subtraction of like and unlike fractions",
-			"H.6	Add and subtract mixed numbers",
-			"H.7	Add and subtract mixed numbers: word problems",
-			"H.8	Estimate sums and differences of mixed number",
-        ],
-		"Class VII Skills": [
-            "A.3	Multiplicative inverses",
-			"F.1	Understanding fractions: word problems",
-			"F.2	Equivalent fractions",
-			"F.3	Write fractions in lowest terms",
-			"F.4	Fractions: word problems with graphs and tables",
-			"F.5	Lowest common denominator",
-			"F.6	Compare and order fractions",
-			"F.7	Compare fractions: word problems",
-			"F.8	Convert between mixed numbers and improper fractions",
-			"F.9	Compare mixed numbers and improper fractions",
-			"F.10	Round mixed numbers",
-			"G.1	Add and subtract fractions",
-			"G.2	Add and subtract fractions: word problems",
-			"G.3	Add and subtract mixed numbers",
-			"G.4	Add and subtract mixed numbers: word problems",
-			"G.5	Inequalities with addition and subtraction of fractions and mixed numbers",
-			"G.6	Estimate sums and differences of mixed numbers",
-			"G.7	Multiply fractions and whole numbers",
-			"G.8	Multiply two fractions using models",
-			"G.9	Multiply fractions",
-			"G.10	Multiply mixed numbers",
-			"G.11	Multiply fractions and mixed numbers: word problems",
-			"G.12	Divide whole numbers and unit fractions",
-			"G.13	Divide fractions",
-			"G.14	Divide mixed numbers",
-			"G.15	Divide fractions and mixed numbers: word problems",
-			"G.16	Estimate products and quotients of fractions and mixed numbers",
-			"G.17	Add, subtract, multiply and divide fractions and mixed numbers: word problems",
-			"G.18	Evaluate numerical expressions involving fractions",
-			"H.2	Convert between decimals and fractions or mixed numbers",
-			"H.3	Compare rational numbers",
-			"H.4	Put rational numbers in order",
-			"H.5	Add and subtract rational numbers",
-			"H.7	Multiply and divide rational numbers",
-			"I.5	Powers with decimal and fractional bases",
-			"K.2	Convert between percents, fractions and decimals",
-			"K.3	Compare percents to fractions and decimals",
-			"P.6	Evaluate nonlinear expressions",
-        ],
-		"Class VIII Skills": [
-            "D.2	Write fractions in lowest terms",
-			"D.3	Lowest common denominator",
-			"D.4	Round decimals and mixed numbers",
-			"D.5	Convert between decimals and fractions or mixed numbers",
-			"D.6	Compare rational numbers",
-			"D.7	Put rational numbers in order",
-			"E.1	Reciprocals and multiplicative inverses",
-			"E.2	Add and subtract rational numbers",
-			"E.3	Add and subtract rational numbers: word problems",
-			"E.5	Multiply and divide rational numbers",
-			"E.6	Multiply and divide rational numbers: word problems",
-			"E.9	Evaluate numerical expressions involving rational numbers",
-			"F.5	Powers with decimal and fractional bases",
-			"J.1	Convert between percents, fractions and decimals",
-			"J.2	Compare percents to fractions and decimals",
-			"V.8	Evaluate rational expressions",
-        ],
-		"Class IX Skills": [
-            "A.2	Compare and order rational numbers",
-			"A.4	Convert between decimals and fractions",
-			"B.4	Add and subtract rational numbers",
-			"B.5	Multiply and divide rational numbers",
-			"B.6	Evaluate numerical expressions involving rational numbers",
-			"B.7	Evaluate variable expressions involving rational numbers",
-			"D.1	Convert between percents, fractions and decimals",
-			"U.2	Powers with decimal and fractional bases",
-			"DD.1	Simplify complex fractions",
-			"DD.2	Simplify rational expressions",
-			"DD.3	Multiply and divide rational expressions",
-			"DD.5	Add and subtract rational expressions",
-			"DD.6	Solve rational equations",
-        ],
-		"Class X Skills": [
-            "A.2	Convert between decimals and fractions",
-			"A.4	Compare and order rational numbers",
-			"B.4	Add and subtract rational numbers",
-			"B.5	Multiply and divide rational numbers",
-			"B.6	Evaluate numerical expressions involving rational numbers",
-			"B.7	Evaluate variable expressions involving rational numbers",
-			"K.1	Simplify complex fractions",
-			"K.2	Simplify rational expressions",
-			"K.3	Multiply and divide rational expressions",
-			"K.5	Add and subtract rational expressions",
-			"K.6	Solve rational equations",
-        ],
-		"Class XI Skills": [
-            "O.1	Rational functions: asymptotes and excluded values",
-			"O.4	Simplify rational expressions",
-			"O.5	Multiply and divide rational expressions",
-			"O.6	Add and subtract rational expressions",
-			"O.7	Solve rational equations",
-        ],
-    },
-	"functions and equations": {
-		"Class II Skills": [
-            "E.8	Addition input/output tables - sums to 20",
-			"F.8	Subtraction input/output tables - up to 18",
-			"G.7	Addition input/output tables - up to two digits",
-			"H.7	Subtraction input/output tables - up to two digits",
-			"S.5	Write the addition or subtraction rule for an input/output table - up to 20",
-			"S.10	Write the addition or subtraction rule for an input/output table - up to 100",
-        ],
-        "Class III Skills": [
-            "C.2	Addition input/output tables - up to three digits",
-			"D.2	Subtraction input/output tables - up to three digits",
-			"H.3	Multiplication input/output tables",
-			"L.2	Division input/output tables",
-        ],
-        "Class VI Skills": [
-            "J.6	Add and subtract integers: input/output tables",
-			"R.1	Write variable equations: word problems",
-			"R.2	Solve equations using properties",
-			"R.3	Solve equations",
-        ],
-		"Class VII Skills": [
-            "P.11	Solve equations using properties",
-			"Q.1	Which x satisfies an equation?",
-			"Q.2	Write an equation from words",
-			"Q.3	Model and solve equations using algebra tiles",
-			"Q.4	Write and solve equations that represent diagrams",
-			"Q.5	Solve one-step equations",
-			"Q.6	Solve two-step equations",
-			"Q.7	Solve equations: word problems",
-			"Q.8	Solve equations involving like terms",
-			"Q.9	Solve equations: complete the solution",
-        ],
-		"Class VIII Skills": [
-            "F.18	Solve equations involving squares and square roots",
-			"F.21	Solve equations involving cubes and cube roots",
-			"I.2	Write equations for proportional relationships from tables",
-			"I.4	Find the constant of proportionality from a graph",
-			"I.5	Write equations for proportional relationships from graphs",
-			"I.6	Identify proportional relationships",
-			"I.8	Interpret graphs of proportional relationships",
-			"I.9	Write and solve equations for proportional relationships",
-			"W.1	Which x satisfies an equation?",
-			"W.2	Write an equation from words",
-			"W.3	Model and solve equations using algebra tiles",
-			"W.4	Write and solve equations that represent diagrams",
-			"W.6	Solve one-step equations",
-			"W.7	Solve two-step equations",
-			"W.8	Solve multi-step equations",
-			"W.9	Solve equations involving like terms",
-			"W.10	Solve equations: complete the solution",
-			"W.11	Solve equations: word problems",
-        ],
-		"Class IX Skills": [
-            "N.1	Model and solve equations using algebra tiles",
-			"N.2	Write and solve equations that represent diagrams",
-			"N.3	Solve one-step linear equations",
-			"N.4	Solve two-step linear equations",
-			"N.5	Solve advanced linear equations",
-			"N.6	Solve equations with variables on both sides",
-			"N.7	Solve equations: complete the solution",
-			"N.8	Find the number of solutions",
-			"N.10	Solve linear equations: word problems",
-			"N.11	Solve linear equations: mixed review",
-			"P.4	Rate of travel: word problems",
-			"P.5	Weighted averages: word problems",
-			"S.1	Identify proportional relationships",
-			"S.2	Find the constant of variation",
-			"S.3	Graph a proportional relationship",
-			"S.4	Write direct variation equations",
-			"S.5	Write and solve direct variation equations",
-			"T.1	Identify linear equations",
-			"T.2	Find the slope of a graph",
-			"T.3	Find the slope from two points",
-			"T.5	Slope-intercept form: find the slope and y-intercept",
-			"T.6	Slope-intercept form: graph an equation",
-			"T.7	Slope-intercept form: write an equation from a graph",
-			"T.8	Slope-intercept form: write an equation",
-			"T.9	Slope-intercept form: write an equation from a table",
-			"T.10	Slope-intercept form: write an equation from a word problem",
-			"T.11	Linear equations: solve for y",
-			"T.12	Write linear equations to solve word problems",
-			"T.13	Compare linear equations, graphs and tables",
-			"T.14	Write equations in standard form",
-			"T.15	Standard form: find x- and y-intercepts",
-			"T.16	Standard form: graph an equation",
-			"T.17	Equations of horizontal and vertical lines",
-			"T.18	Graph a horizontal or vertical line",
-			"T.19	Slopes of parallel and perpendicular lines",
-			"T.20	Write an equation for a parallel or perpendicular line",
-			"BB.1	Characteristics of quadratic equations",
-			"BB.2	Complete a table: quadratic equations",
-			"BB.3	Solve a quadratic equation using square roots",
-			"BB.4	Solve a quadratic equation using the zero product property",
-			"BB.5	Solve a quadratic equation by factorising",
-			"BB.6	Solve a quadratic equation using the quadratic formula",
-			"DD.6	Solve rational equations",
-        ],
-		"Class X Skills": [
-            "D.1	Identify linear equations",
-			"D.2	Find the slope of a graph",
-			"D.3	Find the slope from two points",
-			"D.5	Slope-intercept form: find the slope and y-intercept",
-			"D.6	Slope-intercept form: graph an equation",
-			"D.7	Slope-intercept form: write an equation from a graph",
-			"D.8	Slope-intercept form: write an equation",
-			"D.9	Slope-intercept form: write an equation from a table",
-			"D.10	Slope-intercept form: write an equation from a word problem",
-			"D.11	Write linear equations to solve word problems",
-			"D.12	Compare linear equations, graphs and tables",
-			"D.13	Write equations in standard form",
-			"D.14	Standard form: find x- and y-intercepts",
-			"D.15	Standard form: graph an equation",
-			"D.16	Equations of horizontal and vertical lines",
-			"D.17	Graph a horizontal or vertical line",
-			"D.18	Slopes of parallel and perpendicular lines",
-			"D.19	Write an equation for a parallel or perpendicular line",
-			"E.1	Is (x, y) a solution to the pair of equations?",
-			"E.2	Solve a pair of equations by graphing",
-			"E.3	Solve a pair of equations by graphing: word problems",
-			"E.4	Find the number of solutions to a pair of equations by graphing",
-			"E.5	Find the number of solutions to a pair of equations",
-			"E.6	Solve a pair of equations using substitution",
-			"E.7	Solve a pair of equations using substitution: word problems",
-			"E.8	Solve a pair of equations using elimination",
-			"E.9	Solve a pair of equations using elimination: word problems",
-			"J.1	Characteristics of quadratic equations",
-			"J.2	Complete a table: quadratic equations",
-			"J.3	Solve a quadratic equation using square roots",
-			"J.4	Solve a quadratic equation using the zero product property",
-			"J.5	Solve a quadratic equation by factorising",
-			"J.7	Solve a quadratic equation by completing the square",
-			"J.8	Solve a quadratic equation using the quadratic formula",
-			"J.9	Using the discriminant",
-			"J.10	Graph a quadratic equation",
-			"J.11	Match quadratic functions and graphs",
-			"K.6	Solve rational equations",
-			"V.2	Rate of travel: word problems",
-			"V.3	Weighted averages: word problems",
-        ],
-		"Class XI Skills": [
-            "C.1	Relations: convert between tables, graphs, mappings and lists of points",
-			"C.2	Domain and range of relations",
-			"C.3	Identify independent and dependent variables",
-			"C.4	Identify functions",
-			"C.5	Identify functions: vertical line test",
-			"C.6	Find values using function graphs",
-			"C.7	Evaluate a function",
-			"C.8	Evaluate a function: plug in an expression",
-			"C.9	Complete a function table from a graph",
-			"C.10	Complete a function table from an equation",
-			"C.11	Interpret the graph of a function: word problems",
-			"D.1	Find the slope of a graph",
-			"D.2	Find the slope from two points",
-			"D.4	Slope-intercept form: find the slope and y-intercept",
-			"D.5	Slope-intercept form: graph an equation",
-			"D.6	Slope-intercept form: write an equation from a graph",
-			"D.7	Slope-intercept form: write an equation",
-			"D.8	Slope-intercept form: write an equation from a table",
-			"D.9	Slope-intercept form: write an equation from a word problem",
-			"D.10	Write linear functions to solve word problems",
-			"D.11	Complete a table and graph a linear function",
-			"D.12	Write equations in standard form",
-			"D.13	Standard form: find x- and y-intercepts",
-			"D.14	Standard form: graph an equation",
-			"D.15	Equations of horizontal and vertical lines",
-			"D.16	Graph a horizontal or vertical line",
-			"D.17	Slopes of parallel and perpendicular lines",
-			"D.18	Write an equation for a parallel or perpendicular line",
-			"D.19	Transformations of linear functions",
-			"I.1	Characteristics of quadratic functions",
-			"I.2	Complete a function table: quadratic functions",
-			"I.3	Find a quadratic function",
-			"I.4	Graph a quadratic function",
-			"I.5	Match quadratic functions and graphs",
-			"I.6	Solve a quadratic equation using square roots",
-			"I.7	Solve a quadratic equation using the zero product property",
-			"I.8	Solve a quadratic equation by factorising",
-			"I.9	Complete the square",
-			"I.10	Solve a quadratic equation using the quadratic formula",
-			"I.11	Using the discriminant",
-			"J.7	Solve polynomial equations",
-			"J.13	Match polynomials and graphs",
-			"O.1	Rational functions: asymptotes and excluded values",
-			"O.7	Solve rational equations",
-			"Q.1	Add and subtract functions",
-			"Q.2	Multiply functions",
-			"Q.3	Divide functions",
-			"Q.4	Composition of linear functions: find a value",
-			"Q.5	Composition of linear functions: find an equation",
-			"Q.6	Composition of linear and quadratic functions: find a value",
-			"Q.7	Composition of linear and quadratic functions: find an equation",
-			"T.1	Find properties of sine functions",
-			"T.5	Find properties of cosine functions",
-			"U.2	Symmetry and periodicity of trigonometric functions",
-			"V.4	Rate of travel: word problems",
-			"V.5	Weighted averages: word problems",
-			"Y.1	Find limits using graphs",
-			"Y.2	Find one-sided limits using graphs",
-			"Y.3	Determine if a limit exists",
-			"Z.1	Find limits using addition, subtraction and multiplication laws",
-			"Z.2	Find limits using the division law",
-			"Z.3	Find limits using power and root laws",
-			"Z.4	Find limits using limit laws",
-			"Z.5	Find limits of polynomials and rational functions",
-			"Z.6	Find limits involving factorisation and rationalisation",
-			"AA.1	Find limits at vertical asymptotes using graphs",
-			"AA.2	Determine end behaviour using graphs",
-			"AA.3	Determine end behaviour of polynomial and rational functions",
-			"BB.1	Find the limit at a vertical asymptote of a rational function I",
-			"BB.2	Find the limit at a vertical asymptote of a rational function II",
-			"CC.1	Identify graphs of continuous functions",
-			"CC.2	Determine continuity using graphs",
-			"CC.3	Determine one-sided continuity using graphs",
-			"CC.4	Find and analyse points of discontinuity using graphs",
-			"CC.5	Determine continuity on an interval using graphs",
-			"CC.6	Determine the continuity of a piecewise function at a point",
-			"CC.7	Make a piecewise function continuous",
-			"CC.8	Intermediate Value Theorem",
-			"EE.1	Sum and difference rules",
-			"EE.2	Product rule",
-			"EE.3	Quotient rule",
-			"EE.4	Power rule I",
-			"EE.5	Power rule II",
-			"EE.6	Find derivatives of polynomials",
-			"EE.7	Find derivatives of rational functions",
-			"EE.8	Find derivatives of trigonometric functions I",
-			"EE.9	Find derivatives of trigonometric functions II",
-			"EE.10	Chain rule",
-			"EE.11	Find derivatives of radical functions",
-			"EE.12	Find derivatives using the product rule",
-			"EE.13	Find derivatives using the quotient rule I",
-			"EE.14	Find derivatives using the quotient rule II",
-			"EE.15	Find derivatives using the chain rule I",
-			"EE.16	Find derivatives using the chain rule II",
-        ],
-		"Class XII Skills": [
-            "A.1	Domain and range",
-			"A.2	Identify functions",
-			"A.3	Find the slope of a linear function",
-			"A.4	Graph a linear function",
-			"A.5	Write the equation of a linear function",
-			"A.6	Evaluate functions",
-			"A.7	Find values using function graphs",
-			"A.8	Complete a table for a function graph",
-			"A.9	Add, subtract, multiply and divide functions",
-			"A.10	Composition of functions",
-			"A.11	Identify inverse functions",
-			"A.12	Find values of inverse functions from tables",
-			"A.13	Find values of inverse functions from graphs",
-			"A.14	Find inverse functions and relations",
-			"B.1	Translations of functions",
-			"B.2	Reflections of functions",
-			"B.3	Dilations of functions",
-			"B.4	Transformations of functions",
-			"B.5	Function transformation rules",
-			"B.6	Describe function transformations",
-			"C.11	Match polynomials and graphs",
-			"C.13	Solve equations with sums and differences of cubes",
-			"C.15	Solve equations using a quadratic pattern",
-			"H.1	Find properties of sine functions",
-			"H.5	Find properties of cosine functions",
-			"I.2	Symmetry and periodicity of trigonometric functions",
-			"Q.1	Identify graphs of continuous functions",
-			"Q.2	Determine continuity using graphs",
-			"Q.3	Determine one-sided continuity using graphs",
-			"Q.4	Find and analyse points of discontinuity using graphs",
-			"Q.5	Determine continuity on an interval using graphs",
-			"Q.6	Determine the continuity of a piecewise function at a point",
-			"Q.7	Make a piecewise function continuous",
-			"Q.8	Intermediate Value Theorem",
-			"S.1	Sum and difference rules",
-			"S.2	Product rule",
-			"S.3	Quotient rule",
-			"S.4	Power rule I",
-			"S.5	Power rule II",
-			"S.6	Chain rule",
-			"S.7	Inverse function rule",
-			"T.1	Find derivatives of polynomials",
-			"T.2	Find derivatives of rational functions",
-			"T.3	Find derivatives of trigonometric functions I",
-			"T.4	Find derivatives of trigonometric functions II",
-			"T.5	Find derivatives of exponential functions",
-			"T.6	Find derivatives of logarithmic functions",
-			"T.7	Find derivatives of inverse trigonometric functions",
-			"T.8	Find derivatives of radical functions",
-			"T.9	Find derivatives using the product rule I",
-			"T.10	Find derivatives using the product rule II",
-			"T.11	Find derivatives using the quotient rule I",
-			"T.12	Find derivatives using the quotient rule II",
-			"T.13	Find derivatives using the chain rule I",
-			"T.14	Find derivatives using the chain rule II",
-			"U.1	Find derivatives using implicit differentiation",
-			"U.2	Find tangent lines using implicit differentiation",
-			"U.3	Find derivatives using logarithmic differentiation",
-			"V.1	Find higher derivatives of polynomials",
-			"V.2	Find higher derivatives of rational and radical functions",
-			"V.3	Find second derivatives of trigonometric, exponential and logarithmic functions",
-			"V.4	Find higher derivatives using patterns",
-			"Y.3	Find the equation of a regression line",
-        ],
-    },
-	"geometry": {
-		"Lower kindergarten skills": [
-            "A.1	Name the shape",
-			"A.2	Circles",
-			"A.3	Squares",
-			"A.4	Triangles",
-			"A.5	Rectangles",
-			"A.6	Circles, squares and triangles",
-			"F.1	Inside and outside",
-			"F.2	Above and below",
-			"F.3	Beside and next to",
-			"F.4	Left and right",
-			"F.5	Left, middle and right",
-			"F.6	Top and bottom",
-			"F.7	Top, middle and bottom",
-        ],
-        "Upper kindergarten skills": [
-            "G.1	Inside and outside",
-			"G.2	Above and below",
-			"G.3	Above and below - find solid figures",
-			"G.4	Beside and next to",
-			"G.5	Beside and next to - find solid figures",
-			"G.6	Left, middle and right",
-			"G.7	Top, middle and bottom",
-			"G.8	Location in a grid",
-			"L.9	Count shapes in a Venn diagram",
-			"Q.1	Name the two-dimensional shape",
-			"Q.2	Circles",
-			"Q.3	Triangles",
-			"Q.4	Squares and rectangles",
-			"Q.5	Hexagons",
-			"Q.6	Select two-dimensional shapes",
-			"Q.7	Count sides and corners",
-			"Q.8	Compare sides and corners",
-			"Q.9	Introduction to symmetry",
-			"Q.10	Identify pictures with symmetry",
-			"R.1	Two-dimensional and three-dimensional shapes",
-			"R.2	Name the three-dimensional shape",
-			"R.3	Spheres",
-			"R.4	Cubes",
-			"R.5	Cones",
-			"R.6	Cylinders",
-			"R.7	Select three-dimensional shapes",
-			"R.8	Identify shapes traced from solids",
-			"R.9	Shapes of everyday objects I",
-			"R.10	Shapes of everyday objects II",
-        ],
-        "Class I skills": [
-            "M.1	Name the two-dimensional shape",
-			"M.2	Select two-dimensional shapes",
-			"M.3	Count sides and vertices",
-			"M.4	Compare sides and vertices",
-			"M.5	Open and closed shapes",
-			"M.6	Flip, turn and slide",
-			"M.7	Symmetry",
-			"N.1	Two-dimensional and three-dimensional shapes",
-			"N.2	Name the three-dimensional shape",
-			"N.3	Cubes and rectangular prisms",
-			"N.4	Select three-dimensional shapes",
-			"N.5	Count vertices, edges and faces",
-			"N.6	Compare vertices, edges and faces",
-			"N.7	Identify shapes traced from solids",
-			"N.8	Identify faces of three-dimensional shapes",
-			"N.9	Shapes of everyday objects I",
-			"N.10	Shapes of everyday objects II",
-			"O.1	Above and below",
-			"O.2	Beside and next to",
-			"O.3	Left, middle and right",
-			"O.4	Top, middle and bottom",
-			"O.5	Location in a grid",
-			"U.2	Count shapes in a Venn diagram",
-        ],
-		"Class II Skills": [
-            "O.1	Name the two-dimensional shape",
-			"O.2	Select two-dimensional shapes",
-			"O.3	Count sides and vertices",
-			"O.4	Compare sides and vertices",
-			"O.5	Name the three-dimensional shape",
-			"O.6	Select three-dimensional shapes",
-			"O.7	Count vertices, edges and faces",
-			"O.8	Compare vertices, edges and faces",
-			"O.9	Flip, turn and slide",
-        ],
-		"Class III Skills": [
-            "M.5	Sort shapes into a Venn diagram",
-			"M.6	Count shapes in a Venn diagram",
-			"Q.1	Identify two-dimensional shapes",
-			"Q.2	Count and compare sides and vertices",
-			"Q.3	Identify three-dimensional shapes",
-			"Q.4	Count vertices, edges and faces",
-			"Q.5	Identify faces of three-dimensional shapes",
-			"Q.6	Is it a polygon?",
-			"Q.7	Reflection, rotation and translation",
-			"Q.8	Symmetry",
-			"Q.10	Find the area of rectangles and squares",
-			"Q.11	Find the missing side length of a rectangle",
-        ],
-		"Class IV skills": [
-            "M.1	Which two-dimensional figure is being described?",
-			"M.2	Identify three-dimensional figures",
-			"M.3	Count vertices, edges and faces",
-			"M.4	Identify faces of three-dimensional figures",
-			"M.5	Which three-dimensional figure is being described?",
-			"M.6	Nets of three-dimensional figures",
-			"M.7	Number of sides in polygons",
-			"M.8	Identify lines of symmetry",
-			"M.9	Rotational symmetry",
-			"N.1	Perimeter of rectangles",
-			"N.2	Perimeter of polygons",
-			"N.3	Perimeter of rectilinear shapes",
-			"N.4	Perimeter: find the missing side length",
-			"N.5	Use perimeter to determine cost",
-			"N.6	Find the area of figures made of unit squares",
-			"N.7	Select figures with a given area",
-			"N.8	Select two figures with the same area",
-			"N.9	Create figures with a given area",
-			"N.10	Find the area or missing side length of a rectangle",
-			"N.11	Area and perimeter: word problems",
-        ],
-		"Class V Skills": [
-            "O.1	Which figure is being described?",
-			"O.2	Number of sides in polygons",
-			"O.3	Regular and irregular polygons",
-			"O.4	Types of angles",
-			"O.5	Measure angles with a protractor",
-			"O.6	Lines of symmetry",
-			"O.7	Rotational symmetry",
-			"O.8	Reflection, rotation and translation",
-			"O.9	Identify three-dimensional figures",
-			"O.10	Count vertices, edges and faces",
-			"O.11	Nets of three-dimensional figures",
-			"O.12	Three-dimensional figures viewed from different perspectives",
-			"P.1	Perimeter",
-			"P.2	Perimeter: find the missing side lengths",
-			"P.3	Area of squares and rectangles",
-			"P.4	Area and perimeter of figures on grids",
-			"P.5	Area and perimeter: word problems",
-			"P.6	Use area and perimeter to determine cost",
-			"P.7	Volume of figures made of unit cubes",
-        ],
-		"Class VI Skills": [
-            "S.1	Is it a polygon?",
-			"S.2	Types of angles",
-			"S.3	Measure angles with a protractor",
-			"S.4	Regular and irregular polygons",
-			"S.5	Number of sides in polygons",
-			"S.6	Classify triangles",
-			"S.7	Identify trapeziums",
-			"S.8	Classify quadrilaterals",
-			"S.9	Graph triangles and quadrilaterals",
-			"S.10	Find the unknown angle in triangles and quadrilaterals",
-			"S.11	Lines, line segments and rays",
-			"S.12	Parallel, perpendicular and intersecting lines",
-			"S.13	Parts of a circle",
-			"T.1	Lines of symmetry",
-			"T.2	Rotational symmetry",
-			"T.3	Reflection, rotation and translation",
-			"T.4	Identify congruent and similar figures",
-			"U.1	Construct the midpoint or perpendicular bisector of a segment",
-			"U.2	Construct an angle bisector",
-			"U.3	Construct a perpendicular line",
-			"U.4	Construct an equilateral triangle or regular hexagon",
-			"V.1	Identify three-dimensional figures",
-			"V.2	Count vertices, edges and faces",
-			"V.3	Which figure is being described?",
-			"V.4	Nets of three-dimensional figures",
-			"V.5	Three-dimensional figures viewed from different perspectives",
-			"W.1	Perimeter",
-			"W.2	Area of squares and rectangles",
-			"W.3	Area of compound figures",
-			"W.4	Area between two rectangles",
-			"W.5	Area and perimeter of figures on grids",
-			"W.6	Area and perimeter: word problems",
-			"W.7	Use area and perimeter to determine cost",
-			"W.8	Volume of figures made of unit cubes",
-        ],
-		"Class VII Skills": [
-            "R.1	Identify and classify polygons",
-			"R.2	Name, measure and classify angles",
-			"R.3	Classify triangles",
-			"R.4	Identify trapeziums",
-			"R.5	Classify quadrilaterals",
-			"R.6	Graph triangles and quadrilaterals",
-			"R.7	Triangle angle-sum property",
-			"R.8	Exterior angle property",
-			"R.9	Find missing angles in triangles and quadrilaterals",
-			"R.10	Interior angles of polygons",
-			"R.11	Lines, line segments and half lines",
-			"R.12	Parallel, perpendicular and intersecting lines",
-			"R.13	Identify complementary, supplementary, vertical, adjacent and congruent angles",
-			"R.14	Find measures of complementary, supplementary, vertical and adjacent angles",
-			"R.15	Transversal of parallel lines",
-			"R.16	Find lengths and measures of bisected line segments and angles",
-			"R.17	Parts of a circle",
-			"R.18	Symmetry",
-			"S.1	Similar and congruent figures",
-			"S.2	Side lengths and angle measures of congruent figures",
-			"S.3	Congruence statements and corresponding parts",
-			"S.4	Side lengths and angle measures of similar figures",
-			"S.5	Similar figures and indirect measurement",
-			"T.1	Construct the midpoint or perpendicular bisector of a segment",
-			"T.2	Construct an angle bisector",
-			"T.3	Construct a perpendicular line",
-			"T.4	Construct parallel lines",
-			"T.5	Construct an equilateral triangle or regular hexagon",
-			"U.1	Pythagoras' theorem: find the length of the hypotenuse",
-			"U.2	Pythagoras' theorem: find the missing leg length",
-			"U.3	Pythagoras' theorem: word problems",
-			"U.4	Converse of Pythagoras' theorem: is it a right triangle?",
-			"V.1	Bases of three-dimensional figures",
-			"V.2	Nets of three-dimensional figures",
-			"V.3	Front, side and top view",
-			"W.1	Perimeter",
-			"W.2	Area of rectangles and parallelograms",
-			"W.3	Area of triangles",
-			"W.4	Area and perimeter: word problems",
-			"W.5	Circles: calculate area, circumference, radius and diameter",
-			"W.6	Circles: word problems",
-			"W.7	Semicircles: calculate area, perimeter, radius and diameter",
-			"W.8	Quarter circles: calculate area, perimeter and radius",
-			"W.9	Area of compound figures with triangles, semicircles and quarter circles",
-			"W.10	Area between two shapes",
-			"W.11	Perimeter, area and volume: changes in scale",
-        ],
-		"Class VIII Skills": [
-            "O.1	Identify and classify polygons",
-			"O.2	Classify triangles",
-			"O.3	Identify trapeziums",
-			"O.4	Classify quadrilaterals",
-			"O.5	Graph triangles and quadrilaterals",
-			"O.6	Properties of parallelograms",
-			"O.7	Properties of rhombuses",
-			"O.8	Properties of squares and rectangles",
-			"O.9	Find missing angles in triangles and quadrilaterals",
-			"O.10	Interior angles of polygons",
-			"O.11	Lines, line segments and half lines",
-			"O.12	Identify complementary, supplementary, vertical, adjacent and congruent angles",
-			"O.13	Find measures of complementary, supplementary, vertical and adjacent angles",
-			"O.14	Transversal of parallel lines",
-			"O.15	Find lengths and measures of bisected line segments and angles",
-			"O.16	Parts of a circle",
-			"O.17	Symmetry",
-			"O.18	Count lines of symmetry",
-			"O.19	Draw lines of symmetry",
-			"P.1	Similar and congruent figures",
-			"P.2	Side lengths and angle measures of congruent figures",
-			"P.3	Congruence statements and corresponding parts",
-			"P.4	Congruent triangles: SSS, SAS and ASA",
-			"P.5	Side lengths and angle measures of similar figures",
-			"Q.1	Construct the midpoint or perpendicular bisector of a segment",
-			"Q.2	Construct an angle bisector",
-			"Q.3	Construct a congruent angle",
-			"Q.4	Construct a perpendicular line",
-			"Q.5	Construct parallel lines",
-			"Q.6	Construct an equilateral triangle or regular hexagon",
-			"R.1	Pythagoras' theorem: find the length of the hypotenuse",
-			"R.2	Pythagoras' theorem: find the missing leg length",
-			"R.3	Pythagoras' theorem: find the perimeter",
-			"R.4	Pythagoras' theorem: word problems",
-			"R.5	Converse of Pythagoras' theorem: is it a right triangle?",
-			"S.1	Parts of three-dimensional figures",
-			"S.2	Nets of three-dimensional figures",
-			"S.3	Front, side and top view",
-			"S.4	Base plans",
-			"S.5	Similar solids",
-			"T.1	Perimeter",
-			"T.2	Area",
-			"T.3	Area between two shapes",
-			"T.4	Area and perimeter: word problems",
-			"T.5	Circles, semicircles and quarter circles",
-			"T.6	Circles: word problems",
-			"T.7	Volume of prisms and cylinders",
-			"T.8	Surface area of prisms and cylinders",
-			"T.9	Volume and surface area of similar solids",
-			"T.10	Perimeter, area and volume: changes in scale",
-			"X.5	Add polynomials to find perimeter",
-			"X.13	Multiply polynomials to find area",
-        ],
-		"Class IX Skills": [
-            "E.4	Minimum and maximum area and volume",
-			"E.6	Percent error: area and volume",
-			"F.1	Transversals: name angle pairs",
-			"F.2	Transversals of parallel lines: find angle measures",
-			"F.3	Identify complementary, supplementary, vertical, adjacent and congruent angles",
-			"F.4	Find measures of complementary, supplementary, vertical and adjacent angles",
-			"G.1	Classify triangles",
-			"G.2	Triangle angle-sum property",
-			"G.3	Exterior angle property",
-			"G.4	Exterior angle inequality",
-			"G.5	Angle-side relationships in triangles",
-			"G.6	Triangle Inequality Theorem",
-			"G.7	Midsegments of triangles",
-			"G.8	SSS, SAS and ASA Theorems",
-			"G.9	SSS Theorem in the coordinate plane",
-			"G.10	Congruency in isosceles and equilateral triangles",
-			"G.11	Hypotenuse-Leg Theorem",
-			"H.1	Classify quadrilaterals",
-			"H.2	Graph quadrilaterals",
-			"H.3	Properties of parallelograms",
-			"H.4	Proving a quadrilateral is a parallelogram",
-			"H.5	Properties of rhombuses",
-			"H.6	Properties of squares and rectangles",
-			"H.7	Properties of trapeziums",
-			"H.8	Properties of kites",
-			"H.9	Review: properties of quadrilaterals",
-			"I.1	Polygon vocabulary",
-			"I.2	Interior angles of polygons",
-			"I.3	Exterior angles of polygons",
-			"I.4	Review: interior and exterior angles of polygons",
-			"J.1	Perimeter",
-			"J.2	Area of rectangles and squares",
-			"J.3	Area of parallelograms and triangles",
-			"J.4	Area of trapeziums",
-			"J.5	Area and circumference of circles",
-			"J.6	Area of compound figures",
-			"J.7	Area between two shapes",
-			"J.8	Area and perimeter mixed review",
-			"J.9	Heron's formula",
-			"K.1	Introduction to surface area and volume",
-			"K.2	Surface area of prisms and cylinders",
-			"K.3	Surface area of cones",
-			"K.4	Volume of prisms and cylinders",
-			"K.5	Volume of cones",
-			"K.6	Surface area and volume of spheres",
-			"K.7	Surface area and volume review",
-			"L.1	Parts of a circle",
-			"L.2	Central angles",
-			"L.3	Arc measure and arc length",
-			"L.4	Area of sectors",
-			"L.5	Circle measurements: mixed review",
-			"L.6	Arcs and chords",
-			"L.7	Tangent lines",
-			"L.8	Perimeter of polygons with an inscribed circle",
-			"L.9	Inscribed angles",
-			"L.10	Angles in inscribed right triangles",
-			"L.11	Angles in inscribed quadrilaterals",
-			"M.1	Construct the midpoint or perpendicular bisector of a segment",
-			"M.2	Construct an angle bisector",
-			"M.3	Construct a congruent angle",
-			"M.4	Construct an equilateral triangle or regular hexagon",
-			"Z.5	Add polynomials to find perimeter",
-        ],
-		"Class X Skills": [
-            "D.20	Find the distance between a point and a line",
-			"D.21	Find the distance between two parallel lines",
-			"H.5	Add polynomials to find perimeter",
-			"L.1	Lines, line segments and half lines",
-			"L.2	Lengths of segments on number lines",
-			"L.3	Additive property of length",
-			"L.4	Midpoints",
-			"L.5	Congruent line segments",
-			"L.6	Perpendicular Bisector Theorem",
-			"L.7	Midpoint formula",
-			"L.8	Distance formula",
-			"M.1	Polygon vocabulary",
-			"M.2	Perimeter",
-			"M.3	Area of triangles and quadrilaterals",
-			"M.4	Area and perimeter in the coordinate plane I",
-			"M.5	Area and perimeter in the coordinate plane II",
-			"M.6	Area and circumference of circles",
-			"M.7	Area of compound figures",
-			"M.8	Area between two shapes",
-			"M.9	Area and perimeter of similar figures",
-			"N.1	Translations: find the coordinates",
-			"N.2	Reflections: find the coordinates",
-			"N.3	Rotations: find the coordinates",
-			"N.4	Congruence transformations",
-			"N.5	Compositions of congruence transformations: graph the image",
-			"N.6	Transformations that carry a polygon onto itself",
-			"N.7	Dilations: graph the image",
-			"N.8	Dilations: find the coordinates",
-			"N.9	Dilations: scale factor and classification",
-			"N.10	Dilations and parallel lines",
-			"O.1	Classify triangles",
-			"O.2	Triangle Angle-Sum Theorem",
-			"O.3	Midsegments of triangles",
-			"O.4	Triangles and bisectors",
-			"O.5	Identify medians, altitudes, angle bisectors and perpendicular bisectors",
-			"O.6	Angle-side relationships in triangles",
-			"O.7	Triangle Inequality Theorem",
-			"P.1	Identify similar figures",
-			"P.2	Ratios in similar figures",
-			"P.3	Similarity statements",
-			"P.4	Side lengths and angle measures in similar figures",
-			"P.5	Similar triangles and indirect measurement",
-			"P.6	Perimeters of similar figures",
-			"P.7	Similarity rules for triangles",
-			"P.8	Similar triangles and similarity transformations",
-			"P.9	Areas of similar figures",
-			"Q.1	Pythagoras' Theorem",
-			"Q.2	Converse of Pythagoras' theorem",
-			"Q.3	Pythagoras' Inequality Theorems",
-			"Q.4	Special right triangles",
-			"R.1	Parts of a circle",
-			"R.2	Central angles",
-			"R.3	Arc measure and arc length",
-			"R.4	Area of sectors",
-			"R.5	Circle measurements: mixed review",
-			"R.6	Arcs and chords",
-			"R.7	Tangent lines",
-			"R.8	Perimeter of polygons with an inscribed circle",
-			"R.9	Inscribed angles",
-			"R.10	Angles in inscribed right triangles",
-			"R.11	Angles in inscribed quadrilaterals",
-			"S.1	Trigonometric ratios: sin, cos and tan",
-			"S.2	Trigonometric ratios: csc, sec and cot",
-			"S.3	Trigonometric functions of complementary angles",
-			"S.4	Find trigonometric functions of special angles",
-			"S.5	Find trigonometric functions using a calculator",
-			"S.6	Inverses of trigonometric functions",
-			"S.7	Trigonometric ratios: find a side length",
-			"S.8	Trigonometric ratios: find an angle measure",
-			"S.9	Solve a right triangle",
-			"T.1	Introduction to surface area and volume",
-			"T.2	Surface area of prisms and cylinders",
-			"T.3	Surface area of cones",
-			"T.4	Volume of prisms and cylinders",
-			"T.5	Volume of cones",
-			"T.6	Surface area and volume of spheres",
-			"T.7	Introduction to similar solids",
-			"T.8	Surface area and volume of similar solids",
-			"T.9	Surface area and volume review",
-			"U.4	Minimum and maximum area and volume",
-			"U.6	Percent error: area and volume",
-			"X.6	Geometric probability",
-			"AA.1	Construct a tangent line to a circle",
-			"AA.2	Construct an equilateral triangle inscribed in a circle",
-			"AA.3	Construct a regular hexagon inscribed in a circle",
-			"AA.4	Construct the circumcenter or incenter of a triangle",
-			"AA.5	Construct the inscribed or circumscribed circle of a triangle",
-        ],
-		"Class XI Skills": [
-            "G.8	Distance in the Argand plane",
-			"K.1	Identify the direction a parabola opens",
-			"K.2	Find the vertex of a parabola",
-			"K.3	Find the focus or directrix of a parabola",
-			"K.4	Find the axis of symmetry of a parabola",
-			"K.5	Write equations of parabolas in vertex form from graphs",
-			"K.6	Write equations of parabolas in vertex form using properties",
-			"K.7	Convert equations of parabolas from general to vertex form",
-			"K.8	Find properties of a parabola from equations in general form",
-			"K.9	Graph parabolas",
-			"L.1	Find the centre of a circle",
-			"L.2	Find the radius or diameter of a circle",
-			"L.3	Write equations of circles in standard form from graphs",
-			"L.4	Write equations of circles in standard form using properties",
-			"L.5	Convert equations of circles from general to standard form",
-			"L.6	Find properties of circles from equations in general form",
-			"L.7	Graph circles",
-			"M.1	Find the center, vertices, or co-vertices of an ellipse",
-			"M.2	Find the length of the major or minor axis of an ellipse",
-			"M.3	Find the foci of an ellipse",
-			"M.4	Write equations of ellipses in standard form from graphs",
-			"M.5	Write equations of ellipses in standard form using properties",
-			"M.6	Convert equations of ellipses from general to standard form",
-			"M.7	Find properties of ellipses from equations in general form",
-			"N.1	Find the center of a hyperbola",
-			"N.2	Find the vertices of a hyperbola",
-			"N.3	Find the length of the transverse or conjugate axes of a hyperbola",
-			"N.4	Find the equations for the asymptotes of a hyperbola",
-			"N.5	Find the foci of a hyperbola",
-			"N.6	Write equations of hyperbolas in standard form from graphs",
-			"N.7	Write equations of hyperbolas in standard form using properties",
-			"N.8	Convert equations of hyperbolas from general to standard form",
-			"N.9	Find properties of hyperbolas from equations in general form",
-			"R.1	Convert between radians and degrees",
-			"R.2	Radians and arc length",
-			"R.5	Coterminal angles",
-			"R.6	Reference angles",
-			"S.1	Pythagoras' Theorem and its converse",
-			"S.2	Special right triangles",
-			"S.3	Trigonometric ratios: sin, cos and tan",
-			"S.4	Trigonometric ratios: csc, sec and cot",
-			"S.5	Trigonometric ratios in similar right triangles",
-			"S.6	Find trigonometric ratios using the unit circle",
-			"S.7	Sin, cos and tan of special angles",
-			"S.9	Find trigonometric functions using a calculator",
-			"S.10	Inverses of sin, cos and tan",
-			"S.12	Solve trigonometric equations I",
-			"S.13	Solve trigonometric equations II",
-			"S.14	Trigonometric ratios: find a side length",
-			"S.15	Trigonometric ratios: find an angle measure",
-			"S.16	Solve a right triangle",
-			"S.17	Law of Sines",
-			"S.18	Law of Cosines",
-			"S.19	Solve a triangle",
-			"S.20	Area of a triangle: sine formula",
-			"S.21	Area of a triangle: Law of Sines",
-			"U.1	Complementary angle identities",
-			"U.2	Symmetry and periodicity of trigonometric functions",
-			"FF.12	Geometric probability",
-        ],
-		"Class XII Skills": [
-            "G.1	Convert between radians and degrees",
-			"G.2	Radians and arc length",
-			"G.4	Coterminal and reference angles",
-			"G.5	Find trigonometric ratios using right triangles",
-			"G.6	Find trigonometric ratios using the unit circle",
-			"G.8	Inverses of trigonometric functions",
-			"G.9	Solve trigonometric equations",
-			"G.10	Trigonometric ratios: find a side length",
-			"G.11	Trigonometric ratios: find an angle measure",
-			"G.12	Solve a right triangle",
-			"G.13	Law of Sines",
-			"G.14	Law of Cosines",
-			"G.15	Solve a triangle",
-			"G.16	Area of a triangle: sine formula",
-			"G.17	Area of a triangle: Heron's formula",
-			"I.1	Complementary angle identities",
-			"I.2	Symmetry and periodicity of trigonometric functions",
-			"J.1	Find properties of parabolas",
-			"J.2	Write equations of parabolas in vertex form",
-			"J.3	Graph parabolas",
-			"J.4	Find properties of circles",
-			"J.5	Write equations of circles in standard form",
-			"J.6	Graph circles",
-			"J.7	Find properties of ellipses",
-			"J.8	Find the eccentricity of an ellipse",
-			"J.9	Write equations of ellipses in standard form",
-			"J.10	Find properties of hyperbolas",
-			"J.11	Find the eccentricity of a hyperbola",
-			"J.12	Write equations of hyperbolas in standard form",
-			"J.13	Convert equations of conic sections from general to standard form",
-			"L.8	Distance in the Argand plane",
-			"N.1	Find the magnitude of a vector",
-			"N.2	Find the direction angle of a vector",
-			"N.3	Find the component form of a vector",
-			"N.4	Find the component form of a vector from its magnitude and direction angle",
-			"N.5	Find a unit vector",
-			"N.6	Add and subtract vectors",
-			"N.7	Multiply a vector by a scalar",
-			"N.8	Find the magnitude or direction of a vector scalar multiple",
-			"N.9	Find the magnitude and direction of a vector sum",
-			"N.10	Linear combinations of vectors",
-			"N.11	Graph a resultant vector using the triangle method",
-			"N.12	Graph a resultant vector using the parallelogram method",
-			"O.1	Find the magnitude of a three-dimensional vector",
-			"O.2	Find the component form of a three-dimensional vector",
-			"O.3	Find a three-dimensional unit vector",
-			"O.4	Add and subtract three-dimensional vectors",
-			"O.5	Scalar multiples of three-dimensional vectors",
-			"O.6	Linear combinations of three-dimensional vectors",
-        ],
-    },
-	"graphs": {
-        "Upper kindergarten skills": [
-            "L.8	Sort shapes into a Venn diagram",
-			"L.9	Count shapes in a Venn diagram",
-			"M.1	Which pictograph is correct?",
-        ],
-        "Class I skills": [
-            "P.1	Which pictograph is correct?",
-			"P.2	Interpret pictographs",
-			"P.3	Which tally chart is correct?",
-			"P.4	Interpret tally charts",
-			"P.5	Which table is correct?",
-			"P.6	Interpret data in tables",
-			"U.1	Sort shapes into a Venn diagram",
-			"U.2	Count shapes in a Venn diagram",
-        ],
-		"Class II Skills": [
-            "N.1	Which tally chart is correct?",
-			"N.2	Interpret tally charts",
-        ],
-		"Class III Skills": [
-            "M.1	Interpret line plots",
-			"M.2	Create line plots",
-			"M.3	Interpret pictographs",
-			"M.4	Create pictographs",
-			"M.5	Sort shapes into a Venn diagram",
-			"M.6	Count shapes in a Venn diagram",
-			"Q.9	Maps",
-			"S.9	Add and subtract data from tables",
-        ],
-		"Class IV skills": [
-            "H.1	Read a table",
-			"H.2	Interpret bar graphs",
-			"H.3	Create bar graphs",
-			"H.4	Interpret line plots",
-			"H.5	Create line plots",
-			"H.6	Frequency charts",
-			"H.7	Interpret stem-and-leaf plots",
-			"H.8	Create stem-and-leaf plots",
-			"H.9	Choose the best type of graph",
-        ],
-		"Class V Skills": [
-            "H.5	Use Venn diagrams to solve problems",
-			"K.1	Read a table",
-			"K.2	Interpret line graphs",
-			"K.3	Create line graphs",
-			"K.4	Interpret bar graphs",
-			"K.5	Create bar graphs",
-			"K.6	Interpret pictographs",
-			"K.7	Create pictographs",
-			"K.8	Interpret histograms",
-			"K.9	Create histograms",
-			"K.10	Interpret line plots",
-			"K.11	Create line plots",
-			"K.12	Frequency charts",
-			"K.13	Interpret stem-and-leaf plots",
-			"K.14	Create stem-and-leaf plots",
-			"K.15	Choose the best type of graph",
-        ],
-		"Class VI Skills": [
-            "S.9	Graph triangles and quadrilaterals",
-			"X.1	Interpret pictographs",
-			"X.2	Create pictographs",
-			"X.3	Interpret stem-and-leaf plots",
-			"X.4	Create stem-and-leaf plots",
-			"X.5	Interpret line plots",
-			"X.6	Create line plots",
-			"X.7	Create frequency tables",
-			"X.8	Interpret bar graphs",
-			"X.9	Create bar graphs",
-			"X.10	Interpret histograms",
-			"X.11	Create histograms",
-			"X.12	Interpret line graphs",
-			"X.13	Create line graphs",
-        ],
-		"Class VII Skills": [
-            "F.4	Fractions: word problems with graphs and tables",
-			"M.4	Use Venn diagrams to solve problems",
-			"R.6	Graph triangles and quadrilaterals",
-			"X.1	Interpret tables",
-			"X.2	Interpret line plots",
-			"X.3	Create line plots",
-			"X.4	Interpret stem-and-leaf plots",
-			"X.5	Create stem-and-leaf plots",
-			"X.6	Interpret bar graphs",
-			"X.7	Create bar graphs",
-			"X.8	Interpret histograms",
-			"X.9	Create histograms",
-			"X.10	Create frequency charts",
-			"X.11	Interpret line graphs",
-			"X.12	Create line graphs",
-			"Y.2	Interpret charts to find mean, median, mode and range",
-        ],
-		"Class VIII Skills": [
-            "I.4	Find the constant of proportionality from a graph",
-			"I.5	Write equations for proportional relationships from graphs",
-			"I.7	Graph proportional relationships",
-			"M.3	Use Venn diagrams to solve problems",
-			"N.1	Points on a coordinate plane",
-			"N.2	Quadrants and axes",
-			"N.3	Follow directions on a coordinate plane",
-			"O.5	Graph triangles and quadrilaterals",
-			"Z.1	Interpret tables",
-			"Z.2	Interpret bar graphs",
-			"Z.3	Create bar graphs",
-			"Z.4	Interpret line graphs",
-			"Z.5	Create line graphs",
-			"Z.6	Interpret line plots",
-			"Z.7	Create line plots",
-			"Z.8	Interpret stem-and-leaf plots",
-			"Z.9	Create stem-and-leaf plots",
-			"Z.10	Interpret histograms",
-			"Z.11	Create histograms",
-			"Z.12	Create frequency charts",
-			"Z.13	Interpret pie charts",
-			"Z.14	Pie charts and central angles",
-			"Z.15	Choose the best type of graph",
-			"AA.2	Interpret charts to find mean, median, mode and range",
-        ],
-		"Class IX Skills": [
-            "A.3	Number lines",
-			"H.2	Graph quadrilaterals",
-			"O.1	Interpret bar graphs, line graphs and histograms",
-			"O.2	Create bar graphs, line graphs and histograms",
-			"O.3	Interpret pie charts",
-			"O.4	Interpret stem-and-leaf plots",
-			"R.1	Coordinate plane review",
-			"R.2	Quadrants and axes",
-			"S.2	Find the constant of variation",
-			"S.3	Graph a proportional relationship",
-			"T.1	Identify linear equations",
-			"T.2	Find the slope of a graph",
-			"T.3	Find the slope from two points",
-			"T.4	Find a missing coordinate using slope",
-			"T.6	Slope-intercept form: graph an equation",
-			"T.7	Slope-intercept form: write an equation from a graph",
-			"T.16	Standard form: graph an equation",
-			"T.18	Graph a horizontal or vertical line",
-			"BB.1	Characteristics of quadratic equations",
-        ],
-		"Class X Skills": [
-            "A.1	Number lines",
-			"D.1	Identify linear equations",
-			"D.2	Find the slope of a graph",
-			"D.3	Find the slope from two points",
-			"D.4	Find a missing coordinate using slope",
-			"D.6	Slope-intercept form: graph an equation",
-			"D.7	Slope-intercept form: write an equation from a graph",
-			"D.15	Standard form: graph an equation",
-			"D.17	Graph a horizontal or vertical line",
-			"E.2	Solve a pair of equations by graphing",
-			"E.3	Solve a pair of equations by graphing: word problems",
-			"E.4	Find the number of solutions to a pair of equations by graphing",
-			"J.1	Characteristics of quadratic equations",
-			"J.11	Match quadratic functions and graphs",
-			"L.7	Midpoint formula",
-			"L.8	Distance formula",
-			"N.1	Translations: find the coordinates",
-			"N.2	Reflections: find the coordinates",
-			"N.3	Rotations: find the coordinates",
-			"N.7	Dilations: graph the image",
-			"N.8	Dilations: find the coordinates",
-			"N.9	Dilations: scale factor and classification",
-			"N.10	Dilations and parallel lines",
-			"Z.1	Interpret histograms",
-			"Z.2	Create histograms",
-			"Z.3	Interpret stem-and-leaf plots",
-        ],
-		"Class XI Skills": [
-            "B.1	Graph inequalities",
-			"B.2	Write inequalities from graphs",
-			"B.7	Graph solutions to one-step linear inequalities",
-			"B.9	Graph solutions to two-step linear inequalities",
-			"B.11	Graph solutions to advanced linear inequalities",
-			"B.12	Graph compound inequalities",
-			"B.13	Write compound inequalities from graphs",
-			"B.15	Graph solutions to compound inequalities",
-			"C.1	Relations: convert between tables, graphs, mappings and lists of points",
-			"C.11	Interpret the graph of a function: word problems",
-			"D.1	Find the slope of a graph",
-			"D.2	Find the slope from two points",
-			"D.3	Find a missing coordinate using slope",
-			"D.5	Slope-intercept form: graph an equation",
-			"D.6	Slope-intercept form: write an equation from a graph",
-			"D.11	Complete a table and graph a linear function",
-			"D.14	Standard form: graph an equation",
-			"D.16	Graph a horizontal or vertical line",
-			"E.3	Graph a linear inequality in the coordinate plane",
-			"G.2	Graph complex numbers",
-			"I.1	Characteristics of quadratic functions",
-			"I.5	Match quadratic functions and graphs",
-			"J.13	Match polynomials and graphs",
-			"K.5	Write equations of parabolas in vertex form from graphs",
-			"K.9	Graph parabolas",
-			"L.3	Write equations of circles in standard form from graphs",
-			"L.7	Graph circles",
-			"M.4	Write equations of ellipses in standard form from graphs",
-			"N.6	Write equations of hyperbolas in standard form from graphs",
-			"O.1	Rational functions: asymptotes and excluded values",
-			"P.1	Graph exponential functions",
-			"P.2	Match exponential functions and graphs",
-			"P.3	Graph logarithmic functions",
-			"T.4	Graph sine functions",
-			"T.8	Graph cosine functions",
-			"T.9	Graph sine and cosine functions",
-        ],
-		"Class XII Skills": [
-            "C.11	Match polynomials and graphs",
-			"H.4	Graph sine functions",
-			"H.8	Graph cosine functions",
-			"H.9	Graph sine and cosine functions",
-			"L.2	Graph complex numbers",
-			"M.5	Match polar equations and graphs",
-			"Y.3	Find the equation of a regression line",
-        ],
-    },
-	"integers": {
-		"Class VI Skills": [
-            "I.1	Understanding integers",
-			"I.2	Integers on number lines",
-			"I.3	Graph integers on horizontal and vertical number lines",
-			"I.4	Compare and order integers",
-			"J.1	Add integers using counters",
-			"J.2	Add integers",
-			"J.3	Subtract integers using counters",
-			"J.4	Subtract integers",
-			"J.5	Add and subtract integers: find the sign",
-			"J.6	Add and subtract integers: input/output tables",
-			"J.7	Add three or more integers",
-			"K.6	Add, subtract, multiply or divide two integers",
-			"N.6	Compare temperatures above and below zero",
-        ],
-		"Class VII Skills": [
-            "B.1	Understanding integers",
-			"B.2	Integers on number lines",
-			"B.3	Graph integers on horizontal and vertical number lines",
-			"B.4	Absolute value and opposite integers",
-			"B.5	Compare and order integers",
-			"C.1	Integer addition and subtraction rules",
-			"C.2	Add and subtract integers using counters",
-			"C.3	Add and subtract integers",
-			"C.4	Complete addition and subtraction sentences with integers",
-			"C.5	Add and subtract integers: word problems",
-			"C.6	Integer multiplication and division rules",
-			"C.7	Multiply and divide integers",
-			"C.8	Complete multiplication and division sentences with integers",
-			"C.9	Evaluate numerical expressions involving integers",
-        ],
-		"Class VIII Skills": [
-            "B.1	Integers on number lines",
-			"B.2	Graph integers on horizontal and vertical number lines",
-			"B.3	Compare and order integers",
-			"C.1	Integer addition and subtraction rules",
-			"C.2	Add and subtract integers using counters",
-			"C.3	Add and subtract integers",
-			"C.4	Add and subtract three or more integers",
-			"C.5	Add and subtract integers: word problems",
-			"C.6	Integer multiplication and division rules",
-			"C.7	Multiply and divide integers",
-			"C.8	Evaluate numerical expressions involving integers",
-			"F.4	Powers with negative bases",
-			"V.6	Evaluate absolute value expressions",
-        ],
-		"Class IX Skills": [
-            "A.3	Number lines",
-			"B.1	Add, subtract, multiply and divide integers",
-			"B.2	Evaluate numerical expressions involving integers",
-			"P.3	Consecutive integer problems",
-			"U.1	Powers with integer bases",
-        ],
-		"Class X Skills": [
-            "A.1	Number lines",
-			"B.1	Add, subtract, multiply and divide integers",
-			"B.2	Evaluate numerical expressions involving integers",
-			"V.1	Consecutive integer problems",
-        ],
-		"Class XI Skills": [
-            "V.3	Consecutive integer problems",
-        ],
-    },
-	"logic and reasoning": {
-		"Lower kindergarten skills": [
-            "G.1	Same",
-			"G.2	Different",
-			"G.3	Same and different",
-        ],
-		"Upper kindergarten skills": [
-            "G.1	Same",
-			"G.2	Different",
-			"G.3	Same and different",
-        ],
-		"Class II Skills": [
-            "Q.1	Guess the number",
-        ],
-		"Class III Skills": [
-            "U.1	Guess the number",
-			"U.2	Largest/smallest number possible",
-			"U.3	Find the order",
-			"U.4	Age puzzles",
-			"U.5	Find two numbers based on sum and difference",
-			"U.6	Find two numbers based on sum, difference, product and quotient",
-        ],
-		"Class IV Skills": [
-            "F.6	Solve word problems using guess-and-check",
-			"G.1	Find two numbers based on sum and difference",
-			"G.2	Find two numbers based on sum, difference, product and quotient",
-			"G.3	Find the order",
-        ],
-		"Class V Skills": [
-            "H.3	Guess-and-check problems",
-			"H.4	Find the order",
-			"H.5	Use Venn diagrams to solve problems",
-        ],
-		"Class VI Skills": [
-            "L.4	Guess-and-check word problems",
-			"L.5	Distance/direction to starting point",
-			"L.6	Use logical reasoning to find the order",
-        ],
-		"Class VII Skills": [
-            "M.3	Guess-and-check word problems",
-			"M.4	Use Venn diagrams to solve problems",
-			"M.5	Find the number of each type of coin",
-        ],
-		"Class VIII Skills": [
-            "M.2	Guess-and-check word problems",
-			"M.3	Use Venn diagrams to solve problems",
-        ],
-		"Class IX Skills": [
-            "Q.1	Identify hypotheses and conclusions",
-			"Q.2	Counterexamples",
-			"B.2	Evaluate numerical expressions involving integers",
-        ],
-		"Class X Skills": [
-            "W.1	Identify hypotheses and conclusions",
-			"W.2	Counterexamples",
-			"W.3	Truth tables",
-			"W.4	Truth values",
-			"W.5	Conditionals",
-			"W.6	Negations",
-			"W.7	Converses, inverses and contrapositives",
-			"W.8	Biconditionals",
-        ],
-		"Class XI Skills": [
-            "W.1	Identify hypotheses and conclusions",
-			"W.2	Counterexamples",
-			"W.3	Truth tables",
-			"W.4	Truth values",
-			"W.5	Conditionals",
-			"W.6	Negations",
-			"W.7	Converses, inverses and contrapositives",
-			"W.8	Biconditionals",
-        ],
-    },
-	"measurement": {
-		"Lower kindergarten skills": [
-            "I.1	Long and short",
-			"I.2	Tall and short",
-			"I.3	Wide and narrow",
-			"I.4	Light and heavy",
-        ],
-		"Upper kindergarten skills": [
-            "O.1	Long and short",
-			"O.2	Tall and short",
-			"O.3	Wide and narrow",
-			"O.4	Light and heavy",
-        ],
-		"Class I Skills": [
-            "Q.1	Long and short",
-			"Q.2	Tall and short",
-			"Q.3	Light and heavy",
-			"Q.4	Compare size and weight",
-        ],
-		"Class II Skills": [
-            "P.1	Long and short",
-			"P.2	Tall and short",
-			"P.3	Light and heavy",
-			"P.4	Holds more or less",
-			"P.5	Compare size, weight and capacity",
-			"P.6	Choose the appropriate measuring tool",
-			"P.7	Measure using objects",
-			"P.8	Measure using a centimetre ruler",
-        ],
-		"Class III Skills": [
-            "P.1	Measure using a centimetre ruler",
-			"P.2	Which metric unit of length is appropriate?",
-			"P.3	Compare and convert metric units of length",
-			"P.4	Conversion tables",
-			"P.5	Metric mixed units",
-			"P.6	Light and heavy",
-			"P.7	Holds more or less",
-			"P.8	Compare weight and capacity",
-			"P.9	Read a thermometer",
-			"P.10	Reasonable temperature",
-        ],
-		"Class IV Skills": [
-            "K.1	Choose the appropriate metric unit of measure",
-			"K.2	Compare and convert metric units of length",
-			"K.3	Compare and convert metric units of mass",
-			"K.4	Compare and convert metric units of volume",
-			"K.5	Metric mixed units",
-        ],
-		"Class V Skills": [
-            "N.1	Choose the appropriate metric unit of measure",
-			"N.2	Compare and convert metric units of length",
-			"N.3	Compare and convert metric units of mass",
-			"N.4	Compare and convert metric units of volume",
-			"N.5	Choose the more reasonable temperature",
-			"N.6	Metric mixed units",
-        ],
-		"Class VI Skills": [
-            "N.1	Estimate metric measurements",
-			"N.2	Convert and compare metric units",
-			"N.3	Metric mixed units",
-			"N.4	Convert square and cubic units of length",
-			"N.5	Convert between cubic metres and litres",
-			"N.6	Compare temperatures above and below zero",
-        ],
-		"Class VII Skills": [
-            "N.1	Estimate metric measurements",
-			"N.2	Compare and convert metric units",
-			"N.3	Metric mixed units",
-			"N.4	Convert square and cubic units of length",
-			"N.5	Convert between cubic metres and litres",
-			"N.6	Precision",
-        ],
-		"Class VIII Skills": [
-            "L.1	Convert rates and measurements: metric units",
-			"L.2	Metric mixed units",
-			"L.3	Convert square and cubic units of length",
-			"L.4	Convert between cubic metres and litres",
-			"L.5	Precision",
-        ],
-		"Class IX Skills": [
-            "E.1	Convert rates and measurements",
-			"E.2	Precision",
-			"E.3	Greatest possible error",
-			"E.4	Minimum and maximum area and volume",
-			"E.5	Percent error",
-			"E.6	Percent error: area and volume",
-        ],
-		"Class X Skills": [
-            "U.1	Convert rates and measurements",
-			"U.2	Precision",
-			"U.3	Greatest possible error",
-			"U.4	Minimum and maximum area and volume",
-			"U.5	Percent error",
-			"U.6	Percent error: area and volume",
-        ],
-    },
-	"money": {
-		"Lower kindergarten skills": [
-            "J.1	Coin values",
-			"J.2	Count 1-rupee coins",
-        ],
-		"Upper kindergarten skills": [
-            "P.1	Coin values",
-			"P.2	Count money - 1-rupee coins only",
-			"P.3	Count money - 1- and 2-rupee coins",
-			"P.4	Count money - 1-, 2- and 5-rupee coins",
-			"P.5	Equivalent groups of coins",
-			"P.6	Compare two groups of coins",
-        ],
-		"Class I Skills": [
-            "R.1	Coin values",
-			"R.2	Count coins",
-			"R.3	Count notes",
-        ],
-		"Class II Skills": [
-            "L.1	Coin values",
-			"L.2	Count money - up to 10 rupees",
-			"L.3	Count money - up to 50 rupees",
-			"L.4	Equivalent amounts of money - up to 10 rupees",
-			"L.5	Equivalent amounts of money - up to 50 rupees",
-			"L.6	Exchanging coins",
-			"L.7	Comparing groups of coins",
-			"L.8	Add and subtract money - word problems - up to 10 rupees",
-			"L.9	Which picture shows more - up to 10 rupees",
-			"L.10	Which picture shows more - up to 50 rupees",
-			"L.11	Least number of coins",
-			"L.12	Purchases - do you have enough money - up to 10 rupees",
-			"L.13	Purchases - do you have enough money - up to 50 rupees",
-			"L.14	Making change",
-        ],
-		"Class III Skills": [
-            "N.1	Count coins and notes - up to 500-rupee note",
-			"N.2	Which picture shows more?",
-			"N.3	Purchases - do you have enough money - up to 1,000 rupees",
-			"N.4	Making change",
-			"N.5	Inequalities with money",
-			"N.6	Put money amounts in order",
-			"N.7	Add and subtract money amounts",
-			"N.8	Add money amounts - word problems",
-			"N.9	Price lists",
-			"T.2	Round money amounts",
-        ],
-		"Class IV Skills": [
-            "J.1	Compare money amounts",
-			"J.2	Round money amounts",
-			"J.3	Add and subtract money amounts",
-			"J.4	Add, subtract, multiply and divide money amounts",
-			"J.5	Making change",
-			"J.6	Price lists",
-			"J.7	Price lists with multiplication",
-			"J.8	Unit prices",
-			"N.5	Use perimeter to determine cost",
-        ],
-		"Class V Skills": [
-            "I.1	Add and subtract money amounts",
-			"I.2	Add and subtract money: word problems",
-			"I.3	Multiply money amounts: word problems",
-			"I.4	Divide money amounts: word problems",
-			"I.5	Price lists",
-			"I.6	Unit prices",
-			"P.6	Use area and perimeter to determine cost",
-        ],
-		"Class VI Skills": [
-            "O.1	Find the number of each type of coin",
-			"O.2	Add and subtract money amounts",
-			"O.3	Add and subtract money amounts: word problems",
-			"O.4	Multiply money: word problems",
-			"O.5	Divide money amounts",
-			"O.6	Divide money amounts: word problems",
-			"W.7	Use area and perimeter to determine cost",
-        ],
-		"Class VII Skills": [
-            "K.5	Percents of numbers and money amounts",
-			"L.1	Add, subtract, multiply and divide money amounts: word problems",
-			"L.2	Price lists",
-			"L.3	Unit prices",
-			"L.4	Unit prices: find the total price",
-			"L.5	Percent of a number, discount and more",
-			"L.6	Find the percent: discount and mark-up",
-			"L.7	Sale prices: find the original price",
-			"L.8	Multi-step problems with percents",
-			"L.9	Estimate tips",
-			"L.10	Simple interest",
-			"M.5	Find the number of each type of coin",
-        ],
-		"Class VIII Skills": [
-            "J.6	Percents of numbers and money amounts",
-			"K.1	Price lists",
-			"K.2	Unit prices",
-			"K.3	Unit prices: find the total price",
-			"K.4	Percent of a number: VAT, discount and more",
-			"K.5	Find the percent: discount and mark-up",
-			"K.6	Sale prices: find the original price",
-			"K.7	Multi-step problems with percents",
-			"K.8	Estimate tips",
-			"K.9	Simple interest",
-			"K.10	Compound interest",
-        ],
-		"Class IX Skills": [
-            "C.4	Unit prices",
-			"D.2	Solve percent equations",
-			"D.6	Percent of a number: VAT, discount and more",
-			"D.7	Find the percent: discount and mark-up",
-			"D.8	Multi-step problems with percents",
-			"P.2	Word problems with money",
-        ],
-		"Class X Skills": [
-            "C.1	Simple interest",
-			"C.2	Compound interest",
-			"C.3	Percent of a number: VAT, discount and more",
-			"C.4	Find the percent: discount and mark-up",
-			"C.5	Multi-step problems with percents",
-        ],
-		"Class XI Skills": [
-            "A.1	Simple interest",
-			"A.2	Compound interest",
-			"A.4	Percent of a number: VAT, discount and more",
-			"A.5	Find the percent: discount and mark-up",
-			"A.6	Multi-step problems with percents",
-			"V.2	Word problems with mon",
-        ],
-    },
-	"mixed operations": {
-		"Upper kindergarten skills": [
-            "S.1	Sum and difference",
-        ],
-		"Class I Skills": [
-            "W.1	Addition and subtraction - ways to make a number",
-			"W.2	Which sign makes the number sentence true?",
-			"W.3	Fact families",
-			"W.4	Addition and subtraction facts - numbers up to 10",
-			"W.5	Addition and subtraction facts - numbers up to 18",
-			"W.6	Addition and subtraction word problems",
-			"W.7	Addition and subtraction terms",
-        ],
-		"Class II Skills": [
-            "I.3	Fact families",
-			"I.4	Addition and subtraction terms",
-			"L.8	Add and subtract money - word problems - up to 10 rupees",
-			"S.1	Add and subtract numbers up to 20",
-			"S.2	Addition and subtraction - ways to make a number - up to 20",
-			"S.3	Addition and subtraction word problems - up to 20",
-			"S.4	Addition and subtraction - balance equations - up to 20",
-			"S.5	Write the addition or subtraction rule for an input/output table - up to 20",
-			"S.6	Add and subtract numbers up to 100",
-			"S.7	Addition and subtraction - ways to make a number - up to 100",
-			"S.8	Addition and subtraction word problems - up to 100",
-			"S.9	Addition and subtraction - balance equations - up to 100",
-			"S.10	Write the addition or subtraction rule for an input/output table - up to 100",
-			"S.11	Which sign (+ or -) makes the number sentence true? - up to 100",
-			"S.12	Write addition and subtraction sentences",
-        ],
-		"Class III Skills": [
-            "N.7	Add and subtract money amounts",
-			"N.9	Price lists",
-			"R.1	Addition, subtraction, multiplication and division terms",
-			"R.2	Understanding parentheses",
-			"R.9	Relate addition and multiplication",
-			"R.10	Relate multiplication and division",
-			"S.1	Addition, subtraction, multiplication and division facts",
-			"S.2	Complete the addition, subtraction, multiplication or division sentence",
-			"S.3	Multiplication and division facts up to 5: true or false?",
-			"S.4	Multiplication and division facts up to 10: true or false?",
-			"S.5	Multiplication and division facts up to 12: true or false?",
-			"S.6	Multiplication and division sentences up to 12: true or false?",
-			"S.7	Add, subtract, multiply and divide",
-			"S.8	Addition, subtraction, multiplication and division word problems",
-			"S.9	Add and subtract data from tables",
-			"S.10	Multi-step word problems",
-			"S.11	Missing operators",
-			"T.10	Estimate sums, differences and products: word problems",
-        ],
-		"Class IV Skills": [
-            "F.1	Add, subtract, multiply and divide",
-			"F.2	Addition, subtraction, multiplication and division word problems",
-			"F.3	Estimate sums, differences, products and quotients: word problems",
-			"F.4	Multi-step word problems",
-			"F.5	Word problems with extra or missing information",
-			"F.6	Solve word problems using guess-and-check",
-			"F.7	Choose numbers with a particular sum, difference, product or quotient",
-			"F.8	Mentally add and subtract numbers ending in zeroes",
-			"J.3	Add and subtract money amounts",
-			"J.4	Add, subtract, multiply and divide money amounts",
-			"J.6	Price lists",
-        ],
-		"Class V Skills": [
-            "A.6	Even or odd: arithmetic rules",
-			"B.1	Add and subtract whole numbers",
-			"B.2	Add and subtract whole numbers: word problems",
-			"B.3	Complete addition and subtraction sentences",
-			"B.4	Fill in the missing digits",
-			"B.5	Choose numbers with a particular sum or difference",
-			"B.7	Estimate sums and differences of whole numbers",
-			"B.8	Estimate sums and differences: word problems",
-			"G.1	Add, subtract, multiply and divide whole numbers",
-			"G.2	Add, subtract, multiply and divide whole numbers: word problems",
-			"H.1	Multi-step word problems",
-			"I.1	Add and subtract money amounts",
-			"I.2	Add and subtract money: word problems",
-			"I.5	Price lists",
-        ],
-		"Class VI Skills": [
-            "A.4	Add and subtract whole numbers",
-			"A.5	Add and subtract whole numbers: word problems",
-			"F.1	Add and subtract decimal numbers",
-			"F.2	Add and subtract decimals: word problems",
-			"F.3	Estimate sums and differences of decimals",
-			"F.4	Maps with decimal distances",
-			"H.1	Add and subtract fractions with like denominators",
-			"H.2	Add and subtract fractions with like denominators: word problems",
-			"H.3	Add and subtract fractions with unlike denominators",
-			"H.4	Add and subtract fractions with unlike denominators: word problems",
-			"H.5	Inequalities with addition and subtraction of like and unlike fractions",
-			"H.6	Add and subtract mixed numbers",
-			"H.7	Add and subtract mixed numbers: word problems",
-			"H.8	Estimate sums and differences of mixed numbers",
-			"J.5	Add and subtract integers: find the sign",
-			"J.6	Add and subtract integers: input/output tables",
-			"K.1	Add, subtract, multiply or divide two whole numbers",
-			"K.2	Add, subtract, multiply or divide two whole numbers: word problems",
-			"K.3	Evaluate numerical expressions",
-			"K.4	Add and subtract decimals or fractions",
-			"K.5	Add and subtract decimals or fractions: word problems",
-			"K.6	Add, subtract, multiply or divide two integers",
-			"L.2	Multi-step word problems",
-			"L.3	Word problems with extra or missing information",
-			"O.2	Add and subtract money amounts",
-			"O.3	Add and subtract money amounts: word problems",
-        ],
-		"Class VII Skills": [
-            "C.1	Integer addition and subtraction rules",
-			"C.2	Add and subtract integers using counters",
-			"C.3	Add and subtract integers",
-			"C.4	Complete addition and subtraction sentences with integers",
-			"C.5	Add and subtract integers: word problems",
-			"C.6	Integer multiplication and division rules",
-			"C.7	Multiply and divide integers",
-			"C.8	Complete multiplication and division sentences with integers",
-			"C.9	Evaluate numerical expressions involving integers",
-			"E.1	Add and subtract decimals",
-			"E.2	Add and subtract decimals: word problems",
-			"E.7	Estimate sums, differences and products of decimals",
-			"E.8	Add, subtract, multiply and divide decimals: word problems",
-			"E.9	Multi-step inequalities with decimals",
-			"E.10	Maps with decimal distances",
-			"E.11	Evaluate numerical expressions involving decimals",
-			"G.1	Add and subtract fractions",
-			"G.2	Add and subtract fractions: word problems",
-			"G.3	Add and subtract mixed numbers",
-			"G.4	Add and subtract mixed numbers: word problems",
-			"G.5	Inequalities with addition and subtraction of fractions and mixed numbers",
-			"G.6	Estimate sums and differences of mixed numbers",
-			"G.16	Estimate products and quotients of fractions and mixed numbers",
-			"G.17	Add, subtract, multiply and divide fractions and mixed numbers: word problems",
-			"G.18	Evaluate numerical expressions involving fractions",
-			"H.5	Add and subtract rational numbers",
-			"H.6	Apply addition and subtraction rules",
-			"H.7	Multiply and divide rational numbers",
-			"H.8	Apply multiplication and division rules",
-			"I.6	Evaluate numerical expressions involving exponents",
-			"L.1	Add, subtract, multiply and divide money amounts: word problems",
-			"L.2	Price lists",
-			"L.4	Unit prices: find the total price",
-			"M.1	Estimate to solve word problems",
-        ],
-		"Class VIII Skills": [
-            "C.1	Integer addition and subtraction rules",
-			"C.2	Add and subtract integers using counters",
-			"C.3	Add and subtract integers",
-			"C.4	Add and subtract three or more integers",
-			"C.5	Add and subtract integers: word problems",
-			"C.6	Integer multiplication and division rules",
-			"C.7	Multiply and divide integers",
-			"C.8	Evaluate numerical expressions involving integers",
-			"E.2	Add and subtract rational numbers",
-			"E.3	Add and subtract rational numbers: word problems",
-			"E.4	Apply addition and subtraction rules",
-			"E.5	Multiply and divide rational numbers",
-			"E.6	Multiply and divide rational numbers: word problems",
-			"E.7	Apply multiplication and division rules",
-			"E.8	Apply addition, subtraction, multiplication and division rules",
-			"E.9	Evaluate numerical expressions involving rational numbers",
-			"F.12	Evaluate expressions using properties of exponents",
-			"K.1	Price lists",
-			"K.3	Unit prices: find the total price",
-        ],
-		"Class IX Skills": [
-            "B.1	Add, subtract, multiply and divide integers",
-			"B.2	Evaluate numerical expressions involving integers",
-			"B.4	Add and subtract rational numbers",
-			"B.5	Multiply and divide rational numbers",
-			"B.6	Evaluate numerical expressions involving rational numbers",
-			"P.1	Word problems: mixed review",
-			"P.2	Word problems with money",
-			"U.8	Evaluate expressions using properties of exponents",
-			"DD.3	Multiply and divide rational expressions",
-			"DD.5	Add and subtract rational expressions",
-        ],
-		"Class X Skills": [
-            "B.1	Add, subtract, multiply and divide integers",
-			"B.2	Evaluate numerical expressions involving integers",
-			"B.4	Add and subtract rational numbers",
-			"B.5	Multiply and divide rational numbers",
-			"B.6	Evaluate numerical expressions involving rational numbers",
-			"K.3	Multiply and divide rational expressions",
-			"K.5	Add and subtract rational expressions",
-        ],
-		"Class XI Skills": [
-            "O.5	Multiply and divide rational expressions",
-			"O.6	Add and subtract rational expressions",
-			"V.1	Word problems: mixed review",
-			"V.2	Word problems with money",
-        ],
-    },
-	"multiplication": {
-		"Class III Skills": [
-            "E.1	Count equal groups",
-			"E.2	Identify multiplication expressions for equal groups",
-			"E.3	Write multiplication sentences for equal groups",
-			"E.4	Relate addition and multiplication for equal groups",
-			"E.5	Identify multiplication expressions for arrays",
-			"E.6	Write multiplication sentences for arrays",
-			"E.7	Make arrays to model multiplication",
-			"E.8	Write multiplication sentences for number lines",
-			"F.1	Multiply by 0",
-			"F.2	Multiply by 1",
-			"F.3	Multiply by 2",
-			"F.4	Multiply by 3",
-			"F.5	Multiply by 4",
-			"F.6	Multiply by 5",
-			"F.7	Multiply by 6",
-			"F.8	Multiply by 7",
-			"F.9	Multiply by 8",
-			"F.10	Multiply by 9",
-			"F.11	Multiply by 10",
-			"G.1	Multiplication facts for 2, 3, 4, 5 and 10",
-			"G.2	Multiplication facts for 2, 3, 4, 5, 10: true or false?",
-			"G.3	Multiplication facts for 2, 3, 4, 5, 10: sorting",
-			"G.4	Multiplication facts for 6, 7, 8 and 9",
-			"G.5	Multiplication facts for 6, 7, 8, 9: true or false?",
-			"G.6	Multiplication facts for 6, 7, 8, 9: sorting",
-			"G.7	Multiplication facts up to 10",
-			"G.8	Multiplication facts up to 10: true or false?",
-			"G.9	Multiplication facts up to 10: sorting",
-			"G.10	Multiplication sentences up to 10: true or false?",
-			"G.11	Multiplication facts up to 10: find the missing factor",
-			"G.12	Multiplication facts up to 10: select the missing factors",
-			"G.13	Squares up to 10 x 10",
-			"H.1	Multiplication sentences",
-			"H.2	Multiply numbers ending in zeroes",
-			"H.3	Multiplication input/output tables",
-			"H.4	Multiplication word problems",
-			"H.5	Multiplication word problems: find the missing factor",
-			"H.6	Multiply one-digit numbers by two-digit numbers",
-			"H.7	Multiply one-digit numbers by two-digit numbers: word problems",
-			"H.8	Multiply one-digit numbers by three-digit numbers",
-			"H.9	Multiply one-digit numbers by three-digit numbers: word problems",
-			"H.10	Box multiplication",
-			"H.11	Lattice multiplication",
-			"R.5	Properties of multiplication",
-			"R.6	Solve using properties of multiplication",
-			"R.8	Multiply using the distributive property",
-			"R.9	Relate addition and multiplication",
-			"R.10	Relate multiplication and division",
-			"S.3	Multiplication and division facts up to 5: true or false?",
-			"S.4	Multiplication and division facts up to 10: true or false?",
-			"S.5	Multiplication and division facts up to 12: true or false?",
-			"S.6	Multiplication and division sentences up to 12: true or false?",
-			"T.8	Estimate products",
-			"T.9	Estimate products: word problems",
-        ],
-		"Class IV Skills": [
-            "D.1	Multiplication facts to 10",
-			"D.2	Multiplication facts up to 10: find the missing factor",
-			"D.3	Compare numbers using multiplication",
-			"D.4	Multiply 1-digit numbers by 2-digit numbers",
-			"D.5	Multiply 1-digit numbers by 3-digit or 4-digit numbers",
-			"D.6	Multiply 1-digit numbers by larger numbers",
-			"D.7	Multiplication patterns over increasing place values",
-			"D.8	Properties of multiplication",
-			"D.9	Estimate products - multiply by 1-digit numbers",
-			"D.10	Estimate products - multiply by larger numbers",
-			"D.11	Estimate products: word problems",
-			"D.12	Box multiplication",
-			"D.13	Lattice multiplication",
-			"D.14	Multiply a two-digit number by a two-digit number: complete the missing steps",
-			"D.15	Multiply a two-digit number by a two-digit number",
-			"D.16	Multiply a two-digit number by a two-digit number: word problems",
-			"D.17	Choose numbers with a particular product",
-			"D.18	Multiply a two-digit number by a three-digit number: complete the missing steps",
-			"D.19	Multiply a two-digit number by a three-digit number",
-			"D.20	Multiply a two-digit number by a three-digit number: word problems",
-			"D.21	Multiply numbers ending in zeroes",
-			"D.22	Multiply numbers ending in zeroes: word problems",
-			"D.23	Multiply three numbers",
-			"J.7	Price lists with multiplication",
-        ],
-		"Class V Skills": [
-            "C.1	Multiply by one-digit numbers",
-			"C.2	Multiply by one-digit numbers: word problems",
-			"C.3	Multiplication patterns over increasing place values",
-			"C.4	Multiply numbers ending in zeroes",
-			"C.5	Multiply numbers ending in zeroes: word problems",
-			"C.6	Properties of multiplication",
-			"C.7	Choose numbers with a particular product",
-			"C.8	Estimate products",
-			"C.9	Estimate products: word problems",
-			"C.10	Box multiplication",
-			"C.11	Lattice multiplication",
-			"C.12	Multiply by 2-digit numbers: complete the missing steps",
-			"C.13	Multiply 2-digit numbers by 2-digit numbers",
-			"C.14	Multiply 2-digit numbers by 3-digit numbers",
-			"C.15	Multiply 2-digit numbers by larger numbers",
-			"C.16	Multiply by 2-digit numbers: word problems",
-			"C.17	Multiply three or four numbers",
-			"C.18	Multiply three or four numbers: word problems",
-			"I.3	Multiply money amounts: word problems",
-        ],
-		"Class VI Skills": [
-            "B.1	Multiply whole numbers",
-			"B.2	Multiply whole numbers: word problems",
-			"B.3	Multiply numbers ending in zeroes",
-			"B.4	Multiply numbers ending in zeroes: word problems",
-			"B.5	Multiply three or more numbers",
-			"B.6	Multiply three or more numbers: word problems",
-			"B.7	Estimate products",
-			"O.4	Multiply money: word problems",
-			"Q.3	Properties of addition and multiplication",
-			"Q.7	Properties of multiplication",
-			"Q.8	Solve for a variable using properties of multiplication",
-        ],
-		"Class VII Skills": [
-            "A.3	Multiplicative inverses",
-			"C.6	Integer multiplication and division rules",
-			"C.7	Multiply and divide integers",
-			"C.8	Complete multiplication and division sentences with integers",
-			"E.3	Multiply decimals",
-			"E.4	Multiply decimals and whole numbers: word problems",
-			"G.7	Multiply fractions and whole numbers",
-			"G.8	Multiply two fractions using models",
-			"G.9	Multiply fractions",
-			"G.10	Multiply mixed numbers",
-			"G.11	Multiply fractions and mixed numbers: word problems",
-			"G.16	Estimate products and quotients of fractions and mixed numbers",
-			"H.7	Multiply and divide rational numbers",
-			"H.8	Apply multiplication and division rules",
-			"P.9	Properties of addition and multiplication",
-        ],
-		"Class VIII Skills": [
-            "C.6	Integer multiplication and division rules",
-			"C.7	Multiply and divide integers",
-			"E.1	Reciprocals and multiplicative inverses",
-			"E.5	Multiply and divide rational numbers",
-			"E.6	Multiply and divide rational numbers: word problems",
-			"E.7	Apply multiplication and division rules",
-			"E.8	Apply addition, subtraction, multiplication and division rules",
-			"G.3	Multiply numbers written in scientific notation",
-			"V.11	Properties of addition and multiplication",
-        ],
-		"Class IX Skills": [
-            "B.5	Multiply and divide rational numbers",
-			"X.3	Multiply numbers written in scientific notation",
-			"CC.10	Simplify radical expressions using the distributive property",
-			"DD.3	Multiply and divide rational expressions",
-        ],
-		"Class X Skills": [
-            "B.5	Multiply and divide rational numbers",
-			"K.3	Multiply and divide rational expressions",
-        ],
-		"Class XI Skills": [
-            "O.5	Multiply and divide rational expressions",
-        ],
-    },
-	"number theory": {
-		"Class I Skills": [
-            "A.14	Identify numbers as even or odd",
-			"A.16	Which even or odd number comes before or after?",
-        ],
-		"Class II Skills": [
-            "A.7	Identify numbers as even or odd",
-			"A.8	Select even or odd numbers",
-			"A.10	Which even or odd number comes before or after?",
-			"Q.1	Guess the number",
-        ],
-		"Class III Skills": [
-            "A.1	Even or odd",
-			"A.2	Even or odd: arithmetic rules",
-			"L.4	Divisibility rules for 2, 5 and 10",
-			"U.1	Guess the number",
-        ],
-		"Class IV Skills": [
-            "A.6	Even or odd: arithmetic rules",
-			"E.11	Divisibility rules",
-			"E.12	Divisibility rules: word problems",
-        ],
-		"Class V Skills": [
-            "A.6	Even or odd: arithmetic rules",
-			"D.3	Divisibility rules",
-			"D.4	Divisibility rules: word problems",
-        ],
-		"Class VI Skills": [
-            "C.1	Divisibility rules",
-			"D.1	Prime or composite",
-			"D.2	Identify factors",
-			"D.3	Prime factorisation",
-			"D.4	Prime factorisation with exponents",
-			"D.5	Highest common factor",
-			"D.6	Lowest common multiple",
-			"D.7	HCF and LCM: word problems",
-        ],
-		"Class VII Skills": [
-            "A.1	Prime or composite",
-			"A.2	Prime factorisation",
-			"A.3	Multiplicative inverses",
-			"A.4	Divisibility rules",
-			"A.5	Highest common factor",
-			"A.6	Lowest common multiple",
-			"A.7	HCF and LCM: word problems",
-			"A.10	Classify numbers",
-			"H.1	Identify rational numbers",
-			"P.8	Sort factors of expression",
-        ],
-		"Class VIII Skills": [
-            "A.1	Factors",
-			"A.2	Divisibility rules",
-			"A.3	Prime or composite",
-			"A.4	Prime factorisation",
-			"A.5	Highest common factor",
-			"A.6	Lowest common multiple",
-			"A.7	HCF and LCM: word problems",
-			"A.8	Classify numbers",
-			"D.1	Identify rational and irrational numbers",
-			"E.1	Reciprocals and multiplicative inverses",
-			"V.10	Sort factors of expressions",
-        ],
-		"Class IX Skills": [
-            "A.1	Classify numbers",
-        ],
-		"Class X Skills": [
-            "A.3	Identify rational and irrational numbers",
-			"A.5	Prime factorisation",
-        ],
-    },
-	"patterns": {
-		"Lower kindergarten skills": [
-            "H.1	Colour patterns",
-			"H.2	Size patterns",
-			"H.3	Shape patterns",
-			"H.4	What comes next?",
-        ],
-		"Upper kindergarten skills": [
-            "C.20	Complete a sequence - up to 10",
-			"D.11	Complete a sequence - up to 20",
-			"F.1	Colour patterns",
-			"F.2	Size patterns",
-			"F.3	Shape patterns",
-			"F.4	Find the next shape in a pattern",
-			"F.5	Complete a pattern",
-			"F.6	Growing patterns",
-			"F.7	Find the next shape in a growing pattern",
-			"F.8	Find the next row in a growing pattern",
-        ],
-		"Class I Skills": [
-            "A.17	Skip-counting patterns - with tables",
-			"A.18	Sequences - count up and down by 1, 2, 3, 5 and 10",
-			"A.19	Sequences - count up and down by 100",
-			"S.1	Introduction to patterns",
-			"S.2	Find the next shape in a pattern",
-			"S.3	Complete a pattern",
-			"S.4	Make a pattern",
-			"S.5	Growing patterns",
-			"S.6	Find the next shape in a growing pattern",
-			"S.7	Find the next row in a growing pattern",
-        ],
-		"Class II Skills": [
-            "A.2	Skip-counting sequences",
-			"A.3	Counting patterns - up to 100",
-			"A.11	Skip-counting stories",
-			"A.12	Skip-counting puzzles",
-			"D.1	Repeating patterns",
-			"D.2	Growing patterns",
-			"D.3	Find the next shape in a pattern",
-			"D.4	Complete a repeating pattern",
-			"D.5	Make a repeating pattern",
-			"D.6	Find the next row in a growing pattern",
-        ],
-		"Class III Skills": [
-            "A.3	Skip-counting puzzles",
-			"A.4	Number sequences",
-			"C.8	Addition patterns over increasing place values",
-			"D.6	Subtraction patterns over increasing place values",
-			"V.1	Repeating patterns",
-			"V.2	Growing patterns",
-			"V.3	Find the next shape in a pattern",
-			"V.4	Complete a repeating pattern",
-			"V.5	Make a repeating pattern",
-			"V.6	Find the next row in a growing pattern",
-        ],
-		"Class IV Skills": [
-            "B.6	Addition patterns over increasing place values",
-			"C.4	Subtraction patterns over increasing place values",
-			"D.7	Multiplication patterns over increasing place values",
-			"E.13	Division patterns over increasing place values",
-			"I.1	Complete an increasing number pattern",
-			"I.2	Complete a geometric number pattern",
-			"I.3	Number patterns: word problems",
-			"I.4	Number patterns: mixed review",
-			"L.9	Time patterns",
-        ],
-		"Class V Skills": [
-            "A.6	Even or odd: arithmetic rules",
-			"C.3	Multiplication patterns over increasing place values",
-			"D.9	Division patterns over increasing place values",
-			"F.8	Patterns of equivalent fractions",
-			"J.1	Complete an increasing number sequence",
-			"J.2	Complete a geometric number sequence",
-			"J.3	Use a rule to complete a number sequence",
-			"J.4	Number sequences: word problems",
-			"J.5	Number sequences: mixed review",
-			"M.8	Time patterns",
-        ],
-		"Class VII Skills": [
-            "O.1	Identify arithmetic and geometric sequences",
-			"O.2	Arithmetic sequences",
-			"O.3	Geometric sequences",
-			"O.4	Number sequences: mixed review",
-			"O.5	Number sequences: word problems",
-			"O.6	Evaluate variable expressions for number sequences",
-			"O.7	Write variable expressions for arithmetic sequences",
-        ],
-		"Class VIII Skills": [
-            "U.1	Identify arithmetic and geometric sequences",
-			"U.2	Arithmetic sequences",
-			"U.3	Geometric sequences",
-			"U.4	Number sequences: mixed review",
-			"U.5	Number sequences: word problems",
-			"U.6	Evaluate variable expressions for number sequences",
-			"U.7	Write variable expressions for arithmetic sequences",
-        ],
-		"Class X Skills": [
-            "G.1	Arithmetic sequences",
-			"G.2	Evaluate variable expressions for arithmetic sequences",
-			"G.3	Write variable expressions for arithmetic sequences",
-			"G.4	Partial sums of arithmetic series",
-        ],
-		"Class XI Skills": [
-            "X.1	Classify formulas and sequences",
-			"X.2	Find terms of an arithmetic sequence",
-			"X.3	Find terms of a geometric sequence",
-			"X.4	Find terms of a recursive sequence",
-			"X.5	Evaluate formulas for sequences",
-			"X.6	Write a formula for an arithmetic sequence",
-			"X.7	Write a formula for a geometric sequence",
-			"X.8	Write a formula for a recursive sequence",
-			"X.9	Sequences: mixed review",
-			"X.10	Introduction to sigma notation",
-			"X.11	Identify arithmetic and geometric series",
-			"X.12	Find the sum of a finite arithmetic or geometric series",
-			"X.13	Introduction to partial sums",
-			"X.14	Partial sums of arithmetic series",
-			"X.15	Partial sums of geometric series",
-			"X.16	Partial sums: mixed review",
-			"X.17	Convergent and divergent geometric series",
-			"X.18	Find the value of an infinite geometric series",
-			"X.19	Write a repeating decimal as a fraction",
-        ],
-		"Class XII Skills": [
-            "P.1	Find terms of a sequence",
-			"P.2	Find terms of a recursive sequence",
-			"P.3	Identify a sequence as explicit or recursive",
-			"P.4	Find a recursive formula",
-			"P.5	Find recursive and explicit formulas",
-			"P.6	Convert a recursive formula to an explicit formula",
-			"P.7	Convert an explicit formula to a recursive formula",
-			"P.8	Convert between explicit and recursive formulas",
-			"P.9	Introduction to sigma notation",
-			"P.10	Identify arithmetic and geometric series",
-			"P.11	Find the sum of a finite arithmetic or geometric series",
-			"P.12	Introduction to partial sums",
-			"P.13	Partial sums of arithmetic series",
-			"P.14	Partial sums of geometric series",
-			"P.15	Partial sums: mixed review",
-			"P.16	Convergent and divergent geometric series",
-			"P.17	Find the value of an infinite geometric series",
-			"P.18	Write a repeating decimal as a fraction",
-			"V.4	Find higher derivatives using patterns",
-        ],
-    },
-	"percentages": {
-		"Class VII Skills": [
-            "K.1	What percentage is illustrated?",
-			"K.2	Convert between percents, fractions and decimals",
-			"K.3	Compare percents to fractions and decimals",
-			"K.4	Estimate percents of numbers",
-			"K.5	Percents of numbers and money amounts",
-			"K.6	Percents of numbers: word problems",
-			"K.7	Solve percent equations",
-			"K.8	Solve percent equations: word problems",
-			"L.5	Percent of a number, discount and more",
-			"L.6	Find the percent: discount and mark-up",
-			"L.7	Sale prices: find the original price",
-			"L.8	Multi-step problems with percents",
-			"L.9	Estimate tips",
-			"L.10	Simple interest",
-        ],
-		"Class VIII Skills": [
-            "J.1	Convert between percents, fractions and decimals",
-			"J.2	Compare percents to fractions and decimals",
-			"J.3	Find what percent one number is of another",
-			"J.4	Find what percent one number is of another: word problems",
-			"J.5	Estimate percents of numbers",
-			"J.6	Percents of numbers and money amounts",
-			"J.7	Percents of numbers: word problems",
-			"J.8	Compare percents of numbers",
-			"J.9	Solve percent equations",
-			"J.10	Percent of change",
-			"J.11	Percent of change: word problems",
-			"K.4	Percent of a number: VAT, discount and more",
-			"K.5	Find the percent: discount and mark-up",
-			"K.6	Sale prices: find the original price",
-			"K.7	Multi-step problems with percents",
-			"K.8	Estimate tips",
-			"K.9	Simple interest",
-			"K.10	Compound interest",
-        ],
-		"Class IX Skills": [
-            "D.1	Convert between percents, fractions and decimals",
-			"D.2	Solve percent equations",
-			"D.3	Percent word problems",
-			"D.4	Percent of change",
-			"D.5	Percent of change: word problems",
-			"D.6	Percent of a number: VAT, discount and more",
-			"D.7	Find the percent: discount and mark-up",
-			"D.8	Multi-step problems with percents",
-			"E.5	Percent error",
-			"E.6	Percent error: area and volume",
-        ],
-		"Class X Skills": [
-            "C.1	Simple interest",
-			"C.2	Compound interest",
-			"C.3	Percent of a number: VAT, discount and more",
-			"C.4	Find the percent: discount and mark-up",
-			"C.5	Multi-step problems with percents",
-			"U.5	Percent error",
-			"U.6	Percent error: area and volume",
-        ],
-		"Class XI Skills": [
-            "A.1	Simple interest",
-			"A.2	Compound interest",
-			"A.4	Percent of a number: VAT, discount and more",
-			"A.5	Find the percent: discount and mark-up",
-			"A.6	Multi-step problems with percents",
-        ],
-    },
-	"probability and statistics": {
-		"Upper kindergarten skills": [
-            "N.1	More or less likely",
-        ],
-		"Class I Skills": [
-            "T.1	More, less and equally likely",
-			"T.2	Certain, probable, unlikely and impossible",
-        ],
-		"Class II Skills": [
-            "R.1	More, less and equally likely",
-			"R.2	Certain, probable, unlikely and impossible",
-        ],
-		"Class III Skills": [
-            "W.1	More, less and equally likely",
-			"W.2	Certain, probable, unlikely and impossible",
-			"W.3	Combinations",
-        ],
-		"Class IV Skills": [
-            "P.1	Understanding probability",
-			"P.2	Find the probability",
-			"P.3	Make predictions",
-			"P.4	Combinations",
-        ],
-		"Class V Skills": [
-            "L.1	Understanding probability",
-			"L.2	Find the probability",
-			"L.3	Make predictions",
-			"L.4	Combinations",
-        ],
-		"Class VI Skills": [
-            "Y.1	Combinations",
-			"Y.2	Make predictions",
-			"Y.3	Compound events - find the number of outcomes by counting",
-        ],
-		"Class VII Skills": [
-            "Y.1	Calculate mean, median, mode and range",
-			"Y.2	Interpret charts to find mean, median, mode and range",
-			"Y.3	Mean, median, mode and range: find the missing number",
-			"Y.4	Changes in mean, median, mode and range",
-			"Z.1	Probability of simple events",
-			"Z.2	Probability of opposite, mutually exclusive and overlapping events",
-			"Z.3	Experimental probability",
-			"Z.4	Make predictions",
-			"Z.5	Compound events: find the number of outcomes",
-			"Z.6	Counting principle",
-        ],
-		"Class VIII Skills": [
-            "AA.1	Calculate mean, median, mode and range",
-			"AA.2	Interpret charts to find mean, median, mode and range",
-			"AA.3	Mean, median, mode and range: find the missing number",
-			"AA.4	Changes in mean, median, mode and range",
-			"BB.1	Probability of simple events",
-			"BB.2	Probability of opposite, mutually exclusive and overlapping events",
-			"BB.3	Experimental probability",
-			"BB.4	Make predictions",
-			"BB.5	Compound events: find the number of outcomes",
-			"BB.6	Counting principle",
-        ],
-		"Class IX Skills": [
-            "EE.1	Theoretical probability",
-			"EE.2	Experimental probability",
-			"EE.3	Compound events: find the number of outcomes",
-			"EE.4	Identify independent and dependent events",
-			"EE.5	Probability of independent and dependent events",
-			"EE.6	Factorials",
-			"EE.7	Counting principle",
-			"FF.1	Mean, median, mode and range",
-			"FF.2	Quartiles",
-			"FF.3	Identify biased samples",
-			"FF.4	Variance and standard deviation",
-        ],
-		"Class X Skills": [
-            "X.1	Theoretical probability",
-			"X.2	Experimental probability",
-			"X.3	Compound events: find the number of outcomes",
-			"X.4	Identify independent and dependent events",
-			"X.5	Probability of independent and dependent events",
-			"X.6	Geometric probability",
-			"X.7	Counting principle",
-			"Y.1	Mean, median, mode and range",
-			"Y.2	Quartiles",
-			"Y.3	Identify biased samples",
-        ],
-		"Class XI Skills": [
-            "FF.1	Introduction to probability",
-			"FF.2	Theoretical and experimental probability",
-			"FF.3	Compound events: find the number of outcomes",
-			"FF.4	Calculate probabilities of events",
-			"FF.5	Permutations",
-			"FF.6	Counting principle",
-			"FF.7	Permutation and combination notation",
-			"FF.8	Find probabilities using permutations and combinations",
-			"FF.9	Find probabilities using two-way frequency tables",
-			"FF.10	Identify independent events",
-			"FF.11	Probability of independent and dependent events",
-			"FF.12	Geometric probability",
-			"FF.13	Find conditional probabilities",
-			"FF.14	Independence and conditional probability",
-			"FF.15	Find conditional probabilities using two-way frequency tables",
-			"FF.16	Find probabilities using the addition rule",
-			"FF.17	Find probabilities using the normal distribution",
-			"GG.1	Mean, median, mode and range",
-			"GG.2	Quartiles",
-			"GG.3	Identify biased samples",
-			"GG.4	Mean absolute deviation",
-			"GG.5	Variance and standard deviation",
-        ],
-		"Class XII Skills": [
-            "W.1	Introduction to probability",
-			"W.2	Calculate probabilities of events",
-			"W.3	Combinations and permutations",
-			"W.4	Find probabilities using combinations and permutations",
-			"W.5	Find probabilities using two-way frequency tables",
-			"W.6	Identify independent events",
-			"W.7	Find conditional probabilities",
-			"W.8	Independence and conditional probability",
-			"W.9	Find conditional probabilities using two-way frequency tables",
-			"W.10	Find probabilities using the addition rule",
-			"X.1	Identify discrete and continuous random variables",
-			"X.2	Write a discrete probability distribution",
-			"X.3	Graph a discrete probability distribution",
-			"X.4	Expected values of random variables",
-			"X.5	Variance of random variables",
-			"X.6	Standard deviation of random variables",
-			"X.7	Write the probability distribution for a game of chance",
-			"X.8	Expected values for a game of chance",
-			"X.9	Choose the better bet",
-			"X.10	Find probabilities using the binomial distribution",
-			"X.11	Mean, variance and standard deviation of binomial distributions",
-			"X.12	Find probabilities using the normal distribution I",
-			"X.13	Find probabilities using the normal distribution II",
-			"X.14	Find z-values",
-			"X.15	Find values of normal variables",
-			"X.16	Distributions of sample means",
-			"X.17	The Central Limit Theorem",
-			"X.18	Use normal distributions to approximate binomial distributions",
-			"Y.1	Match correlation coefficients to scatter plots",
-			"Y.2	Calculate correlation coefficients",
-			"Y.4	Interpret regression lines",
-			"Y.5	Analyse a regression line of a data set",
-			"Y.6	Analyse a regression line using statistics of a data set",
-        ],
-    },
-	"properties": {
-		"Class I Skills": [
-            "E.14	Related addition facts",
-			"I.13	Related subtraction facts",
-        ],
-		"Class II Skills": [
-            "I.1	Related addition facts",
-			"I.2	Related subtraction facts",
-			"I.3	Fact families",
-			"I.4	Addition and subtraction terms",
-        ],
-		"Class III Skills": [
-            "F.1	Multiply by 0",
-			"F.2	Multiply by 1",
-			"R.2	Understanding parentheses",
-			"R.3	Properties of addition",
-			"R.4	Solve using properties of addition",
-			"R.5	Properties of multiplication",
-			"R.6	Solve using properties of multiplication",
-			"R.7	Distributive property: find the missing factor",
-			"R.8	Multiply using the distributive property",
-			"R.9	Relate addition and multiplication",
-			"R.10	Relate multiplication and division",
-        ],
-		"Class IV Skills": [
-            "B.4	Properties of addition",
-			"D.8	Properties of multiplication",
-			"E.3	Properties of division",
-        ],
-		"Class V Skills": [
-            "B.6	Properties of addition",
-			"C.6	Properties of multiplication",
-        ],
-		"Class VI Skills": [
-            "J.5	Add and subtract integers: find the sign",
-			"K.3	Evaluate numerical expressions",
-			"Q.3	Properties of addition and multiplication",
-			"Q.4	Multiply using the distributive property",
-			"Q.5	Write equivalent expressions using properties",
-			"Q.6	Properties of addition",
-			"Q.7	Properties of multiplication",
-			"Q.8	Solve for a variable using properties of multiplication",
-			"R.2	Solve equations using properties",
-        ],
-		"Class VII Skills": [
-            "C.1	Integer addition and subtraction rules",
-			"C.6	Integer multiplication and division rules",
-			"C.9	Evaluate numerical expressions involving integers",
-			"E.11	Evaluate numerical expressions involving decimals",
-			"H.6	Apply addition and subtraction rules",
-			"H.8	Apply multiplication and division rules",
-			"I.6	Evaluate numerical expressions involving exponents",
-			"P.9	Properties of addition and multiplication",
-			"P.10	Multiply using the distributive property",
-			"P.11	Solve equations using properties",
-			"P.12	Write equivalent expressions using properties",
-        ],
-		"Class VIII Skills": [
-            "C.1	Integer addition and subtraction rules",
-			"C.6	Integer multiplication and division rules",
-			"C.8	Evaluate numerical expressions involving integers",
-			"E.4	Apply addition and subtraction rules",
-			"E.7	Apply multiplication and division rules",
-			"E.8	Apply addition, subtraction, multiplication and division rules",
-			"E.9	Evaluate numerical expressions involving rational numbers",
-			"F.12	Evaluate expressions using properties of exponents",
-			"V.11	Properties of addition and multiplication",
-			"V.12	Multiply using the distributive property",
-			"V.13	Simplify variable expressions using properties",
-			"W.5	Properties of equality",
-        ],
-		"Class IX Skills": [
-            "B.2	Evaluate numerical expressions involving integers",
-			"B.6	Evaluate numerical expressions involving rational numbers",
-			"U.8	Evaluate expressions using properties of exponents",
-			"BB.4	Solve a quadratic equation using the zero product property",
-        ],
-		"Class X Skills": [
-            "B.2	Evaluate numerical expressions involving integers",
-			"B.6	Evaluate numerical expressions involving rational numbers",
-			"F.2	Matrix operation rules",
-			"J.4	Solve a quadratic equation using the zero product property",
-        ],
-    },
-	"ratio and proportion": {
-		"Class VI Skills": [
-            "M.1	Write a ratio",
-			"M.2	Write a ratio: word problems",
-			"M.3	Identify equivalent ratios",
-			"M.4	Write an equivalent ratio",
-			"M.5	Ratio tables",
-			"M.6	Unit rates and equivalent rates",
-			"M.7	Compare ratios: word problems",
-			"M.8	Do the ratios form a proportion?",
-			"M.9	Solve the proportion",
-			"M.10	Scale drawings: word problems",
-        ],
-		"Class VII Skills": [
-            "J.1	Understanding ratios",
-			"J.2	Identify equivalent ratios",
-			"J.3	Write an equivalent ratio",
-			"J.4	Equivalent ratios: word problems",
-			"J.5	Unit rates",
-			"J.6	Compare ratios: word problems",
-			"J.7	Scale drawings: word problems",
-			"J.8	Do the ratios form a proportion?",
-			"J.9	Do the ratios form a proportion: word problems",
-			"J.10	Solve proportions",
-			"J.11	Solve proportions: word problems",
-			"J.12	Estimate population size using proportions",
-			"J.13	Rate of change",
-			"J.14	Constant rate of change",
-			"W.11	Perimeter, area and volume: changes in scale",
-        ],
-		"Class VIII Skills": [
-            "H.1	Understanding ratios",
-			"H.2	Identify equivalent ratios",
-			"H.3	Write an equivalent ratio",
-			"H.4	Equivalent ratios: word problems",
-			"H.5	Unit rates",
-			"H.6	Compare ratios: word problems",
-			"H.7	Solve proportions: word problems",
-			"H.8	Do the ratios form a proportion?",
-			"H.9	Do the ratios form a proportion: word problems",
-			"H.10	Solve proportions",
-			"H.11	Estimate population size using proportions",
-			"H.12	Scale drawings: word problems",
-			"H.13	Rate of change",
-			"H.14	Constant rate of change",
-			"I.1	Find the constant of proportionality from a table",
-			"I.2	Write equations for proportional relationships from tables",
-			"I.3	Identify proportional relationships by graphing",
-			"I.4	Find the constant of proportionality from a graph",
-			"I.5	Write equations for proportional relationships from graphs",
-			"I.6	Identify proportional relationships",
-			"I.7	Graph proportional relationships",
-			"I.8	Interpret graphs of proportional relationships",
-			"I.9	Write and solve equations for proportional relationships",
-			"T.10	Perimeter, area and volume: changes in scale",
-        ],
-		"Class IX Skills": [
-            "C.1	Identify equivalent ratios",
-			"C.2	Write an equivalent ratio",
-			"C.3	Unit rates",
-			"C.5	Solve proportions",
-			"C.6	Solve proportions: word problems",
-			"C.7	Scale drawings: word problems",
-			"S.1	Identify proportional relationships",
-			"S.2	Find the constant of variation",
-			"S.3	Graph a proportional relationship",
-			"S.4	Write direct variation equations",
-			"S.5	Write and solve direct variation equations",
-        ],
-		"Class X Skills": [
-            "M.9	Area and perimeter of similar figures",
-        ],
-    },
-	"subtraction": {
-		"Upper kindergarten skills": [
-            "J.1	Subtract with pictures - numbers up to 5",
-			"J.2	Subtraction sentences - numbers up to 5",
-			"J.3	Subtract - numbers up to 5",
-			"J.4	Complete the subtraction sentence - numbers up to 5",
-			"J.5	Subtraction word problems - numbers up to 5",
-			"K.1	Subtract with pictures - numbers up to 10",
-			"K.2	Subtraction sentences - numbers up to 10",
-			"K.3	Make a number using subtraction - numbers up to 10",
-			"K.4	Subtract - numbers up to 10",
-			"K.5	Complete the subtraction sentence - numbers up to 10",
-			"K.6	Write subtraction sentences",
-			"K.7	Subtraction word problems - numbers up to 10",
-			"S.1	Sum and difference",
-        ],
-		"Class I Skills": [
-            "G.1	Subtract with pictures - numbers up to 10",
-			"G.2	Subtraction sentences - numbers up to 10",
-			"G.3	Subtraction sentences using number lines - numbers up to 10",
-			"G.4	Subtract zero and all",
-			"H.1	Subtracting 1",
-			"H.2	Subtracting 2",
-			"H.3	Subtracting 3",
-			"H.4	Subtracting 4",
-			"H.5	Subtracting 5",
-			"H.6	Subtracting 6",
-			"H.7	Subtracting 7",
-			"H.8	Subtracting 8",
-			"H.9	Subtracting 9",
-			"H.10	Subtracting 0",
-			"I.1	Subtraction facts - numbers up to 10",
-			"I.2	Ways to make a number - subtraction sentences",
-			"I.3	Ways to subtract from a number - subtraction sentences",
-			"I.4	Make a number using subtraction - numbers up to 10",
-			"I.5	Complete the subtraction sentence",
-			"I.6	Subtraction word problems - numbers up to 10",
-			"I.7	Subtraction sentences for word problems - numbers up to 10",
-			"I.8	Subtraction facts - numbers up to 18",
-			"I.9	Subtraction sentences using number lines - numbers up to 18",
-			"I.10	Subtraction word problems - numbers up to 18",
-			"I.11	Subtraction sentences for word problems - numbers up to 18",
-			"I.12	Make a number using subtraction - numbers up to 20",
-			"I.13	Related subtraction facts",
-			"I.14	Subtraction sentences: true or false?",
-			"I.15	Subtract a one-digit number from a two-digit number - without regrouping",
-			"I.16	Subtract a one-digit number from a two-digit number - with regrouping",
-			"J.1	Relate addition and subtraction sentences",
-			"J.2	Subtract doubles",
-			"J.3	Subtract multiples of 10",
-			"J.4	Subtract a multiple of 10",
-			"W.1	Addition and subtraction - ways to make a number",
-			"W.2	Which sign makes the number sentence true?",
-			"W.3	Fact families",
-			"W.4	Addition and subtraction facts - numbers up to 10",
-			"W.5	Addition and subtraction facts - numbers up to 18",
-			"W.6	Addition and subtraction word problems",
-			"W.7	Addition and subtraction terms",
-        ],
-		"Class II Skills": [
-            "F.1	Review - subtract one-digit numbers - up to 10",
-			"F.2	Review - ways to subtract - up to 10",
-			"F.3	Review - writing subtraction sentences - up to 10",
-			"F.4	Subtract doubles",
-			"F.5	Subtract a one-digit number from a two-digit number up to 18",
-			"F.6	Subtraction with pictures",
-			"F.7	Write subtraction sentences to describe pictures - up to 18",
-			"F.8	Subtraction input/output tables - up to 18",
-			"F.9	Subtract zero/all",
-			"F.10	Subtraction word problems - up to 18",
-			"F.11	Complete the subtraction sentence - up to 18",
-			"F.12	Write the subtraction sentence - up to 18",
-			"F.13	Balance subtraction equations - up to 18",
-			"H.1	Subtract multiples of 10",
-			"H.2	Subtract a one-digit number from a two-digit number - without regrouping",
-			"H.3	Subtract a one-digit number from a two-digit number - with regrouping",
-			"H.4	Subtract two two-digit numbers - without regrouping",
-			"H.5	Subtract two two-digit numbers - with regrouping",
-			"H.6	Write subtraction sentences to describe pictures - up to two digits",
-			"H.7	Subtraction input/output tables - up to two digits",
-			"H.8	Ways to make a number using subtraction",
-			"H.9	Subtraction word problems - up to two digits",
-			"H.10	Complete the subtraction sentence - up to two digits",
-			"H.11	Write the subtraction sentence - up to two digits",
-			"H.12	Balance subtraction equations - up to two digits",
-			"I.2	Related subtraction facts",
-			"I.3	Fact families",
-			"L.8	Add and subtract money - word problems - up to 10 rupees",
-			"S.1	Add and subtract numbers up to 20",
-			"S.2	Addition and subtraction - ways to make a number - up to 20",
-			"S.3	Addition and subtraction word problems - up to 20",
-			"S.4	Addition and subtraction - balance equations - up to 20",
-			"S.5	Write the addition or subtraction rule for an input/output table - up to 20",
-			"S.6	Add and subtract numbers up to 100",
-			"S.7	Addition and subtraction - ways to make a number - up to 100",
-			"S.8	Addition and subtraction word problems - up to 100",
-			"S.9	Addition and subtraction - balance equations - up to 100",
-			"S.10	Write the addition or subtraction rule for an input/output table - up to 100",
-			"S.11	Which sign (+ or -) makes the number sentence true? - up to 100",
-			"S.12	Write addition and subtraction sentences",
-        ],
-		"Class III Skills": [
-            "D.1	Subtract numbers up to three digits",
-			"D.2	Subtraction input/output tables - up to three digits",
-			"D.3	Subtract numbers up to three digits - word problems",
-			"D.4	Complete the subtraction sentence - up to three digits",
-			"D.5	Balance subtraction equations - up to three digits",
-			"D.6	Subtraction patterns over increasing place values",
-			"D.7	Subtraction: fill in the missing digits",
-			"N.7	Add and subtract money amounts",
-			"T.6	Estimate differences",
-			"T.7	Estimate differences: word problems",
-        ],
-		"Class IV Skills": [
-            "C.1	Subtract numbers up to five digits",
-			"C.2	Subtract numbers up to five digits: word problems",
-			"C.3	Subtraction: fill in the missing digits",
-			"C.4	Subtraction patterns over increasing place values",
-			"C.5	Choose numbers with a particular difference",
-			"C.6	Estimate differences",
-			"C.7	Estimate differences: word problems",
-			"F.8	Mentally add and subtract numbers ending in zeroes",
-			"J.3	Add and subtract money amounts",
-			"J.6	Price lists",
-        ],
-		"Class V Skills": [
-            "B.1	Add and subtract whole numbers",
-			"B.2	Add and subtract whole numbers: word problems",
-			"B.3	Complete addition and subtraction sentences",
-			"B.4	Fill in the missing digits",
-			"B.5	Choose numbers with a particular sum or difference",
-			"B.7	Estimate sums and differences of whole numbers",
-			"B.8	Estimate sums and differences: word problems",
-			"I.1	Add and subtract money amounts",
-			"I.2	Add and subtract money: word problems",
-        ],
-		"Class VI Skills": [
-            "A.4	Add and subtract whole numbers",
-			"A.5	Add and subtract whole numbers: word problems",
-			"F.1	Add and subtract decimal numbers",
-			"F.2	Add and subtract decimals: word problems",
-			"F.3	Estimate sums and differences of decimals",
-			"F.4	Maps with decimal distances",
-			"H.1	Add and subtract fractions with like denominators",
-			"H.2	Add and subtract fractions with like denominators: word problems",
-			"H.3	Add and subtract fractions with unlike denominators",
-			"H.4	Add and subtract fractions with unlike denominators: word problems",
-			"H.5	Inequalities with addition and subtraction of like and unlike fractions",
-			"H.6	Add and subtract mixed numbers",
-			"H.7	Add and subtract mixed numbers: word problems",
-			"H.8	Estimate sums and differences of mixed numbers",
-			"J.3	Subtract integers using counters",
-			"J.4	Subtract integers",
-			"J.5	Add and subtract integers: find the sign",
-			"J.6	Add and subtract integers: input/output tables",
-			"O.2	Add and subtract money amounts",
-			"O.3	Add and subtract money amounts: word problems",
-        ],
-		"Class VII Skills": [
-            "C.1	Integer addition and subtraction rules",
-			"C.2	Add and subtract integers using counters",
-			"C.3	Add and subtract integers",
-			"C.4	Complete addition and subtraction sentences with integers",
-			"C.5	Add and subtract integers: word problems",
-			"E.1	Add and subtract decimals",
-			"E.2	Add and subtract decimals: word problems",
-			"E.10	Maps with decimal distances",
-			"G.1	Add and subtract fractions",
-			"G.2	Add and subtract fractions: word problems",
-			"G.3	Add and subtract mixed numbers",
-			"G.4	Add and subtract mixed numbers: word problems",
-			"G.5	Inequalities with addition and subtraction of fractions and mixed numbers",
-			"G.6	Estimate sums and differences of mixed numbers",
-			"H.5	Add and subtract rational numbers",
-			"H.6	Apply addition and subtraction rules",
-        ],
-		"Class VIII Skills": [
-            "C.1	Integer addition and subtraction rules",
-			"C.2	Add and subtract integers using counters",
-			"C.3	Add and subtract integers",
-			"C.4	Add and subtract three or more integers",
-			"C.5	Add and subtract integers: word problems",
-			"E.2	Add and subtract rational numbers",
-			"E.3	Add and subtract rational numbers: word problems",
-			"E.4	Apply addition and subtraction rules",
-			"E.8	Apply addition, subtraction, multiplication and division rules",
-        ],
-		"Class IX Skills": [
-            "B.4	Add and subtract rational numbers",
-			"DD.5	Add and subtract rational expressions",
-        ],
-		"Class X Skills": [
-            "B.4	Add and subtract rational numbers",
-			"K.5	Add and subtract rational expressions",
-        ],
-		"Class XI Skills": [
-            "O.6	Add and subtract rational expressions",
-        ],
-    },
-	"time": {
-		"Class I Skills": [
-            "V.1	Days of the week",
-			"V.2	Seasons of the year",
-			"V.3	Read a calendar",
-			"V.4	Months of the year",
-			"V.5	A.M. or P.M.",
-        ],
-		"Class II Skills": [
-            "M.1	Days of the week",
-			"M.2	Seasons",
-			"M.3	Read a calendar",
-			"M.4	Months of the year",
-			"M.5	Number of days in each month",
-			"M.6	Relate time units",
-			"M.7	A.M. or P.M.",
-        ],
-		"Class III Skills": [
-            "O.1	Match analogue clocks and times",
-			"O.2	Match digital clocks and times",
-			"O.3	Read clocks and write times",
-			"O.4	A.M. or P.M.",
-			"O.5	Elapsed time",
-			"O.6	Elapsed time word problems",
-			"O.7	Time patterns",
-			"O.8	Read a calendar",
-			"O.9	Reading schedules",
-			"O.10	Timelines",
-        ],
-		"Class IV Skills": [
-            "L.1	Convert time units",
-			"L.2	Add and subtract mixed time units",
-			"L.3	A.M. or P.M.",
-			"L.4	Elapsed time",
-			"L.5	Find start and end times: multi-step word problems",
-			"L.6	Convert between 12-hour and 24-hour time",
-			"L.7	Transportation schedules - 12-hour time",
-			"L.8	Transportation schedules - 24-hour time",
-			"L.9	Time patterns",
-        ],
-		"Class V Skills": [
-            "M.1	Convert time units",
-			"M.2	Add and subtract mixed time units",
-			"M.3	Elapsed time",
-			"M.4	Find start and end times: word problems",
-			"M.5	Convert between 12-hour and 24-hour time",
-			"M.6	Schedules and timelines - 12-hour time",
-			"M.7	Schedules - 24-hour time",
-			"M.8	Time patterns",
-        ],
-		"Class VI Skills": [
-            "P.1	Elapsed time",
-			"P.2	Time units",
-			"P.3	Find start and end times",
-			"P.4	Convert between 12-hour and 24-hour time",
-			"P.5	Transportation schedules",
-        ],
-		"Class VII Skills": [
-            "M.6	Elapsed time word problems",
-        ],
-		"Class VIII Skills": [
-            "M.4	Elapsed time word problems",
-        ],
-    },
-	"trigonometry": {
-		"Class VII Skills": [
-            "U.1	Pythagoras' theorem: find the length of the hypotenuse",
-			"U.2	Pythagoras' theorem: find the missing leg length",
-			"U.3	Pythagoras' theorem: word problems",
-			"U.4	Converse of Pythagoras' theorem: is it a right triangle?",
-        ],
-		"Class VIII Skills": [
-            "R.1	Pythagoras' theorem: find the length of the hypotenuse",
-			"R.2	Pythagoras' theorem: find the missing leg length",
-			"R.3	Pythagoras' theorem: find the perimeter",
-			"R.4	Pythagoras' theorem: word problems",
-			"R.5	Converse of Pythagoras' theorem: is it a right triangle?",
-        ],
-		"Class X Skills": [
-            "Q.1	Pythagoras' Theorem",
-			"Q.2	Converse of Pythagoras' theorem",
-			"Q.3	Pythagoras' Inequality Theorems",
-			"Q.4	Special right triangles",
-			"S.1	Trigonometric ratios: sin, cos and tan",
-			"S.2	Trigonometric ratios: csc, sec and cot",
-			"S.3	Trigonometric functions of complementary angles",
-			"S.4	Find trigonometric functions of special angles",
-			"S.5	Find trigonometric functions using a calculator",
-			"S.6	Inverses of trigonometric functions",
-			"S.7	Trigonometric ratios: find a side length",
-			"S.8	Trigonometric ratios: find an angle measure",
-			"S.9	Solve a right triangle",
-        ],
-		"Class XI Skills": [
-            "R.1	Convert between radians and degrees",
-			"R.2	Radians and arc length",
-			"R.3	Quadrants",
-			"R.4	Graphs of angles",
-			"R.5	Coterminal angles",
-			"R.6	Reference angles",
-			"S.1	Pythagoras' Theorem and its converse",
-			"S.2	Special right triangles",
-			"S.3	Trigonometric ratios: sin, cos and tan",
-			"S.4	Trigonometric ratios: csc, sec and cot",
-			"S.5	Trigonometric ratios in similar right triangles",
-			"S.6	Find trigonometric ratios using the unit circle",
-			"S.7	Sin, cos and tan of special angles",
-			"S.8	Csc, sec and cot of special angles",
-			"S.9	Find trigonometric functions using a calculator",
-			"S.10	Inverses of sin, cos and tan",
-			"S.11	Inverses of csc, sec and cot",
-			"S.12	Solve trigonometric equations I",
-			"S.13	Solve trigonometric equations II",
-			"S.14	Trigonometric ratios: find a side length",
-			"S.15	Trigonometric ratios: find an angle measure",
-			"S.16	Solve a right triangle",
-			"S.17	Law of Sines",
-			"S.18	Law of Cosines",
-			"S.19	Solve a triangle",
-			"T.1	Find properties of sine functions",
-			"T.2	Write equations of sine functions from graphs",
-			"T.3	Write equations of sine functions using properties",
-			"T.4	Graph sine functions",
-			"T.5	Find properties of cosine functions",
-			"T.6	Write equations of cosine functions from graphs",
-			"T.7	Write equations of cosine functions using properties",
-			"T.8	Graph cosine functions",
-			"T.9	Graph sine and cosine functions",
-			"U.1	Complementary angle identities",
-			"U.2	Symmetry and periodicity of trigonometric functions",
-			"U.3	Find trigonometric ratios using a Pythagorean or reciprocal identity",
-			"U.4	Find trigonometric ratios using multiple identities",
-        ],
-		"Class XII Skills": [
-            "G.1	Convert between radians and degrees",
-			"G.2	Radians and arc length",
-			"G.3	Quadrants",
-			"G.4	Coterminal and reference angles",
-			"G.5	Find trigonometric ratios using right triangles",
-			"G.6	Find trigonometric ratios using the unit circle",
-			"G.7	Find trigonometric ratios using reference angles",
-			"G.8	Inverses of trigonometric functions",
-			"G.9	Solve trigonometric equations",
-			"G.10	Trigonometric ratios: find a side length",
-			"G.11	Trigonometric ratios: find an angle measure",
-			"G.12	Solve a right triangle",
-			"G.13	Law of Sines",
-			"G.14	Law of Cosines",
-			"G.15	Solve a triangle",
-			"H.1	Find properties of sine functions",
-			"H.2	Write equations of sine functions from graphs",
-			"H.3	Write equations of sine functions using properties",
-			"H.4	Graph sine functions",
-			"H.5	Find properties of cosine functions",
-			"H.6	Write equations of cosine functions from graphs",
-			"H.7	Write equations of cosine functions using properties",
-			"H.8	Graph cosine functions",
-			"H.9	Graph sine and cosine functions",
-			"I.1	Complementary angle identities",
-			"I.2	Symmetry and periodicity of trigonometric functions",
-			"I.3	Find trigonometric ratios using a Pythagorean or reciprocal identity",
-			"I.4	Find trigonometric ratios using multiple identities",
-        ],
-    },
-	"word problems": {
-		"Upper kindergarten skills": [
-            "H.6	Addition word problems - sums up to 5",
-			"I.8	Addition word problems - sums up to 10",
-			"J.5	Subtraction word problems - numbers up to 5",
-			"K.7	Subtraction word problems - numbers up to 10",
-        ],
-		"Class I Skills": [
-            "A.17	Skip-counting patterns - with tables",
-			"E.5	Addition word problems - sums up to 10",
-			"E.6	Addition sentences for word problems - sums up to 10",
-			"E.9	Addition word problems - sums up to 18",
-			"F.10	Add three numbers - word problems",
-			"I.6	Subtraction word problems - numbers up to 10",
-			"I.7	Subtraction sentences for word problems - numbers up to 10",
-			"I.10	Subtraction word problems - numbers up to 18",
-			"K.4	Comparison word problems",
-        ],
-		"Class II Skills": [
-            "A.11	Skip-counting stories",
-			"A.12	Skip-counting puzzles",
-			"B.3	Greatest and least - word problems - up to 100",
-			"E.10	Addition word problems - one digit",
-			"E.15	Add three or more one-digit numbers - word problems",
-			"F.10	Subtraction word problems - up to 18",
-			"G.9	Addition word problems - up to two digits",
-			"G.14	Add three or more numbers up to two digits - word problems",
-			"H.9	Subtraction word problems - up to two digits",
-			"L.8	Add and subtract money - word problems - up to 10 rupees",
-			"Q.1	Guess the number",
-			"S.3	Addition and subtraction word problems - up to 20",
-			"S.8	Addition and subtraction word problems - up to 100",
-        ],
-		"Class III Skills": [
-            "A.3	Skip-counting puzzles",
-			"B.9	Place value word problems",
-			"C.7	Add three or more numbers up to three digits - word problems",
-			"D.3	Subtract numbers up to three digits - word problems",
-			"H.4	Multiplication word problems",
-			"H.5	Multiplication word problems: find the missing factor",
-			"H.7	Multiply one-digit numbers by two-digit numbers: word problems",
-			"H.9	Multiply one-digit numbers by three-digit numbers: word problems",
-			"L.3	Division word problems",
-			"N.8	Add money amounts - word problems",
-			"S.8	Addition, subtraction, multiplication and division word problems",
-			"S.10	Multi-step word problems",
-			"T.5	Estimate sums: word problems",
-			"T.7	Estimate differences: word problems",
-			"T.9	Estimate products: word problems",
-			"T.10	Estimate sums, differences and products: word problems",
-			"U.1	Guess the number",
-			"U.3	Find the order",
-			"U.4	Age puzzles",
-			"U.5	Find two numbers based on sum and difference",
-			"U.6	Find two numbers based on sum, difference, product and quotient",
-        ],
-		"Class IV Skills": [
-            "B.2	Add numbers up to five digits: word problems",
-			"B.9	Estimate sums: word problems",
-			"C.2	Subtract numbers up to five digits: word problems",
-			"C.7	Estimate differences: word problems",
-			"D.11	Estimate products: word problems",
-			"D.16	Multiply a two-digit number by a two-digit number: word problems",
-			"D.20	Multiply a two-digit number by a three-digit number: word problems",
-			"D.22	Multiply numbers ending in zeroes: word problems",
-			"E.2	Division facts to 10: word problems",
-			"E.5	Divide larger numbers: word problems",
-			"E.7	Interpret remainders",
-			"E.10	Estimate quotients: word problems",
-			"E.12	Divisibility rules: word problems",
-			"F.2	Addition, subtraction, multiplication and division word problems",
-			"F.3	Estimate sums, differences, products and quotients: word problems",
-			"F.4	Multi-step word problems",
-			"F.5	Word problems with extra or missing information",
-			"F.6	Solve word problems using guess-and-check",
-			"G.1	Find two numbers based on sum and difference",
-			"G.2	Find two numbers based on sum, difference, product and quotient",
-			"G.3	Find the order",
-			"I.3	Number patterns: word problems",
-			"L.5	Find start and end times: multi-step word problems",
-        ],
-		"Class V Skills": [
-            "B.2	Add and subtract whole numbers: word problems",
-			"B.8	Estimate sums and differences: word problems",
-			"C.2	Multiply by one-digit numbers: word problems",
-			"C.5	Multiply numbers ending in zeroes: word problems",
-			"C.9	Estimate products: word problems",
-			"C.16	Multiply by 2-digit numbers: word problems",
-			"C.18	Multiply three or four numbers: word problems",
-			"D.2	Division facts to 12: word problems",
-			"D.4	Divisibility rules: word problems",
-			"D.6	Divide by one-digit numbers: word problems",
-			"D.7	Divide by one-digit numbers: interpret remainders",
-			"D.8	Estimate quotients: word problems",
-			"D.11	Divide numbers ending in zeroes: word problems",
-			"D.13	Divide by two-digit numbers: word problems",
-			"F.2	Unit fractions: modelling word problems",
-			"F.3	Unit fractions: word problems",
-			"F.4	Fractions of a whole: modelling word problems",
-			"F.5	Fractions of a whole: word problems",
-			"F.6	Fractions of a group: word problems",
-			"F.13	Fractions of a number: word problems",
-			"G.2	Add, subtract, multiply and divide whole numbers: word problems",
-			"H.1	Multi-step word problems",
-			"H.2	Word problems with extra or missing information",
-			"H.3	Guess-and-check problems",
-			"H.4	Find the order",
-			"H.5	Use Venn diagrams to solve problems",
-			"I.2	Add and subtract money: word problems",
-			"I.3	Multiply money amounts: word problems",
-			"I.4	Divide money amounts: word problems",
-			"J.4	Number sequences: word problems",
-			"M.4	Find start and end times: word problems",
-			"P.5	Area and perimeter: word problems",
-        ],
-		"Class VI Skills": [
-            "A.5	Add and subtract whole numbers: word problems",
-			"B.2	Multiply whole numbers: word problems",
-			"B.4	Multiply numbers ending in zeroes: word problems",
-			"B.6	Multiply three or more numbers: word problems",
-			"C.3	Divide numbers ending in zeroes: word problems",
-			"D.7	HCF and LCM: word problems",
-			"F.2	Add and subtract decimals: word problems",
-			"G.2	Understanding fractions: word problems",
-			"G.5	Fractions: word problems",
-			"G.8	Compare fractions: word problems",
-			"H.2	Add and subtract fractions with like denominators: word problems",
-			"H.4	Add and subtract fractions with unlike denominators: word problems",
-			"H.7	Add and subtract mixed numbers: word problems",
-			"K.2	Add, subtract, multiply or divide two whole numbers: word problems",
-			"K.5	Add and subtract decimals or fractions: word problems",
-			"L.1	Estimate to solve word problems",
-			"L.2	Multi-step word problems",
-			"L.3	Word problems with extra or missing information",
-			"L.4	Guess-and-check word problems",
-			"L.5	Distance/direction to starting point",
-			"L.6	Use logical reasoning to find the order",
-			"M.2	Write a ratio: word problems",
-			"M.7	Compare ratios: word problems",
-			"O.3	Add and subtract money amounts: word problems",
-			"O.4	Multiply money: word problems",
-			"O.6	Divide money amounts: word problems",
-			"R.1	Write variable equations: word problems",
-			"W.6	Area and perimeter: word problems",
-        ],
-		"Class VII Skills": [
-            "A.7	HCF and LCM: word problems",
-			"C.5	Add and subtract integers: word problems",
-			"E.2	Add and subtract decimals: word problems",
-			"E.4	Multiply decimals and whole numbers: word problems",
-			"E.6	Divide decimals by whole numbers: word problems",
-			"E.8	Add, subtract, multiply and divide decimals: word problems",
-			"F.4	Fractions: word problems with graphs and tables",
-			"F.7	Compare fractions: word problems",
-			"G.2	Add and subtract fractions: word problems",
-			"G.4	Add and subtract mixed numbers: word problems",
-			"G.11	Multiply fractions and mixed numbers: word problems",
-			"G.15	Divide fractions and mixed numbers: word problems",
-			"G.17	Add, subtract, multiply and divide fractions and mixed numbers: word problems",
-			"J.4	Equivalent ratios: word problems",
-			"J.6	Compare ratios: word problems",
-			"J.9	Do the ratios form a proportion: word problems",
-			"J.11	Solve proportions: word problems",
-			"K.6	Percents of numbers: word problems",
-			"K.8	Solve percent equations: word problems",
-			"L.1	Add, subtract, multiply and divide money amounts: word problems",
-			"M.1	Estimate to solve word problems",
-			"M.2	Multi-step word problems",
-			"M.3	Guess-and-check word problems",
-			"M.4	Use Venn diagrams to solve problems",
-			"M.5	Find the number of each type of coin",
-			"M.6	Elapsed time word problems",
-			"O.5	Number sequences: word problems",
-			"P.2	Write variable expressions: word problems",
-			"Q.7	Solve equations: word problems",
-			"U.3	Pythagoras' theorem: word problems",
-			"W.4	Area and perimeter: word problems",
-			"W.6	Circles: word problems",
-        ],
-		"Class VIII Skills": [
-            "A.7	HCF and LCM: word problems",
-			"C.5	Add and subtract integers: word problems",
-			"E.3	Add and subtract rational numbers: word problems",
-			"E.6	Multiply and divide rational numbers: word problems",
-			"H.4	Equivalent ratios: word problems",
-			"H.6	Compare ratios: word problems",
-			"H.7	Solve proportions: word problems",
-			"H.9	Do the ratios form a proportion: word problems",
-			"I.8	Interpret graphs of proportional relationships",
-			"I.9	Write and solve equations for proportional relationships",
-			"J.4	Find what percent one number is of another: word problems",
-			"J.7	Percents of numbers: word problems",
-			"J.11	Percent of change: word problems",
-			"M.1	Multi-step word problems",
-			"M.2	Guess-and-check word problems",
-			"M.3	Use Venn diagrams to solve problems",
-			"M.4	Elapsed time word problems",
-			"R.4	Pythagoras' theorem: word problems",
-			"T.4	Area and perimeter: word problems",
-			"T.6	Circles: word problems",
-			"U.5	Number sequences: word problems",
-			"V.3	Write variable expressions: word problems",
-			"W.11	Solve equations: word problems",
-        ],
-		"Class IX Skills": [
-            "C.2	Write an equivalent ratio",
-			"C.6	Solve proportions: word problems",
-			"D.3	Percent word problems",
-			"D.5	Percent of change: word problems",
-			"N.10	Solve linear equations: word problems",
-			"P.1	Word problems: mixed review",
-			"P.3	Consecutive integer problems",
-			"P.4	Rate of travel: word problems",
-			"P.5	Weighted averages: word problems",
-			"Q.1	Identify hypotheses and conclusions",
-			"Q.2	Counterexamples",
-        ],
-		"Class X Skills": [
-            "E.3	Solve a pair of equations by graphing: word problems",
-			"E.7	Solve a pair of equations using substitution: word problems",
-			"E.9	Solve a pair of equations using elimination: word problems",
-			"V.1	Consecutive integer problems",
-			"V.2	Rate of travel: word problems",
-			"V.3	Weighted averages: word problems",
-			"W.1	Identify hypotheses and conclusions",
-			"W.2	Counterexamples",
-        ],
-		"Class XI Skills": [
-            "E.4	Linear inequalities: word problems",
-			"V.1	Word problems: mixed review",
-			"V.3	Consecutive integer problems",
-			"V.4	Rate of travel: word problems",
-			"V.5	Weighted averages: word problems",
-			"W.1	Identify hypotheses and conclusions",
-			"W.2	Counterexamples",
-        ],
-    },
-}
-
 # Filter topics based on selected grade
 def filter_topics_by_grade(topics_dict, selected_grade_display):
     """Filter topics to show only those relevant to the selected grade level"""
@@ -5360,12 +206,23 @@ if view_mode == "🎓 Grades":
     st.markdown(f"*All subjects and topics for {selected_grade_display}*")
     st.markdown("---")
     
-    if selected_grade in grade_curriculum:
+    # Only the selected grade's part of the catalog is looked at
+    grade_sections = catalog.grade_sections(selected_grade)
+    if grade_sections is not None:
         st.subheader("📖 Subject Areas & Topics")
         
-        # Display each subject area as an expandable section
-        for subject_area, subtopics in grade_curriculum[selected_grade].items():
-            with st.expander(f"📝 {subject_area}", expanded=False):
+        # Display each subject area as an expandable section; the activity
+        # buttons are only built while the section is open
+        for subject_area, subtopics in grade_sections.items():
+            section = st.expander(
+                f"📝 {subject_area}",
+                expanded=False,
+                key=f"grade_section_{selected_grade}_{subject_area}",
+                on_change="rerun"
+            )
+            if not section.open:
+                continue
+            with section:
                 st.markdown(f"**{len(subtopics)} activities available**")
                 
                 # Create a grid layout for better organization
@@ -5376,7 +233,7 @@ if view_mode == "🎓 Grades":
                         if st.button(f"🎯 {activity}", key=f"grade_{selected_grade}_{subject_area}_{i}"):
                             # FIXED: Properly set both grade and subtopic
                             st.query_params["grade"] = selected_grade  # Make sure grade is set
-                            st.query_params["subtopic"] = sanitize(activity)  # Use the activity name
+                            st.query_params["subtopic"] = slug_index.slug_for(activity)  # Use the activity name
                             st.rerun()
     else:
         st.info(f"📚 Curriculum for {selected_grade_display} is being prepared.")
@@ -5389,11 +246,20 @@ else:
     st.markdown("---")
 
     # Show available topics for the selected grade
-    if selected_topic in topics:
+    topic_categories = catalog.topic_categories(selected_topic)
+    if topic_categories is not None:
         st.subheader(f"📝 All {selected_topic.capitalize()} Activities by Grade Level")
         
-        for category, subtopics in topics[selected_topic].items():
-            with st.expander(f"📚 {category} ({len(subtopics)} activities)", expanded=False):
+        for category, subtopics in topic_categories.items():
+            section = st.expander(
+                f"📚 {category} ({len(subtopics)} activities)",
+                expanded=False,
+                key=f"topic_section_{selected_topic}_{category}",
+                on_change="rerun"
+            )
+            if not section.open:
+                continue
+            with section:
                 # Create a more organized display with columns
                 cols = st.columns(2)
                 for i, item in enumerate(subtopics):
@@ -5401,7 +267,7 @@ else:
                         # Create clickable buttons
                         if st.button(f"🎯 {item}", key=f"topic_{selected_topic}_{category}_{i}"):
                             # FIXED: Properly set both grade and subtopic
-                            st.query_params["subtopic"] = sanitize(item)
+                            st.query_params["subtopic"] = slug_index.slug_for(item)
                             st.rerun()
     else:
         st.error("❌ Topic not found. Please select a valid topic from the sidebar.")
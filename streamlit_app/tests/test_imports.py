@@ -0,0 +1,35 @@
+"""Activity modules import fast: heavy libraries wait for utils.lazy_imports.
+
+One fresh interpreter, with streamlit already imported, imports every
+route's module in turn (``python -m utils.bench imports`` gives each module
+an interpreter of its own).  MATHWIZ_IMPORT_BUDGET_MS overrides the budget
+on slow machines.
+"""
+import os
+
+import pytest
+
+from utils.bench import iter_routes, profile_imports
+
+IMPORT_BUDGET_MS = float(os.environ.get("MATHWIZ_IMPORT_BUDGET_MS", 250))
+
+# Libraries activities must bind with lazy_import()
+HEAVY_PACKAGES = {"matplotlib", "numpy", "pandas", "plotly"}
+
+ROUTES = list(iter_routes())
+
+
+@pytest.fixture(scope="module")
+def imports():
+    return profile_imports([route["module"] for _, _, route in ROUTES])
+
+
+@pytest.mark.parametrize("route", [route for _, _, route in ROUTES],
+                         ids=[f"{grade}/{subtopic}" for grade, subtopic, _ in ROUTES])
+def test_activity_import_budget(imports, route):
+    measurement = imports[route["module"]]
+    heavy = HEAVY_PACKAGES.intersection(measurement["dependencies"])
+    assert not heavy, f"importing {route['path']} imports {sorted(heavy)}; use lazy_import()"
+    assert measurement["import_ms"] <= IMPORT_BUDGET_MS, (
+        f"importing {route['path']} took {measurement['import_ms']:.0f} ms, over {IMPORT_BUDGET_MS:.0f} ms"
+    )
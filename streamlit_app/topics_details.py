@@ -1,6 +1,8 @@
 import streamlit as st
 import importlib
 
+from utils.slugs import get_slug_index
+
 # Routing block: check for a subtopic query parameter
 params = st.query_params
 if "subtopic" in params:
@@ -4534,22 +4536,17 @@ topics = {
     },
 }
 
-# Helper function to sanitize subtopic text for URL usage
-def sanitize(text):
-    # Convert to lower case and replace spaces with underscores.
-    # You can add more replacements if needed.
-    return text.lower().replace(" ", "_").replace("-", "").replace(":", "")
-
 # **Main Content: Display Selected Topic**
 st.title(f"{selected_topic.capitalize()} Practice")
 st.subheader("Subtopics")
 
+slug_index = get_slug_index()
 if selected_topic in topics:
     for category, subtopics in topics[selected_topic].items():
         st.markdown(f"### {category}")
         # Build an unordered list where each subtopic is a clickable link.
         subtopics_html = "<ul>" + "".join(
-            f"<li><a href='?subtopic={sanitize(item)}'>{item}</a></li>"
+            f"<li><a href='?subtopic={slug_index.slug_for(item)}'>{item}</a></li>"
             for item in subtopics
         ) + "</ul>"
         st.markdown(subtopics_html, unsafe_allow_html=True)
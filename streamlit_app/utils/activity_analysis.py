@@ -0,0 +1,222 @@
+"""Static analysis of activity source files.
+
+Activities are never imported to describe them: the route manifest build
+parses each file and records what tools need to drive an activity without a
+browser, such as its run() entry point, its adaptive difficulty levels and
+the call that generates a new problem.
+"""
+import ast
+import copy
+import re
+
+ENTRY_POINT = "run"
+
+_STATE_KEY = re.compile(r"^st\.session_state(?:\.(\w+)|\[['\"](\w+)['\"]\])$")
+
+
+def _state_key(node):
+    """Return the session state key read by an expression like st.session_state.key, or None"""
+    match = _STATE_KEY.match(ast.unparse(node))
+    return (match.group(1) or match.group(2)) if match else None
+
+
+def _int_constant(node):
+    """Return the value of an integer literal node, or None"""
+    if isinstance(node, ast.Constant) and type(node.value) is int:
+        return node.value
+    return None
+
+
+def _looks_like_difficulty(key):
+    """Check whether a session state key is named like a difficulty setting"""
+    return "difficult" in key or "level" in key
+
+
+def defines_entry_point(tree):
+    """Check whether a parsed activity defines a top-level run() function"""
+    return any(
+        isinstance(node, ast.FunctionDef) and node.name == ENTRY_POINT
+        for node in tree.body
+    )
+
+
+def difficulty_levels(tree):
+    """Find the adaptive difficulty key of a parsed activity and its levels.
+
+    Activities step a session state key up and down by one between fixed
+    bounds, written either as ``min(st.session_state.k + 1, 5)`` /
+    ``max(st.session_state.k - 1, 1)`` or as ``if st.session_state.k < 5:``
+    followed by ``st.session_state.k += 1``.  Returns
+    ``{"key": k, "levels": [1, 2, 3, 4, 5]}``, or None when no such key is found.
+    """
+    aliases = {}  # local name -> state key, for "old = st.session_state.k"
+    stepped, initial = set(), {}
+    clamps = ({}, {})  # (lows, highs) from min()/max() clamps
+    guards = ({}, {})  # (lows, highs) from "if k < 5: k += 1" guards
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+            key = _state_key(node.value)
+            if key is not None and isinstance(target, ast.Name):
+                aliases[target.id] = key
+            key, value = _state_key(target), _int_constant(node.value)
+            if key is not None and value is not None:
+                initial.setdefault(key, value)
+
+    def key_of(node):
+        if isinstance(node, ast.Name):
+            return aliases.get(node.id)
+        return _state_key(node)
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in ("min", "max") \
+                and len(node.args) == 2:
+            for step, bound in (node.args, node.args[::-1]):
+                bound = _int_constant(bound)
+                if bound is None or not isinstance(step, ast.BinOp) or _int_constant(step.right) != 1:
+                    continue
+                key = key_of(step.left)
+                if key is None:
+                    continue
+                if node.func.id == "min" and isinstance(step.op, ast.Add):
+                    stepped.add(key)
+                    clamps[1].setdefault(key, bound)
+                elif node.func.id == "max" and isinstance(step.op, ast.Sub):
+                    stepped.add(key)
+                    clamps[0].setdefault(key, bound)
+        elif isinstance(node, ast.If):
+            steps = {}
+            for statement in node.body:
+                for inner in ast.walk(statement):
+                    if isinstance(inner, ast.AugAssign) and isinstance(inner.op, (ast.Add, ast.Sub)) \
+                            and _int_constant(inner.value) == 1 and _state_key(inner.target) is not None:
+                        steps[_state_key(inner.target)] = inner.op
+            stepped.update(steps)
+            for compare in ast.walk(node.test):
+                if not isinstance(compare, ast.Compare) or len(compare.ops) != 1:
+                    continue
+                key, bound = _state_key(compare.left), _int_constant(compare.comparators[0])
+                if key not in steps or bound is None:
+                    continue
+                op = compare.ops[0]
+                if isinstance(steps[key], ast.Add) and isinstance(op, (ast.Lt, ast.LtE)):
+                    guards[1].setdefault(key, bound if isinstance(op, ast.Lt) else bound + 1)
+                elif isinstance(steps[key], ast.Sub) and isinstance(op, (ast.Gt, ast.GtE)):
+                    guards[0].setdefault(key, bound if isinstance(op, ast.Gt) else bound - 1)
+
+    lows = {**guards[0], **clamps[0]}
+    highs = {**guards[1], **clamps[1]}
+    candidates = [key for key in stepped if key in highs]
+    if not candidates:
+        return None
+    # Prefer keys named like a difficulty, then keys with a known lower bound
+    key = max(sorted(candidates), key=lambda k: (_looks_like_difficulty(k), k in lows))
+    low, high = lows.get(key, initial.get(key, 1)), highs[key]
+    if low >= high:
+        return None
+    return {"key": key, "levels": list(range(low, high + 1)), "initial_state": _initial_state(tree, key)}
+
+
+def _initial_state(tree, key):
+    """Return the literal values set by the ``if "x" not in st.session_state:`` block that initializes `key`.
+
+    Presetting the difficulty key skips such a block, so callers that choose a
+    level seed the session with these values too.  Values that aren't plain
+    literals (generated problems, sets) are left out.
+    """
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.If) and isinstance(node.test, ast.Compare)
+                and len(node.test.ops) == 1 and isinstance(node.test.ops[0], ast.NotIn)
+                and ast.unparse(node.test.comparators[0]) == "st.session_state"):
+            continue
+        values = {}
+        for statement in node.body:
+            for inner in ast.walk(statement):
+                if not isinstance(inner, ast.Assign):
+                    continue
+                for target in inner.targets:
+                    state_key = _state_key(target)
+                    if state_key is None:
+                        continue
+                    try:
+                        value = ast.literal_eval(inner.value)
+                    except ValueError:
+                        continue
+                    if isinstance(value, (type(None), bool, int, float, str, list, dict)):
+                        values.setdefault(state_key, value)
+        if key in values:
+            return values
+    return {}
+
+
+def _writes_state(function):
+    """Check whether a function body assigns to a session state key"""
+    return any(
+        _state_key(target) is not None
+        for node in ast.walk(function) if isinstance(node, ast.Assign)
+        for target in node.targets
+    )
+
+
+def generator_call(tree):
+    """Return the source of the call that generates a new problem, or None.
+
+    Activities either have a no-argument ``generate_*`` function that stores
+    the problem in session state itself (``generate_new_question()``), or
+    store the return value of a module function called with constants and
+    session state values (``make_problem(st.session_state.level)``).
+    """
+    functions = {node.name: node for node in tree.body if isinstance(node, ast.FunctionDef)}
+
+    generators = [
+        function for name, function in functions.items()
+        if name.startswith("generate") and not function.args.kwonlyargs
+        and len(function.args.args) == len(function.args.defaults) and _writes_state(function)
+    ]
+    # The outermost generator, i.e. the one no other generator calls
+    called_by_generators = {
+        node.func.id
+        for function in generators
+        for node in ast.walk(function)
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+    }
+    outermost = [function.name for function in generators if function.name not in called_by_generators]
+    if len(outermost) == 1:
+        return f"{outermost[0]}()"
+
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Assign) and len(node.targets) == 1 and _state_key(node.targets[0])
+                and isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Name)
+                and node.value.func.id in functions and not node.value.keywords):
+            continue
+        if all(isinstance(arg, ast.Constant) or _state_key(arg) for arg in node.value.args):
+            return ast.unparse(node.value)
+    return None
+
+
+def while_loop_body_lines(tree):
+    """Return the first body line of every while loop, to count rejection-loop iterations"""
+    return sorted(node.body[0].lineno for node in ast.walk(tree) if isinstance(node, ast.While))
+
+
+def level_states(difficulty):
+    """Return [(level, session state)] that start an activity at each of its difficulty levels"""
+    if not difficulty:
+        return [(None, {})]
+    # Presetting the level skips the activity's own initialization, so seed that too
+    return [
+        (level, {**copy.deepcopy(difficulty["initial_state"]), difficulty["key"]: level})
+        for level in difficulty["levels"]
+    ]
+
+
+def analyze_activity(file_path):
+    """Parse an activity file and return {"entry": bool, "difficulty": dict or None, "generator": str or None}"""
+    with open(file_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=file_path)
+    return {
+        "entry": defines_entry_point(tree),
+        "difficulty": difficulty_levels(tree),
+        "generator": generator_call(tree),
+    }
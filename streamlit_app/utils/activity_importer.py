@@ -0,0 +1,90 @@
+"""Import system for activity modules.
+
+Every activity file in the Grades tree is importable under the virtual
+``mathwiz.activities`` package without touching ``sys.path``:
+
+    Grades/Year 5/S.Time/elapsed_time.py -> mathwiz.activities.year5.s_time.elapsed_time
+
+A single meta path finder answers for the whole namespace from the route
+manifest, so finding a module is a dict lookup whatever the size of
+``sys.path``, and two activities with the same file name in different
+sections or grades can never collide in ``sys.modules``.
+"""
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import re
+import sys
+import threading
+
+ROOT_PACKAGE = "mathwiz.activities"
+
+_finder = None
+_install_lock = threading.Lock()
+
+
+def package_name(folder):
+    """Convert a Grades folder name to a package name, e.g. 'S.Time' -> 's_time'"""
+    name = folder.lower().replace(".", "_").replace(" ", "")
+    return re.sub(r"[^0-9a-z_]", "", name)
+
+
+def module_name(grade_folder, section_folder, subtopic):
+    """Return the fully qualified module name of an activity file"""
+    return f"{ROOT_PACKAGE}.{package_name(grade_folder)}.{package_name(section_folder)}.{subtopic}"
+
+
+class _PackageLoader(importlib.abc.Loader):
+    """Loader for the empty intermediate packages of the activity namespace"""
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        pass
+
+
+class ActivityFinder(importlib.abc.MetaPathFinder):
+    """Meta path finder that maps mathwiz.activities.* names to activity files"""
+
+    def __init__(self, files):
+        # module name -> absolute file path
+        self._files = dict(files)
+        self._packages = set()
+        for name in self._files:
+            parts = name.split(".")
+            for i in range(1, len(parts)):
+                self._packages.add(".".join(parts[:i]))
+        self._package_loader = _PackageLoader()
+
+    def find_spec(self, fullname, path=None, target=None):
+        file_path = self._files.get(fullname)
+        if file_path is not None:
+            return importlib.util.spec_from_file_location(fullname, file_path)
+        if fullname in self._packages:
+            spec = importlib.machinery.ModuleSpec(fullname, self._package_loader, is_package=True)
+            spec.submodule_search_locations = []
+            return spec
+        return None
+
+    def module_names(self):
+        """Return every activity module name this finder can import"""
+        return sorted(self._files)
+
+
+def install_activity_finder(manifest):
+    """Install a finder for the routes of a manifest on sys.meta_path once and return it"""
+    global _finder
+    if _finder is None:
+        with _install_lock:
+            if _finder is None:
+                files = {
+                    route["module"]: route["path"]
+                    for grade_routes in manifest["routes"].values()
+                    for route in grade_routes.values()
+                }
+                finder = ActivityFinder(files)
+                # Our names are a closed set, so answer before the path-based finders
+                sys.meta_path.insert(0, finder)
+                _finder = finder
+    return _finder
@@ -0,0 +1,75 @@
+"""Process-wide registry of loaded activity modules.
+
+Streamlit re-executes main.py on every interaction, so activity modules are
+kept here between reruns instead of being re-executed on each click.  A module
+is only imported again when its source file's modification time changes.
+Freshly imported modules draw from a seedable stand-in for the random module
+(utils.generation) and get their generator served from the problem bank
+(utils.problem_bank) when the bank has pools for them.
+"""
+import importlib
+import os
+import sys
+import threading
+
+from utils.activity_importer import install_activity_finder
+from utils.generation import install_seeded_random
+from utils.problem_bank import attach_problem_bank
+from utils.route_manifest import get_manifest
+
+# (grade, subtopic) -> (mtime_ns, module)
+_modules = {}
+
+# One lock per activity so a slow first load doesn't block other activities
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+def _lock_for(key):
+    """Return the load lock for a registry key"""
+    with _locks_guard:
+        lock = _locks.get(key)
+        if lock is None:
+            lock = _locks[key] = threading.Lock()
+        return lock
+
+
+def _import_activity(name):
+    """Import (or re-import) an activity module through the activity finder"""
+    install_activity_finder(get_manifest())
+    sys.modules.pop(name, None)
+    return importlib.import_module(name)
+
+
+def load_activity(grade, subtopic, route):
+    """Return the activity module for (grade, subtopic), loading it only if needed"""
+    key = (grade, subtopic)
+    mtime = os.stat(route["path"]).st_mtime_ns
+
+    cached = _modules.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with _lock_for(key):
+        # Another session may have loaded it while we were waiting
+        cached = _modules.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        module = _import_activity(route["module"])
+        install_seeded_random(module)
+        attach_problem_bank(module, grade, subtopic, route)
+        _modules[key] = (mtime, module)
+        return module
+
+
+def loaded_activities():
+    """Return the (grade, subtopic) keys of every cached activity"""
+    return list(_modules)
+
+
+def clear_activities():
+    """Drop every cached activity module"""
+    for _, module in _modules.values():
+        sys.modules.pop(module.__name__, None)
+    _modules.clear()
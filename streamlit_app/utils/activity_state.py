@@ -0,0 +1,112 @@
+"""Activity-scoped session state.
+
+Activities write loose keys (``show_feedback``, ``user_answer``,
+``problem_data`` ...) straight into st.session_state.  Without help those keys
+outlive the visit, collide with the next activity's keys of the same name
+and pile up for the rest of the session.
+
+The router brackets every activity run with enter_activity().  Keys that
+appear while an activity is active belong to it.  When the student moves to
+another activity or back to the curriculum, the owned keys are moved out of
+st.session_state into one dict per activity, and moved back when the student
+returns.  Only the most recently used MAX_KEPT_ACTIVITIES dicts are kept, so
+a session's state stays the same size however many activities it visits.
+
+Widget values are left to Streamlit, which already drops them once the
+widget is no longer drawn.
+"""
+from collections import OrderedDict
+
+import streamlit as st
+from streamlit.errors import StreamlitAPIException
+from streamlit.runtime.state import get_session_state
+
+STORE_KEY = "_activity_state"
+
+# How many left activities keep their state for when the student comes back
+MAX_KEPT_ACTIVITIES = 3
+
+
+def _store():
+    """Return this session's activity state bookkeeping, creating it on first use"""
+    store = st.session_state.get(STORE_KEY)
+    if store is None:
+        store = {
+            "active": None,  # route of the running activity
+            "shared": set(),  # keys that existed before it started
+            "kept": OrderedDict(),  # route -> {key: value}, least recently left first
+        }
+        st.session_state[STORE_KEY] = store
+    return store
+
+
+def _widget_keys():
+    """Return the session state keys that belong to widgets"""
+    try:
+        return set(get_session_state()._state._key_id_mapper.id_key_mapping.values())
+    except AttributeError:
+        # Streamlit's internals moved; treating widget keys as plain keys is
+        # still safe, restored values just act as widget defaults
+        return set()
+
+
+def _stash_active(store, max_kept):
+    """Move the active activity's keys out of st.session_state"""
+    if store["active"] is None:
+        return
+    skip = store["shared"] | _widget_keys() | {STORE_KEY}
+    owned = {key: st.session_state[key] for key in list(st.session_state.keys()) if key not in skip}
+    for key in owned:
+        del st.session_state[key]
+
+    kept = store["kept"]
+    kept[store["active"]] = owned
+    kept.move_to_end(store["active"])
+    while len(kept) > max_kept:
+        kept.popitem(last=False)
+    store["active"] = None
+
+
+def enter_activity(route_id, max_kept=MAX_KEPT_ACTIVITIES):
+    """Make `route_id` the active activity, swapping its state in if the student is switching to it"""
+    store = _store()
+    if store["active"] == route_id:
+        return
+    _stash_active(store, max_kept)
+
+    store["shared"] = set(st.session_state.keys())
+    for key, value in store["kept"].pop(route_id, {}).items():
+        try:
+            st.session_state[key] = value
+        except StreamlitAPIException:
+            # A widget already owns the key this run; it keeps its own value
+            pass
+    store["active"] = route_id
+
+
+def leave_activity(max_kept=MAX_KEPT_ACTIVITIES):
+    """Put the active activity's state away, e.g. when the student goes back to the curriculum"""
+    _stash_active(_store(), max_kept)
+
+
+def state_by_owner():
+    """Return {owner: {key: value}} for this session's state.
+
+    The owner is the route of the activity a key belongs to, kept ones
+    included, or None for keys the app set outside any activity.
+    """
+    store = _store()
+    owners = {}
+    for key in st.session_state.keys():
+        if key == STORE_KEY:
+            continue
+        owner = None if key in store["shared"] or store["active"] is None else store["active"]
+        owners.setdefault(owner, {})[key] = st.session_state[key]
+    for route_id, kept in store["kept"].items():
+        owners.setdefault(route_id, {}).update(kept)
+    return owners
+
+
+def kept_activities():
+    """Return the routes whose state is kept for this session, least recently left first"""
+    return list(_store()["kept"])
@@ -0,0 +1,212 @@
+"""Parse and compare typed answers.
+
+Activities that take a typed answer compare it with the correct one, and a
+student may write the same answer several ways: "$1,250.5" and "1250.50",
+"1 1/2" and "3/2", "2 hours 30 minutes" and "150 min", "xiv" and "XIV".
+Each kind of answer has one grammar, compiled once here, and
+canonical_answer() turns text into a canonical value, or None when the text
+doesn't fit the grammar:
+
+    integer      "1,250", "-7"                      int
+    decimal      "3.50", "-.5", "12"                Fraction
+    fraction     "3/4", "1 1/2", "0.25", "25%"      Fraction
+    money        "$1,250.50", "-$3", "75¢"          Fraction of dollars
+    time         "3:05 pm", "Monday 15:05"          (day, hour, minute, period)
+    duration     "2h 30m", "1 hour 5 minutes"       whole minutes
+    roman        "XIV", "mcmxc"                     int
+    expression   "(5 x 3) + 2"                      canonical text (utils.expressions)
+
+Times are kept on a 12-hour clock: "15:05" is (None, 3, 5, "pm").  Days
+are indexes into DAYS, and a day's first three letters are enough.
+
+    answers_match("1 1/2", "3/2", "fraction")        True
+    answers_match("150 min", "2h 30m", "duration")   True
+
+Canonical values are cached, so grading many answers to the same question
+parses its correct answer once.  python -m utils.bench answers measures the
+checks per second.
+"""
+import functools
+import re
+from fractions import Fraction
+
+from utils import expressions
+from utils.expressions import exact_number
+
+KINDS = ("integer", "decimal", "fraction", "money", "time", "duration", "roman", "expression")
+
+DAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+# Canonical values kept per (text, kind)
+CACHE_SIZE = 16384
+
+# Signs, with the minus signs students paste in from elsewhere
+_SIGN = r"([+\-−–]?)"
+_NUMBER = r"(?:\d{1,3}(?:,\d{3})+|\d+)"
+_INTEGER = re.compile(rf"{_SIGN}\s*({_NUMBER})")
+_DECIMAL = re.compile(rf"{_SIGN}\s*({_NUMBER}(?:\.\d*)?|\.\d+)")
+_FRACTION = re.compile(rf"{_SIGN}\s*(?:(\d+)\s+)?(\d+)\s*/\s*(\d+)")
+_PERCENT = re.compile(rf"{_SIGN}\s*({_NUMBER}(?:\.\d*)?|\.\d+)\s*%")
+_MONEY = re.compile(
+    rf"{_SIGN}\s*(\$?)\s*{_SIGN}\s*({_NUMBER}(?:\.\d*)?|\.\d+)\s*(¢|c|cents?|dollars?)?",
+    re.IGNORECASE,
+)
+_TIME = re.compile(
+    r"(?:([a-z]+)\.?,?\s*)?(\d{1,2})\s*[:.]\s*(\d{1,2})\s*(?:([ap])\.?\s*m\.?)?",
+    re.IGNORECASE,
+)
+_DURATION = re.compile(
+    r"(?:(\d+)\s*(?:h|hrs?|hours?)\.?)?\s*(?:and\s*)?(?:(\d+)\s*(?:m|mins?|minutes?)\.?)?",
+    re.IGNORECASE,
+)
+_ROMAN = re.compile(r"M{0,3}(?:CM|CD|D?C{0,3})(?:XC|XL|L?X{0,3})(?:IX|IV|V?I{0,3})", re.IGNORECASE)
+_ROMAN_VALUES = {"I": 1, "V": 5, "X": 10, "L": 50, "C": 100, "D": 500, "M": 1000}
+
+
+def _signed(sign, value):
+    return -value if sign and sign != "+" else value
+
+
+def parse_integer(text):
+    """Return a whole number, with or without thousands separators, as an int"""
+    match = _INTEGER.fullmatch(text)
+    if match is None:
+        return None
+    return _signed(match[1], int(match[2].replace(",", "")))
+
+
+def parse_decimal(text):
+    """Return a whole number or decimal as an exact Fraction"""
+    match = _DECIMAL.fullmatch(text)
+    if match is None:
+        return None
+    return _signed(match[1], exact_number(match[2].replace(",", "")))
+
+
+def parse_fraction(text):
+    """Return a fraction, mixed number, decimal or percentage as a Fraction"""
+    match = _FRACTION.fullmatch(text)
+    if match is not None:
+        sign, whole, numerator, denominator = match.groups()
+        denominator = int(denominator)
+        if denominator == 0:
+            return None
+        return _signed(sign, Fraction(int(whole or 0) * denominator + int(numerator), denominator))
+    match = _PERCENT.fullmatch(text)
+    if match is not None:
+        return _signed(match[1], exact_number(match[2].replace(",", "")) / 100)
+    return parse_decimal(text)
+
+
+def parse_money(text):
+    """Return an amount of money as a Fraction of dollars; a ¢ or "cents" suffix counts cents"""
+    match = _MONEY.fullmatch(text)
+    if match is None:
+        return None
+    sign, dollar, inner_sign, number, unit = match.groups()
+    if (sign and inner_sign) or (dollar and unit and unit[0] in "¢cC"):
+        return None
+    value = exact_number(number.replace(",", ""))
+    if unit and unit[0] in "¢cC":
+        value /= 100
+    return _signed(sign or inner_sign, value)
+
+
+def parse_time(text):
+    """Return a clock time as (day index or None, hour 1-12, minute, "am"/"pm" or None)"""
+    match = _TIME.fullmatch(text)
+    if match is None:
+        return None
+    day, hour, minute, period = match.groups()
+    hour, minute = int(hour), int(minute)
+    if day is not None:
+        day = day.lower()
+        day = next((index for index, name in enumerate(DAYS) if len(day) >= 3 and name.startswith(day)), None)
+        if day is None:
+            return None
+    if minute > 59:
+        return None
+    if period is not None:
+        if not 1 <= hour <= 12:
+            return None
+        return day, hour, minute, period.lower() + "m"
+    if hour > 23:
+        return None
+    if hour > 12 or hour == 0:
+        # A 24-hour clock time
+        return day, hour % 12 or 12, minute, "pm" if hour >= 12 else "am"
+    return day, hour, minute, None
+
+
+def parse_duration(text):
+    """Return a length of time in hours and/or minutes as whole minutes"""
+    match = _DURATION.fullmatch(text)
+    if match is None or match.groups() == (None, None):
+        return None
+    hours, minutes = match.groups()
+    return int(hours or 0) * 60 + int(minutes or 0)
+
+
+def parse_roman(text):
+    """Return the value of a Roman numeral written in standard form"""
+    if not text or _ROMAN.fullmatch(text) is None:
+        return None
+    total = previous = 0
+    for letter in reversed(text.upper()):
+        value = _ROMAN_VALUES[letter]
+        total = total - value if value < previous else total + value
+        previous = max(previous, value)
+    return total
+
+
+def parse_expression(text):
+    """Return an expression's canonical text (see utils.expressions.normalize_expression)"""
+    try:
+        return expressions.normalize_expression(text)
+    except expressions.ExpressionError:
+        return None
+
+
+_PARSERS = {
+    "integer": parse_integer,
+    "decimal": parse_decimal,
+    "fraction": parse_fraction,
+    "money": parse_money,
+    "time": parse_time,
+    "duration": parse_duration,
+    "roman": parse_roman,
+    "expression": parse_expression,
+}
+
+
+def parse_answer(text, kind):
+    """Return the canonical value of an answer of a kind (one of KINDS), or None if it isn't one"""
+    parser = _PARSERS.get(kind)
+    if parser is None:
+        raise ValueError(f"answer kind {kind!r} is not one of {KINDS}")
+    if not isinstance(text, str):
+        return None
+    text = text.strip()
+    return parser(text) if text else None
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def canonical_answer(text, kind):
+    """parse_answer(), cached"""
+    return parse_answer(text, kind)
+
+
+def answers_match(given, expected, kind):
+    """Check whether a student's answer has the same canonical value as the correct one.
+
+    An answer that doesn't parse never matches.  A time written without AM
+    or PM matches the correct time with either, as students read clocks
+    that don't show it.
+    """
+    value = canonical_answer(given, kind)
+    if value is None:
+        return False
+    correct = canonical_answer(expected, kind)
+    if kind == "time" and correct is not None and None in (value[3], correct[3]):
+        return value[:3] == correct[:3]
+    return value == correct
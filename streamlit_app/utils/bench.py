@@ -0,0 +1,582 @@
+"""Benchmarks for the activity modules.
+
+Run from the streamlit_app directory:
+
+    python -m utils.bench imports [--budget-ms 250] [--sort time]
+    python -m utils.bench generators [--iterations 2000] [--compare baseline.json]
+    python -m utils.bench charts [--iterations 50]
+    python -m utils.bench answers [--iterations 20000] [--min-rate 100000]
+
+``imports`` imports every activity module in a fresh interpreter and records
+wall time, peak RSS growth and the third-party packages the import pulled in.
+The report is written as CSV (bench_results/imports.csv by default) and the
+command exits with status 1 when a module exceeds the budget.
+
+``generators`` calls each activity's problem generator (the call recorded in
+the route manifest) in a headless session, at every difficulty level, and
+records calls per second, the slowest call and how often the activity's
+while loops (rejection loops such as ``while b == a: b = randint(...)``) ran
+their body per call.  Results are written as stable, sorted JSON
+(bench_results/generators.json by default) so two runs can be diffed, and
+``--compare`` reports and fails on regressions against an earlier file.
+
+``charts`` draws sample bar graphs, line graphs and dot plots with the SVG
+chart engine (utils.svg_chart) and with matplotlib, as the graph activities
+used to, and records the render time and the bytes sent to the browser for
+each (bench_results/charts.csv by default).
+
+``answers`` checks sample answers of every kind with the answer engine
+(utils.answers) and records checks per second, in the fastest of many passes
+over the samples, in three modes: "cold" parses both answers, "graded" finds
+the correct answers already cached, as when many students' worksheets are
+graded against the same questions, and "warm" finds both cached
+(bench_results/answers.csv by default).  The command exits with status 1
+when the graded rate over all samples is below ``--min-rate``; only the
+graded and warm paths are held to it.  Cold checks parse two answers each
+and run slower, expressions slowest of all.
+"""
+import argparse
+import ast
+import csv
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.activity_analysis import level_states, while_loop_body_lines
+from utils.route_manifest import APP_DIR, get_manifest
+
+RESULTS_DIR = os.path.join(APP_DIR, "bench_results")
+
+# Runs in a fresh interpreter and imports the modules named on the command
+# line one after another, printing a JSON line for each.  streamlit is imported
+# before the clock starts: every activity needs it and a server process
+# already has it.
+_IMPORT_PROBE = r"""
+import importlib, json, sys, time
+sys.path.insert(0, sys.argv[1])
+try:
+    import resource
+except ImportError:
+    resource = None
+import streamlit
+from utils.activity_importer import install_activity_finder
+from utils.route_manifest import get_manifest
+
+install_activity_finder(get_manifest())
+
+def peak_rss_kb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+for module_name in sys.argv[2:]:
+    before = set(sys.modules)
+    rss_before = peak_rss_kb()
+    start = time.perf_counter()
+    importlib.import_module(module_name)
+    elapsed = time.perf_counter() - start
+    rss_after = peak_rss_kb()
+
+    packages = {name.partition(".")[0] for name in set(sys.modules) - before}
+    third_party = sorted(
+        name for name in packages
+        if name not in sys.stdlib_module_names and not name.startswith("_")
+        and getattr(sys.modules.get(name), "__file__", None)
+    )
+    print(json.dumps({
+        "import_ms": elapsed * 1000,
+        "peak_rss_kb": None if rss_before is None else rss_after - rss_before,
+        "dependencies": third_party,
+    }))
+"""
+
+IMPORT_SORT_KEYS = {
+    "time": lambda row: -row["import_ms"],
+    "rss": lambda row: -(row["peak_rss_kb"] or 0),
+    "name": lambda row: row["module"],
+}
+
+
+def iter_routes():
+    """Yield (grade, subtopic, route) for every route in the manifest"""
+    for grade, grade_routes in sorted(get_manifest()["routes"].items()):
+        for subtopic, route in sorted(grade_routes.items()):
+            yield grade, subtopic, route
+
+
+def profile_import(module_name, repeat=1):
+    """Import a module in fresh interpreters and return the fastest run's measurements"""
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", _IMPORT_PROBE, APP_DIR, module_name],
+            cwd=APP_DIR, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            error = result.stderr.strip().splitlines()
+            raise RuntimeError(f"importing {module_name} failed: {error[-1] if error else result.returncode}")
+        measurement = json.loads(result.stdout.strip().splitlines()[-1])
+        if best is None or measurement["import_ms"] < best["import_ms"]:
+            best = measurement
+    return best
+
+
+def profile_imports(module_names):
+    """Import modules one after another in one fresh interpreter and return each one's measurements.
+
+    Quicker than profile_import() per module, but a package two modules
+    share is only charged to the first of them.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", _IMPORT_PROBE, APP_DIR, *module_names],
+        cwd=APP_DIR, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()
+        raise RuntimeError(f"importing activity modules failed: {error[-1] if error else result.returncode}")
+    lines = result.stdout.strip().splitlines()[-len(module_names):]
+    return dict(zip(module_names, (json.loads(line) for line in lines)))
+
+
+def write_csv(rows, columns, path):
+    """Write benchmark rows to a CSV file, creating its directory if needed"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({
+                column: " ".join(value) if isinstance(value, list) else value
+                for column, value in row.items()
+            })
+
+
+def run_imports(args):
+    """Profile the import of every activity module"""
+    routes = [
+        (grade, subtopic, route) for grade, subtopic, route in iter_routes()
+        if not args.only or args.only in subtopic
+    ]
+
+    def measure(entry):
+        grade, subtopic, route = entry
+        row = {"grade": grade, "subtopic": subtopic, "module": route["module"]}
+        try:
+            row.update(profile_import(route["module"], args.repeat))
+        except RuntimeError as e:
+            row.update(import_ms=0.0, peak_rss_kb=None, dependencies=[], error=str(e))
+        return row
+
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        rows = list(pool.map(measure, routes))
+    rows.sort(key=IMPORT_SORT_KEYS[args.sort])
+
+    write_csv(rows, ["grade", "subtopic", "module", "import_ms", "peak_rss_kb", "dependencies", "error"],
+              args.output)
+
+    print(f"{'import ms':>10} {'peak RSS KB':>12}  activity / third-party packages")
+    for row in rows[:args.top]:
+        rss = "" if row["peak_rss_kb"] is None else row["peak_rss_kb"]
+        print(f"{row['import_ms']:>10.1f} {rss:>12}  {row['subtopic']}  [{', '.join(row['dependencies'])}]")
+    print(f"\nFull report for {len(rows)} modules: {os.path.relpath(args.output)}")
+
+    failed = [row for row in rows if row.get("error")]
+    for row in failed:
+        print(f"ERROR {row['subtopic']}: {row['error']}")
+
+    over_budget = []
+    if args.budget_ms is not None:
+        over_budget = [row for row in rows if row["import_ms"] > args.budget_ms]
+        for row in over_budget:
+            print(f"OVER BUDGET {row['subtopic']}: {row['import_ms']:.1f} ms > {args.budget_ms:.1f} ms")
+    return 1 if failed or over_budget else 0
+
+
+def _count_loop_iterations(file_path, lines, call):
+    """Call `call` once and return how many times the given lines of a file ran"""
+    hits = 0
+    lines = set(lines)
+
+    def trace_lines(frame, event, arg):
+        nonlocal hits
+        if event == "line" and frame.f_lineno in lines:
+            hits += 1
+        return trace_lines
+
+    def trace_calls(frame, event, arg):
+        if frame.f_code.co_filename == file_path:
+            return trace_lines
+        return None
+
+    sys.settrace(trace_calls)
+    try:
+        call()
+    finally:
+        sys.settrace(None)
+    return hits
+
+
+def profile_generator(module, route, level, state, iterations, trace_iterations):
+    """Time an activity's generator at one difficulty level and count its loop iterations"""
+    # Imported here: they pull in streamlit, which the imports benchmark keeps out of its parent
+    from utils.headless import headless_session
+
+    code = compile(route["generator"], route["path"], "eval")
+    namespace = vars(module)
+    with open(route["path"], encoding="utf-8") as f:
+        loop_lines = while_loop_body_lines(ast.parse(f.read()))
+
+    with headless_session(state):
+        # Let the activity initialize the rest of its state, as on a first visit
+        module.run()
+
+        def call():
+            eval(code, namespace)
+
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            call()
+            timings.append(time.perf_counter() - start)
+
+        loop_iterations = [
+            _count_loop_iterations(module.__file__, loop_lines, call)
+            for _ in range(trace_iterations if loop_lines else 0)
+        ]
+
+    total = sum(timings)
+    # Calls per second from the median call, which a stray GC pause or context switch doesn't move
+    median = sorted(timings)[len(timings) // 2]
+    return {
+        "level": level,
+        "ops_per_sec": round(1 / median, 1) if median else None,
+        "mean_us": round(total / iterations * 1e6, 1),
+        "worst_ms": round(max(timings) * 1000, 3),
+        "loop_iterations_mean": round(sum(loop_iterations) / len(loop_iterations), 2) if loop_iterations else 0,
+        "loop_iterations_max": max(loop_iterations, default=0),
+    }
+
+
+def compare_generators(baseline, results, threshold):
+    """Return regression lines for generator results that got slower or loop more than a baseline"""
+    regressions = []
+    for subtopic, entry in sorted(results.items()):
+        old_entry = baseline.get(subtopic)
+        if old_entry is None:
+            continue
+        for level, row in sorted(entry.get("levels", {}).items()):
+            old = old_entry.get("levels", {}).get(level)
+            if old is None:
+                continue
+            if "error" in row and "error" not in old:
+                regressions.append(f"{subtopic} level {level}: {row['error']}")
+            if not old.get("ops_per_sec") or not row.get("ops_per_sec"):
+                continue
+            if row["ops_per_sec"] < old["ops_per_sec"] * (1 - threshold):
+                regressions.append(f"{subtopic} level {level}: {old['ops_per_sec']:.0f} -> "
+                                   f"{row['ops_per_sec']:.0f} calls/s")
+            if row["loop_iterations_max"] > max(old["loop_iterations_max"] * 2, old["loop_iterations_max"] + 10):
+                regressions.append(f"{subtopic} level {level}: worst loop iterations "
+                                   f"{old['loop_iterations_max']} -> {row['loop_iterations_max']}")
+        if entry.get("error") and not old_entry.get("error"):
+            regressions.append(f"{subtopic}: {entry['error']}")
+    return regressions
+
+
+def run_generators(args):
+    """Benchmark the problem generator of every activity at every difficulty level"""
+    from utils.activity_registry import load_activity
+
+    results = {}
+    skipped = []
+    for grade, subtopic, route in iter_routes():
+        if args.only and args.only not in subtopic:
+            continue
+        if not route.get("generator"):
+            skipped.append(subtopic)
+            continue
+        entry = results[subtopic] = {"grade": grade, "generator": route["generator"], "levels": {}}
+        try:
+            module = load_activity(grade, subtopic, route)
+        except Exception as e:
+            entry["error"] = f"{type(e).__name__}: {e}"
+            continue
+        for level, state in level_states(route.get("difficulty")):
+            try:
+                row = profile_generator(module, route, level, state, args.iterations, args.trace_iterations)
+            except Exception as e:
+                row = {"level": level, "error": f"{type(e).__name__}: {e}"}
+            entry["levels"][str(level)] = row
+
+    rows = [
+        {"subtopic": subtopic, **row}
+        for subtopic, entry in results.items()
+        for row in entry["levels"].values()
+        if "error" not in row
+    ]
+    rows.sort(key=lambda row: row["ops_per_sec"] or 0)
+    print(f"{'calls/s':>10} {'worst ms':>9} {'loops avg':>9} {'loops max':>9}  activity / level")
+    for row in rows[:args.top]:
+        print(f"{row['ops_per_sec']:>10.0f} {row['worst_ms']:>9.2f} {row['loop_iterations_mean']:>9.2f} "
+              f"{row['loop_iterations_max']:>9}  {row['subtopic']} / {row['level']}")
+
+    errors = [
+        f"{subtopic}: {entry['error']}" for subtopic, entry in results.items() if "error" in entry
+    ] + [
+        f"{subtopic} level {level}: {row['error']}"
+        for subtopic, entry in results.items()
+        for level, row in entry["levels"].items() if "error" in row
+    ]
+    for error in sorted(errors):
+        print(f"ERROR {error}")
+    if skipped:
+        print(f"No generator found in the manifest for {len(skipped)} activities: {', '.join(skipped)}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"iterations": args.iterations, "results": results}, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"\n{len(rows)} activity levels benchmarked: {os.path.relpath(args.output)}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare_generators(baseline, results, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+    return 1 if errors else 0
+
+
+# Charts as the data and graphs activities draw them: (svg function, kwargs)
+CHART_SAMPLES = {
+    "bar": ("bar_chart_svg", {
+        "categories": ["Soccer", "Basketball", "Tennis", "Swimming", "Baseball", "Volleyball"],
+        "values": [18, 12, 7, 15, 9, 4], "title": "Favourite Sports", "x_label": "Sport",
+        "y_label": "Number of Students", "y_max": 20, "y_step": 5, "value_labels": True,
+    }),
+    "line_months": ("line_chart_svg", {
+        "x_values": ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug"],
+        "y_values": [3, 5, 9, 14, 18, 22, 25, 24], "title": "Average Temperature",
+        "x_label": "Month", "y_label": "Temperature (°C)", "color": "#FF8C00",
+        "categorical": True, "value_labels": True,
+    }),
+    "line_years": ("line_chart_svg", {
+        "x_values": [2015, 2016, 2017, 2018, 2019, 2020, 2021, 2022],
+        "y_values": [120, 135, 150, 148, 170, 165, 190, 210], "title": "Library Visitors",
+        "x_label": "Year", "y_label": "Visitors", "color": "#4169E1",
+    }),
+    "dot_plot": ("dot_plot_svg", {
+        "counts": {0: 2, 1: 5, 2: 3, 3: 6, 4: 1, 5: 2}, "x_min": 0, "x_max": 5,
+        "x_label": "Number of pets", "color": "#2196F3",
+    }),
+}
+
+
+def _matplotlib_chart(name, options):
+    """Draw a CHART_SAMPLES chart with matplotlib the way the activities did before SVG"""
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    if name == "bar":
+        fig, ax = plt.subplots(figsize=(8, 6))
+        x_pos = np.arange(len(options["categories"]))
+        colors = plt.cm.Set3(np.linspace(0, 1, len(options["categories"])))
+        bars = ax.bar(x_pos, options["values"], color=colors, edgecolor="black", linewidth=1)
+        ax.set_xticks(x_pos)
+        ax.set_xticklabels(options["categories"], rotation=45 if len(options["categories"]) > 5 else 0,
+                           ha="right")
+        ax.set_ylim(0, options["y_max"])
+        ax.set_yticks(range(0, options["y_max"] + 1, options["y_step"]))
+        ax.grid(True, axis="y", alpha=0.3, linestyle="--")
+        for bar, value in zip(bars, options["values"]):
+            ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + options["y_step"] / 10,
+                    str(value), ha="center", va="bottom", fontsize=10)
+    elif name.startswith("line"):
+        fig, ax = plt.subplots(figsize=(10, 6))
+        x_values = range(len(options["x_values"])) if options.get("categorical") else options["x_values"]
+        ax.plot(x_values, options["y_values"], color=options["color"], linewidth=2, marker="o", markersize=8)
+        if options.get("categorical"):
+            ax.set_xticks(x_values)
+            ax.set_xticklabels(options["x_values"], rotation=45, ha="right")
+        ax.grid(True, alpha=0.3, linestyle="-")
+        ax.set_ylim(0, max(options["y_values"]) * 1.1)
+        if options.get("value_labels"):
+            for x, y in zip(x_values, options["y_values"]):
+                ax.text(x, y + 0.5, str(y), ha="center", va="bottom", fontsize=10)
+    else:
+        fig, ax = plt.subplots(figsize=(6, 3.5))
+        for value, count in options["counts"].items():
+            ax.plot([value] * count, range(1, count + 1), "x", color=options["color"], markersize=14, mew=3)
+        ax.set_xticks(range(options["x_min"], options["x_max"] + 1))
+        ax.set_yticks([])
+        for side in ("left", "right", "top"):
+            ax.spines[side].set_visible(False)
+
+    if "title" in options:
+        ax.set_title(options["title"], fontsize=14, fontweight="bold")
+        ax.set_ylabel(options["y_label"], fontsize=12)
+    ax.set_xlabel(options["x_label"], fontsize=12)
+    plt.tight_layout()
+    return fig
+
+
+def _median_ms(func, iterations):
+    """Return the median wall time of func() in milliseconds"""
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return times[len(times) // 2]
+
+
+def run_charts(args):
+    """Compare the SVG chart engine with matplotlib on sample charts"""
+    import matplotlib
+    matplotlib.use("Agg")
+    from utils import svg_chart
+    from utils.figure_cache import render_png
+
+    rows = []
+    for name, (function, options) in CHART_SAMPLES.items():
+        draw_svg = getattr(svg_chart, function)
+        svg = draw_svg(**options)
+        png = render_png(_matplotlib_chart(name, options))
+        svg_ms = _median_ms(lambda: draw_svg(**options), args.iterations)
+        png_ms = _median_ms(lambda: render_png(_matplotlib_chart(name, options)),
+                            max(1, args.iterations // 10))
+        rows.append({
+            "chart": name,
+            "svg_ms": round(svg_ms, 3), "svg_bytes": len(svg.encode()),
+            "matplotlib_ms": round(png_ms, 3), "png_bytes": len(png),
+            "speedup": round(png_ms / svg_ms, 1),
+        })
+
+    write_csv(rows, ["chart", "svg_ms", "svg_bytes", "matplotlib_ms", "png_bytes", "speedup"], args.output)
+    print(f"{'chart':<12} {'svg ms':>8} {'svg bytes':>10} {'mpl ms':>8} {'png bytes':>10} {'speedup':>8}")
+    for row in rows:
+        print(f"{row['chart']:<12} {row['svg_ms']:>8.3f} {row['svg_bytes']:>10} {row['matplotlib_ms']:>8.1f} "
+              f"{row['png_bytes']:>10} {row['speedup']:>7.0f}x")
+    print(f"\nReport: {os.path.relpath(args.output)}")
+    return 0
+
+
+# A student's answer and the correct one for each kind utils.answers parses
+ANSWER_SAMPLES = [
+    ("integer", "1,250", "1250"), ("integer", "-7", "-7"),
+    ("decimal", "3.50", "3.5"), ("decimal", ".75", "0.75"),
+    ("fraction", "1 1/2", "3/2"), ("fraction", "25%", "1/4"), ("fraction", "0.4", "2/5"),
+    ("money", "$1,265.10", "1265.1"), ("money", "75¢", "$0.75"),
+    ("time", "3:05 pm", "3:05 PM"), ("time", "monday 9:30pm", "Monday 9:30 PM"), ("time", "11:58", "11:58"),
+    ("duration", "2 hours 30 minutes", "2h 30m"), ("duration", "150 min", "2h 30m"),
+    ("roman", "xiv", "XIV"), ("roman", "MCMXC", "MCMXC"),
+    ("expression", "(5 x 3) + 2", "(5 × 3) + 2"), ("expression", "12 ÷ (4 - 1)", "12÷(4-1)"),
+]
+
+
+def _checks_per_second(samples, iterations, mode):
+    """Return how many answers_match() calls on `samples` run per second, in the fastest pass.
+
+    mode is "cold" (nothing cached), "graded" (the correct answers cached,
+    as when a worksheet's questions have been graded before) or "warm"
+    (both answers cached).
+    """
+    from utils import answers, expressions
+
+    fastest = None
+    for _ in range(max(1, iterations // len(samples))):
+        if mode != "warm":
+            answers.canonical_answer.cache_clear()
+            expressions.parse_expression.cache_clear()
+        if mode == "graded":
+            for kind, _, expected in samples:
+                answers.canonical_answer(expected, kind)
+        start = time.perf_counter()
+        for kind, given, expected in samples:
+            answers.answers_match(given, expected, kind)
+        elapsed = time.perf_counter() - start
+        fastest = elapsed if fastest is None else min(fastest, elapsed)
+    return len(samples) / fastest
+
+
+def run_answers(args):
+    """Measure how fast the answer engine checks answers of every kind"""
+    from utils import answers
+
+    wrong = [sample for sample in ANSWER_SAMPLES if not answers.answers_match(sample[1], sample[2], sample[0])]
+    if wrong:
+        raise ValueError(f"sample answers that don't match: {wrong}")
+
+    modes = ("cold", "graded", "warm")
+    rows = []
+    for kind in answers.KINDS + ("all",):
+        samples = [sample for sample in ANSWER_SAMPLES if kind in (sample[0], "all")]
+        rows.append({
+            "kind": kind,
+            **{f"{mode}_per_s": round(_checks_per_second(samples, args.iterations, mode)) for mode in modes},
+        })
+
+    write_csv(rows, ["kind"] + [f"{mode}_per_s" for mode in modes], args.output)
+    print(f"{'kind':<12} {'cold/s':>10} {'graded/s':>10} {'warm/s':>10}")
+    for row in rows:
+        print(f"{row['kind']:<12} {row['cold_per_s']:>10,} {row['graded_per_s']:>10,} {row['warm_per_s']:>10,}")
+    print(f"\nReport: {os.path.relpath(args.output)}")
+    if rows[-1]["graded_per_s"] < args.min_rate:
+        print(f"{rows[-1]['graded_per_s']:,} graded checks/s is below {args.min_rate:,}")
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.bench", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    imports = commands.add_parser("imports", help="profile the import of every activity module")
+    imports.add_argument("--budget-ms", type=float, default=None,
+                         help="fail when a module takes longer than this to import")
+    imports.add_argument("--sort", choices=sorted(IMPORT_SORT_KEYS), default="time")
+    imports.add_argument("--repeat", type=int, default=1, help="keep the fastest of N fresh imports")
+    imports.add_argument("--jobs", type=int, default=1, help="interpreters to run at once")
+    imports.add_argument("--only", default="", help="only profile subtopics containing this text")
+    imports.add_argument("--top", type=int, default=20, help="rows to print")
+    imports.add_argument("--output", default=os.path.join(RESULTS_DIR, "imports.csv"))
+    imports.set_defaults(func=run_imports)
+
+    generators = commands.add_parser("generators", help="benchmark problem generation at every difficulty level")
+    generators.add_argument("--iterations", type=int, default=2000, help="timed calls per activity level")
+    generators.add_argument("--trace-iterations", type=int, default=200,
+                            help="calls per activity level traced to count loop iterations")
+    generators.add_argument("--only", default="", help="only benchmark subtopics containing this text")
+    generators.add_argument("--top", type=int, default=20, help="slowest rows to print")
+    generators.add_argument("--compare", default=None, help="earlier generators.json to check for regressions")
+    generators.add_argument("--threshold", type=float, default=0.25,
+                            help="fractional slowdown in calls/s reported as a regression")
+    generators.add_argument("--output", default=os.path.join(RESULTS_DIR, "generators.json"))
+    generators.set_defaults(func=run_generators)
+
+    charts = commands.add_parser("charts", help="compare SVG and matplotlib chart rendering")
+    charts.add_argument("--iterations", type=int, default=50,
+                        help="timed SVG renders per chart (a tenth as many matplotlib renders)")
+    charts.add_argument("--output", default=os.path.join(RESULTS_DIR, "charts.csv"))
+    charts.set_defaults(func=run_charts)
+
+    answers = commands.add_parser("answers", help="benchmark answer checking with utils.answers")
+    answers.add_argument("--iterations", type=int, default=20000, help="checks timed per kind")
+    answers.add_argument("--min-rate", type=int, default=100000,
+                         help="fail when fewer graded checks per second run over all samples")
+    answers.add_argument("--output", default=os.path.join(RESULTS_DIR, "answers.csv"))
+    answers.set_defaults(func=run_answers)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+"""Curriculum catalog shown on the home page.
+
+The grade curriculum and the topics catalog live in catalog.json next to
+main.py.  The file is parsed once per process; the home page then only asks
+for the grade or topic the student is looking at.
+"""
+import json
+import os
+import threading
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CATALOG_PATH = os.path.join(APP_DIR, "catalog.json")
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog():
+    """Return the process-wide catalog dict with "grades" and "topics" entries"""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                with open(CATALOG_PATH, encoding="utf-8") as f:
+                    _catalog = json.load(f)
+    return _catalog
+
+
+def grade_sections(grade):
+    """Return {section: [activity labels]} for a grade key, or None if it has no curriculum"""
+    return get_catalog()["grades"].get(grade)
+
+
+def topic_categories(topic):
+    """Return {category: [activity labels]} for a topic, or None if it isn't catalogued"""
+    return get_catalog()["topics"].get(topic)
@@ -0,0 +1,98 @@
+"""Analog clock faces for time activities.
+
+At minute resolution a clock has only 720 hand positions, so every face is
+drawn once as SVG and kept in a process-wide atlas keyed by
+(hour, minute, style).  A clock on a question page costs a dict lookup
+instead of a matplotlib figure.
+
+    st.markdown(clock_face_html(9, 45), unsafe_allow_html=True)
+
+Styles (CLOCK_STYLES) set the size, the face tint, the numeral weight and
+whether the face shows A.M./P.M.; only styles that show the period tell
+8:00 from 20:00 apart.
+"""
+import math
+import threading
+
+CLOCK_STYLES = {
+    "plain": {"size": 260, "face": "white", "numerals": "normal", "period": False},
+    "period": {"size": 260, "face": "white", "numerals": "normal", "period": True},
+    "blue": {"size": 150, "face": "#d4e9f2", "numerals": "bold", "period": False},
+    "green": {"size": 150, "face": "#d4f2d4", "numerals": "bold", "period": False},
+    "yellow": {"size": 150, "face": "#fffbe0", "numerals": "bold", "period": False},
+    "pink": {"size": 150, "face": "#fde7ea", "numerals": "bold", "period": False},
+}
+
+# (hour, minute, style) -> svg
+_atlas = {}
+_atlas_lock = threading.Lock()
+
+
+def _hand(angle, length, color, width):
+    """Return a clock hand pointing at `angle` degrees clockwise from 12"""
+    radians = math.radians(angle)
+    x, y = length * math.sin(radians), -length * math.cos(radians)
+    return (f'<line x1="0" y1="0" x2="{x:.1f}" y2="{y:.1f}" stroke="{color}" '
+            f'stroke-width="{width}" stroke-linecap="round"/>')
+
+
+def _draw(hour, minute, style):
+    """Draw one clock face"""
+    options = CLOCK_STYLES[style]
+    height = 250 if options["period"] else 220
+    parts = [f'<svg width="{options["size"]}" viewBox="-110 -110 220 {height}">',
+             f'<circle cx="0" cy="0" r="100" fill="{options["face"]}" stroke="black" stroke-width="3"/>']
+    parts.append(f'<g text-anchor="middle" dominant-baseline="central" font-size="16" '
+                 f'font-weight="{options["numerals"]}">')
+    for number in range(1, 13):
+        radians = math.radians(number * 30)
+        parts.append(f'<text x="{85 * math.sin(radians):.1f}" y="{-85 * math.cos(radians):.1f}">{number}</text>')
+    parts.append("</g>")
+    # Minute ticks: one dashed ring with a dash every 6 degrees
+    step = 2 * math.pi * 95 / 60
+    parts.append(f'<circle cx="0" cy="0" r="95" fill="none" stroke="#666" stroke-width="5" '
+                 f'stroke-dasharray="1.2 {step - 1.2:.3f}"/>')
+    parts.append(_hand((hour % 12 + minute / 60) * 30, 50, "black", 6))
+    parts.append(_hand(minute * 6, 75, "#1f4fd1", 3.5))
+    parts.append('<circle cx="0" cy="0" r="6" fill="black"/>')
+    if options["period"]:
+        parts.append(f'<text x="0" y="130" text-anchor="middle" font-size="20" font-weight="bold">'
+                     f'{"A.M." if hour < 12 else "P.M."}</text>')
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def clock_face_svg(hour, minute, style="plain"):
+    """Return the SVG of a clock showing hour:minute (hour 0-23)"""
+    if style not in CLOCK_STYLES:
+        raise ValueError(f"Unknown clock style {style!r}; expected one of {', '.join(CLOCK_STYLES)}")
+    hour = int(hour) % 24
+    if not CLOCK_STYLES[style]["period"]:
+        hour %= 12
+    key = (hour, int(minute) % 60, style)
+    svg = _atlas.get(key)
+    if svg is None:
+        svg = _draw(*key)
+        with _atlas_lock:
+            _atlas.setdefault(key, svg)
+    return svg
+
+
+def clock_face_html(hour, minute, style="plain"):
+    """Return a clock face centred in its column, ready for st.markdown"""
+    return f'<div style="text-align: center;">{clock_face_svg(hour, minute, style)}</div>'
+
+
+def clock_faces_cached():
+    """Return how many clock faces the atlas holds"""
+    return len(_atlas)
+
+
+def prerender_clock_faces(styles=None):
+    """Draw every hand position of the given styles (default: all) into the atlas"""
+    for style in styles or CLOCK_STYLES:
+        hours = range(24) if CLOCK_STYLES[style]["period"] else range(12)
+        for hour in hours:
+            for minute in range(60):
+                clock_face_svg(hour, minute, style)
+    return len(_atlas)
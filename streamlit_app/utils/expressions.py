@@ -0,0 +1,305 @@
+"""Arithmetic expressions as activities write them.
+
+Activities build expressions such as "(12 + 3) × 4 ÷ 5" and need their
+value, a canonical form to compare a student's expression with, and the
+order-of-operations steps for the explanation.  parse_expression() parses
+one once (results are cached) into a tree of tuples:
+
+    ("num", Fraction, text)     a number, with the text it was written as
+    ("name", name)              a variable, bound when evaluating
+    ("neg", operand)            unary minus
+    ("group", inner)            parentheses, kept as written
+    (op, left, right)           op is one of + - × ÷
+
+Only numbers, names, the four operations and parentheses parse; "*", "x"
+and "X" are read as ×, "/" and ":" as ÷.  Nothing is handed to eval(), so
+expressions may come from students.
+
+    evaluate_expression("(12 + 3) × 4 ÷ 5")           Fraction(12, 1)
+    evaluate_expression("packs × per_pack", {"packs": 3, "per_pack": 8})
+    normalize_expression("(5 x 3)")                   "5×3"
+    reduction_steps(parse_expression("2 + 3 × 4"))    multiply, then add
+
+Values are exact Fractions; format_number() and to_number() turn them
+back into what activities display and store.
+"""
+import functools
+import re
+from decimal import Decimal
+from fractions import Fraction
+
+# Longest expression parsed; student input past it is rejected
+MAX_LENGTH = 200
+
+_OPERATORS = {"+": "+", "-": "-", "−": "-", "–": "-", "×": "×", "*": "×", "·": "×",
+              "x": "×", "X": "×", "÷": "÷", "/": "÷", ":": "÷"}
+_PRECEDENCE = {"+": 1, "-": 1, "×": 2, "÷": 2}
+_STEP_KINDS = {"+": "add", "-": "subtract", "×": "multiply", "÷": "divide"}
+
+# A standalone x or X is a times sign, so "5x3" and "5 x 3" both multiply
+_TOKEN = re.compile(r"\s*(?:(\d+(?:\.\d+)?|\.\d+)|([xX])(?![A-Za-z_])|([A-Za-z_]\w*)|(\S))")
+
+
+class ExpressionError(ValueError):
+    """An expression that doesn't parse or can't be evaluated"""
+
+
+def exact_number(digits):
+    """Return a number written in digits ("12", "0.75", ".5") as a Fraction"""
+    # Several times faster than Fraction(digits), which runs a regex of its own
+    whole, _, decimals = digits.partition(".")
+    return Fraction(int(whole + decimals or "0"), 10 ** len(decimals))
+
+
+def _tokens(text):
+    """Return [(kind, value)] for an expression's numbers, names and symbols"""
+    tokens = []
+    for number, times, name, symbol in _TOKEN.findall(text):
+        if number:
+            tokens.append(("num", number))
+        elif times:
+            tokens.append(("op", "×"))
+        elif name:
+            tokens.append(("name", name))
+        elif symbol in _OPERATORS:
+            tokens.append(("op", _OPERATORS[symbol]))
+        elif symbol in "()":
+            tokens.append((symbol, symbol))
+        else:
+            raise ExpressionError(f"unexpected {symbol!r} in {text!r}")
+    return tokens
+
+
+class _Parser:
+    """Recursive descent parser over _tokens(); precedence climbs sum → term → factor"""
+
+    def __init__(self, text):
+        self.text = text
+        # Ends with a (None, None) token, so peeking past the end needs no check
+        self.tokens = _tokens(text) + [(None, None)]
+        self.position = 0
+
+    def peek(self):
+        return self.tokens[self.position]
+
+    def take(self):
+        self.position += 1
+        return self.tokens[self.position - 1]
+
+    def parse(self):
+        if len(self.tokens) == 1:
+            raise ExpressionError("empty expression")
+        tree = self.sum()
+        if self.position < len(self.tokens) - 1:
+            raise ExpressionError(f"unexpected {self.peek()[1]!r} in {self.text!r}")
+        return tree
+
+    def sum(self):
+        tree = self.term()
+        while self.peek() in (("op", "+"), ("op", "-")):
+            tree = (self.take()[1], tree, self.term())
+        return tree
+
+    def term(self):
+        tree = self.factor()
+        while self.peek() in (("op", "×"), ("op", "÷")):
+            tree = (self.take()[1], tree, self.factor())
+        return tree
+
+    def factor(self):
+        kind, value = self.take()
+        if kind == "num":
+            return ("num", exact_number(value), value)
+        if kind == "name":
+            return ("name", value)
+        if (kind, value) == ("op", "-"):
+            return ("neg", self.factor())
+        if (kind, value) == ("op", "+"):
+            return self.factor()
+        if kind == "(":
+            inner = self.sum()
+            if self.take()[0] != ")":
+                raise ExpressionError(f"missing ')' in {self.text!r}")
+            return ("group", inner)
+        raise ExpressionError(f"expected a number in {self.text!r}")
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_expression(text):
+    """Parse an expression into a tree (see the module docstring); raises ExpressionError"""
+    if len(text) > MAX_LENGTH:
+        raise ExpressionError(f"expression longer than {MAX_LENGTH} characters")
+    return _Parser(text).parse()
+
+
+def _value(value):
+    """Return a variable's value as a Fraction; floats keep the digits they print with"""
+    if isinstance(value, float):
+        return Fraction(repr(value))
+    if isinstance(value, (int, Fraction)) and not isinstance(value, bool):
+        return Fraction(value)
+    raise ExpressionError(f"{value!r} is not a number")
+
+
+def _apply(op, left, right):
+    if op == "+":
+        return left + right
+    if op == "-":
+        return left - right
+    if op == "×":
+        return left * right
+    if right == 0:
+        raise ExpressionError("division by zero")
+    return left / right
+
+
+def evaluate(tree, variables=None):
+    """Return the exact value (a Fraction) of a parsed expression"""
+    kind = tree[0]
+    if kind == "num":
+        return tree[1]
+    if kind == "name":
+        if not variables or tree[1] not in variables:
+            raise ExpressionError(f"no value for {tree[1]!r}")
+        return _value(variables[tree[1]])
+    if kind == "neg":
+        return -evaluate(tree[1], variables)
+    if kind == "group":
+        return evaluate(tree[1], variables)
+    return _apply(kind, evaluate(tree[1], variables), evaluate(tree[2], variables))
+
+
+def evaluate_expression(text, variables=None):
+    """Parse and evaluate an expression; `variables` maps names to numbers"""
+    return evaluate(parse_expression(text), variables)
+
+
+def format_number(value):
+    """Return a Fraction as a whole number, an exact decimal, or a/b when the decimal repeats"""
+    value = Fraction(value)
+    if value.denominator == 1:
+        return str(value.numerator)
+    denominator = value.denominator
+    for factor in (2, 5):
+        while denominator % factor == 0:
+            denominator //= factor
+    if denominator != 1:
+        return f"{value.numerator}/{value.denominator}"
+    return format(Decimal(value.numerator) / Decimal(value.denominator), "f")
+
+
+def to_number(value):
+    """Return a Fraction as an int when it is whole, else a float"""
+    return value.numerator if value.denominator == 1 else float(value)
+
+
+def format_expression(tree, compact=False):
+    """Write a parsed expression back out, with × and ÷ and the parentheses as written"""
+    kind = tree[0]
+    if kind == "num":
+        return tree[2]
+    if kind == "name":
+        return tree[1]
+    if kind == "neg":
+        return "-" + format_expression(tree[1], compact)
+    if kind == "group":
+        return "(" + format_expression(tree[1], compact) + ")"
+    separator = "" if compact else " "
+    return f"{format_expression(tree[1], compact)}{separator}{kind}{separator}{format_expression(tree[2], compact)}"
+
+
+def normalize_expression(text):
+    """Return an expression's canonical compact form, without parentheses around the whole of it"""
+    tree = parse_expression(text)
+    while tree[0] == "group":
+        tree = tree[1]
+    return format_expression(tree, compact=True)
+
+
+def _number(value):
+    return ("num", value, format_number(value))
+
+
+def _collapse(tree):
+    """Replace parentheses around a lone number, and minus signs before one, by the number"""
+    kind = tree[0]
+    if kind in ("num", "name"):
+        return tree
+    if kind in ("neg", "group"):
+        inner = _collapse(tree[1])
+        if inner[0] == "num":
+            return _number(-inner[1]) if kind == "neg" else inner
+        return (kind, inner)
+    return (kind, _collapse(tree[1]), _collapse(tree[2]))
+
+
+def _next_operation(tree, depth=0, in_group=False, path=()):
+    """Yield (depth, precedence, path, whole group) of every operation whose operands are numbers"""
+    kind = tree[0]
+    if kind == "group":
+        yield from _next_operation(tree[1], depth + 1, True, path + (1,))
+    elif kind == "neg":
+        yield from _next_operation(tree[1], depth, False, path + (1,))
+    elif kind in _PRECEDENCE:
+        if tree[1][0] == "num" and tree[2][0] == "num":
+            yield depth, _PRECEDENCE[kind], path, in_group
+        else:
+            yield from _next_operation(tree[1], depth, False, path + (1,))
+            yield from _next_operation(tree[2], depth, False, path + (2,))
+
+
+def _replace(tree, path, node):
+    if not path:
+        return node
+    index = path[0]
+    return tree[:index] + (_replace(tree[index], path[1:], node),) + tree[index + 1:]
+
+
+def _substitute(tree, variables):
+    """Replace a tree's names by their values"""
+    kind = tree[0]
+    if kind == "name":
+        return _number(evaluate(tree, variables))
+    if kind == "num":
+        return tree
+    if kind in ("neg", "group"):
+        return (kind, _substitute(tree[1], variables))
+    return (kind, _substitute(tree[1], variables), _substitute(tree[2], variables))
+
+
+def reduction_steps(tree, variables=None):
+    """Return the order-of-operations steps that reduce an expression to its value.
+
+    Each step is a dict: "kind" ("parentheses" when the operation is all
+    that is left inside a pair of parentheses, else "add", "subtract",
+    "multiply" or "divide"), "text" (e.g. "3 × 4 = 12" or "(2 + 5) = 7"),
+    "result" (a Fraction) and "expression" (what is left to evaluate).
+    Parentheses go first, innermost first; then × and ÷, then + and -,
+    each left to right.
+    """
+    if variables:
+        tree = _substitute(tree, variables)
+    tree = _collapse(tree)
+    steps = []
+    while tree[0] != "num":
+        candidates = list(_next_operation(tree))
+        if not candidates:
+            raise ExpressionError(f"can't reduce {format_expression(tree)!r}")
+        # Deepest parentheses first, then × and ÷ before + and -; leftmost wins ties
+        depth, precedence, path, whole_group = max(candidates, key=lambda c: (c[0], c[1]))
+        node = tree
+        for index in path:
+            node = node[index]
+        result = _apply(node[0], node[1][1], node[2][1])
+        if whole_group:
+            text = f"({format_expression(node)}) = {format_number(result)}"
+        else:
+            text = f"{format_expression(node)} = {format_number(result)}"
+        tree = _collapse(_replace(tree, path, _number(result)))
+        steps.append({
+            "kind": "parentheses" if whole_group else _STEP_KINDS[node[0]],
+            "text": text,
+            "result": result,
+            "expression": format_expression(tree),
+        })
+    return steps
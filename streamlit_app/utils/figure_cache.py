@@ -0,0 +1,206 @@
+"""Cache of rendered matplotlib figures.
+
+Activities that draw with matplotlib redraw their figure on every rerun, so
+clicking an answer button redraws a chart the student is already looking
+at.  Activities split the drawing into a function that only depends on its
+arguments and returns the figure:
+
+    def draw_map(problem, show_result):
+        fig, ax = plt.subplots(figsize=(8, 8))
+        ...
+        return fig
+
+and display it with show_figure(draw_map, problem, show_result).
+The figure is drawn once per distinct set of arguments and kept as PNG
+bytes:
+
+    memory  a process-wide LRU capped at MAX_FIGURE_BYTES
+    disk    optional; set MATHWIZ_FIGURE_CACHE to a directory to keep PNGs
+            across restarts and share them between server processes
+
+Keys hash the drawing function's name and code together with its arguments,
+so editing a draw function never serves a stale chart from disk.  The
+problem bank (utils.problem_bank) records the figures drawn for each banked
+problem with record_figures() and hands them back with preload_figure()
+when it serves the problem.  Arguments
+are keyed by their repr(), so pass values whose repr shows everything the
+drawing depends on: a plain dict rather than a Counter, whose repr is sorted
+by count instead of in drawing order.
+"""
+import hashlib
+import io
+import marshal
+import contextlib
+import os
+import threading
+from collections import OrderedDict
+
+import streamlit as st
+
+from utils.lazy_imports import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
+
+FIGURE_CACHE_ENV = "MATHWIZ_FIGURE_CACHE"
+
+# Total PNG bytes kept in memory
+MAX_FIGURE_BYTES = 64 * 1024 * 1024
+
+# Same output as st.pyplot's defaults
+SAVEFIG_OPTIONS = {"format": "png", "bbox_inches": "tight", "dpi": 200}
+
+# key -> png bytes, least recently used first
+_figures = OrderedDict()
+_figures_bytes = 0
+_figures_lock = threading.Lock()
+_stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+# draw function -> hash of its name and code
+_code_hashes = {}
+
+# record_figures() collects into this thread's dict
+_local = threading.local()
+
+
+def _code_hash(draw):
+    """Return a digest identifying a draw function's name and code"""
+    digest = _code_hashes.get(draw)
+    if digest is None:
+        code = draw.__code__
+        digest = hashlib.sha1(
+            f"{draw.__module__}.{draw.__qualname__}".encode() + marshal.dumps(code)
+        ).hexdigest()
+        _code_hashes[draw] = digest
+    return digest
+
+
+def figure_key(draw, args, kwargs):
+    """Return the cache key of draw(*args, **kwargs)"""
+    # repr, not JSON: dict order and int-vs-str keys change the drawing
+    data = repr((args, sorted(kwargs.items())))
+    return hashlib.sha1((_code_hash(draw) + data).encode()).hexdigest()
+
+
+def _remember(key, png, max_bytes):
+    """Keep a PNG in memory, evicting the least recently used ones past the cap"""
+    global _figures_bytes
+    if len(png) > max_bytes:
+        return
+    with _figures_lock:
+        if key in _figures:
+            return
+        _figures[key] = png
+        _figures_bytes += len(png)
+        while _figures_bytes > max_bytes:
+            _, evicted = _figures.popitem(last=False)
+            _figures_bytes -= len(evicted)
+
+
+def _disk_path(key):
+    """Return the disk tier path for a key, or None when the disk tier is off"""
+    directory = os.environ.get(FIGURE_CACHE_ENV)
+    if not directory:
+        return None
+    return os.path.join(directory, key[:2], f"{key}.png")
+
+
+def _write_disk(path, png):
+    """Store a PNG in the disk tier; a failed write only costs a redraw later"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(png)
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+
+
+def render_png(fig):
+    """Return a matplotlib figure as PNG bytes and close it"""
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, **SAVEFIG_OPTIONS)
+    finally:
+        plt.close(fig)
+    return buffer.getvalue()
+
+
+def figure_png(draw, *args, **kwargs):
+    """Return the PNG of the figure draw(*args, **kwargs) returns, drawing it only if needed"""
+    key = figure_key(draw, args, kwargs)
+    with _figures_lock:
+        png = _figures.get(key)
+        if png is not None:
+            _figures.move_to_end(key)
+            _stats["hits"] += 1
+    if png is not None:
+        _record(key, png)
+        return png
+
+    path = _disk_path(key)
+    if path is not None and os.path.exists(path):
+        with open(path, "rb") as f:
+            png = f.read()
+        counter = "disk_hits"
+    else:
+        png = render_png(draw(*args, **kwargs))
+        counter = "misses"
+        if path is not None:
+            _write_disk(path, png)
+    with _figures_lock:
+        _stats[counter] += 1
+
+    _remember(key, png, MAX_FIGURE_BYTES)
+    _record(key, png)
+    return png
+
+
+def _record(key, png):
+    """Hand a figure to the calling thread's record_figures() block, if any"""
+    recorded = getattr(_local, "recorded", None)
+    if recorded is not None:
+        recorded[key] = png
+
+
+@contextlib.contextmanager
+def record_figures():
+    """Collect {key: png} of every figure figure_png() returns in the calling thread"""
+    previous = getattr(_local, "recorded", None)
+    _local.recorded = {}
+    try:
+        yield _local.recorded
+    finally:
+        _local.recorded = previous
+
+
+def has_figure(key):
+    """Check whether the memory tier holds the figure with this key"""
+    with _figures_lock:
+        return key in _figures
+
+
+def preload_figure(key, png):
+    """Put a figure drawn elsewhere into the memory tier"""
+    _remember(key, png, MAX_FIGURE_BYTES)
+
+
+def show_figure(draw, *args, width="stretch", **kwargs):
+    """Display the figure draw(*args, **kwargs) returns, from the cache when possible"""
+    st.image(figure_png(draw, *args, **kwargs), width=width)
+
+
+def figure_cache_stats():
+    """Return the memory tier's size and the hit/miss counters"""
+    with _figures_lock:
+        return {"entries": len(_figures), "bytes": _figures_bytes, **_stats}
+
+
+def clear_figure_cache():
+    """Drop every figure kept in memory and reset the counters"""
+    global _figures_bytes
+    with _figures_lock:
+        _figures.clear()
+        _figures_bytes = 0
+        for name in _stats:
+            _stats[name] = 0
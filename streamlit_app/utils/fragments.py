@@ -0,0 +1,94 @@
+"""Partial reruns for an activity's question and feedback.
+
+Every click used to rerun the whole app: main.py's routing, the activity's
+run(), its header, difficulty indicator and instructions, only to redraw
+the question the student clicked in.  Activities mark the function that
+draws the question, answer widgets and feedback as a fragment:
+
+    @question_fragment
+    def display_question():
+        ...
+        if st.button("Submit"):
+            st.session_state.show_feedback = True
+            rerun_question()
+        ...
+        if st.button("Next Question"):
+            reset_question_state()
+            st.rerun()
+
+Widgets inside it rerun only that function.  rerun_question() redraws the
+question after a state change that only the question shows; moving on to a
+new question keeps st.rerun(), since run() draws the new question's header
+and difficulty.  Until then, anything outside the fragment (the difficulty
+indicator, scores in the header) shows the values from the last full run.
+
+`python -m utils.harness <subtopic> --fragments` measures the clicks the
+way a browser sends them, as fragment reruns.  An error in a question shows
+main.py's error message in its place.  Headless runs call the
+question function directly; drawing_question() tells code such as
+utils.worksheet which elements belong to the question.
+"""
+import functools
+import threading
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+_local = threading.local()
+
+
+def show_activity_error(error, key=None):
+    """Tell the student an activity failed, with a button back to the curriculum"""
+    st.error(f"❌ Error loading activity: {str(error)}")
+    st.info("💡 This activity is experiencing technical issues. Please try another one.")
+    if st.button("← Back to Curriculum", key=key):
+        if "subtopic" in st.query_params:
+            del st.query_params["subtopic"]
+        st.rerun()
+
+
+def question_fragment(func):
+    """Run `func` as a Streamlit fragment: its widgets rerun only it"""
+
+    @functools.wraps(func)
+    def guarded(*args, **kwargs):
+        # A fragment rerun doesn't pass through main.py's error handling
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            show_activity_error(e, key=f"activity_error_{func.__qualname__}")
+
+    fragment = st.fragment(guarded)
+
+    @functools.wraps(func)
+    def run_question(*args, **kwargs):
+        # st.fragment skips the call without a session; headless runs (the
+        # warm-up, the problem bank build) still need the question drawn
+        if get_script_run_ctx(suppress_warning=True) is None:
+            _local.depth = getattr(_local, "depth", 0) + 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _local.depth -= 1
+        return fragment(*args, **kwargs)
+
+    return run_question
+
+
+def drawing_question():
+    """Return True while the calling thread runs a question function headless"""
+    return getattr(_local, "depth", 0) > 0
+
+
+def in_fragment_rerun():
+    """Return True while Streamlit reruns only fragments, not the whole app"""
+    ctx = get_script_run_ctx()
+    return bool(ctx is not None and getattr(ctx, "fragment_ids_this_run", None))
+
+
+def rerun_question():
+    """Rerun the question fragment that is running, or the whole app on a full run"""
+    if in_fragment_rerun():
+        st.rerun(scope="fragment")
+    st.rerun()
+
@@ -0,0 +1,242 @@
+"""Seeded problem generation for every activity.
+
+Activities draw their problems from the global ``random`` module, so a
+problem can't be reproduced, shared or cached by identity.  Rather than
+thread a random.Random through every generator, the activity registry gives
+each loaded activity module a stand-in for its ``random`` global: calls go
+to the calling thread's seeded random.Random inside seeded_random(), and to
+the random module everywhere else.  Browser sessions are unaffected, and two
+threads can generate with different seeds at the same time.
+
+generate() is the uniform entry point:
+
+    problem = generate("elapsed_time", seed=42, difficulty=3)
+
+It opens the activity headless at that difficulty level (as a first visit
+would), calls its generator (the call recorded in the route manifest) and
+returns a plain dict:
+
+    {"grade", "subtopic", "seed", "difficulty",
+     "state": {key: value},   session state the generator wrote
+     "deleted": [key],        session state keys it removed
+     "result": value}         what the generator returned
+
+The same (subtopic, seed, difficulty) gives the same problem, and problems
+pickle, so they can be cached, stored (utils.problem_bank) and generated in
+worker processes.  Headless sessions share one session state per process,
+so generate() calls in one process run one at a time.
+
+Check which activities reproduce their problems from a seed:
+
+    python -m utils.generation show elapsed_time --seed 42 --difficulty 3
+    python -m utils.generation check [--only text]
+"""
+import argparse
+import ast
+import contextlib
+import json
+import pickle
+import random
+import sys
+import threading
+
+import streamlit as st
+from streamlit.runtime.state.session_state_proxy import SessionStateProxy
+
+from utils.activity_analysis import level_states
+from utils.route_manifest import DEFAULT_GRADE, get_manifest, lookup_route
+
+_local = threading.local()
+
+
+class _ActivityRandom:
+    """Stands in for the random module in activity modules; see seeded_random()"""
+
+    def __getattr__(self, name):
+        rng = getattr(_local, "rng", None)
+        # random.Random and friends aren't methods of an instance
+        if rng is None or not hasattr(rng, name):
+            return getattr(random, name)
+        return getattr(rng, name)
+
+
+_activity_random = _ActivityRandom()
+
+
+def install_seeded_random(module):
+    """Point an activity module's `random` global at the seedable stand-in"""
+    if getattr(module, "random", None) is random:
+        module.random = _activity_random
+
+
+@contextlib.contextmanager
+def seeded_random(rng):
+    """Make activity code in the calling thread draw from `rng` (a random.Random)"""
+    previous = getattr(_local, "rng", None)
+    _local.rng = rng
+    try:
+        yield rng
+    finally:
+        _local.rng = previous
+
+
+@contextlib.contextmanager
+def record_state_access():
+    """Record the session state keys the calling thread reads before writing, writes and deletes"""
+    log = {"read": set(), "written": [], "deleted": []}
+    originals = {name: getattr(SessionStateProxy, name) for name in ("__getitem__", "__setitem__", "__delitem__")}
+    thread = threading.get_ident()
+
+    def getitem(proxy, key):
+        if threading.get_ident() == thread and str(key) not in log["written"]:
+            log["read"].add(str(key))
+        return originals["__getitem__"](proxy, key)
+
+    def setitem(proxy, key, value):
+        if threading.get_ident() == thread and str(key) not in log["written"]:
+            log["written"].append(str(key))
+        originals["__setitem__"](proxy, key, value)
+
+    def delitem(proxy, key):
+        if threading.get_ident() == thread:
+            log["deleted"].append(str(key))
+        originals["__delitem__"](proxy, key)
+
+    SessionStateProxy.__getitem__ = getitem
+    SessionStateProxy.__setitem__ = setitem
+    SessionStateProxy.__delitem__ = delitem
+    try:
+        yield log
+    finally:
+        for name, method in originals.items():
+            setattr(SessionStateProxy, name, method)
+
+
+def generator_parts(route):
+    """Return (function name, argument expressions) of the route's generator call"""
+    call = ast.parse(route["generator"], mode="eval").body
+    return call.func.id, [ast.Expression(arg) for arg in call.args]
+
+
+def generator_args(module, route):
+    """Evaluate the generator call's arguments against the current session state"""
+    _, expressions = generator_parts(route)
+    namespace = vars(module)
+    return tuple(eval(compile(expression, route["path"], "eval"), namespace) for expression in expressions)
+
+
+def call_generator(module, route, args):
+    """Call an activity's generator once in a headless session.
+
+    Returns ({"state", "deleted", "result"}, keys read before being written).
+    """
+    name, _ = generator_parts(route)
+    with record_state_access() as log:
+        result = getattr(module, name)(*args)
+    problem = {
+        "state": {key: st.session_state[key] for key in log["written"] if key in st.session_state},
+        "deleted": [key for key in log["deleted"] if key not in st.session_state],
+        "result": result,
+    }
+    return problem, log["read"]
+
+
+def level_state(route, difficulty):
+    """Return the session state that opens an activity at a difficulty level (None: its default)"""
+    levels = dict(level_states(route.get("difficulty")))
+    if difficulty is None:
+        return {}
+    if difficulty not in levels:
+        raise ValueError(f"difficulty {difficulty!r} is not one of {sorted(levels, key=repr)}")
+    return levels[difficulty]
+
+
+@contextlib.contextmanager
+def generated(subtopic, seed, difficulty=None, grade=DEFAULT_GRADE):
+    """Generate an activity's problem for `seed` and yield (module, problem) inside its headless session.
+
+    The session still holds the problem, so the caller can draw it with the
+    activity's own run(), as utils.worksheet does.
+    """
+    # Imported here: the registry attaches the problem bank, which imports this module
+    from utils.activity_registry import load_activity
+    from utils.headless import headless_session
+
+    route = lookup_route(grade, subtopic)
+    if route is None:
+        raise KeyError(f"no activity {subtopic!r} in grade {grade!r}")
+    if not route.get("generator"):
+        raise ValueError(f"{subtopic} has no generator call the route manifest could find")
+    module = load_activity(grade, subtopic, route)
+    state = level_state(route, difficulty)
+
+    with seeded_random(random.Random(seed)), headless_session(state):
+        # Let the activity initialize the rest of its state, as on a first visit
+        module.run()
+        problem, _ = call_generator(module, route, generator_args(module, route))
+        yield module, {"grade": grade, "subtopic": subtopic, "seed": seed, "difficulty": difficulty, **problem}
+
+
+def generate(subtopic, seed, difficulty=None, grade=DEFAULT_GRADE):
+    """Return the problem an activity generates for `seed` at a difficulty level"""
+    with generated(subtopic, seed, difficulty, grade) as (_, problem):
+        return problem
+
+
+def run_show(args):
+    """Print one generated problem"""
+    problem = generate(args.subtopic, args.seed, args.difficulty, args.grade)
+    print(json.dumps(problem, indent=2, default=repr, ensure_ascii=False))
+    return 0
+
+
+def run_check(args):
+    """Generate each activity's problems twice per seed and report those that differ"""
+    checked, failures = 0, []
+    for grade, grade_routes in sorted(get_manifest()["routes"].items()):
+        for subtopic, route in sorted(grade_routes.items()):
+            if not route.get("generator") or (args.only and args.only not in subtopic):
+                continue
+            checked += 1
+            for difficulty, _ in level_states(route.get("difficulty")):
+                try:
+                    for seed in range(args.seeds):
+                        first, second = (
+                            pickle.dumps(generate(subtopic, seed, difficulty, grade)) for _ in range(2)
+                        )
+                        if first != second:
+                            raise ValueError(f"seed {seed} gave two different problems")
+                except Exception as e:
+                    failures.append(f"{subtopic} level {difficulty}: {type(e).__name__}: {e}")
+                    break
+    for line in failures:
+        print(line)
+    print(f"{checked} activities checked, {len(failures)} levels failed or not reproducible")
+    return 1 if failures else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.generation", description=__doc__.splitlines()[0])
+    parser.add_argument("--grade", default=DEFAULT_GRADE)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    show = commands.add_parser("show", help="print the problem an activity generates for a seed")
+    show.add_argument("subtopic")
+    show.add_argument("--seed", type=int, default=0)
+    show.add_argument("--difficulty", type=int, default=None, help="difficulty level (default: the activity's)")
+    show.set_defaults(func=run_show)
+
+    check = commands.add_parser("check", help="check that every activity reproduces its problems from a seed")
+    check.add_argument("--seeds", type=int, default=3, help="seeds tried per activity level")
+    check.add_argument("--only", default="", help="only check subtopics containing this text")
+    check.set_defaults(func=run_check)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    # Run the imported module's main(): activities look up the seeded random
+    # there, not in this __main__ copy
+    from utils.generation import main as generation_main
+    sys.exit(generation_main())
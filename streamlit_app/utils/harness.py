@@ -0,0 +1,305 @@
+"""Headless load harness for activity routes.
+
+Drives an activity through main.py with Streamlit's AppTest the way a
+student would, without a browser:
+
+    open    load ?grade=...&subtopic=... in a fresh session
+    answer  fill the answer widgets (or click an answer button)
+    submit  click the Submit / Check button
+    next    click the Next / New button
+
+and reports latency percentiles and memory allocated per step.  Run it from
+the streamlit_app directory:
+
+    python -m utils.harness elapsed_time --iterations 1000 [--allocations]
+
+Answers are random, so most of them are wrong; that exercises the same
+feedback and retry paths a struggling student would.
+
+AppTest reruns the whole script on every interaction.  With --fragments,
+steps after "open" rerun only the @question_fragment functions the last
+full run drew, as a browser does when the student clicks inside the
+question; a fragment that calls st.rerun() still goes on to a full run.
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+import tracemalloc
+from urllib import parse
+
+from streamlit.runtime.scriptrunner_utils.script_requests import RerunData, ScriptRequests
+from streamlit.testing.v1 import AppTest, app_test
+from streamlit.testing.v1.element_tree import parse_tree_from_messages
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner, require_widgets_deltas
+
+from utils.bench import RESULTS_DIR
+from utils.route_manifest import APP_DIR, DEFAULT_GRADE
+from utils.warmup import WARMUP_ENV
+
+MAIN_SCRIPT = os.path.join(APP_DIR, "main.py")
+
+STEPS = ("open", "answer", "submit", "next")
+
+# Button labels, matched case-insensitively after the emoji
+SUBMIT_LABEL = re.compile(r"\b(submit|check)\b", re.IGNORECASE)
+NEXT_LABEL = re.compile(r"\b(next|new|continue|try another|another)\b", re.IGNORECASE)
+OTHER_LABEL = re.compile(r"\b(back|hint|skip|clear|remove|reset|add|select)\b", re.IGNORECASE)
+
+ANSWER_WIDGETS = ("text_input", "number_input", "radio", "selectbox", "text_area")
+
+
+class FragmentScriptRunner(LocalScriptRunner):
+    """AppTest's script runner, rerunning only `fragment_ids` while they are set"""
+
+    fragment_ids = None
+
+    def run(self, widget_state=None, query_params=None, timeout=3, page_hash=""):
+        if not self.fragment_ids:
+            return super().run(widget_state, query_params, timeout, page_hash)
+        # The runner is created with a full rerun queued, which would absorb ours
+        self._requests = ScriptRequests()
+        self.request_rerun(RerunData(
+            widget_states=widget_state,
+            query_string=parse.urlencode(query_params or {}, doseq=True),
+            page_script_hash=page_hash,
+            fragment_id_queue=list(self.fragment_ids),
+            is_fragment_scoped_rerun=True,
+        ))
+        try:
+            if not self._script_thread:
+                self.start()
+            require_widgets_deltas(self, timeout)
+        finally:
+            self.join()
+        return parse_tree_from_messages(self.forward_msgs())
+
+
+def percentile(sorted_values, fraction):
+    """Return the nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class ActivityHarness:
+    """One simulated student session on an activity route"""
+
+    def __init__(self, grade, subtopic, seed=None, timeout=30, allocations=False, fragments=False):
+        # The harness runs main.py in this process; the warm-up would compete with it
+        os.environ.setdefault(WARMUP_ENV, "0")
+        self.grade = grade
+        self.subtopic = subtopic
+        self.timeout = timeout
+        self.allocations = allocations
+        self.fragments = fragments
+        if fragments:
+            # AppTest builds a new runner for every run; have it build ours
+            app_test.LocalScriptRunner = FragmentScriptRunner
+        self.rng = random.Random(seed)
+        self.app = None
+        self.fragment_ids = None  # question fragments the last run drew
+        self.timings = {step: [] for step in STEPS}  # step -> [ms]
+        self.allocated = {step: [] for step in STEPS}  # step -> [peak bytes]
+        self.errors = {step: 0 for step in STEPS}
+        self.skipped = {step: 0 for step in STEPS}
+
+    def _run(self, step, action=None):
+        """Apply an interaction, rerun the script and record the step"""
+        if self.allocations:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        if self.fragments and step != "open":
+            FragmentScriptRunner.fragment_ids = self.fragment_ids
+        registered = self.app._fragment_storage.registration_sequence()
+        start = time.perf_counter()
+        if action is not None:
+            action()
+        try:
+            self.app.run(timeout=self.timeout)
+        finally:
+            FragmentScriptRunner.fragment_ids = None
+        # A browser reruns the fragment its clicked element was last drawn in;
+        # older ids of the same function stay registered until a clean full run
+        drawn = self.app._fragment_storage.ids_registered_after(registered)
+        if drawn:
+            self.fragment_ids = drawn
+        self.timings[step].append((time.perf_counter() - start) * 1000)
+        if self.allocations:
+            self.allocated[step].append(tracemalloc.get_traced_memory()[1] - baseline)
+        # AppTest moves an alert's leading emoji into its icon
+        if self.app.exception or any(str(e.value).startswith("Error loading activity") for e in self.app.error):
+            self.errors[step] += 1
+
+    def _buttons(self, pattern):
+        """Return the enabled buttons whose label matches a pattern"""
+        return [b for b in self.app.button if not b.disabled and pattern.search(b.label)]
+
+    def open(self):
+        """Load the activity in a new session"""
+        self.app = AppTest.from_file(MAIN_SCRIPT, default_timeout=self.timeout)
+        self.app.query_params["grade"] = self.grade
+        self.app.query_params["subtopic"] = self.subtopic
+        self._run("open")
+
+    def answer(self):
+        """Fill every answer widget with a random value, or click a random answer button"""
+        widgets = [w for kind in ANSWER_WIDGETS for w in getattr(self.app, kind) if not w.disabled]
+        if widgets:
+            def fill():
+                for widget in widgets:
+                    value = self._random_value(widget)
+                    if value is not None:
+                        widget.set_value(value)
+            # Widgets in a form only reach the script on submit, like in a browser
+            if all(getattr(w, "form_id", "") for w in widgets):
+                fill()
+            else:
+                self._run("answer", fill)
+            return
+
+        choices = [
+            b for b in self.app.button
+            if not b.disabled and not (SUBMIT_LABEL.search(b.label) or NEXT_LABEL.search(b.label)
+                                       or OTHER_LABEL.search(b.label))
+        ]
+        if not choices:
+            self.skipped["answer"] += 1
+            return
+        # Some answer buttons check the answer at once, others only select it for submit()
+        self._run("answer", self.rng.choice(choices).click)
+
+    def _random_value(self, widget):
+        """Return a plausible random value for an answer widget, or None to leave it alone"""
+        options = getattr(widget, "options", None)
+        if options:
+            option = self.rng.choice(options)
+            # AppTest only knows the displayed labels; it can't map them back
+            # through a format_func that changes them, and such a format_func
+            # may not even accept a label
+            try:
+                return option if str(widget.format_func(option)) == option else None
+            except Exception:
+                return None
+        if type(widget).__name__ == "NumberInput":
+            low = widget.min if widget.min is not None else 0
+            high = widget.max if widget.max is not None else max(low + 100, 100)
+            value = self.rng.uniform(low, high)
+            return int(value) if widget.proto.data_type == widget.proto.INT else round(value, 2)
+        return str(self.rng.randint(0, 100))
+
+    def submit(self):
+        """Click the submit button"""
+        buttons = self._buttons(SUBMIT_LABEL)
+        if not buttons:
+            self.skipped["submit"] += 1
+            return
+        self._run("submit", buttons[0].click)
+
+    def next(self):
+        """Click the button that moves on to the next question"""
+        buttons = self._buttons(NEXT_LABEL)
+        if not buttons:
+            self.skipped["next"] += 1
+            return
+        self._run("next", buttons[0].click)
+
+    def cycle(self):
+        """Answer, submit and move on once"""
+        self.answer()
+        self.submit()
+        self.next()
+
+    def summary(self):
+        """Return {step: stats} with latency percentiles in ms and allocation in KB"""
+        stats = {}
+        for step in STEPS:
+            timings = sorted(self.timings[step])
+            allocated = sorted(self.allocated[step])
+            stats[step] = {
+                "count": len(timings),
+                "skipped": self.skipped[step],
+                "errors": self.errors[step],
+                "p50_ms": percentile(timings, 0.5),
+                "p90_ms": percentile(timings, 0.9),
+                "p99_ms": percentile(timings, 0.99),
+                "max_ms": timings[-1] if timings else None,
+                "p50_alloc_kb": percentile(allocated, 0.5) / 1024 if allocated else None,
+                "max_alloc_kb": allocated[-1] / 1024 if allocated else None,
+            }
+        return stats
+
+
+def merge_summaries(harnesses):
+    """Combine the recordings of several sessions into one harness for reporting"""
+    merged = ActivityHarness(harnesses[0].grade, harnesses[0].subtopic)
+    for harness in harnesses:
+        for step in STEPS:
+            merged.timings[step].extend(harness.timings[step])
+            merged.allocated[step].extend(harness.allocated[step])
+            merged.errors[step] += harness.errors[step]
+            merged.skipped[step] += harness.skipped[step]
+    return merged.summary()
+
+
+def print_summary(stats, out=sys.stdout):
+    """Print a harness summary as a table"""
+    print(f"{'step':<8}{'count':>7}{'skipped':>9}{'errors':>8}{'p50 ms':>9}{'p90 ms':>9}"
+          f"{'p99 ms':>9}{'max ms':>9}{'p50 KB':>9}{'max KB':>9}", file=out)
+    for step, row in stats.items():
+        cells = [
+            "-" if row[name] is None else f"{row[name]:.1f}"
+            for name in ("p50_ms", "p90_ms", "p99_ms", "max_ms", "p50_alloc_kb", "max_alloc_kb")
+        ]
+        print(f"{step:<8}{row['count']:>7}{row['skipped']:>9}{row['errors']:>8}"
+              + "".join(f"{cell:>9}" for cell in cells), file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.harness", description=__doc__.splitlines()[0])
+    parser.add_argument("subtopic", help="activity slug, as in ?subtopic=...")
+    parser.add_argument("--grade", default=DEFAULT_GRADE)
+    parser.add_argument("--iterations", type=int, default=100, help="answer/submit/next cycles per session")
+    parser.add_argument("--sessions", type=int, default=1, help="fresh sessions to open one after another")
+    parser.add_argument("--allocations", action="store_true", help="trace memory allocated per step (slower)")
+    parser.add_argument("--fragments", action="store_true",
+                        help="rerun only the question fragment after each click, as a browser does")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the random answers")
+    parser.add_argument("--timeout", type=float, default=30, help="seconds allowed per script run")
+    parser.add_argument("--output", default=None,
+                        help="JSON report path (default bench_results/harness_<subtopic>.json)")
+    args = parser.parse_args(argv)
+
+    if args.allocations:
+        tracemalloc.start()
+
+    harnesses = []
+    start = time.perf_counter()
+    for session in range(args.sessions):
+        seed = None if args.seed is None else args.seed + session
+        harness = ActivityHarness(args.grade, args.subtopic, seed, args.timeout, args.allocations, args.fragments)
+        harness.open()
+        for _ in range(args.iterations):
+            harness.cycle()
+        harnesses.append(harness)
+    elapsed = time.perf_counter() - start
+
+    stats = merge_summaries(harnesses)
+    print_summary(stats)
+    print(f"\n{args.sessions} session(s) x {args.iterations} cycles in {elapsed:.1f} s")
+
+    output = args.output or os.path.join(RESULTS_DIR, f"harness_{args.subtopic}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({"grade": args.grade, "subtopic": args.subtopic, "sessions": args.sessions,
+                   "iterations": args.iterations, "steps": stats}, f, indent=2)
+    print(f"Report: {os.path.relpath(output)}")
+    return 1 if any(row["errors"] for row in stats.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
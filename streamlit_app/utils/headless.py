@@ -0,0 +1,65 @@
+"""Run activity code outside a browser session.
+
+A thread without a Streamlit ScriptRunContext turns every st.* element call
+into a no-op and reads and writes st.session_state in one process-wide
+fallback dict.  headless_session() hands that dict to one caller at a time,
+emptied and optionally pre-filled, so tools such as the warm-up can call an
+activity's run() exactly as a first visit would.
+
+Without a session Streamlit also returns the shared main DeltaGenerator from
+st.form(), st.columns() and friends, and st.form() marks it as a form, which
+breaks every browser session in the process.  headless_session() therefore
+points the thread's st.* calls at a private, detached DeltaGenerator.
+"""
+import contextlib
+import logging
+import threading
+
+import streamlit as st
+from streamlit import deprecation_util
+from streamlit.delta_generator import DeltaGenerator
+from streamlit.delta_generator_singletons import context_dg_stack
+from streamlit.elements.lib import policies
+from streamlit.runtime.scriptrunner_utils import script_run_context
+
+_session_lock = threading.Lock()
+_local = threading.local()
+
+
+class _HeadlessWarningFilter(logging.Filter):
+    """Drop the warnings Streamlit logs on every st.* call of a headless run"""
+
+    def filter(self, record):
+        return not getattr(_local, "active", False)
+
+
+# "missing ScriptRunContext", API deprecation notices and widget label
+# warnings, which browser sessions already log
+for _module in (script_run_context, deprecation_util, policies):
+    logging.getLogger(_module.__name__).addFilter(_HeadlessWarningFilter())
+
+
+def _clear_state():
+    """Remove every key from the headless session state"""
+    for key in list(st.session_state.keys()):
+        del st.session_state[key]
+
+
+@contextlib.contextmanager
+def headless_session(state=None):
+    """Give the calling thread an empty st.session_state, pre-filled with `state`"""
+    if script_run_context.get_script_run_ctx(suppress_warning=True) is not None:
+        raise RuntimeError("headless_session() needs a thread that isn't running a Streamlit script")
+
+    with _session_lock:
+        _local.active = True
+        # A DeltaGenerator without a root container swallows every element
+        dg_token = context_dg_stack.set(context_dg_stack.get() + (DeltaGenerator(root_container=None),))
+        try:
+            _clear_state()
+            st.session_state.update(state or {})
+            yield st.session_state
+        finally:
+            _clear_state()
+            context_dg_stack.reset(dg_token)
+            _local.active = False
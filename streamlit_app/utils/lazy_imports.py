@@ -0,0 +1,68 @@
+"""Deferred imports for the heavy libraries used by activities.
+
+matplotlib, pandas, numpy and plotly cost hundreds of milliseconds and tens
+of MB to import, yet most questions never draw a chart.  Activities bind them
+at module level with::
+
+    plt = lazy_import("matplotlib.pyplot")
+
+and the real import happens on the first attribute access, i.e. only when a
+render path actually uses the library.
+"""
+import importlib
+import sys
+import threading
+import types
+
+_import_lock = threading.Lock()
+
+
+def _use_agg_backend():
+    """Select the non-interactive backend before pyplot is first imported"""
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+# Setup that must run right before a module is imported for the first time
+_BEFORE_IMPORT = {
+    "matplotlib.pyplot": _use_agg_backend,
+}
+
+
+class LazyModule(types.ModuleType):
+    """Module stand-in that imports the real module on first attribute access"""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__["_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_module"]
+        if module is None:
+            with _import_lock:
+                module = self.__dict__["_module"]
+                if module is None:
+                    if self.__name__ not in sys.modules and self.__name__ in _BEFORE_IMPORT:
+                        _BEFORE_IMPORT[self.__name__]()
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_module"] is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name):
+    """Return module `name`, deferring its import until it is first used"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
@@ -0,0 +1,248 @@
+"""Shared number line renderer.
+
+Number line activities draw the same kind of figure: a line from `start` to
+`end` with a tick every `step`, some labelled ticks, marked points and jump
+arcs.  number_line_svg() draws all of them:
+
+    number_line_svg(0, 1, Fraction(1, 8), labels="all", label_format="fraction",
+                    points=[{"value": Fraction(3, 8), "label": "A"}],
+                    jumps=[{"start": Fraction(3, 8), "end": Fraction(5, 8), "label": "+2/8"}])
+
+`start`, `end` and `step` may be ints, floats, Decimals or Fractions; ticks
+are computed exactly, so 0.1 steps don't drift.  The line, its ticks and its
+tick labels only depend on (start, end, step) and the style, and are kept in
+the shared SVG cache (utils.svg_cache); only the points and jumps of a
+question are drawn on each call.
+
+Style keywords (see STYLE for the defaults) override the look per activity.
+
+Points are dicts with a "value" and optionally:
+
+    label            text above the point
+    marker           "dot" (default), "bar" or "box"
+    color            marker and label colour
+    fill, stroke     box fill / dot outline (None for no outline)
+    radius           dot radius
+    label_size       label font size
+    label_gap        distance from the line to the label baseline
+    tag              draw the label as white text on a rounded tag
+
+Jumps are dicts with "start", "end" and optionally "label", "color" and
+"height"; they are drawn as an arc with an arrowhead at "end".
+"""
+from decimal import Decimal
+from fractions import Fraction
+
+from utils.svg_cache import cached_svg
+
+STYLE = {
+    "width": 600,
+    "height": 120,
+    "margin": 50,  # from the SVG edge to the start and end ticks
+    "line_y": 60,
+    "responsive": False,  # scale to the container width instead of `width` px
+    "line_color": "#333",
+    "line_width": 2,
+    "overhang": 0,  # how far the line runs past the start and end ticks
+    "arrows": "right",  # "none", "right" or "both"
+    "arrow_shape": "triangle",  # or "chevron"
+    "major_ticks": "integers",  # start, end and whole numbers; or "ends" for start and end only
+    "major_tick": 10,
+    "major_tick_width": 2,
+    "major_tick_color": "#333",
+    "minor_tick": 6,
+    "minor_tick_width": 1,
+    "minor_tick_color": "#666",
+    "labels": "major",  # "major", "all" or "none"
+    "label_format": "value",  # "value" (0.25) or "fraction" (2/8, over 1/step)
+    "label_offset": 30,  # from the line down to the label baseline
+    "label_color": "#333",
+    "major_label_size": 14,
+    "minor_label_size": 12,
+    "major_label_weight": "normal",
+}
+
+# Fraction lines from 0 to 1 with every tick labelled and room above for jumps
+FRACTION_JUMPS = {
+    "height": 200,
+    "line_y": 120,
+    "arrows": "both",
+    "arrow_shape": "chevron",
+    "major_tick_width": 1,
+    "minor_tick": 10,
+    "minor_tick_color": "#333",
+    "labels": "all",
+    "label_format": "fraction",
+    "label_offset": 25,
+    "label_color": "#666",
+    "major_label_size": 12,
+}
+
+
+def _fraction(value):
+    """Return a number as an exact Fraction; floats are read as they print"""
+    if isinstance(value, (int, Fraction, Decimal)):
+        return Fraction(value)
+    return Fraction(repr(value))
+
+
+def _num(x):
+    """Format an SVG coordinate"""
+    return f"{x:.2f}".rstrip("0").rstrip(".")
+
+
+def tick_values(start, end, step):
+    """Return the tick values from start to end, as Fractions; the end always gets a tick"""
+    start, end, step = _fraction(start), _fraction(end), _fraction(step)
+    values = [start + i * step for i in range(int((end - start) / step) + 1)]
+    if values[-1] != end:
+        values.append(end)
+    return values
+
+
+def format_value(value, label_format="value", step=None):
+    """Return the label text for a tick or point value"""
+    value = _fraction(value)
+    if value.denominator == 1:
+        return str(value.numerator)
+    if label_format == "fraction" and step is not None:
+        # Over the line's own denominator, so 2/8 stays 2/8 on an eighths line
+        denominator = _fraction(step).denominator
+        return f"{value * denominator}/{denominator}"
+    return f"{float(value):.10g}"
+
+
+def x_position(value, start, end, style):
+    """Return the x coordinate of a value on the line"""
+    start, end = _fraction(start), _fraction(end)
+    length = style["width"] - 2 * style["margin"]
+    return style["margin"] + float((_fraction(value) - start) / (end - start)) * length
+
+
+def _arrow(x, y, direction, style):
+    """Return the arrow drawn at one end of the line"""
+    size = 8 * direction
+    color, width = style["line_color"], style["line_width"]
+    if style["arrow_shape"] == "chevron":
+        return (f'<path d="M {_num(x - size)} {_num(y - 5)} L {_num(x)} {_num(y)} L {_num(x - size)} '
+                f'{_num(y + 5)}" stroke="{color}" stroke-width="{width}" fill="none"/>')
+    return (f'<polygon points="{_num(x)},{_num(y)} {_num(x - size)},{_num(y - 5)} '
+            f'{_num(x - size)},{_num(y + 5)}" fill="{color}"/>')
+
+
+@cached_svg
+def _axis_svg(start, end, step, style_items):
+    """Return the line, ticks and tick labels of a number line"""
+    style = dict(style_items)
+    y = style["line_y"]
+    left = style["margin"] - style["overhang"]
+    right = style["width"] - style["margin"] + style["overhang"]
+
+    parts = [f'<line x1="{_num(left)}" y1="{y}" x2="{_num(right)}" y2="{y}" '
+             f'stroke="{style["line_color"]}" stroke-width="{style["line_width"]}"/>']
+    if style["arrows"] in ("right", "both"):
+        parts.append(_arrow(right, y, 1, style))
+    if style["arrows"] == "both":
+        parts.append(_arrow(left, y, -1, style))
+
+    values = tick_values(start, end, step)
+    for i, value in enumerate(values):
+        x = _num(x_position(value, start, end, style))
+        major = i == 0 or i == len(values) - 1 or (style["major_ticks"] == "integers" and value.denominator == 1)
+        kind = "major" if major else "minor"
+        half = style[f"{kind}_tick"]
+        parts.append(f'<line x1="{x}" y1="{y - half}" x2="{x}" y2="{y + half}" '
+                     f'stroke="{style[f"{kind}_tick_color"]}" stroke-width="{style[f"{kind}_tick_width"]}"/>')
+
+        if style["labels"] == "all" or (style["labels"] == "major" and major):
+            weight = style["major_label_weight"] if major else "normal"
+            parts.append(f'<text x="{x}" y="{y + style["label_offset"]}" text-anchor="middle" '
+                         f'font-size="{style[f"{kind}_label_size"]}" font-weight="{weight}" '
+                         f'fill="{style["label_color"]}">{format_value(value, style["label_format"], step)}</text>')
+    return "".join(parts)
+
+
+def _point_svg(point, x, style):
+    """Return the marker and label of a point"""
+    y = style["line_y"]
+    color = point.get("color", "#007acc")
+    marker = point.get("marker", "dot")
+    if marker == "bar":
+        parts = [f'<line x1="{_num(x)}" y1="{y - 20}" x2="{_num(x)}" y2="{y + 20}" stroke="{color}" stroke-width="3"/>']
+        gap = point.get("label_gap", 25)
+    elif marker == "box":
+        parts = [f'<rect x="{_num(x - 20)}" y="{y - 5}" width="40" height="10" fill="{point.get("fill", "white")}" '
+                 f'stroke="{color}" stroke-width="2" rx="3"/>']
+        gap = point.get("label_gap", 15)
+    else:
+        stroke = point.get("stroke", "black")
+        outline = f' stroke="{stroke}" stroke-width="2"' if stroke else ""
+        parts = [f'<circle cx="{_num(x)}" cy="{y}" r="{point.get("radius", 8)}" fill="{color}"{outline}/>']
+        gap = point.get("label_gap", 15)
+
+    label = point.get("label")
+    if label is not None:
+        size = point.get("label_size", 14)
+        label_y = y - gap
+        if point.get("tag"):
+            tag_width = size * 0.62 * len(str(label)) + 16
+            parts.append(f'<rect x="{_num(x - tag_width / 2)}" y="{_num(label_y - size - 4)}" '
+                         f'width="{_num(tag_width)}" height="{size + 10}" rx="6" fill="{color}" '
+                         f'stroke="white" stroke-width="2"/>')
+            color = "white"
+        parts.append(f'<text x="{_num(x)}" y="{_num(label_y)}" text-anchor="middle" font-size="{size}" '
+                     f'font-weight="bold" fill="{color}">{label}</text>')
+    return "".join(parts)
+
+
+def _marker_id(color):
+    """Return the id of the arrowhead marker for a jump colour"""
+    return "nl-arrow-" + "".join(c for c in color if c.isalnum())
+
+
+def _jump_svg(jump, x1, x2, style):
+    """Return the arc, arrowhead and label of a jump"""
+    y = style["line_y"] - 10
+    color = jump.get("color", "#2196F3")
+    height = jump.get("height", 50)
+    mid = (x1 + x2) / 2
+    parts = [f'<path d="M {_num(x1)} {y} Q {_num(mid)} {style["line_y"] - height} {_num(x2)} {y}" '
+             f'stroke="{color}" stroke-width="3" fill="none" marker-end="url(#{_marker_id(color)})"/>']
+    if jump.get("label") is not None:
+        parts.append(f'<text x="{_num(mid)}" y="{style["line_y"] - height - 10}" text-anchor="middle" '
+                     f'font-size="18" font-weight="bold" fill="{color}">{jump["label"]}</text>')
+    return "".join(parts)
+
+
+def number_line_svg(start, end, step, points=(), jumps=(), extra="", **style):
+    """Return the SVG of a number line with marked points and jump arcs.
+
+    `extra` is raw SVG drawn on top, e.g. an equation above the line.
+    """
+    unknown = set(style) - set(STYLE)
+    if unknown:
+        raise TypeError(f"Unknown number line style: {', '.join(sorted(unknown))}")
+    style = {**STYLE, **style}
+    start, end, step = _fraction(start), _fraction(end), _fraction(step)
+
+    width, height = style["width"], style["height"]
+    size = 'width="100%"' if style["responsive"] else f'width="{width}" height="{height}"'
+    parts = [f'<svg {size} viewBox="0 0 {width} {height}">']
+
+    colors = sorted({jump.get("color", "#2196F3") for jump in jumps})
+    if colors:
+        parts.append("<defs>")
+        for color in colors:
+            parts.append(f'<marker id="{_marker_id(color)}" markerWidth="10" markerHeight="7" refX="9" '
+                         f'refY="3.5" orient="auto"><polygon points="0 0, 10 3.5, 0 7" fill="{color}"/></marker>')
+        parts.append("</defs>")
+
+    parts.append(_axis_svg(start, end, step, tuple(sorted(style.items()))))
+    for jump in jumps:
+        parts.append(_jump_svg(jump, x_position(jump["start"], start, end, style),
+                               x_position(jump["end"], start, end, style), style))
+    for point in points:
+        parts.append(_point_svg(point, x_position(point["value"], start, end, style), style))
+    parts.append(extra)
+    parts.append("</svg>")
+    return "".join(parts)
@@ -0,0 +1,399 @@
+"""Offline bank of pre-generated problems.
+
+Every Next click used to generate its problem on the request thread, and
+some generators retry in rejection loops (``while b == a: b = randint(...)``)
+whose worst case lands on the student's click.  The problem bank moves that
+work offline: a build runs each activity's generator (the call recorded in
+the route manifest) at every difficulty level and stores deduplicated pools
+of problems in one SQLite file:
+
+    python -m utils.problem_bank build [--count 200] [--figures 20] [--seed 1] [--only text]
+    python -m utils.problem_bank stats
+
+A banked problem is what one generator call did: the session state keys it
+wrote (and deleted) and the value it returned.  ``--figures N`` also runs
+the activity for the first N problems of each pool and stores the charts it
+drew through utils.figure_cache, so serving those problems serves their
+charts too; charts are large next to problems, so the rest draw live.
+
+When the router loads an activity, attach_problem_bank() replaces its
+generator with one that replays the next problem from the pool for the
+current difficulty level.  Each session walks a pool from a random offset,
+so a student sees every problem in it once before the live generator takes
+over again.  Only generators that read nothing from session state but the
+difficulty level are banked; the build reports the others and they keep
+generating live, as do activities edited since the build and headless
+callers (the warm-up and ``utils.bench generators`` measure live generation).
+
+The bank is problem_bank.sqlite next to main.py; MATHWIZ_PROBLEM_BANK names
+another file, and ``MATHWIZ_PROBLEM_BANK=0`` turns serving off.
+"""
+import argparse
+import contextlib
+import functools
+import hashlib
+import os
+import pickle
+import random
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+
+import streamlit as st
+from streamlit.logger import get_logger
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from utils import figure_cache
+from utils.activity_analysis import level_states
+from utils.generation import call_generator, generator_args, generator_parts, seeded_random
+from utils.route_manifest import APP_DIR, get_manifest
+
+PROBLEM_BANK_ENV = "MATHWIZ_PROBLEM_BANK"
+DEFAULT_BANK_PATH = os.path.join(APP_DIR, "problem_bank.sqlite")
+
+# Session key holding {(activity, pool): [offset, drawn]}
+CURSORS_KEY = "_problem_bank"
+
+# Generator calls per stored problem before a build stops looking for new ones
+ATTEMPTS_PER_PROBLEM = 5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS activities (
+    activity TEXT PRIMARY KEY,
+    source_hash TEXT NOT NULL,
+    generator TEXT NOT NULL,
+    built_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS problems (
+    activity TEXT NOT NULL,
+    pool TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (activity, pool, idx)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS figures (
+    key TEXT PRIMARY KEY,
+    png BLOB NOT NULL
+) WITHOUT ROWID;
+"""
+
+logger = get_logger(__name__)
+
+_stats = {"served": 0, "live": 0}
+_stats_lock = threading.Lock()
+
+
+def bank_path():
+    """Return the problem bank file to serve from, or None when serving is off"""
+    path = os.environ.get(PROBLEM_BANK_ENV, DEFAULT_BANK_PATH)
+    if path in ("", "0"):
+        return None
+    return path
+
+
+def source_hash(path):
+    """Return a digest of an activity's source, to tell when its bank is stale"""
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def activity_id(grade, subtopic):
+    """Return the bank's name for an activity"""
+    return f"{grade}/{subtopic}"
+
+
+def _connect(path, read_only=True):
+    """Open the bank; read-only connections fail instead of creating a missing file"""
+    if read_only:
+        return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    connection = sqlite3.connect(path)
+    connection.executescript(_SCHEMA)
+    return connection
+
+
+def _pool_key(args, difficulty):
+    """Return the pool a generator call draws from: its arguments, or else the current level"""
+    if args:
+        return repr(args)
+    if difficulty is None:
+        return repr(None)
+    return repr(st.session_state.get(difficulty["key"]))
+
+
+# Serving
+
+def load_pools(path, activity, expected_hash):
+    """Return {pool: [problem blobs]} for an activity, or {} when it isn't banked or is stale"""
+    with contextlib.closing(_connect(path)) as connection:
+        row = connection.execute(
+            "SELECT source_hash FROM activities WHERE activity = ?", (activity,)
+        ).fetchone()
+        if row is None or row[0] != expected_hash:
+            return {}
+        pools = {}
+        for pool, data in connection.execute(
+            "SELECT pool, data FROM problems WHERE activity = ? ORDER BY pool, idx", (activity,)
+        ):
+            pools.setdefault(pool, []).append(data)
+        return pools
+
+
+def _load_figures(path, keys):
+    """Put a banked problem's charts into the figure cache"""
+    missing = [key for key in keys if not figure_cache.has_figure(key)]
+    if not missing:
+        return
+    with contextlib.closing(_connect(path)) as connection:
+        for key in missing:
+            row = connection.execute("SELECT png FROM figures WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                figure_cache.preload_figure(key, row[0])
+
+
+def _draw(activity, pool_key, pool):
+    """Return this session's next problem from a pool, or None once it has seen them all"""
+    cursors = st.session_state.get(CURSORS_KEY)
+    if cursors is None:
+        cursors = st.session_state[CURSORS_KEY] = {}
+    cursor = cursors.get((activity, pool_key))
+    if cursor is None:
+        cursor = cursors[(activity, pool_key)] = [random.randrange(len(pool)), 0]
+    offset, drawn = cursor
+    if drawn >= len(pool):
+        return None
+    cursor[1] += 1
+    return pickle.loads(zlib.decompress(pool[(offset + drawn) % len(pool)]))
+
+
+def _count(outcome):
+    """Count a generator call served from the bank or generated live"""
+    with _stats_lock:
+        _stats[outcome] += 1
+
+
+def _banked(live, path, activity, difficulty, pools):
+    """Wrap a generator so browser sessions replay banked problems before generating live"""
+    @functools.wraps(live)
+    def generate(*args, **kwargs):
+        if kwargs or get_script_run_ctx(suppress_warning=True) is None:
+            return live(*args, **kwargs)
+        pool_key = _pool_key(args, difficulty)
+        pool = pools.get(pool_key)
+        problem = _draw(activity, pool_key, pool) if pool else None
+        if problem is None:
+            _count("live")
+            return live(*args)
+        for key in problem["deleted"]:
+            st.session_state.pop(key, None)
+        st.session_state.update(problem["state"])
+        if problem["figures"]:
+            _load_figures(path, problem["figures"])
+        _count("served")
+        return problem["result"]
+
+    return generate
+
+
+def attach_problem_bank(module, grade, subtopic, route):
+    """Serve a freshly loaded activity's generator from the problem bank, if it has pools for it"""
+    path = bank_path()
+    if path is None or not route.get("generator") or not os.path.exists(path):
+        return False
+    activity = activity_id(grade, subtopic)
+    try:
+        pools = load_pools(path, activity, source_hash(route["path"]))
+    except sqlite3.Error as e:
+        logger.warning("Problem bank %s unreadable: %r", path, e)
+        return False
+    name, _ = generator_parts(route)
+    live = getattr(module, name, None)
+    if not pools or live is None:
+        return False
+    setattr(module, name, _banked(live, path, activity, route.get("difficulty"), pools))
+    return True
+
+
+def problem_bank_stats():
+    """Return how many problems were served from the bank and how many generated live"""
+    with _stats_lock:
+        return dict(_stats)
+
+
+# Building
+
+def generate_pool(module, route, state, count, figures=0, seed=None):
+    """Call an activity's generator until it has `count` distinct problems at one level.
+
+    The generator draws from random.Random(seed), so a seeded build is
+    reproducible.  The first `figures` problems are drawn to record their
+    charts.  Returns (pool key, [problem blobs], {figure key: png}).  Raises
+    ValueError when the generator reads session state besides the difficulty
+    level, since replaying its problems would ignore that state.
+    """
+    # Imported here: building is the only user of headless sessions in this module
+    from utils.headless import headless_session
+
+    difficulty = route.get("difficulty")
+    allowed = {difficulty["key"]} if difficulty else set()
+
+    blobs, seen, pngs = [], set(), {}
+    with seeded_random(random.Random(seed)), headless_session(state):
+        # Let the activity initialize the rest of its state, as on a first visit
+        module.run()
+        args = generator_args(module, route)
+        pool_key = _pool_key(args, difficulty)
+
+        for _ in range(count * ATTEMPTS_PER_PROBLEM):
+            if len(blobs) >= count:
+                break
+            problem, read = call_generator(module, route, args)
+            unexpected = read - allowed
+            if unexpected:
+                raise ValueError(f"generator reads session state: {', '.join(sorted(unexpected))}")
+            try:
+                data = pickle.dumps(problem, protocol=pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                raise ValueError(f"problem can't be stored: {e}") from None
+            digest = hashlib.sha1(data).digest()
+            if digest in seen:
+                continue
+            seen.add(digest)
+
+            # A copy: drawing the problem below may change the state it refers to
+            problem = pickle.loads(data)
+            problem["figures"] = []
+            if len(blobs) < figures:
+                # Draw the problem the way a student first sees it
+                with figure_cache.record_figures() as drawn:
+                    module.run()
+                problem["figures"] = sorted(drawn)
+                pngs.update(drawn)
+            blobs.append(zlib.compress(pickle.dumps(problem, protocol=pickle.HIGHEST_PROTOCOL), 9))
+    return pool_key, blobs, pngs
+
+
+def build_activity(connection, grade, subtopic, route, count, figures, seed=None):
+    """Generate and store the pools of one activity.
+
+    Returns ({pool: problems stored}, {level: error}).  Levels whose generator
+    raises are left to live generation; when every level raises, so does this.
+    """
+    from utils.activity_registry import load_activity
+
+    module = load_activity(grade, subtopic, route)
+    # The activity's own figures are only worth drawing when it draws through the figure cache
+    if not hasattr(module, "show_figure"):
+        figures = 0
+    activity = activity_id(grade, subtopic)
+    pools, pngs, errors = {}, {}, {}
+    for level, state in level_states(route.get("difficulty")):
+        try:
+            level_seed = None if seed is None else f"{seed}/{activity}/{level}"
+            pool_key, blobs, drawn = generate_pool(module, route, state, count, figures, level_seed)
+        except Exception as e:
+            errors[level] = e
+            continue
+        pools[pool_key] = blobs
+        pngs.update(drawn)
+    if not pools:
+        raise next(iter(errors.values()))
+
+    with connection:
+        connection.execute("DELETE FROM problems WHERE activity = ?", (activity,))
+        connection.executemany(
+            "INSERT INTO problems (activity, pool, idx, data) VALUES (?, ?, ?, ?)",
+            [(activity, pool_key, idx, blob) for pool_key, blobs in pools.items() for idx, blob in enumerate(blobs)],
+        )
+        connection.executemany("INSERT OR IGNORE INTO figures (key, png) VALUES (?, ?)", pngs.items())
+        connection.execute(
+            "INSERT OR REPLACE INTO activities (activity, source_hash, generator, built_at) VALUES (?, ?, ?, ?)",
+            (activity, source_hash(route["path"]), route["generator"], time.time()),
+        )
+    return {pool_key: len(blobs) for pool_key, blobs in pools.items()}, errors
+
+
+def _describe(error):
+    """Return a one-line reason an activity or level was left to live generation"""
+    return str(error) if type(error) is ValueError else f"{type(error).__name__}: {error}"
+
+
+def run_build(args):
+    """Build the problem bank for every activity with a generator"""
+    start = time.perf_counter()
+    built, skipped = 0, []
+    with contextlib.closing(_connect(args.output, read_only=False)) as connection:
+        for grade, grade_routes in sorted(get_manifest()["routes"].items()):
+            for subtopic, route in sorted(grade_routes.items()):
+                if args.only and args.only not in subtopic:
+                    continue
+                if not route.get("generator"):
+                    skipped.append((subtopic, "no generator"))
+                    continue
+                activity_start = time.perf_counter()
+                try:
+                    pools, errors = build_activity(connection, grade, subtopic, route, args.count, args.figures,
+                                                   args.seed)
+                except Exception as e:
+                    with connection:
+                        connection.execute("DELETE FROM activities WHERE activity = ?",
+                                           (activity_id(grade, subtopic),))
+                        connection.execute("DELETE FROM problems WHERE activity = ?",
+                                           (activity_id(grade, subtopic),))
+                    skipped.append((subtopic, _describe(e)))
+                    continue
+                built += 1
+                sizes = " ".join(f"{pool}:{size}" for pool, size in pools.items())
+                print(f"{subtopic:<60} {sizes}  ({time.perf_counter() - activity_start:.1f} s)")
+                skipped.extend((f"{subtopic} level {level}", _describe(e)) for level, e in errors.items())
+        connection.execute("VACUUM")
+
+    for subtopic, reason in skipped:
+        print(f"skipped {subtopic}: {reason}")
+    print(f"{built} activities banked, {len(skipped)} activities or levels left to live generation in "
+          f"{time.perf_counter() - start:.1f} s -> {args.output} ({os.path.getsize(args.output) / 1024:.0f} KB)")
+    return 0
+
+
+def run_stats(args):
+    """Print the activities in the bank and their pool sizes"""
+    if not os.path.exists(args.output):
+        print(f"{args.output} does not exist; run `python -m utils.problem_bank build`")
+        return 1
+    with contextlib.closing(_connect(args.output)) as connection:
+        rows = connection.execute(
+            "SELECT activity, COUNT(DISTINCT pool), COUNT(*), SUM(LENGTH(data)) FROM problems GROUP BY activity"
+        ).fetchall()
+        figures, figure_bytes = connection.execute("SELECT COUNT(*), SUM(LENGTH(png)) FROM figures").fetchone()
+    print(f"{'pools':>5} {'problems':>8} {'KB':>8}  activity")
+    for activity, pools, problems, size in rows:
+        print(f"{pools:>5} {problems:>8} {size / 1024:>8.1f}  {activity}")
+    print(f"{len(rows)} activities, {sum(row[2] for row in rows)} problems, "
+          f"{figures} figures ({(figure_bytes or 0) / 1024:.0f} KB)")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.problem_bank", description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default=bank_path() or DEFAULT_BANK_PATH,
+                        help="bank file (default: $MATHWIZ_PROBLEM_BANK or problem_bank.sqlite)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="generate problem pools for every activity and difficulty level")
+    build.add_argument("--count", type=int, default=200, help="distinct problems per activity level")
+    build.add_argument("--figures", type=int, default=0, metavar="N",
+                       help="also store the charts drawn for the first N problems of each pool")
+    build.add_argument("--only", default="", help="only build subtopics containing this text")
+    build.add_argument("--seed", type=int, default=None, help="seed the generators for a reproducible build")
+    build.set_defaults(func=run_build)
+
+    stats = commands.add_parser("stats", help="list the banked activities and their pool sizes")
+    stats.set_defaults(func=run_stats)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
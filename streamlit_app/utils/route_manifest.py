@@ -0,0 +1,218 @@
+"""Route manifest mapping activity URLs to their files in the Grades tree.
+
+The manifest is generated by scanning ``streamlit_app/Grades`` and written to
+``route_manifest.json`` next to main.py.  The app loads it once per process
+and resolves ``?grade=...&subtopic=...`` with a single dict lookup.
+
+Regenerate it after adding, moving or removing an activity file:
+
+    python -m utils.route_manifest
+
+and check it against the tree and the curriculum catalog (non-zero exit
+status on problems) with:
+
+    python -m utils.route_manifest --check
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+
+from utils.activity_analysis import ENTRY_POINT, analyze_activity
+from utils.activity_importer import module_name
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GRADES_DIR = os.path.join(APP_DIR, "Grades")
+MANIFEST_PATH = os.path.join(APP_DIR, "route_manifest.json")
+
+MANIFEST_VERSION = 4
+
+# URL grade parameter -> folder under Grades/
+GRADE_FOLDERS = {
+    "lower_kindergarten": "Preschool",
+    "upper_kindergarten": "Foundation",
+    "class_i": "Year 1",
+    "class_ii": "Year 2",
+    "class_iii": "Year 3",
+    "class_iv": "Year 4",
+    "class_v": "Year 5",
+    "class_vi": "Year 6",
+    "class_vii": "Year 7",
+    "class_viii": "Year 8",
+    "class_ix": "Year 9",
+    "class_x": "Year 10",
+    "class_xi": "Year 11",
+    "class_xii": "Year 12"
+}
+
+DEFAULT_GRADE = "class_v"
+
+_manifest = None
+_manifest_lock = threading.Lock()
+
+
+def iter_activity_files(grades_dir=GRADES_DIR):
+    """Yield (grade_folder, section_folder, file_path) for every activity file"""
+    for grade_folder in sorted(os.listdir(grades_dir)):
+        grade_dir = os.path.join(grades_dir, grade_folder)
+        if not os.path.isdir(grade_dir):
+            continue
+        for section_folder in sorted(os.listdir(grade_dir)):
+            section_dir = os.path.join(grade_dir, section_folder)
+            if not os.path.isdir(section_dir) or section_folder.startswith(("_", ".")):
+                continue
+            for file_name in sorted(os.listdir(section_dir)):
+                if file_name.endswith(".py") and not file_name.startswith("_"):
+                    yield grade_folder, section_folder, os.path.join(section_dir, file_name)
+
+
+def build_manifest(grades_dir=GRADES_DIR):
+    """Scan the Grades tree and return a fresh manifest dict"""
+    folder_grades = {folder: grade for grade, folder in GRADE_FOLDERS.items()}
+    routes = {}
+    missing_entry_point = []
+
+    for grade_folder, section_folder, file_path in iter_activity_files(grades_dir):
+        grade = folder_grades.get(grade_folder)
+        if grade is None:
+            continue
+        subtopic = os.path.splitext(os.path.basename(file_path))[0]
+        relative_path = os.path.relpath(file_path, APP_DIR).replace(os.sep, "/")
+        analysis = analyze_activity(file_path)
+        if not analysis["entry"]:
+            missing_entry_point.append(relative_path)
+
+        routes.setdefault(grade, {})[subtopic] = {
+            "grade": grade_folder,
+            "section": section_folder,
+            "module": module_name(grade_folder, section_folder, subtopic),
+            "path": relative_path,
+            "entry": ENTRY_POINT if analysis["entry"] else None,
+            "difficulty": analysis["difficulty"],
+            "generator": analysis["generator"],
+        }
+
+    return {
+        "version": MANIFEST_VERSION,
+        "routes": routes,
+        "missing_entry_point": missing_entry_point,
+    }
+
+
+def write_manifest(manifest, path=MANIFEST_PATH):
+    """Write a manifest as stable, diff-friendly JSON"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True, ensure_ascii=False)
+        f.write("\n")
+
+
+def _resolve_paths(manifest):
+    """Turn the app-relative route paths of a manifest into absolute paths"""
+    for grade_routes in manifest["routes"].values():
+        for route in grade_routes.values():
+            route["path"] = os.path.join(APP_DIR, *route["path"].split("/"))
+    return manifest
+
+
+def read_manifest(path=MANIFEST_PATH):
+    """Read a manifest file, resolving every route path to an absolute path"""
+    with open(path, encoding="utf-8") as f:
+        return _resolve_paths(json.load(f))
+
+
+def get_manifest():
+    """Return the process-wide manifest, loading it on first use"""
+    global _manifest
+    if _manifest is None:
+        with _manifest_lock:
+            if _manifest is None:
+                if os.path.exists(MANIFEST_PATH):
+                    _manifest = read_manifest()
+                else:
+                    # No generated manifest shipped: scan the tree once instead
+                    _manifest = _resolve_paths(build_manifest())
+    return _manifest
+
+
+def lookup_route(grade, subtopic):
+    """Return the manifest entry for an activity URL, or None if there is none"""
+    return get_manifest()["routes"].get(grade, {}).get(subtopic)
+
+
+def check_manifest(manifest, grades_dir=GRADES_DIR):
+    """Compare a loaded manifest with the Grades tree.
+
+    Returns a dict of problem lists: manifest entries whose file is missing,
+    activity files that no route points at, and files without a run() entry point.
+    """
+    routed_paths = set()
+    missing_files = []
+    for grade, grade_routes in sorted(manifest["routes"].items()):
+        for subtopic, route in sorted(grade_routes.items()):
+            routed_paths.add(os.path.normcase(route["path"]))
+            if not os.path.exists(route["path"]):
+                missing_files.append(f"{grade}/{subtopic} -> {os.path.relpath(route['path'], APP_DIR)}")
+
+    unrouted_files = [
+        os.path.relpath(file_path, APP_DIR)
+        for _, _, file_path in iter_activity_files(grades_dir)
+        if os.path.normcase(file_path) not in routed_paths
+    ]
+
+    return {
+        "missing_files": missing_files,
+        "unrouted_files": unrouted_files,
+        "missing_entry_point": list(manifest.get("missing_entry_point", [])),
+    }
+
+
+def print_report(problems, out=sys.stdout):
+    """Print a manifest check report and return the number of problems found"""
+    titles = {
+        "missing_files": "Routes whose file is missing",
+        "unrouted_files": "Activity files no route points at",
+        "missing_entry_point": f"Activity files without a {ENTRY_POINT}() function",
+        "dead_links": "Curriculum entries with no activity file",
+        "unlinked_routes": "Activity files the curriculum never links to",
+        "slug_collisions": "Slugs produced by more than one label",
+        "near_collisions": "Slugs that only differ by repeated underscores",
+    }
+    total = 0
+    for name, title in titles.items():
+        entries = problems.get(name, [])
+        total += len(entries)
+        print(f"{title}: {len(entries)}", file=out)
+        for entry in entries:
+            print(f"  - {entry}", file=out)
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or check the activity route manifest")
+    parser.add_argument("--check", action="store_true",
+                        help="check the existing manifest against the Grades tree instead of rewriting it")
+    parser.add_argument("--output", default=MANIFEST_PATH, help="manifest file to write or check")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        # utils.slugs reads the manifest itself, so it can't be imported at module level
+        from utils import catalog
+        from utils.slugs import SlugIndex, link_problems
+
+        manifest = read_manifest(args.output)
+        problems = check_manifest(manifest)
+        problems.update(link_problems(SlugIndex(catalog.get_catalog(), manifest)))
+        return 1 if print_report(problems) else 0
+
+    manifest = build_manifest()
+    write_manifest(manifest, args.output)
+    route_count = sum(len(grade_routes) for grade_routes in manifest["routes"].values())
+    print(f"Wrote {route_count} routes to {os.path.relpath(args.output)}")
+    if manifest["missing_entry_point"]:
+        print_report({"missing_entry_point": manifest["missing_entry_point"]})
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
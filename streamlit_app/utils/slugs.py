@@ -0,0 +1,147 @@
+"""URL slugs for catalog activity labels.
+
+An activity label such as "Schedules: 24-hour time" becomes the subtopic slug
+``schedules_24hour_time`` used in ``?subtopic=...`` links.  The slug index maps
+labels to slugs, slugs back to labels, and slugs to activity routes.  It is
+built once per process from the catalog and the route manifest, so buttons,
+deep links and breadcrumbs never recompute a slug on a click.
+"""
+import re
+import threading
+
+from utils import catalog
+from utils.route_manifest import get_manifest
+
+# sanitize() in one pass: spaces become underscores, punctuation is dropped
+_SLUG_TABLE = str.maketrans({" ": "_", "-": None, ":": None, ",": None, ".": None,
+                             "(": None, ")": None, "?": None})
+_REPEATED_UNDERSCORES = re.compile(r"_+")
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def sanitize(text):
+    """Convert activity names to valid URL parameters"""
+    return text.lower().translate(_SLUG_TABLE)
+
+
+def canonical_slug(slug):
+    """Collapse repeated underscores, so "schedules__24hour_time" matches "schedules_24hour_time" """
+    return _REPEATED_UNDERSCORES.sub("_", slug).strip("_")
+
+
+class SlugIndex:
+    """Bidirectional label <-> slug <-> route index over the catalog"""
+
+    def __init__(self, catalog_data, manifest):
+        self._slugs = {}  # label -> slug
+        self._labels = {}  # slug -> [labels]
+        self._grade_links = {}  # grade -> {slug: (section, label)}
+        self._routes = manifest["routes"]
+        self._canonical_routes = {}  # grade -> {canonical slug: route slug}
+
+        for grade, sections in catalog_data["grades"].items():
+            links = self._grade_links.setdefault(grade, {})
+            for section, labels in sections.items():
+                for label in labels:
+                    slug = self._add_label(label)
+                    links.setdefault(slug, (section, label))
+
+        for categories in catalog_data["topics"].values():
+            for labels in categories.values():
+                for label in labels:
+                    self._add_label(label)
+
+        for grade, grade_routes in self._routes.items():
+            canonical = self._canonical_routes.setdefault(grade, {})
+            for slug in grade_routes:
+                canonical.setdefault(canonical_slug(slug), slug)
+
+    def _add_label(self, label):
+        slug = self._slugs.get(label)
+        if slug is None:
+            slug = self._slugs[label] = sanitize(label)
+            self._labels.setdefault(slug, []).append(label)
+        return slug
+
+    def slug_for(self, label):
+        """Return the URL slug of an activity label"""
+        slug = self._slugs.get(label)
+        return slug if slug is not None else sanitize(label)
+
+    def labels_for(self, slug):
+        """Return every catalog label that produces a slug"""
+        return list(self._labels.get(slug, ()))
+
+    def link_for(self, grade, slug):
+        """Return (section, label) of the grade curriculum entry linking to a slug, or None"""
+        return self._grade_links.get(grade, {}).get(slug)
+
+    def route_for(self, grade, slug):
+        """Return the route for a slug, tolerating repeated underscores, or None"""
+        grade_routes = self._routes.get(grade, {})
+        route = grade_routes.get(slug)
+        if route is None:
+            route_slug = self._canonical_routes.get(grade, {}).get(canonical_slug(slug))
+            if route_slug is not None:
+                route = grade_routes[route_slug]
+        return route
+
+    def collisions(self):
+        """Return {slug: labels} for slugs produced by more than one label"""
+        return {slug: labels for slug, labels in sorted(self._labels.items()) if len(labels) > 1}
+
+    def near_collisions(self):
+        """Return groups of distinct slugs that only differ by repeated underscores.
+
+        Route slugs take part too, so a label whose slug misses its activity
+        file by an underscore shows up here.
+        """
+        groups = {}
+        slugs = set(self._labels)
+        for grade_routes in self._routes.values():
+            slugs.update(grade_routes)
+        for slug in slugs:
+            groups.setdefault(canonical_slug(slug), set()).add(slug)
+        return sorted(sorted(group) for group in groups.values() if len(group) > 1)
+
+    def dead_links(self):
+        """Return "grade/label" for curriculum entries whose slug has no activity file"""
+        return [
+            f"{grade}/{label}"
+            for grade, links in sorted(self._grade_links.items())
+            for slug, (_, label) in links.items()
+            if self.route_for(grade, slug) is None
+        ]
+
+    def unlinked_routes(self):
+        """Return "grade/slug" for activity files the grade curriculum never links to"""
+        unlinked = []
+        for grade, grade_routes in sorted(self._routes.items()):
+            linked = {
+                self._canonical_routes[grade].get(canonical_slug(slug))
+                for slug in self._grade_links.get(grade, {})
+            }
+            unlinked.extend(f"{grade}/{slug}" for slug in sorted(grade_routes) if slug not in linked)
+        return unlinked
+
+
+def link_problems(index):
+    """Return the catalog link problems of a slug index as report lists"""
+    return {
+        "dead_links": index.dead_links(),
+        "unlinked_routes": index.unlinked_routes(),
+        "slug_collisions": [f"{slug}: {' | '.join(labels)}" for slug, labels in index.collisions().items()],
+        "near_collisions": [" ~ ".join(group) for group in index.near_collisions()],
+    }
+
+
+def get_slug_index():
+    """Return the process-wide slug index, building it on first use"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = SlugIndex(catalog.get_catalog(), get_manifest())
+    return _index
@@ -0,0 +1,182 @@
+"""Session state memory accounting.
+
+Activities keep problems, scenario lists and sometimes whole figures in
+st.session_state, and all of it stays in server memory for as long as the
+session lives.  state_usage() measures one session's state: how many keys it
+holds, their approximate deep size grouped by the activity that owns them
+(see utils.activity_state) and the largest values.
+
+Two ways to look at it:
+
+    ?debug=state                 a page showing the current session's state
+    MATHWIZ_STATE_LOG=<seconds>  a log line per session at most this often
+                                 (default 300, 0 turns it off)
+
+Sizes are approximate: every key is measured on its own, so objects shared
+between keys are counted once for each of them.
+"""
+import os
+import sys
+import time
+import types
+from collections import deque
+
+import streamlit as st
+from streamlit.logger import get_logger
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from utils.activity_state import state_by_owner
+from utils.clock_face import clock_faces_cached
+from utils.figure_cache import figure_cache_stats
+from utils.problem_bank import problem_bank_stats
+from utils.svg_cache import svg_cache_stats
+
+STATE_LOG_ENV = "MATHWIZ_STATE_LOG"
+DEFAULT_LOG_INTERVAL = 300
+
+# Session key holding when this session last logged its state
+LOGGED_AT_KEY = "_state_usage_logged_at"
+
+# Largest values listed in reports
+TOP_VALUES = 10
+
+# Objects walked per value; a figure's object graph can be very large
+MAX_OBJECTS = 100_000
+
+APP_OWNER = "app"
+
+# Shared by the whole process, not by the value that references them
+_OPAQUE = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+           types.MethodType, types.CodeType)
+
+logger = get_logger(__name__)
+
+
+def deep_size(obj, max_objects=MAX_OBJECTS):
+    """Return the approximate number of bytes `obj` and everything it references take"""
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack and len(seen) < max_objects:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _OPAQUE):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current, 0)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset, deque)):
+            stack.extend(current)
+        elif not isinstance(current, (str, bytes, bytearray, int, float, complex, bool)):
+            attributes = getattr(current, "__dict__", None)
+            if isinstance(attributes, dict):
+                stack.append(attributes)
+            for slot in getattr(type(current), "__slots__", ()):
+                if isinstance(slot, str) and hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+    return total
+
+
+def owner_name(route_id):
+    """Return the short name reports use for a key owner"""
+    return APP_OWNER if route_id is None else route_id.rsplit(".", 1)[-1]
+
+
+def state_usage(top=TOP_VALUES):
+    """Measure the current session's state.
+
+    Returns {"keys", "bytes", "owners": [{"owner", "keys", "bytes"}],
+    "largest": [{"key", "owner", "type", "bytes"}]}, biggest first.
+    """
+    owners = []
+    values = []
+    for route_id, state in state_by_owner().items():
+        name = owner_name(route_id)
+        sizes = {key: deep_size(value) for key, value in state.items() if key != LOGGED_AT_KEY}
+        if not sizes:
+            continue
+        owners.append({"owner": name, "keys": len(sizes), "bytes": sum(sizes.values())})
+        values.extend(
+            {"key": key, "owner": name, "type": type(state[key]).__name__, "bytes": size}
+            for key, size in sizes.items()
+        )
+
+    owners.sort(key=lambda row: row["bytes"], reverse=True)
+    values.sort(key=lambda row: row["bytes"], reverse=True)
+    return {
+        "keys": sum(row["keys"] for row in owners),
+        "bytes": sum(row["bytes"] for row in owners),
+        "owners": owners,
+        "largest": values[:top],
+    }
+
+
+def format_usage(usage, owners=3):
+    """Return a one-line summary of a state_usage() report"""
+    line = f"{usage['keys']} keys, {usage['bytes'] / 1024:.1f} KB"
+    if usage["owners"]:
+        line += "; by owner: " + ", ".join(
+            f"{row['owner']} {row['bytes'] / 1024:.1f} KB" for row in usage["owners"][:owners]
+        )
+    if usage["largest"]:
+        largest = usage["largest"][0]
+        line += (f"; largest: {largest['key']} ({largest['owner']}, {largest['type']}, "
+                 f"{largest['bytes'] / 1024:.1f} KB)")
+    return line
+
+
+def log_interval():
+    """Return the seconds between state log lines of a session, 0 when off"""
+    return float(os.environ.get(STATE_LOG_ENV, DEFAULT_LOG_INTERVAL))
+
+
+def log_state_usage(interval=None):
+    """Log this session's state usage if it hasn't been logged for `interval` seconds"""
+    interval = log_interval() if interval is None else interval
+    if interval <= 0:
+        return
+    now = time.monotonic()
+    if now - st.session_state.get(LOGGED_AT_KEY, float("-inf")) < interval:
+        return
+    st.session_state[LOGGED_AT_KEY] = now
+
+    ctx = get_script_run_ctx()
+    session_id = ctx.session_id if ctx is not None else "-"
+    logger.info("Session %s state: %s", session_id, format_usage(state_usage()))
+
+
+def show_state_page():
+    """Render the ?debug=state page for the current session"""
+    usage = state_usage(top=25)
+    st.title("🔍 Session state")
+
+    col1, col2 = st.columns(2)
+    col1.metric("Keys", usage["keys"])
+    col2.metric("Approximate size", f"{usage['bytes'] / 1024:.1f} KB")
+
+    st.subheader("By owning activity")
+    st.table([
+        {"Owner": row["owner"], "Keys": row["keys"], "KB": round(row["bytes"] / 1024, 1)}
+        for row in usage["owners"]
+    ])
+
+    st.subheader("Largest values")
+    st.table([
+        {"Key": row["key"], "Owner": row["owner"], "Type": row["type"],
+         "KB": round(row["bytes"] / 1024, 1)}
+        for row in usage["largest"]
+    ])
+    st.caption("Each value is measured on its own; objects shared between keys count for each.")
+
+    st.subheader("Shared figure caches")
+    svg = svg_cache_stats()
+    st.markdown(f"**SVG:** {svg['entries']} figures, {svg['chars'] / 1024:.1f} KB, "
+                f"{svg['hits']} hits / {svg['misses']} misses")
+    st.markdown(f"**Clock faces:** {clock_faces_cached()} drawn")
+    figures = figure_cache_stats()
+    st.markdown(f"**Charts:** {figures['entries']} figures, {figures['bytes'] / 1024:.1f} KB, "
+                f"{figures['hits']} hits / {figures['disk_hits']} disk hits / {figures['misses']} misses")
+    bank = problem_bank_stats()
+    st.markdown(f"**Problem bank:** {bank['served']} problems served / {bank['live']} generated live")
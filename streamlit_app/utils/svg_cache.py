@@ -0,0 +1,96 @@
+"""Process-wide cache of rendered SVG figures.
+
+Geometry activities build the same SVG strings over and over: every rerun
+redraws the figure from the same (shape, colour, rotation, size) parameters,
+and some question generators draw every candidate figure just to pick one.
+Activities mark their pure SVG helpers with::
+
+    @cached_svg
+    def draw_cube_net_cross():
+        ...
+
+and repeated calls with the same arguments return the string built the first
+time.  Only functions whose output depends on nothing but their arguments may
+be cached (no random ids, no session state).
+
+All cached functions share one LRU bounded by the total length of the stored
+SVG, and every function keeps hit/miss counters (svg_cache_stats()).
+"""
+import functools
+import threading
+from collections import OrderedDict
+
+# Total characters of SVG kept across all cached functions
+MAX_SVG_CHARS = 8 * 1024 * 1024
+
+# (function, args, kwargs) -> svg, least recently used first
+_cache = OrderedDict()
+_cache_chars = 0
+_cache_lock = threading.Lock()
+
+# "module.function" -> {"hits": n, "misses": n}
+_stats = {}
+
+
+def _store(key, svg, max_chars):
+    """Add a rendered figure, evicting the least recently used ones past the size bound"""
+    global _cache_chars
+    if len(svg) > max_chars:
+        return
+    with _cache_lock:
+        if key in _cache:
+            return
+        _cache[key] = svg
+        _cache_chars += len(svg)
+        while _cache_chars > max_chars:
+            _, evicted = _cache.popitem(last=False)
+            _cache_chars -= len(evicted)
+
+
+def cached_svg(func):
+    """Decorate a pure SVG-building function so equal calls share one rendered string"""
+    name = f"{func.__module__}.{func.__qualname__}"
+    counters = _stats.setdefault(name, {"hits": 0, "misses": 0})
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (func, args, tuple(sorted(kwargs.items())))
+        try:
+            with _cache_lock:
+                svg = _cache.get(key)
+                if svg is not None:
+                    _cache.move_to_end(key)
+                    counters["hits"] += 1
+                    return svg
+                counters["misses"] += 1
+        except TypeError:
+            # Unhashable arguments: nothing to key the figure on
+            return func(*args, **kwargs)
+
+        svg = func(*args, **kwargs)
+        if isinstance(svg, str):
+            _store(key, svg, MAX_SVG_CHARS)
+        return svg
+
+    return wrapper
+
+
+def svg_cache_stats():
+    """Return the cache's size and the hit/miss counters of every cached function"""
+    with _cache_lock:
+        functions = {name: dict(counters) for name, counters in _stats.items()}
+        stats = {"entries": len(_cache), "chars": _cache_chars}
+    stats["hits"] = sum(counters["hits"] for counters in functions.values())
+    stats["misses"] = sum(counters["misses"] for counters in functions.values())
+    stats["functions"] = functions
+    return stats
+
+
+def clear_svg_cache():
+    """Drop every cached figure and reset the counters"""
+    global _cache_chars
+    with _cache_lock:
+        _cache.clear()
+        _cache_chars = 0
+        for counters in _stats.values():
+            counters["hits"] = counters["misses"] = 0
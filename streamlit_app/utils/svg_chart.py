@@ -0,0 +1,361 @@
+"""Lightweight SVG charts for the data and graphs activities.
+
+Bar graphs, line graphs and dot plots only need axes, rectangles, markers
+and labels.  Drawing them with matplotlib costs a figure, a layout pass,
+rasterising, PNG encoding and a base64 image sent to the browser; these
+functions build the same charts as a small SVG string instead:
+
+    st.markdown(bar_chart_svg(["Red", "Blue"], [4, 7], title="Favourite colour",
+                              y_max=10, y_step=2), unsafe_allow_html=True)
+
+The charts follow matplotlib's look (font sizes in points, Set3 bar colours,
+faint grid, a box around the plot) so converted activities look as they did.
+Charts scale to the width of their column, like st.pyplot, up to their
+nominal width.  Labels are escaped; every argument is plain data, so the
+functions need nothing but the standard library.
+"""
+import html
+import math
+
+# Chart sizes are in px at 100 px per inch, so figsize=(8, 6) is 800 x 600
+PX_PER_PT = 100 / 72
+
+FONT_FAMILY = "DejaVu Sans, Verdana, Arial, sans-serif"
+
+# Font sizes in points, as matplotlib takes them
+TICK_SIZE = 10
+LABEL_SIZE = 12
+TITLE_SIZE = 14
+
+AXIS_COLOR = "black"
+GRID_COLOR = "#b0b0b0"
+
+# Matplotlib's Set3 colour map, which the bar graphs colour their bars with
+SET3 = ("#8dd3c7", "#ffffb3", "#bebada", "#fb8072", "#80b1d3", "#fdb462",
+        "#b3de69", "#fccde5", "#d9d9d9", "#bc80bd", "#ccebc5", "#ffed6f")
+
+# Tick steps tried for numeric axes, times a power of ten
+NICE_STEPS = (1, 2, 2.5, 5, 10)
+
+
+def _px(points):
+    """Return a size in points as px"""
+    return points * PX_PER_PT
+
+
+def _num(x):
+    """Format an SVG coordinate"""
+    return f"{x:.1f}".rstrip("0").rstrip(".")
+
+
+def _text_width(text, points):
+    """Return the approximate width in px of a label"""
+    return 0.6 * _px(points) * len(str(text))
+
+
+def _text(x, y, text, points, anchor="middle", baseline="auto", weight="normal", rotate=None):
+    """Return an SVG text element"""
+    attributes = f'x="{_num(x)}" y="{_num(y)}" font-size="{_num(_px(points))}" text-anchor="{anchor}"'
+    if baseline != "auto":
+        attributes += f' dominant-baseline="{baseline}"'
+    if weight != "normal":
+        attributes += f' font-weight="{weight}"'
+    if rotate:
+        attributes += f' transform="rotate({rotate} {_num(x)} {_num(y)})"'
+    return f'<text {attributes}>{html.escape(str(text))}</text>'
+
+
+
+def set3_colors(n):
+    """Return the colours plt.cm.Set3(np.linspace(0, 1, n)) picks for n bars"""
+    if n == 1:
+        return [SET3[0]]
+    step = 1 / (n - 1)
+    return [SET3[min(int(i * step * len(SET3)), len(SET3) - 1)] if i < n - 1 else SET3[-1]
+            for i in range(n)]
+
+
+def nice_ticks(low, high, max_bins=8):
+    """Return evenly spaced round tick values covering low..high"""
+    span = high - low
+    if span <= 0:
+        return [low]
+    magnitude = 10 ** math.floor(math.log10(span / max_bins))
+    step = next(m * magnitude for m in NICE_STEPS if span / (m * magnitude) <= max_bins)
+    first = math.ceil(low / step - 1e-9)
+    last = math.floor(high / step + 1e-9)
+    return [round(i * step, 10) for i in range(first, last + 1)]
+
+
+def format_tick(value):
+    """Return the label of a numeric tick"""
+    if float(value).is_integer():
+        return str(int(value))
+    return f"{value:g}"
+
+
+def _layout(width, height, title, x_label, y_label, y_labels, x_labels, rotate):
+    """Return the plot area (left, top, right, bottom) left after the labels, like tight_layout"""
+    tick_px = _px(TICK_SIZE)
+    left = 12 + max((_text_width(label, TICK_SIZE) for label in y_labels), default=0) + 10
+    if y_label:
+        left += _px(LABEL_SIZE) * 1.5
+    if rotate:
+        longest = max((_text_width(label, TICK_SIZE) for label in x_labels), default=0)
+        bottom = 12 + longest * math.sin(math.radians(rotate)) + tick_px + 10
+    else:
+        bottom = 12 + tick_px * 1.4 + 8
+    if x_label:
+        bottom += _px(LABEL_SIZE) * 1.6
+    top = 12 + (_px(TITLE_SIZE) * 1.8 if title else 0)
+    return left, top, width - 20, height - bottom
+
+
+def _open_svg(width, height, background="white"):
+    """Return the opening of a chart scaled to its column up to its nominal width"""
+    return (f'<svg viewBox="0 0 {width} {height}" width="100%" style="max-width: {width}px;" '
+            f'font-family="{FONT_FAMILY}"><rect width="{width}" height="{height}" fill="{background}"/>')
+
+
+def _axes_svg(area, x_ticks, y_ticks, grid, rotate, title, x_label, y_label, width, height):
+    """Return the grid, box, ticks, tick labels, axis labels and title of a chart.
+
+    x_ticks and y_ticks are (position in px, label) pairs; grid is "x", "y",
+    "both" or "none", and draws the lines under everything else.
+    """
+    left, top, right, bottom = area
+    tick_length = _px(3.5)
+    grid_lines = []
+    if grid in ("y", "both"):
+        grid_lines += [f'M{_num(left)} {_num(y)}H{_num(right)}' for y, _ in y_ticks]
+    if grid in ("x", "both"):
+        grid_lines += [f'M{_num(x)} {_num(top)}V{_num(bottom)}' for x, _ in x_ticks]
+
+    parts = []
+    if grid_lines:
+        dash = ' stroke-dasharray="4 2"' if grid == "y" else ""
+        parts.append(f'<path d="{"".join(grid_lines)}" stroke="{GRID_COLOR}" stroke-opacity="0.3" '
+                     f'stroke-width="{_num(_px(0.8))}"{dash} fill="none"/>')
+
+    ticks = [f'M{_num(left)} {_num(y)}h{_num(-tick_length)}' for y, _ in y_ticks]
+    ticks += [f'M{_num(x)} {_num(bottom)}v{_num(tick_length)}' for x, _ in x_ticks]
+    parts.append(f'<path d="{"".join(ticks)}" stroke="{AXIS_COLOR}" stroke-width="{_num(_px(0.8))}"/>')
+
+    for y, label in y_ticks:
+        parts.append(_text(left - tick_length - 4, y, label, TICK_SIZE, anchor="end", baseline="central"))
+    label_y = bottom + tick_length + 4
+    for x, label in x_ticks:
+        if rotate:
+            parts.append(_text(x, label_y, label, TICK_SIZE, anchor="end", baseline="hanging", rotate=-rotate))
+        else:
+            parts.append(_text(x, label_y, label, TICK_SIZE, baseline="hanging"))
+
+    if x_label:
+        parts.append(_text((left + right) / 2, height - 12, x_label, LABEL_SIZE, baseline="text-after-edge"))
+    if y_label:
+        x = 12 + _px(LABEL_SIZE) / 2
+        parts.append(_text(x, (top + bottom) / 2, y_label, LABEL_SIZE, baseline="central", rotate=-90))
+    if title:
+        parts.append(_text((left + right) / 2, 12 + _px(TITLE_SIZE), title, TITLE_SIZE, weight="bold"))
+    return parts
+
+
+def _box_svg(area):
+    """Return the box drawn around the plot area"""
+    left, top, right, bottom = area
+    return (f'<rect x="{_num(left)}" y="{_num(top)}" width="{_num(right - left)}" height="{_num(bottom - top)}" '
+            f'fill="none" stroke="{AXIS_COLOR}" stroke-width="{_num(_px(0.8))}"/>')
+
+
+def bar_chart_svg(categories, values, title="", x_label="", y_label="", y_max=None, y_step=None,
+                  colors=None, value_labels=False, rotate_labels=None, width=800, height=600):
+    """Return the SVG of a vertical bar chart.
+
+    The y axis runs from 0 to y_max with a tick every y_step (both picked
+    from the data when omitted).  Bars are coloured from Set3 unless
+    `colors` lists one colour per bar.  Category labels are turned 45
+    degrees when there are more than five, unless rotate_labels says
+    otherwise.
+    """
+    values = list(values)
+    if y_max is None:
+        y_ticks = nice_ticks(0, max(values, default=1) * 1.05)
+        if y_ticks[-1] < max(values, default=1) * 1.05:
+            y_ticks.append(2 * y_ticks[-1] - y_ticks[-2])
+        y_max = y_ticks[-1]
+    else:
+        y_ticks = (list(range(0, int(y_max) + 1, y_step)) if y_step
+                   else nice_ticks(0, y_max))
+    if rotate_labels is None:
+        rotate_labels = len(categories) > 5
+    rotate = 45 if rotate_labels else 0
+
+    y_labels = [format_tick(value) for value in y_ticks]
+    area = _layout(width, height, title, x_label, y_label, y_labels, categories, rotate)
+    left, top, right, bottom = area
+
+    # Bars are 0.8 wide at 0, 1, 2...; the view adds 5% margins like matplotlib
+    count = max(len(categories), 1)
+    x_low, x_high = -0.4, count - 0.6
+    margin = (x_high - x_low) * 0.05
+    x_low, x_high = x_low - margin, x_high + margin
+
+    def x_px(x):
+        return left + (x - x_low) / (x_high - x_low) * (right - left)
+
+    def y_px(y):
+        return bottom - y / y_max * (bottom - top)
+
+    x_ticks = [(x_px(i), category) for i, category in enumerate(categories)]
+    parts = [_open_svg(width, height)]
+    parts += _axes_svg(area, x_ticks, [(y_px(value), label) for value, label in zip(y_ticks, y_labels)],
+                       "y", rotate, title, x_label, y_label, width, height)
+
+    colors = colors or set3_colors(len(categories))
+    bar_width = x_px(0.8) - x_px(0)
+    for i, value in enumerate(values):
+        x, y = x_px(i - 0.4), y_px(min(value, y_max))
+        parts.append(f'<rect x="{_num(x)}" y="{_num(y)}" width="{_num(bar_width)}" height="{_num(bottom - y)}" '
+                     f'fill="{colors[i]}" stroke="black" stroke-width="{_num(_px(1))}"/>')
+        if value_labels:
+            label_y = y_px(value + (y_step or y_ticks[1] - y_ticks[0]) / 10)
+            parts.append(_text(x_px(i), label_y, format_tick(value), TICK_SIZE, baseline="text-after-edge"))
+
+    parts.append(_box_svg(area))
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def line_chart_svg(x_values, y_values, title="", x_label="", y_label="", color="#1f77b4",
+                   categorical=False, value_labels=False, y_max=None, highlights=(),
+                   rotate_labels=None, width=1000, height=600):
+    """Return the SVG of a line graph with a marker on every point.
+
+    With `categorical` the x values are labels (months, days) spaced evenly;
+    otherwise they are numbers on a linear axis.  The y axis runs from 0 to
+    y_max (the largest value plus 10% when omitted).
+
+    Highlights are dicts with "points" ([(x, y), ...] in data coordinates)
+    and optionally "color", "radius" (px), "opacity", "connect" (draw a
+    dashed line through the points) and "label" (shown in a rounded box one
+    unit above the first point).
+    """
+    x_values, y_values = list(x_values), list(y_values)
+    y_max = y_max or max(y_values, default=1) * 1.1
+    y_ticks = nice_ticks(0, y_max)
+    if rotate_labels is None:
+        rotate_labels = categorical
+    rotate = 45 if rotate_labels else 0
+
+    if categorical:
+        positions = list(range(len(x_values)))
+        tick_values = positions
+        tick_labels = [str(x) for x in x_values]
+    else:
+        positions = x_values
+    x_low, x_high = min(positions), max(positions)
+    margin = (x_high - x_low) * 0.05 or 0.5
+    x_low, x_high = x_low - margin, x_high + margin
+    if not categorical:
+        tick_values = nice_ticks(x_low, x_high, max_bins=9)
+        tick_labels = [format_tick(value) for value in tick_values]
+
+    y_labels = [format_tick(value) for value in y_ticks]
+    area = _layout(width, height, title, x_label, y_label, y_labels, tick_labels, rotate)
+    left, top, right, bottom = area
+
+    def x_px(position):
+        return left + (position - x_low) / (x_high - x_low) * (right - left)
+
+    def data_x_px(x):
+        return x_px(x_values.index(x) if categorical else x)
+
+    def y_px(y):
+        return bottom - y / y_max * (bottom - top)
+
+    parts = [_open_svg(width, height)]
+    parts += _axes_svg(area, [(x_px(x), label) for x, label in zip(tick_values, tick_labels)],
+                       [(y_px(value), label) for value, label in zip(y_ticks, y_labels)],
+                       "both", rotate, title, x_label, y_label, width, height)
+
+    points = [(x_px(x), y_px(y)) for x, y in zip(positions, y_values)]
+    path = "".join(f'{"M" if i == 0 else "L"}{_num(x)} {_num(y)}' for i, (x, y) in enumerate(points))
+    parts.append(f'<path d="{path}" stroke="{color}" stroke-width="{_num(_px(2))}" fill="none" '
+                 f'stroke-linejoin="round"/>')
+    radius = _num(_px(4))
+    parts.extend(f'<circle cx="{_num(x)}" cy="{_num(y)}" r="{radius}" fill="{color}"/>' for x, y in points)
+    if value_labels:
+        for (x, _), value in zip(points, y_values):
+            parts.append(_text(x, y_px(value + 0.5), value, TICK_SIZE, baseline="text-after-edge"))
+
+    for highlight in highlights:
+        parts.extend(_highlight_svg(highlight, data_x_px, y_px))
+
+    parts.append(_box_svg(area))
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def _highlight_svg(highlight, x_px, y_px):
+    """Return the markers, dashed line and label of a line chart highlight"""
+    color = highlight.get("color", "green")
+    opacity = highlight.get("opacity", 0.5)
+    points = [(x_px(x), y_px(y)) for x, y in highlight["points"]]
+    parts = []
+    if highlight.get("connect"):
+        path = "".join(f'{"M" if i == 0 else "L"}{_num(x)} {_num(y)}' for i, (x, y) in enumerate(points))
+        parts.append(f'<path d="{path}" stroke="{color}" stroke-opacity="0.3" stroke-width="{_num(_px(2))}" '
+                     f'stroke-dasharray="{_num(_px(7.4))} {_num(_px(3.2))}" fill="none"/>')
+    radius = _num(highlight.get("radius", _px(7.5)))
+    parts.extend(f'<circle cx="{_num(x)}" cy="{_num(y)}" r="{radius}" fill="{color}" fill-opacity="{opacity}"/>'
+                 for x, y in points)
+
+    label = highlight.get("label")
+    if label is not None and points:
+        x_value, y_value = highlight["points"][0]
+        x, y = x_px(x_value), y_px(y_value + 1)
+        box_width = _text_width(label, TICK_SIZE) + 12
+        box_height = _px(TICK_SIZE) + 10
+        parts.append(f'<rect x="{_num(x - box_width / 2)}" y="{_num(y - box_height)}" width="{_num(box_width)}" '
+                     f'height="{_num(box_height)}" rx="5" fill="lightgreen" stroke="black"/>')
+        parts.append(_text(x, y - box_height / 2, label, TICK_SIZE, baseline="central"))
+    return parts
+
+
+def dot_plot_svg(counts, x_min, x_max, x_label="", color="black", mark="X", width=600, height=350):
+    """Return the SVG of a dot plot: one column per whole number from x_min to x_max.
+
+    `counts` maps values to how many marks their column gets; marks stack
+    30 px apart, closer when a column would run off the top.
+    """
+    padding = 60
+    baseline = height - padding
+    column_width = (width - 2 * padding) / (x_max - x_min + 1)
+    tallest = max(counts.values(), default=0)
+    spacing = min(30, (baseline - 50) / tallest) if tallest else 30
+
+    parts = [f'<svg viewBox="0 0 {width} {height}" width="100%" style="max-width: {width}px;" '
+             f'font-family="Arial, sans-serif">',
+             f'<rect x="0" y="0" width="{width}" height="{height}" fill="#f8f9fa" rx="10"/>',
+             f'<line x1="{padding}" y1="{baseline}" x2="{width - padding}" y2="{baseline}" stroke="black" stroke-width="2"/>',
+             f'<polygon points="{padding - 5},{baseline} {padding},{baseline - 3} {padding},{baseline + 3}" fill="black"/>',
+             f'<polygon points="{width - padding + 5},{baseline} {width - padding},{baseline - 3} '
+             f'{width - padding},{baseline + 3}" fill="black"/>']
+
+    marks = []
+    for i, value in enumerate(range(x_min, x_max + 1)):
+        x = _num(padding + (i + 0.5) * column_width)
+        parts.append(f'<text x="{x}" y="{baseline + 25}" text-anchor="middle" font-weight="bold" '
+                     f'font-size="16">{value}</text>')
+        marks.extend(f'<text x="{x}" y="{_num(baseline - 30 - j * spacing)}">{html.escape(mark)}</text>'
+                     for j in range(counts.get(value, 0)))
+    if marks:
+        parts.append(f'<g text-anchor="middle" font-size="24" font-weight="bold" fill="{color}">')
+        parts.extend(marks)
+        parts.append("</g>")
+
+    if x_label:
+        parts.append(f'<text x="{_num(width / 2)}" y="{height - 15}" text-anchor="middle" font-weight="bold" '
+                     f'font-size="18">{html.escape(x_label)}</text>')
+    parts.append("</svg>")
+    return "".join(parts)
@@ -0,0 +1,133 @@
+"""Warm-up of popular activities when the server starts.
+
+The first student to open an activity after a deploy would otherwise pay for
+importing it, loading matplotlib and its font cache and drawing the first
+figure.  start_warmup() does that work once per process in a background
+thread: for each activity it loads the module into the activity registry and
+calls run() in a headless session once per difficulty level recorded in the
+route manifest.
+
+warmup.json next to main.py lists the activities to warm first; the rest of
+the ``limit`` is filled from the grade's curriculum in catalog order.  The
+MATHWIZ_WARMUP environment variable overrides the limit, and
+``MATHWIZ_WARMUP=0`` turns the warm-up off.
+
+Run it in the foreground to see what it does:
+
+    python -m utils.warmup
+"""
+import json
+import os
+import threading
+import time
+
+from streamlit.logger import get_logger
+
+from utils import catalog
+from utils.activity_analysis import level_states
+from utils.activity_registry import load_activity
+from utils.headless import headless_session
+from utils.route_manifest import APP_DIR, DEFAULT_GRADE
+from utils.slugs import get_slug_index
+
+WARMUP_CONFIG_PATH = os.path.join(APP_DIR, "warmup.json")
+WARMUP_ENV = "MATHWIZ_WARMUP"
+
+logger = get_logger(__name__)
+
+_started = False
+_started_lock = threading.Lock()
+
+
+def read_config(path=WARMUP_CONFIG_PATH):
+    """Return the warm-up settings from warmup.json and the environment"""
+    config = {"grade": DEFAULT_GRADE, "limit": 10, "activities": []}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            config.update(json.load(f))
+    limit = os.environ.get(WARMUP_ENV)
+    if limit:
+        config["limit"] = int(limit)
+    return config
+
+
+def warmup_routes(config):
+    """Return [(subtopic, route)] to warm: listed activities first, then curriculum order"""
+    grade, limit = config["grade"], config["limit"]
+    slug_index = get_slug_index()
+
+    subtopics = list(config["activities"])
+    for labels in (catalog.grade_sections(grade) or {}).values():
+        subtopics.extend(slug_index.slug_for(label) for label in labels)
+
+    routes = []
+    seen = set()
+    for subtopic in subtopics:
+        if len(routes) >= limit:
+            break
+        route = slug_index.route_for(grade, subtopic)
+        if route is None or route["module"] in seen:
+            continue
+        seen.add(route["module"])
+        routes.append((subtopic, route))
+    return routes
+
+
+def warm_activity(grade, subtopic, route):
+    """Load an activity and run it headless once per difficulty level.
+
+    Returns the number of runs that raised.
+    """
+    module = load_activity(grade, subtopic, route)
+    failures = 0
+    for _, state in level_states(route.get("difficulty")):
+        try:
+            with headless_session(state):
+                module.run()
+        except Exception as e:
+            failures += 1
+            logger.warning("Warm-up of %s %s failed: %r", subtopic, state, e)
+    return failures
+
+
+def run_warmup(config=None):
+    """Warm the configured activities in the calling thread and log how long it took"""
+    config = config or read_config()
+    start = time.perf_counter()
+    routes = warmup_routes(config)
+
+    runs = failures = 0
+    for subtopic, route in routes:
+        activity_start = time.perf_counter()
+        try:
+            failures += warm_activity(config["grade"], subtopic, route)
+        except Exception as e:
+            failures += 1
+            logger.warning("Warm-up could not load %s: %r", subtopic, e)
+        difficulty = route.get("difficulty")
+        runs += len(difficulty["levels"]) if difficulty else 1
+        logger.debug("Warmed %s in %.0f ms", subtopic, (time.perf_counter() - activity_start) * 1000)
+
+    elapsed = time.perf_counter() - start
+    logger.info("Warm-up: %d activities, %d runs in %.2f s (%d failed)",
+                len(routes), runs, elapsed, failures)
+    return elapsed
+
+
+def start_warmup():
+    """Start the warm-up in a background thread, once per process"""
+    global _started
+    if _started:
+        return
+    with _started_lock:
+        if _started:
+            return
+        _started = True
+    config = read_config()
+    if config["limit"] <= 0:
+        return
+    threading.Thread(target=run_warmup, args=(config,), name="mathwiz-warmup", daemon=True).start()
+
+
+if __name__ == "__main__":
+    run_warmup()
@@ -0,0 +1,93 @@
+"""Interactive widgets served as one static Streamlit component.
+
+Activities used to inject a whole HTML page, scripts included, into
+components.html() on every rerun: the iframe was rebuilt on each click and
+its libraries fetched again from a CDN, which fails on offline networks.
+The widgets now live in assets/widgets (index.html plus one script per
+widget) and are served by the Streamlit server like any custom component:
+
+    values = draggable_bar_chart(bars, max_value=20, step_size=2, title="Pets",
+                                 x_label="Pet", y_label="Students",
+                                 problem=data, key="bars")
+
+Streamlit creates the iframe once and only posts the arguments on each
+rerun; the page skips reruns whose arguments haven't changed, and sizes the
+iframe to its content whenever that changes.  Script and style files are
+sent with "Cache-Control: public", so browsers keep them.
+
+The widgets keep the student's clicks and drags in the page and send only
+the final answer back, so working on a question costs no reruns; moving to
+the next one sends just its new arguments.  `problem` identifies the
+question: each answer is tagged with it, and an answer to an earlier
+question (still held under the same key) comes back as None.  Two questions
+in a row can be the same problem, so activities call new_question(key) each
+time they start one; the widget then redraws and forgets the last answer.
+"""
+import hashlib
+import json
+import os
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WIDGETS_DIR = os.path.join(APP_DIR, "assets", "widgets")
+
+_widgets = components.declare_component("mathwiz_widgets", path=WIDGETS_DIR)
+
+# Session key holding {widget key: number of questions started}
+QUESTION_COUNTS_KEY = "_widget_questions"
+
+
+def _problem_id(problem):
+    """Return a short stable id for any JSON-like description of a question"""
+    text = json.dumps(problem, sort_keys=True, default=str)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
+def new_question(key):
+    """Start a new question in the widget under `key`, even if it asks the same as the last one"""
+    counts = st.session_state.setdefault(QUESTION_COUNTS_KEY, {})
+    counts[key] = counts.get(key, 0) + 1
+
+
+def _widget(name, problem, key, **args):
+    """Show a widget and return its answer to `problem`, or None until the student gives one"""
+    question = st.session_state.get(QUESTION_COUNTS_KEY, {}).get(key, 0)
+    problem_id = _problem_id([question, problem])
+    value = _widgets(widget=name, problem=problem_id, key=key, default=None, **args)
+    if isinstance(value, dict) and value.get("problem") == problem_id:
+        return value
+    return None
+
+
+def draggable_bar_chart(bars, max_value, step_size, title, x_label, y_label, locked=False, problem=None,
+                        key=None):
+    """Show a bar chart whose draggable bars the student sets to their target.
+
+    `bars` are dicts with "category", "value", "targetValue", "isDraggable"
+    and "index".  Returns {index: value} for the draggable bars once the
+    student clicks Check Answer, else None; `locked` shows the bars fixed.
+    """
+    value = _widget("bar_chart", problem, key, bars=bars, maxValue=max_value, stepSize=step_size,
+                    title=title, xLabel=x_label, yLabel=y_label, locked=locked)
+    if value is None:
+        return None
+    return {int(index): bar_value for index, bar_value in value["values"].items()}
+
+
+def shade_grid(target=None, problem=None, key=None):
+    """Show a 10 x 10 grid the student shades by dragging; return the number of cells shaded.
+
+    The count next to the grid compares the shading with `target`.  Put the
+    grid inside an st.form so dragging doesn't rerun the script; the count
+    reaches Python when the form is submitted (None if the grid wasn't touched).
+    """
+    value = _widget("shade_grid", problem, key, target=target)
+    return None if value is None else value["shaded"]
+
+
+def order_numbers(numbers, problem=None, key=None):
+    """Show `numbers` as buttons the student clicks in order; return that order once submitted, else None"""
+    value = _widget("order_numbers", problem, key, numbers=numbers)
+    return None if value is None else value["order"]
@@ -0,0 +1,468 @@
+"""Printable worksheets built from the activities' own questions.
+
+Teachers ask for worksheets mixing activities at chosen difficulties.  A
+worksheet question is a seeded problem (utils.generation) drawn by the
+activity's own question function: each question is generated headless, the
+activity's run() draws it, and the elements its @question_fragment function
+sends (text, figures, tables, answer choices and blanks) are turned into
+HTML.  Buttons such as Submit and Hint and interactive widgets are left out.
+
+    python -m utils.worksheet --section C.Multiplication --section D.Division \\
+        --count 40 --difficulty 2 --students 30 --jobs 8 --output worksheets.html
+
+Questions are rendered in chunks over a ProcessPoolExecutor and written to
+one HTML file as the chunks complete, in order, one printable page per
+student (print it to PDF from a browser).  Every question has its own seed,
+so the same command writes the same worksheets whatever the --jobs.
+"""
+import argparse
+import base64
+import contextlib
+import html
+import os
+import random
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from streamlit import dataframe_util
+from streamlit.delta_generator import DeltaGenerator
+from streamlit.elements.lib import image_utils
+
+from utils.fragments import drawing_question
+from utils.generation import generated
+from utils.route_manifest import DEFAULT_GRADE, get_manifest
+
+# Questions per task sent to a worker process
+CHUNK_SIZE = 20
+
+# Buttons that drive the activity rather than answer the question
+_CONTROL_BUTTON = re.compile(
+    r"submit|skip|next|hint|check|reset|clear|back|try again|new |show|start|continue|explain|help|undo|done",
+    re.IGNORECASE,
+)
+# State keys holding a problem's answer, most specific first
+_ANSWER_KEYS = [
+    re.compile(r"(^|_)correct_answers?$"),
+    re.compile(r"(^|_)final_answer$"),
+    re.compile(r"(^|_)(correct|answers?)(_|$)"),
+]
+_NOT_ANSWER_KEY = re.compile(r"submitted|selected|user|wrong|type|options|alt_|shown|checked|feedback|given")
+# Widgets and lines outside the question that pick or show the level
+_DIFFICULTY_WIDGET = re.compile(r"difficulty|level", re.IGNORECASE)
+# Placeholder first options of select boxes
+_PLACEHOLDER_OPTION = re.compile(r"^(select|choose|pick)\b.*", re.IGNORECASE)
+
+_STYLE = """
+body { font-family: Arial, sans-serif; margin: 0 auto; max-width: 800px; color: #222; }
+.worksheet { padding: 24px 32px; page-break-after: always; }
+.worksheet header { display: flex; justify-content: space-between; border-bottom: 2px solid #333; }
+.question { margin: 18px 0; page-break-inside: avoid; }
+.question > .number { float: left; font-weight: bold; margin-right: 8px; }
+.question img, .question svg { max-width: 100%; height: auto; }
+.choices { list-style: none; padding-left: 0; }
+.choices li::before { content: "\\25CB  "; }
+.blank { display: inline-block; min-width: 160px; border-bottom: 1px solid #333; }
+.answers li { margin: 4px 0; }
+table { border-collapse: collapse; } td, th { border: 1px solid #999; padding: 2px 8px; }
+"""
+
+
+# Capturing a question's elements
+
+class _DataUrlMedia:
+    """Stands in for streamlit.runtime in image_utils: the capturing thread's images become data: URLs"""
+
+    def __init__(self, runtime, thread):
+        self._runtime = runtime
+        self._thread = thread
+
+    def _capturing(self):
+        return threading.get_ident() == self._thread
+
+    def exists(self):
+        return self._capturing() or self._runtime.exists()
+
+    def get_instance(self):
+        return self if self._capturing() else self._runtime.get_instance()
+
+    @property
+    def media_file_mgr(self):
+        return self
+
+    def add(self, data, mimetype, image_id):
+        if isinstance(data, str):
+            with open(data, "rb") as f:
+                data = f.read()
+        return f"data:{mimetype};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+@contextlib.contextmanager
+def capture_question():
+    """Collect what the calling thread's activity draws.
+
+    Yields {"question": [...], "page": [...]} of (element type, proto,
+    height) tuples: the elements drawn by @question_fragment functions and
+    everything drawn.  Expanders (hints, explanations) are left out.
+    """
+    captured = {"question": [], "page": []}
+    # DeltaGenerator answers any attribute, so hidden blocks are kept here rather than marked
+    hidden = []
+    enqueue, block = DeltaGenerator._enqueue, DeltaGenerator._block
+    runtime = image_utils.runtime
+    thread = threading.get_ident()
+
+    def capture(dg, delta_type, element_proto, *args, **kwargs):
+        if threading.get_ident() == thread and not any(dg._active_dg is block for block in hidden):
+            layout_config = kwargs.get("layout_config")
+            height = getattr(layout_config, "height", None)
+            element = (delta_type, element_proto, height if isinstance(height, int) else None)
+            captured["page"].append(element)
+            if drawing_question():
+                captured["question"].append(element)
+        return enqueue(dg, delta_type, element_proto, *args, **kwargs)
+
+    def capture_block(dg, block_proto=None, *args, **kwargs):
+        child = block(dg, block_proto, *args, **kwargs)
+        if threading.get_ident() == thread and (
+            any(dg._active_dg is block for block in hidden)
+            or block_proto is not None and block_proto.WhichOneof("type") in ("expandable", "popover")
+        ):
+            # Headless blocks are the parent itself; hand out a separate one to recognize
+            child = DeltaGenerator(root_container=None)
+            hidden.append(child)
+        return child
+
+    DeltaGenerator._enqueue, DeltaGenerator._block = capture, capture_block
+    image_utils.runtime = _DataUrlMedia(runtime, thread)
+    try:
+        yield captured
+    finally:
+        DeltaGenerator._enqueue, DeltaGenerator._block = enqueue, block
+        image_utils.runtime = runtime
+
+
+# Elements to HTML
+
+def _inline_markdown(text, allow_html):
+    """Convert the inline markdown activities use (bold, italics, code) to HTML"""
+    if not allow_html:
+        text = html.escape(text, quote=False)
+    text = re.sub(r"`([^`]+)`", r"<code>\1</code>", text)
+    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
+    text = re.sub(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])", r"<em>\1</em>", text)
+    return text
+
+
+def _markdown_block(lines, allow_html):
+    """Convert one blank-line separated block of markdown to HTML"""
+    parts, items, list_tag = [], [], None
+
+    def close_list():
+        nonlocal items, list_tag
+        if items:
+            parts.append(f"<{list_tag}>" + "".join(f"<li>{item}</li>" for item in items) + f"</{list_tag}>")
+        items, list_tag = [], None
+
+    paragraph = []
+    for line in lines + [""]:
+        stripped = line.strip()
+        heading = re.match(r"^(#{1,6})\s+(.*)$", stripped)
+        bullet = re.match(r"^[-*+]\s+(.*)$", stripped)
+        numbered = re.match(r"^\d+[.)]\s+(.*)$", stripped)
+        rule = re.match(r"^(-{3,}|\*{3,}|_{3,})$", stripped)
+        if paragraph and (not stripped or heading or bullet or numbered or rule):
+            parts.append("<p>" + "<br>".join(_inline_markdown(text, allow_html) for text in paragraph) + "</p>")
+            paragraph = []
+        if bullet or numbered:
+            tag = "ul" if bullet else "ol"
+            if list_tag != tag:
+                close_list()
+                list_tag = tag
+            items.append(_inline_markdown((bullet or numbered).group(1), allow_html))
+            continue
+        close_list()
+        if heading:
+            level = min(len(heading.group(1)) + 1, 6)
+            parts.append(f"<h{level}>{_inline_markdown(heading.group(2), allow_html)}</h{level}>")
+        elif stripped and not rule:
+            paragraph.append(stripped)
+    return parts
+
+
+def markdown_html(body, allow_html=False):
+    """Convert the markdown subset activities write (headings, lists, emphasis) to HTML.
+
+    With allow_html, a block that starts with a tag is passed through as is,
+    as Streamlit's markdown renderer does.
+    """
+    parts = []
+    for block in re.split(r"\n\s*\n", body.strip()):
+        if not block.strip():
+            continue
+        if allow_html and block.lstrip().startswith("<"):
+            parts.append(block)
+        else:
+            parts.extend(_markdown_block(block.split("\n"), allow_html))
+    return "\n".join(parts)
+
+
+def _choices_html(options):
+    """Return answer choices as a list of empty circles"""
+    return '<ul class="choices">' + "".join(f"<li>{html.escape(option)}</li>" for option in options) + "</ul>"
+
+
+def element_html(delta_type, proto, height=None):
+    """Return printable HTML for one captured element, or "" for elements a worksheet leaves out"""
+    if delta_type == "markdown":
+        return markdown_html(proto.body, proto.allow_html)
+    if delta_type == "heading":
+        return markdown_html(f"### {proto.body}")
+    if delta_type in ("text", "alert"):
+        return markdown_html(proto.body)
+    if delta_type == "html":
+        return proto.body
+    if delta_type == "imgs":
+        return "".join(
+            f'<figure><img src="{html.escape(img.url)}">'
+            + (f"<figcaption>{html.escape(img.caption)}</figcaption>" if img.caption else "")
+            + "</figure>"
+            for img in proto.imgs if img.url
+        )
+    if delta_type in ("dataframe", "table"):
+        frame = dataframe_util.convert_arrow_bytes_to_pandas_df(proto.arrow_data.data)
+        return frame.to_html(index=False, border=0)
+    if delta_type == "iframe" and proto.srcdoc:
+        return (f'<iframe srcdoc="{html.escape(proto.srcdoc)}" '
+                f'style="width: 100%; height: {height or 150}px; border: 0;"></iframe>')
+    if delta_type in ("radio", "selectbox", "multiselect"):
+        options = [option for option in proto.options if not _PLACEHOLDER_OPTION.match(option)]
+        label = markdown_html(proto.label) if proto.label.strip() else ""
+        return label + _choices_html(options)
+    if delta_type in ("text_input", "number_input", "text_area"):
+        label = _inline_markdown(proto.label, False) if proto.label.strip() else "Answer:"
+        return f'<p>{label} <span class="blank"></span></p>'
+    return ""
+
+
+def _shows_difficulty(proto):
+    """Check whether an element is a level picker or a short line showing the level"""
+    text = getattr(proto, "label", "") or getattr(proto, "body", "") or ""
+    return bool(_DIFFICULTY_WIDGET.search(text)) and len(text) < 60
+
+
+def question_html(captured):
+    """Return the HTML of a captured question; buttons that aren't controls become answer choices.
+
+    Activities that don't draw their question in a @question_fragment
+    function give everything run() draws below the page title, less the
+    difficulty picker.
+    """
+    elements = captured["question"]
+    if not elements:
+        page = captured["page"]
+        titles = [i for i, (delta_type, proto, _) in enumerate(page) if delta_type == "heading" and proto.tag == "h1"]
+        elements = [
+            element for element in page[titles[-1] + 1 if titles else 0:]
+            if not _shows_difficulty(element[1])
+        ]
+    parts, choices = [], []
+    for delta_type, proto, height in elements:
+        if delta_type == "button":
+            if proto.label and not _CONTROL_BUTTON.search(proto.label):
+                choices.append(proto.label)
+            continue
+        if choices:
+            parts.append(_choices_html(choices))
+            choices = []
+        part = element_html(delta_type, proto, height)
+        if part:
+            parts.append(part)
+    if choices:
+        parts.append(_choices_html(choices))
+    return "\n".join(parts)
+
+
+def _answer_text(value):
+    """Return an answer value as worksheet text"""
+    if isinstance(value, dict):
+        for key in ("final_answer", "final", "total", "sum", "answer"):
+            if key in value:
+                return _answer_text(value[key])
+        return "; ".join(_answer_text(part) for part in value.values())
+    if isinstance(value, (list, tuple, set)):
+        return ", ".join(_answer_text(part) for part in value)
+    return str(value)
+
+
+def problem_answer(problem):
+    """Return the answer a problem's state records, or None.
+
+    Activities name it differently; correct_answer, final_answer and then
+    other *_answer/correct_* keys are tried, at the top level and one dict
+    down.  A correct_index picks from the problem's options.
+    """
+    state = problem["state"]
+    scopes = [state] + [value for value in state.values() if isinstance(value, dict)]
+    for pattern in _ANSWER_KEYS:
+        for scope in scopes:
+            for key, value in scope.items():
+                if not isinstance(key, str) or not pattern.search(key) or _NOT_ANSWER_KEY.search(key) \
+                        or value is None or value == "":
+                    continue
+                options = scope.get("options")
+                if key.endswith("_index") and isinstance(value, int) and isinstance(options, list) \
+                        and 0 <= value < len(options):
+                    value = options[value]
+                return _answer_text(value)
+    return None
+
+
+def render_question(grade, subtopic, seed, difficulty):
+    """Generate and draw one question; return {"html", "answer"}"""
+    with generated(subtopic, seed, difficulty, grade) as (module, problem):
+        with capture_question() as captured:
+            module.run()
+    return {"html": question_html(captured), "answer": problem_answer(problem)}
+
+
+def render_chunk(questions):
+    """Worker task: render a list of question specs, keeping going past activities that raise"""
+    rendered = []
+    for spec in questions:
+        try:
+            rendered.append(render_question(spec["grade"], spec["subtopic"], spec["seed"], spec["difficulty"]))
+        except Exception as e:
+            rendered.append({"html": f"<p><em>Question unavailable ({html.escape(type(e).__name__)})</em></p>",
+                             "answer": None, "error": f"{spec['subtopic']}: {type(e).__name__}: {e}"})
+    return rendered
+
+
+# Planning and writing
+
+def worksheet_activities(sections=(), subtopics=(), grade=DEFAULT_GRADE):
+    """Return [(subtopic, route)] of the activities with a generator in the given sections or slugs"""
+    routes = get_manifest()["routes"].get(grade, {})
+    chosen = []
+    for subtopic, route in sorted(routes.items()):
+        if not route.get("generator"):
+            continue
+        if subtopic in subtopics or route["section"] in sections:
+            chosen.append((subtopic, route))
+    return chosen
+
+
+def _level_for(route, difficulty):
+    """Return the activity's level closest to a requested difficulty, or None when it has no levels"""
+    levels = (route.get("difficulty") or {}).get("levels")
+    if not levels or difficulty is None:
+        return None
+    return min(levels, key=lambda level: (abs(level - difficulty), level))
+
+
+def plan_worksheets(activities, students, count, difficulties=(None,), seed=0, grade=DEFAULT_GRADE):
+    """Return one question spec per student and question, in document order.
+
+    Each worksheet cycles through the activities and the difficulties, then
+    shuffles its questions.  Every spec carries its own seed, so a question
+    doesn't depend on which worker renders it.
+    """
+    plan = []
+    for student in range(students):
+        questions = [
+            (activities[i % len(activities)], difficulties[i % len(difficulties)])
+            for i in range(count)
+        ]
+        random.Random(f"{seed}/{student}").shuffle(questions)
+        for number, ((subtopic, route), difficulty) in enumerate(questions, start=1):
+            plan.append({
+                "student": student, "number": number, "grade": grade, "subtopic": subtopic,
+                "difficulty": _level_for(route, difficulty), "seed": f"{seed}/{student}/{number}",
+            })
+    return plan
+
+
+def _chunks(plan, size):
+    """Split a plan into worker tasks of `size` consecutive questions"""
+    return [plan[start:start + size] for start in range(0, len(plan), size)]
+
+
+def write_worksheets(path, plan, title, jobs=None, chunk_size=CHUNK_SIZE, answers=False):
+    """Render a plan over worker processes and stream the worksheets into one HTML file.
+
+    Returns the errors of questions that couldn't be rendered.
+    """
+    errors = []
+    with open(path, "w", encoding="utf-8") as out, ProcessPoolExecutor(max_workers=jobs) as executor:
+        out.write(f'<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>{html.escape(title)}</title>'
+                  f"<style>{_STYLE}</style></head><body>\n")
+        student, key = None, []
+
+        def close_worksheet():
+            if answers and key:
+                out.write('<section class="answers"><h3>Answer key</h3><ol>'
+                          + "".join(f"<li>{html.escape(answer or '—')}</li>" for answer in key) + "</ol></section>")
+            out.write("</section>\n")
+
+        # map() runs the chunks in parallel and hands them back in order
+        chunks = _chunks(plan, chunk_size)
+        for chunk, rendered in zip(chunks, executor.map(render_chunk, chunks)):
+            for spec, question in zip(chunk, rendered):
+                if spec["student"] != student:
+                    if student is not None:
+                        close_worksheet()
+                    student, key = spec["student"], []
+                    out.write(f'<section class="worksheet"><header><h2>{html.escape(title)}</h2>'
+                              f'<p>Name: <span class="blank"></span> Date: <span class="blank"></span></p>'
+                              f"</header>\n")
+                out.write(f'<div class="question"><span class="number">{spec["number"]}.</span>'
+                          f'{question["html"]}</div>\n')
+                key.append(question["answer"])
+                if "error" in question:
+                    errors.append(question["error"])
+            out.flush()
+        if student is not None:
+            close_worksheet()
+        out.write("</body></html>\n")
+    return errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.worksheet", description=__doc__.splitlines()[0])
+    parser.add_argument("--grade", default=DEFAULT_GRADE)
+    parser.add_argument("--section", action="append", default=[], help="Grades section, e.g. C.Multiplication")
+    parser.add_argument("--activity", action="append", default=[], help="activity slug")
+    parser.add_argument("--count", type=int, default=20, help="questions per worksheet")
+    parser.add_argument("--difficulty", type=int, action="append", default=[],
+                        help="difficulty level; repeat to mix levels (default: each activity's own)")
+    parser.add_argument("--students", type=int, default=1, help="worksheets, each with different questions")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="questions per worker task")
+    parser.add_argument("--answers", action="store_true", help="add an answer key to each worksheet")
+    parser.add_argument("--title", default="Worksheet")
+    parser.add_argument("--output", default="worksheets.html")
+    args = parser.parse_args(argv)
+
+    activities = worksheet_activities(args.section, args.activity, args.grade)
+    if not activities:
+        parser.error("no activities with a generator match --section/--activity")
+    plan = plan_worksheets(activities, args.students, args.count, args.difficulty or [None], args.seed, args.grade)
+
+    start = time.perf_counter()
+    errors = write_worksheets(args.output, plan, args.title, args.jobs, args.chunk_size, args.answers)
+    elapsed = time.perf_counter() - start
+    for error in sorted(set(errors)):
+        print(f"unavailable: {error}")
+    print(f"{args.students} worksheet(s), {len(plan)} questions from {len(activities)} activities "
+          f"in {elapsed:.1f} s -> {args.output} ({os.path.getsize(args.output) / 1024:.0f} KB)")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    # Run the imported module's main(), so worker processes are handed
+    # utils.worksheet.render_chunk rather than this __main__ copy's
+    from utils.worksheet import main as worksheet_main
+    sys.exit(worksheet_main())